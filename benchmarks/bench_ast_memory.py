@@ -0,0 +1,151 @@
+"""
+AST node benchmark: memory per node and construction rate of nodes.py classes,
+and of the flat struct-of-arrays encoding (src/utils/flat_ast.py).
+
+Usage:
+    python -m benchmarks.bench_ast_memory --nodes 1000000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import parse_source
+from src.utils.flat_ast import FIELDS, flatten, unflatten
+from src.utils.nodes import ASTNode, Identifier
+
+
+def iter_nodes(root):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        for name in field_names(type(node)):
+            value = getattr(node, name)
+            if isinstance(value, ASTNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(value)
+
+
+_FIELDS = {cls: [field.lstrip("$*=") for field in fields] for cls, fields in FIELDS.items()}
+
+
+def field_names(cls):
+    """Constructor parameters of ``cls``; every node stores them under the same names."""
+    return _FIELDS[cls]
+
+
+def construction_recipe(root):
+    """Post-order ``(cls, args)`` list that rebuilds ``root``; node arguments
+    are ``(1, index)`` / ``(2, [index, ...])`` references to earlier entries."""
+    recipe = []
+
+    def build(node):
+        args = []
+        for name in field_names(type(node)):
+            value = getattr(node, name)
+            if isinstance(value, ASTNode):
+                args.append((1, build(value)))
+            elif isinstance(value, list):
+                args.append((2, [build(item) for item in value]))
+            else:
+                args.append((0, value))
+        recipe.append((type(node), args))
+        return len(recipe) - 1
+
+    build(root)
+    return recipe
+
+
+def constructor_calls(root):
+    """``(cls, args)`` for every node, with the children of ``root`` as arguments."""
+    return [
+        (type(node), [getattr(node, name) for name in field_names(type(node))])
+        for node in iter_nodes(root)
+    ]
+
+
+def replay(recipe):
+    built = []
+    append = built.append
+    for cls, spec in recipe:
+        append(cls(*[
+            value if kind == 0 else built[value] if kind == 1 else [built[i] for i in value]
+            for kind, value in spec
+        ]))
+    return built[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1_000_000, help="approximate AST size")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes (best is kept)")
+    args = parser.parse_args()
+
+    per_function = sum(1 for _ in iter_nodes(parse_source(generate_program(11)))) / 11
+    source = generate_program(max(1, int(args.nodes / per_function)))
+    sys.setrecursionlimit(100_000)
+
+    start = time.perf_counter()
+    program = parse_source(source, "fast")
+    parse_seconds = time.perf_counter() - start
+    count = sum(1 for _ in iter_nodes(program))
+    recipe = construction_recipe(program)
+    calls = constructor_calls(program)
+
+    gc.collect()
+    tracemalloc.start()
+    rebuilt = replay(recipe)
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert str(rebuilt) == str(program)
+    del rebuilt
+
+    gc.collect()
+    tracemalloc.start()
+    flat = flatten(program)
+    flat_traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    def timed(func):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
+
+    flatten_seconds = timed(lambda: flatten(program))
+    unflatten_seconds = timed(lambda: unflatten(flat))
+    tree_scan = timed(lambda: sum(1 for node in iter_nodes(program) if type(node) is Identifier))
+    flat_scan = timed(lambda: sum(1 for _ in flat.iter_kind(Identifier)))
+    del program
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        for cls, call_args in calls:
+            cls(*call_args)
+        best = min(best, time.perf_counter() - start)
+        gc.enable()
+
+    print(f"{count:,} nodes ({len(source) / 1e6:.1f} MB source)")
+    print(f"  memory            {traced / count:>8.1f} bytes/node (tracemalloc, with child lists)")
+    print(f"  construction      {count / best / 1e6:>8.2f} M nodes/s (constructor calls only)")
+    print(f"  descent parse     {count / parse_seconds / 1e6:>8.2f} M nodes/s (source to AST)")
+    print(f"  flat memory       {flat_traced / count:>8.1f} bytes/node (FlatAST)")
+    print(f"  flatten           {count / flatten_seconds / 1e6:>8.2f} M nodes/s")
+    print(f"  unflatten         {count / unflatten_seconds / 1e6:>8.2f} M nodes/s")
+    print(f"  find Identifiers  {tree_scan * 1000:>8.1f} ms tree walk, {flat_scan * 1000:.1f} ms FlatAST")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Batch compilation benchmark: compile_many over a directory of small
+generated programs, with workers forked from a warm parent vs spawned
+workers that import the front end and warm their DFA themselves.
+
+Usage:
+    python -m benchmarks.bench_batch --files 500 --workers 2 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import generate_program
+from src.frontend.batch import collect_files, compile_many
+
+
+def run(files, workers, mp_context, warmup):
+    start = time.perf_counter()
+    first = None
+    statuses = set()
+    for record in compile_many(files, workers, warmup=warmup, mp_context=mp_context):
+        if first is None:
+            first = time.perf_counter() - start
+        statuses.add(record["status"])
+    assert statuses == {"ok"}, statuses
+    return first, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=500, help="generated source files")
+    parser.add_argument("--functions", type=int, default=3, help="functions per file")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({2, 4, os.cpu_count() or 1} - {1}), help="pool sizes to try")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = generate_program(args.functions)
+        for index in range(args.files):
+            Path(directory, f"p{index:05}.tyc").write_text(source, encoding="utf-8")
+        files = collect_files([directory])
+        warmup = [source]
+        print(f"{os.cpu_count()} CPUs, {len(files):,} files of {len(source):,} bytes")
+
+        first, total = run(files, 1, None, warmup)
+        print(f"  in-process          first {first * 1e3:>7.1f} ms  total {total:>6.2f} s  "
+              f"{len(files) / total:>6.0f} files/s")
+        for workers in args.workers:
+            for label, context in (("forked warm", None), ("spawned cold", "spawn")):
+                context = context and multiprocessing.get_context(context)
+                first, total = run(files, workers, context, warmup)
+                print(f"  {workers:>2} {label:<16} first {first * 1e3:>7.1f} ms  "
+                      f"total {total:>6.2f} s  {len(files) / total:>6.0f} files/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Binary AST benchmark: loading an AST from the binary format (src/utils/
+binary_ast.py) against re-parsing its source and against pickle.
+
+Usage:
+    python -m benchmarks.bench_binary_ast --functions 2000
+"""
+
+import argparse
+import gc
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import parse_source
+from src.frontend.session import FrontEndSession
+from src.utils import binary_ast
+
+
+def best_of(repeat, func):
+    """Best time of ``repeat`` calls, with the cyclic GC off as in timeit."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000,
+                        help="functions in the generated program")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes (best is kept)")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    source = generate_program(args.functions)
+    ast = parse_source(source, "fast")
+    pickled = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "program.tycast")
+        binary_ast.dump(ast, path)
+        size = os.path.getsize(path)
+
+        def load_lazy():
+            with binary_ast.load(path) as mapped:
+                mapped.root
+
+        def load_one():
+            with binary_ast.load(path) as mapped:
+                mapped.root.decls[len(mapped.root.decls) // 2]
+
+        def load_all():
+            with binary_ast.load(path) as mapped:
+                list(mapped.root.decls)
+
+        session = FrontEndSession("fast")
+        rows = [
+            ("parse, antlr backends", len(source), lambda: session.build_ast(source)),
+            ("parse, descent + fast lexer", len(source), lambda: parse_source(source, "fast")),
+            ("pickle.loads", len(pickled), lambda: pickle.loads(pickled)),
+            ("binary load, all nodes", size, load_all),
+            ("binary load, one declaration", size, load_one),
+            ("binary load, nothing built", size, load_lazy),
+        ]
+        print(f"{len(ast.decls):,} declarations, {len(source) / 1e6:.1f} MB source")
+        for name, nbytes, func in rows:
+            seconds = best_of(args.repeat, func)
+            print(f"  {name:<30} {nbytes / 1e6:>6.2f} MB  {seconds * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Peak RSS benchmark: antlr4.InputStream vs memory-mapped ByteCharStream.
+
+Each mode runs in a fresh interpreter that opens the source file, lexes the
+first --tokens tokens with the generated TyCLexer and reports its peak RSS.
+
+Usage:
+    python -m benchmarks.bench_char_stream --size-mb 50
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.corpus import generate_program_of_size
+
+MODES = ("imports-only", "InputStream", "ByteCharStream")
+
+# Every step runs in its own interpreter: on Linux ru_maxrss survives
+# fork/exec, so measuring in a child of a process that held the generated
+# source would report the parent's peak.
+
+
+def peak_rss_mb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+
+def run_child(mode, path, num_tokens, size_mb):
+    if mode == "write":
+        with open(path, "w", encoding="ascii") as f:
+            f.write(generate_program_of_size(int(size_mb * 1024 * 1024)))
+        return
+
+    from antlr4 import InputStream
+    from build.TyCLexer import TyCLexer
+    from src.frontend.char_stream import ByteCharStream
+
+    if mode == "imports-only":
+        print(f"{peak_rss_mb():.1f}")
+        return
+    if mode == "InputStream":
+        with open(path, encoding="ascii") as f:
+            stream = InputStream(f.read())
+    else:
+        stream = ByteCharStream.from_path(path)
+    lexer = TyCLexer(stream)
+    for _ in range(num_tokens):
+        if lexer.nextToken().type == -1:
+            break
+    print(f"{peak_rss_mb():.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=50.0, help="input size in MB")
+    parser.add_argument("--tokens", type=int, default=100_000, help="tokens to lex")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], args.child[1], args.tokens, args.size_mb)
+        return
+
+    def child(mode, path):
+        return subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_char_stream",
+             "--size-mb", str(args.size_mb), "--tokens", str(args.tokens),
+             "--child", mode, path],
+            check=True, capture_output=True, text=True,
+        ).stdout
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "input.tyc")
+        child("write", path)
+        print(f"Input: {os.path.getsize(path) / (1024 * 1024):.1f} MB, lexing {args.tokens} tokens")
+        for mode in MODES:
+            print(f"{mode:<16} peak RSS {float(child(mode, path)):>8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compilation cache benchmark: FrontEndSession without a cache, with a cold
+(empty) CompileCache and with a warm one that already holds every result.
+
+Usage:
+    python -m benchmarks.bench_compile_cache --inputs 200 --functions 20
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.compile_cache import CompileCache
+from src.frontend.session import FrontEndSession
+
+
+def timed(func, sources):
+    start = time.perf_counter()
+    func(sources)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--inputs", type=int, default=200, help="number of distinct inputs")
+    parser.add_argument("--functions", type=int, default=20, help="functions per input")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    program = generate_program(args.functions)
+    sources = [f"/* input {i} */\n{program}" for i in range(args.inputs)]
+    total = sum(map(len, sources))
+    print(f"Inputs: {len(sources)}, {total / 1e6:.1f} MB in total")
+    print(f"{'Stage':<28} {'no cache':>10} {'cold':>10} {'warm':>10} {'speedup':>9}")
+
+    for backend in ("antlr", "descent"):
+        for stage in ("parse", "build_ast"):
+            with tempfile.TemporaryDirectory() as directory:
+                cache = CompileCache(directory)
+                plain = FrontEndSession("fast", parser_backend=backend)
+                cached = FrontEndSession("fast", parser_backend=backend, cache=cache)
+                run = lambda session: getattr(session, f"{stage}_many")
+                uncached = timed(run(plain), sources)
+                cold = timed(run(cached), sources)
+                warm = timed(run(cached), sources)
+                print(
+                    f"{stage + ' (' + backend + ')':<28} {uncached:>9.2f}s {cold:>9.2f}s "
+                    f"{warm:>9.2f}s {uncached / warm:>8.1f}x"
+                )
+                print(f"  {cache.stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
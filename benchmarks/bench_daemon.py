@@ -0,0 +1,98 @@
+"""
+Compiler daemon benchmark: latency of one small program through a fresh
+interpreter using tests/utils.py, through the daemon client command, per
+request through a connected DaemonClient, and in this process with a warm
+FrontEndSession (the daemon's compile time without its overhead).
+
+Usage:
+    python -m benchmarks.bench_daemon --requests 500 --workers 2
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import generate_program
+from src.frontend.batch import BatchCompiler
+from src.frontend.daemon import execute
+from src.frontend.daemon_client import DaemonClient, wait_for_daemon
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+COLD_SCRIPT = """
+import sys
+from tests.utils import Parser
+print(Parser(open(sys.argv[1]).read()).parse())
+"""
+
+
+def wall_times(command, runs, env):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=PROJECT_ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def describe(times):
+    times = sorted(times)
+    p99 = times[min(len(times) - 1, int(len(times) * 0.99))]
+    return f"median {statistics.median(times) * 1e3:>7.2f} ms  p99 {p99 * 1e3:>7.2f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500, help="timed requests per op")
+    parser.add_argument("--runs", type=int, default=10, help="timed process launches")
+    parser.add_argument("--workers", type=int, default=2, help="daemon worker processes")
+    parser.add_argument("--functions", type=int, default=1, help="functions in the program")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PROJECT_ROOT), str(PROJECT_ROOT / "build")]))
+    source = generate_program(args.functions)
+    with tempfile.TemporaryDirectory() as directory:
+        program = Path(directory, "program.tyc")
+        program.write_text(source, encoding="utf-8")
+        socket_path = Path(directory, "tyc.sock")
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "src.frontend.daemon", "--socket", str(socket_path),
+             "--workers", str(args.workers), "--warmup", str(program)],
+            cwd=PROJECT_ROOT, env=env, stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_for_daemon(socket_path, timeout=60)
+            print(f"{os.cpu_count()} CPUs, {len(source):,} byte program, {args.workers} daemon workers")
+            cold = wall_times([sys.executable, "-c", COLD_SCRIPT, str(program)], args.runs, env)
+            print(f"  fresh interpreter, tests/utils.py  {describe(cold)}")
+            client = wall_times(
+                [sys.executable, "-m", "src.frontend.daemon_client", "--socket", str(socket_path),
+                 "parse", str(program)],
+                args.runs, env,
+            )
+            print(f"  daemon_client command              {describe(client)}")
+            compiler = BatchCompiler(digest=True)
+            compiler.warm_up([source])
+            with DaemonClient(socket_path) as connection:
+                for op in ("tokenize", "parse", "ast", "check"):
+                    for label, call in (
+                        ("DaemonClient", lambda: connection.request(op, source)),
+                        ("in-process  ", lambda: execute(compiler, op, source)),
+                    ):
+                        times = []
+                        for _ in range(args.requests):
+                            start = time.perf_counter()
+                            call()
+                            times.append(time.perf_counter() - start)
+                        print(f"  {label} {op:<22} {describe(times)}")
+                connection.request("stop")
+        finally:
+            daemon.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
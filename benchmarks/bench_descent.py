@@ -0,0 +1,53 @@
+"""
+Parser backend benchmark: TyCParser + ASTGeneration vs DescentParser.
+
+Usage:
+    python -m benchmarks.bench_descent --functions 20
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.session import FrontEndSession
+
+
+def parser_corpus():
+    from tests.utils import collect_check_inputs
+
+    return [source for _, source in collect_check_inputs("test_parser.py")]
+
+
+def measure(parser_backend, lexer_backend, sources, repeat):
+    session = FrontEndSession(lexer_backend, parser_backend=parser_backend)
+    session.build_ast_many(sources)  # warm the DFA
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        session.build_ast_many(sources)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=20,
+                        help="functions in the generated program workload")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes (best is kept)")
+    args = parser.parse_args()
+
+    workloads = {
+        "test_parser.py corpus": parser_corpus(),
+        f"generated program ({args.functions} functions)": [generate_program(args.functions)],
+    }
+    for name, sources in workloads.items():
+        print(f"{name}")
+        for lexer_backend in ("antlr", "fast"):
+            antlr = measure("antlr", lexer_backend, sources, args.repeat)
+            descent = measure("descent", lexer_backend, sources, args.repeat)
+            print(f"  {lexer_backend:<5} lexer  antlr {antlr * 1000:>8.1f} ms"
+                  f"  descent {descent * 1000:>8.1f} ms  ({antlr / descent:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
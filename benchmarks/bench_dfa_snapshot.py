@@ -0,0 +1,96 @@
+"""
+Cold vs warm start benchmark for the persisted prediction DFA.
+
+Every measurement runs in a fresh interpreter. The snapshot is trained on the
+lexer and parser test corpora and written to a temporary file; the cold
+child starts with empty DFAs, the warm child loads the snapshot first. Each
+child parses its workload twice: the second pass shows the steady state.
+
+Usage:
+    python -m benchmarks.bench_dfa_snapshot
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_program
+
+
+def corpus():
+    from tests.utils import collect_check_inputs
+
+    return [
+        source
+        for test_file in ("test_lexer.py", "test_parser.py")
+        for _, source in collect_check_inputs(test_file)
+    ]
+
+
+def run_child(mode, workload, path, functions):
+    from src.frontend import dfa_snapshot
+    from src.frontend.session import FrontEndSession
+
+    if mode == "train":
+        dfa_snapshot.train(corpus())
+        dfa_snapshot.save_dfa_snapshot(path)
+        return
+
+    load = 0.0
+    if mode == "warm":
+        start = time.perf_counter()
+        assert dfa_snapshot.load_dfa_snapshot(path)
+        load = time.perf_counter() - start
+
+    session = FrontEndSession(load_dfa=False)
+    sources = corpus() if workload == "corpus" else [generate_program(functions)]
+    passes = []
+    for _ in range(2):
+        start = time.perf_counter()
+        session.parse_many(sources)
+        passes.append(time.perf_counter() - start)
+    print(json.dumps({"load": load, "first pass": passes[0], "second pass": passes[1]}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=20,
+                        help="functions in the generated program workload")
+    parser.add_argument("--runs", type=int, default=5, help="child processes per mode")
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "WORKLOAD", "PATH"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child, args.functions)
+        return
+
+    def child(mode, workload, path):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_dfa_snapshot",
+             "--functions", str(args.functions), "--child", mode, workload, path],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        return json.loads(output) if output else None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tyc_dfa.snapshot")
+        child("train", "corpus", path)
+        print(f"Snapshot: {os.path.getsize(path) / 1024:.0f} KB, best of {args.runs} runs")
+        print(f"{'workload':<10} {'mode':<5} {'load':>9} {'first pass':>12} {'second pass':>12}")
+        for workload in ("corpus", "program"):
+            for mode in ("cold", "warm"):
+                runs = [child(mode, workload, path) for _ in range(args.runs)]
+                best = {key: min(run[key] for run in runs) * 1000 for key in runs[0]}
+                print(
+                    f"{workload:<10} {mode:<5} {best['load']:>7.1f}ms "
+                    f"{best['first pass']:>10.1f}ms {best['second pass']:>10.1f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Incremental reparsing benchmark: one-character edits in a large generated
+program through IncrementalDocument, compared with a full descent parse.
+
+Usage:
+    python -m benchmarks.bench_incremental --lines 100000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from benchmarks.corpus import FUNCTION_TEMPLATE, generate_program
+from src.frontend.descent import parse_source
+from src.frontend.incremental import IncrementalDocument
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100_000, help="approximate lines of source")
+    parser.add_argument("--edits", type=int, default=200, help="edits timed per kind")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    per_function = FUNCTION_TEMPLATE.count("\n")
+    source = generate_program(max(1, args.lines // per_function))
+    print(f"{source.count(chr(10)):,} lines, {len(source) / 1e6:.1f} MB")
+
+    start = time.perf_counter()
+    parse_source(source, "fast")
+    full = time.perf_counter() - start
+    start = time.perf_counter()
+    document = IncrementalDocument(source, "fast")
+    initial = time.perf_counter() - start
+    print(f"  full parse           {full * 1e3:>9.1f} ms")
+    print(f"  IncrementalDocument  {initial * 1e3:>9.1f} ms (initial parse)")
+
+    # Edits spread over the file: a digit changed in a function body, a
+    # character typed into the comment before a function, and a statement
+    # added; each is undone again right after
+    step = max(1, len(document.spans) // args.edits)
+    edits = [
+        ("change a digit", "total + k * ", "total + k * 7"),
+        ("type in a comment", "/* function", "/* xfunction"),
+        ("insert a statement", "total--;", "total--; total++;"),
+    ]
+    for label, old, new in edits:
+        times, reparsed = [], 0
+        for index in range(1, len(document.spans) - 1, step)[:args.edits]:
+            decl_start, decl_end = document.spans[index]
+            at = document.source.find(old, decl_start - 20, decl_end)
+            if at < 0:
+                continue
+            for before, after in ((old, new), (new, old)):
+                start = time.perf_counter()
+                document.edit(at, at + len(before), after)
+                times.append(time.perf_counter() - start)
+                reparsed += document.reparsed
+        median = statistics.median(times)
+        print(
+            f"  {label:<20} {median * 1e3:>9.2f} ms median, {max(times) * 1e3:.2f} ms max "
+            f"over {len(times)} edits, {reparsed / len(times):.1f} declarations reparsed "
+            f"({full / median:,.0f}x faster than a full parse)"
+        )
+    assert str(document.program) == str(parse_source(source, "fast"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Interning benchmark: type nodes and identifier strings shared by the
+InternTable of a compilation, and identity vs structural type comparison.
+
+Usage:
+    python -m benchmarks.bench_interning --functions 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import parse_source
+from src.utils.nodes import ASTNode, StructType, Type
+
+NAME_FIELDS = ("name", "member", "struct_name")
+
+
+def iter_nodes(root):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        for name in node.__slots__:
+            value = getattr(node, name)
+            if isinstance(value, ASTNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(value)
+
+
+def shared(objects):
+    """``(occurrences, distinct objects, bytes as separate objects, bytes
+    shared)``; CPython already shares one-character strings, so those are
+    counted once either way."""
+    copies = [obj for obj in objects if not (isinstance(obj, str) and len(obj) == 1)]
+    distinct = {id(obj): obj for obj in copies}
+    return (
+        len(objects),
+        len({id(obj) for obj in objects}),
+        sum(map(sys.getsizeof, copies)),
+        sum(map(sys.getsizeof, distinct.values())),
+    )
+
+
+def structural_equal(a, b):
+    """Type equality without interning: same class and, for structs, same name."""
+    return type(a) is type(b) and (type(a) is not StructType or a.struct_name == b.struct_name)
+
+
+def best_of(repeat, func, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000,
+                        help="functions in the generated program")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes (best is kept)")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    program = parse_source(generate_program(args.functions), "fast")
+    all_nodes = list(iter_nodes(program))
+    types = [node for node in all_nodes if isinstance(node, Type)]
+    names = [
+        text for node in all_nodes for field in NAME_FIELDS
+        if isinstance(text := getattr(node, field, None), str)
+    ]
+    print(f"{len(all_nodes):,} node references in the AST")
+    saved_total = 0
+    for label, objects in (("type nodes", types), ("identifier strings", names)):
+        count, distinct, before, after = shared(objects)
+        saved_total += before - after
+        print(
+            f"  {label:<20} {count:>9,} references, {distinct:>6,} objects, "
+            f"{(before - after) / 1e6:.2f} MB saved"
+        )
+    print(f"  {'total':<20} {saved_total / 1e6:.2f} MB saved "
+          f"({saved_total / len(all_nodes):.1f} bytes per node reference)")
+
+    rng = random.Random(0)
+    pairs = [(a, rng.choice(types)) for a in types]
+    identity = best_of(args.repeat, lambda: [a is b for a, b in pairs])
+    structural = best_of(args.repeat, lambda: [structural_equal(a, b) for a, b in pairs])
+    text = best_of(args.repeat, lambda: [str(a) == str(b) for a, b in pairs])
+    assert [a is b for a, b in pairs] == [structural_equal(a, b) for a, b in pairs]
+    print(f"{len(pairs):,} type comparisons")
+    for label, seconds in (("a is b", identity), ("class + struct name", structural),
+                           ("str(a) == str(b)", text)):
+        print(f"  {label:<20} {seconds * 1e3:>8.1f} ms  {seconds / identity:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
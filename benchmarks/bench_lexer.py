@@ -0,0 +1,56 @@
+"""
+Lexer throughput benchmark: generated TyCLexer vs hand-written TyCFastLexer.
+
+Usage:
+    python -m benchmarks.bench_lexer --size-mb 2
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import generate_program_of_size
+from antlr4 import CommonTokenStream, InputStream
+from build.TyCLexer import TyCLexer
+from src.frontend.fast_lexer import TyCFastLexer
+
+
+def count_antlr(source):
+    stream = CommonTokenStream(TyCLexer(InputStream(source)))
+    stream.fill()
+    return len(stream.tokens)
+
+
+def count_fast_stream(source):
+    stream = CommonTokenStream(TyCFastLexer(source))
+    stream.fill()
+    return len(stream.tokens)
+
+
+def count_fast_tokenize(source):
+    return sum(1 for _ in TyCFastLexer(source).tokenize()) + 1
+
+
+def measure(label, func, source):
+    start = time.perf_counter()
+    tokens = func(source)
+    elapsed = time.perf_counter() - start
+    rate = tokens / elapsed
+    print(f"{label:<28} {tokens:>10} tokens {elapsed:>8.3f} s {rate:>12,.0f} tokens/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=2.0, help="input size in MB")
+    args = parser.parse_args()
+
+    source = generate_program_of_size(int(args.size_mb * 1024 * 1024))
+    print(f"Input: {len(source) / (1024 * 1024):.2f} MB")
+    baseline = measure("TyCLexer (ANTLR)", count_antlr, source)
+    stream = measure("TyCFastLexer (token stream)", count_fast_stream, source)
+    fast = measure("TyCFastLexer.tokenize()", count_fast_tokenize, source)
+    print(f"Speedup: {stream / baseline:.1f}x (token stream), {fast / baseline:.1f}x (tokenize)")
+
+
+if __name__ == "__main__":
+    main()
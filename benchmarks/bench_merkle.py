@@ -0,0 +1,68 @@
+"""
+Structural hash benchmark: hashing every subtree of an AST, cached hash
+lookups, subtree comparison by hash vs by ``str``, and indexing duplicates.
+
+Usage:
+    python -m benchmarks.bench_merkle --functions 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import parse_source
+from src.utils.merkle import HashIndex, clear_hashes, iter_subtree, structural_hash
+from src.utils.nodes import BlockStmt
+
+
+def best_of(repeat, func, setup=None):
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000,
+                        help="functions in the generated program")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes (best is kept)")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    program = parse_source(generate_program(args.functions), "fast")
+    subtrees = list(iter_subtree(program))
+    nodes = len(subtrees)
+    print(f"{nodes:,} nodes")
+
+    first = best_of(args.repeat, lambda: structural_hash(program), lambda: clear_hashes(program))
+    cached = best_of(args.repeat, lambda: [structural_hash(node) for node in subtrees])
+    print(f"  hash whole tree      {first * 1e3:>8.1f} ms  {nodes / first / 1e6:.2f} M nodes/s")
+    print(f"  cached, every node   {cached * 1e3:>8.1f} ms  {nodes / cached / 1e6:.2f} M nodes/s")
+
+    rng = random.Random(0)
+    bodies = [node for node in subtrees if isinstance(node, BlockStmt)]
+    pairs = [(a, rng.choice(bodies)) for a in bodies]
+    by_hash = best_of(args.repeat, lambda: [structural_hash(a) == structural_hash(b) for a, b in pairs])
+    by_text = best_of(args.repeat, lambda: [str(a) == str(b) for a, b in pairs])
+    assert [structural_hash(a) == structural_hash(b) for a, b in pairs] == [str(a) == str(b) for a, b in pairs]
+    print(f"{len(pairs):,} block comparisons")
+    print(f"  by hash              {by_hash * 1e3:>8.1f} ms  1x")
+    print(f"  str(a) == str(b)     {by_text * 1e3:>8.1f} ms  {by_text / by_hash:.0f}x")
+
+    indexing = best_of(args.repeat, lambda: HashIndex(program))
+    index = HashIndex(program)
+    duplicates = index.duplicates(BlockStmt)
+    print(f"HashIndex: {indexing * 1e3:.1f} ms for {len(index):,} distinct subtrees, "
+          f"{len(duplicates):,} blocks occurring more than once "
+          f"({sum(map(len, duplicates.values())):,} occurrences)")
+
+
+if __name__ == "__main__":
+    main()
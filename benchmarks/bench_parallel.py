@@ -0,0 +1,101 @@
+"""
+Parallel parsing benchmark: parse_parallel with 1 to N worker processes on
+generated programs of growing size, against a serial descent parse, and
+the time of each step of parse_parallel run in this process. The Program
+parse_parallel returns builds its declarations on first access; the time
+to build them all is reported separately.
+
+Usage:
+    python -m benchmarks.bench_parallel --megabytes 1 10 100 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import PositionedParser, parse_source
+from src.frontend.parallel import (
+    CHUNKS_PER_WORKER,
+    MIN_CHUNK_SIZE,
+    ChunkDecls,
+    chunk_boundaries,
+    parse_parallel,
+)
+from src.utils.flat_ast import flatten
+from src.utils.nodes import Program
+
+BYTES_PER_FUNCTION = len(generate_program(100)) / 100
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def steps(source, workers):
+    """Seconds spent in each step of parse_parallel with ``workers``
+    workers, run one after the other in this process."""
+    chunk_size = max(MIN_CHUNK_SIZE, len(source) // (workers * CHUNKS_PER_WORKER))
+    scan, cuts = timed(lambda: chunk_boundaries(source, chunk_size))
+    bounds = list(zip([0] + cuts, cuts + [len(source)]))
+
+    def parse_chunk(start, end):
+        line = source.count("\n", 0, start) + 1
+        column = start - source.rfind("\n", 0, start) - 1
+        parser = PositionedParser(source[start:end], 0, line, column)
+        return flatten(Program(list(parser.declarations())))
+
+    parse, flats = timed(lambda: [parse_chunk(start, end) for start, end in bounds])
+    transfer, flats = timed(lambda: [pickle.loads(pickle.dumps(flat)) for flat in flats])
+    decls = ChunkDecls()
+    collect, _ = timed(lambda: [decls.add_chunk(flat) for flat in flats])
+    build, _ = timed(lambda: list(decls))
+    return len(bounds), [
+        ("boundary scan", "parent", scan),
+        ("parse + flatten", "workers", parse),
+        ("pickling the FlatASTs", "both", transfer),
+        ("collecting the declarations", "parent", collect),
+        ("building every declaration", "on access", build),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--megabytes", type=float, nargs="+", default=[1, 10],
+                        help="approximate sizes of the generated programs")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+                        help="worker processes to try")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    print(f"{os.cpu_count()} CPUs")
+    for megabytes in args.megabytes:
+        source = generate_program(max(1, int(megabytes * 1e6 / BYTES_PER_FUNCTION)))
+        serial, expected = timed(lambda: parse_source(source, "fast"))
+        expected = str(expected)
+        print(f"{len(source) / 1e6:.1f} MB: serial parse {serial:.2f} s")
+        for workers in args.workers:
+            # the pool is started, and its workers imported, before timing
+            with ProcessPoolExecutor(workers) as executor:
+                list(executor.map(abs, range(workers)))
+                seconds, program = timed(
+                    lambda: parse_parallel(source, workers=workers, executor=executor)
+                )
+            build, _ = timed(lambda: list(program.decls))
+            assert str(program) == expected
+            print(f"  {workers:>3} workers  {seconds:>7.2f} s  {serial / seconds:>5.2f}x"
+                  f"  (+{build:.2f} s to build every declaration)")
+        chunks, parts = steps(source, max(args.workers))
+        print(f"  steps for {chunks} chunks:")
+        for name, where, seconds in parts:
+            print(f"    {name:<32} {where:<9} {seconds:>7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+AST serializer benchmark: dumps() on generated programs and on left-deep
+``a + b + ...`` chains of growing size.
+
+Usage:
+    python -m benchmarks.bench_serializer --functions 2000
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import parse_source
+from src.utils.nodes import BinaryOp, Identifier
+from src.utils.serializer import dumps
+
+
+def chain(length):
+    expr = Identifier("a")
+    for _ in range(length):
+        expr = BinaryOp(expr, "+", Identifier("b"))
+    return expr
+
+
+def measure(node, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = dumps(node)
+        best = min(best, time.perf_counter() - start)
+    return best, len(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000,
+                        help="functions in the generated program workload")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes (best is kept)")
+    args = parser.parse_args()
+
+    workloads = {
+        f"generated program ({args.functions} functions)": parse_source(
+            generate_program(args.functions), "fast"
+        ),
+    }
+    for length in (1_000, 10_000, 100_000):
+        workloads[f"a + b + ... chain ({length:,} operators)"] = chain(length)
+    for name, node in workloads.items():
+        seconds, chars = measure(node, args.repeat)
+        print(f"{name:<42} {seconds * 1000:>8.1f} ms  {chars / seconds / 1e6:>6.1f} M chars/s")
+
+
+if __name__ == "__main__":
+    main()
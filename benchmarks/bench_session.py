@@ -0,0 +1,80 @@
+"""
+Per-input overhead benchmark: fresh wrappers vs a reused FrontEndSession.
+
+Usage:
+    python -m benchmarks.bench_session --inputs 5000
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import generate_program
+from antlr4 import CommonTokenStream, InputStream
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from tests.utils import Tokenizer, Parser
+from src.frontend.session import FrontEndSession
+from src.utils.error_listener import NewErrorListener
+
+SNIPPETS = [
+    "int x;",
+    "void main() { printInt(1); }",
+    "struct P { int x; int y; };",
+    "int f(int a) { if (a > 0) return a; else return -a; }",
+    "void g() { for (auto i = 0; i < 10; i++) { printInt(i); } }",
+]
+
+
+def measure(label, func, sources, repeat=3):
+    """Best of ``repeat`` runs; returns seconds per input."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(sources)
+        best = min(best, time.perf_counter() - start)
+    per_input = best / len(sources)
+    print(f"{label:<40} {per_input * 1e6:>9.1f} us/input")
+    return per_input
+
+
+def fresh_setup(sources):
+    for source in sources:
+        parser = TyCParser(CommonTokenStream(TyCLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+
+
+def compare(label, fresh, reused, sources):
+    before = measure(f"{label} per input", fresh, sources)
+    after = measure(f"FrontEndSession {label}", reused, sources)
+    print(f"  saved {(before - after) * 1e6:.1f} us/input ({before / after:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--inputs", type=int, default=5000, help="number of inputs")
+    args = parser.parse_args()
+
+    sources = (SNIPPETS + [generate_program(1)]) * (args.inputs // (len(SNIPPETS) + 1))
+    print(f"Inputs: {len(sources)}, average {sum(map(len, sources)) / len(sources):.0f} chars")
+
+    session = FrontEndSession("antlr")
+    compare("setup only", fresh_setup, lambda s: [session._pipeline(x) for x in s], sources)
+    for backend in ("antlr", "fast"):
+        session = FrontEndSession(backend)
+        compare(
+            f"tokenize ({backend})",
+            lambda s: [Tokenizer(x, backend).get_tokens_as_string() for x in s],
+            session.tokenize_many,
+            sources,
+        )
+        compare(
+            f"parse ({backend})",
+            lambda s: [Parser(x, backend).parse() for x in s],
+            session.parse_many,
+            sources,
+        )
+
+
+if __name__ == "__main__":
+    main()
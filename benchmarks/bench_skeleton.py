@@ -0,0 +1,69 @@
+"""
+Skeleton parsing benchmark: a full descent parse vs a skeleton parse that
+defers function bodies, for a signature-only task, and the cost of parsing
+every deferred body afterwards.
+
+Usage:
+    python -m benchmarks.bench_skeleton --functions 2000
+"""
+
+import argparse
+import sys
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import parse_source
+from src.frontend.skeleton import parse_skeleton
+from src.utils.nodes import FuncDecl
+
+
+def signatures(program):
+    """The signature-only task: every function's name and parameter types."""
+    return [
+        (decl.name, [str(param.param_type) for param in decl.params])
+        for decl in program.decls if isinstance(decl, FuncDecl)
+    ]
+
+
+def parse_all_bodies(program):
+    for decl in program.decls:
+        if isinstance(decl, FuncDecl):
+            len(decl.body.statements)
+    return program
+
+
+def best_of(repeat, func):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000,
+                        help="functions in the generated program")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes (best is kept)")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    source = generate_program(args.functions)
+    assert signatures(parse_skeleton(source)) == signatures(parse_source(source, "fast"))
+    assert str(parse_all_bodies(parse_skeleton(source))) == str(parse_source(source, "fast"))
+    print(f"{len(source) / 1e6:.1f} MB of source, {args.functions:,} functions")
+
+    full = best_of(args.repeat, lambda: signatures(parse_source(source, "fast")))
+    skeleton = best_of(args.repeat, lambda: signatures(parse_skeleton(source)))
+    forced = best_of(args.repeat, lambda: parse_all_bodies(parse_skeleton(source)))
+    for label, seconds in (
+        ("full parse + signatures", full),
+        ("skeleton + signatures", skeleton),
+        ("skeleton + every body", forced),
+    ):
+        print(f"  {label:<24} {seconds * 1e3:>8.1f} ms  {full / seconds:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Startup benchmark: import time (the sum that ``python -X importtime``
+reports) and wall time of a fresh interpreter that parses one small
+program, through the eagerly importing routes (tests/utils.py,
+FrontEndSession) and through src/frontend/startup.py. Also times
+deserializing the generated ATNs against unpickling them.
+
+Run it once as is and once after ``python3 run.py startup precompile`` to
+see what checked-hash bytecode saves when PYTHONDONTWRITEBYTECODE is set.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 21
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import generate_program
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ROUTES = {
+    "tests/utils.py Parser": (
+        "from tests.utils import Parser; Parser(SOURCE).parse()"
+    ),
+    "FrontEndSession": (
+        "from src.frontend.session import FrontEndSession; FrontEndSession().parse(SOURCE)"
+    ),
+    "descent.parse_source, fast lexer": (
+        "from src.frontend.descent import parse_source; parse_source(SOURCE, 'fast')"
+    ),
+    "startup": (
+        "from src.frontend import startup; startup.parse(SOURCE)"
+    ),
+    "startup, fast lexer + descent": (
+        "from src.frontend import startup; startup.parse(SOURCE, 'fast', 'descent')"
+    ),
+}
+PRELUDE = "import sys; SOURCE = open(sys.argv[1]).read(); "
+
+
+def import_time(stderr: str) -> float:
+    """Total milliseconds of the top-level imports in ``-X importtime`` output."""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # nested imports are indented below their importer
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative)
+    return total / 1e3
+
+
+def launch(code, program, env):
+    """Wall time and import time (ms) of ``python -c code program``."""
+    command = [sys.executable, "-X", "importtime", "-c", code, str(program)]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=PROJECT_ROOT, env=env, check=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return (time.perf_counter() - start) * 1e3, import_time(result.stderr)
+
+
+def measure(routes, program, runs, env):
+    """Median wall time and import time (ms) of each route. The routes take
+    turns, so drift in machine load affects them alike."""
+    for code in routes.values():
+        launch(code, program, env)  # writes bytecode, where Python may
+    samples = {name: [] for name in routes}
+    for _ in range(runs):
+        for name, code in routes.items():
+            samples[name].append(launch(code, program, env))
+    return {
+        name: tuple(statistics.median(column) for column in zip(*launches))
+        for name, launches in samples.items()
+    }
+
+
+def atn_load_times(repeat):
+    """Median milliseconds to deserialize each generated ATN, and to unpickle
+    the deserialized ATN."""
+    import pickle
+
+    from antlr4.atn.ATNDeserializer import ATNDeserializer
+
+    from build import TyCLexer, TyCParser
+
+    def median_ms(func):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1e3)
+        return statistics.median(samples)
+
+    times = {}
+    for module in (TyCLexer, TyCParser):
+        serialized = module.serializedATN()
+        pickled = pickle.dumps(ATNDeserializer().deserialize(serialized), pickle.HIGHEST_PROTOCOL)
+        times[module.__name__, "deserialize"] = median_ms(lambda: ATNDeserializer().deserialize(serialized))
+        times[module.__name__, "unpickle"] = median_ms(lambda: pickle.loads(pickled))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=21, help="timed process launches per route")
+    parser.add_argument("--functions", type=int, default=1, help="functions in the program")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PROJECT_ROOT), str(PROJECT_ROOT / "build")]))
+    with tempfile.TemporaryDirectory() as directory:
+        program = Path(directory, "program.tyc")
+        program.write_text(generate_program(args.functions), encoding="utf-8")
+        bytecode = "off" if env.get("PYTHONDONTWRITEBYTECODE") else "on"
+        print(f"{os.cpu_count()} CPUs, bytecode caching {bytecode}")
+        routes = {"python -c pass": "pass"}
+        routes.update((name, PRELUDE + code) for name, code in ROUTES.items())
+        for name, (wall, imports) in measure(routes, program, args.runs, env).items():
+            print(f"  {name:<32} imports {imports:>6.1f} ms  wall {wall:>6.1f} ms")
+
+    for (module, label), ms in atn_load_times(repeat=50).items():
+        print(f"  {module:<20} {label:<12} {ms:>6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
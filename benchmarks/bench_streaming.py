@@ -0,0 +1,59 @@
+"""
+Streaming benchmark: peak memory and time to serialize every declaration of
+growing programs, from one parsed Program vs one declaration at a time.
+
+Usage:
+    python -m benchmarks.bench_streaming --functions 500 1000 2000 4000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import iter_declarations, parse_source
+from src.utils.serializer import dumps
+
+
+def whole_program(source):
+    return sum(len(dumps(decl)) for decl in parse_source(source, "fast").decls)
+
+
+def streamed(source):
+    return sum(len(dumps(decl)) for decl in iter_declarations(source, "fast"))
+
+
+def measure(func, source):
+    """``(seconds, peak bytes)``; the source itself is not counted."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(source)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, nargs="+", default=[500, 1000, 2000, 4000],
+                        help="functions in each generated program")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    print(f"{'functions':>9} {'source':>8}   {'whole Program':>22}   {'streamed':>22}")
+    for functions in args.functions:
+        source = generate_program(functions)
+        whole_time, whole_peak, whole_size = measure(whole_program, source)
+        stream_time, stream_peak, stream_size = measure(streamed, source)
+        assert whole_size == stream_size
+        print(
+            f"{functions:>9,} {len(source) / 1e6:>6.1f}MB   "
+            f"{whole_peak / 1e6:>7.1f} MB {whole_time:>7.2f} s   "
+            f"{stream_peak / 1e6:>7.2f} MB {stream_time:>7.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
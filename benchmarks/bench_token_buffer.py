@@ -0,0 +1,75 @@
+"""
+Token storage benchmark: CommonTokenStream vs CompactTokenBuffer.
+
+Usage:
+    python -m benchmarks.bench_token_buffer --tokens 2000000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.corpus import generate_program_of_size
+from antlr4 import CommonTokenStream
+from build.TyCParser import TyCParser
+from src.frontend.fast_lexer import TyCFastLexer
+from src.frontend.token_buffer import CompactTokenBuffer, CompactTokenStream
+
+# Average token length of the generated corpus, including whitespace
+BYTES_PER_TOKEN = 4.1
+
+
+def measure_memory(label, build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    tokens = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<28} {len(tokens):>10} tokens {size / 2**20:>9.1f} MB "
+        f"{size / len(tokens):>6.1f} B/token {elapsed:>7.2f} s"
+    )
+    return size
+
+
+def build_common(source):
+    stream = CommonTokenStream(TyCFastLexer(source))
+    stream.fill()
+    return stream.tokens
+
+
+def build_compact(source):
+    return CompactTokenBuffer.from_source(source, "fast").fill()
+
+
+def measure_parse(label, stream):
+    start = time.perf_counter()
+    TyCParser(stream).program()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} parse {elapsed:>7.2f} s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=2_000_000, help="approximate token count")
+    parser.add_argument("--parse-tokens", type=int, default=200_000,
+                        help="approximate token count for the parse timing")
+    args = parser.parse_args()
+
+    source = generate_program_of_size(int(args.tokens * BYTES_PER_TOKEN))
+    common = measure_memory("CommonTokenStream", lambda: build_common(source))
+    compact = measure_memory("CompactTokenBuffer", lambda: build_compact(source))
+    print(f"Memory reduction: {common / compact:.1f}x")
+
+    source = generate_program_of_size(int(args.parse_tokens * BYTES_PER_TOKEN))
+    baseline = measure_parse("CommonTokenStream", CommonTokenStream(TyCFastLexer(source)))
+    compact = measure_parse(
+        "CompactTokenStream", CompactTokenStream(CompactTokenBuffer.from_source(source, "fast"))
+    )
+    print(f"Parse time ratio: {compact / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Parse strategy benchmark: full LL vs two-stage SLL/LL.
+
+Usage:
+    python -m benchmarks.bench_two_stage --functions 20
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.session import FrontEndSession
+
+
+def parser_corpus():
+    from tests.utils import collect_check_inputs
+
+    return [source for _, source in collect_check_inputs("test_parser.py")]
+
+
+def measure(strategy, sources, repeat):
+    session = FrontEndSession(strategy=strategy)
+    session.parse_many(sources)  # warm the DFA
+    session.stats.clear()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        session.parse_many(sources)
+        best = min(best, time.perf_counter() - start)
+    return best, session.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=20,
+                        help="functions in the generated program workload")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes (best is kept)")
+    args = parser.parse_args()
+
+    workloads = {
+        "test_parser.py corpus": parser_corpus(),
+        f"generated program ({args.functions} functions)": [generate_program(args.functions)],
+    }
+    for name, sources in workloads.items():
+        ll, _ = measure("ll", sources, args.repeat)
+        two_stage, stats = measure("two-stage", sources, args.repeat)
+        print(f"{name}")
+        print(f"  ll         {ll * 1000:>9.1f} ms")
+        print(f"  two-stage  {two_stage * 1000:>9.1f} ms  ({ll / two_stage:.2f}x)")
+        print(f"  {stats.summary()}")
+
+
+if __name__ == "__main__":
+    main()
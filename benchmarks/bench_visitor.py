@@ -0,0 +1,198 @@
+"""
+Visitor benchmark: full BaseVisitor traversals through ``node.accept``, through
+the handler table of ``ASTVisitor.visit`` and with the iterative ``walk``, and
+N analyses run as N separate traversals or fused into one by FusedVisitor.
+
+Usage:
+    python -m benchmarks.bench_visitor --functions 2000
+"""
+
+import argparse
+import gc
+import sys
+import time
+
+from benchmarks.corpus import generate_program
+from src.frontend.descent import parse_source
+from src.utils.nodes import IntLiteral, Stmt
+from src.utils.visitor import BaseVisitor, FusedVisitor
+
+
+class AcceptVisitor(BaseVisitor):
+    """BaseVisitor dispatching the way ``visit`` used to: via ``node.accept``."""
+
+    def visit(self, node, o=None):
+        return node.accept(self, o)
+
+
+class CountingAcceptVisitor(AcceptVisitor):
+    """The same hook on every node of the recursive traversal."""
+
+    def __init__(self):
+        self.count = 0
+
+    def visit(self, node, o=None):
+        self.count += 1
+        return node.accept(self, o)
+
+
+class CountingVisitor(BaseVisitor):
+    """``walk`` with a hook on every node."""
+
+    def __init__(self):
+        self.count = 0
+
+    def pre_visit(self, node, o=None):
+        self.count += 1
+
+
+class SymbolCollector(BaseVisitor):
+    """Declared names."""
+
+    def __init__(self):
+        self.names = []
+
+    def visit_struct_decl(self, node, o=None):
+        self.names.append(node.name)
+        super().visit_struct_decl(node, o)
+
+    def visit_func_decl(self, node, o=None):
+        self.names.append(node.name)
+        super().visit_func_decl(node, o)
+
+    def visit_param(self, node, o=None):
+        self.names.append(node.name)
+        super().visit_param(node, o)
+
+    def visit_var_decl(self, node, o=None):
+        self.names.append(node.name)
+        super().visit_var_decl(node, o)
+
+
+class UseCounter(BaseVisitor):
+    """Uses of each identifier."""
+
+    def __init__(self):
+        self.uses = {}
+
+    def visit_identifier(self, node, o=None):
+        self.uses[node.name] = self.uses.get(node.name, 0) + 1
+
+
+class DivisionLint(BaseVisitor):
+    """Divisions and remainders by a literal zero."""
+
+    def __init__(self):
+        self.warnings = 0
+
+    def visit_binary_op(self, node, o=None):
+        if node.operator in ("/", "%") and isinstance(node.right, IntLiteral) and node.right.value == 0:
+            self.warnings += 1
+        super().visit_binary_op(node, o)
+
+
+class CallGraph(BaseVisitor):
+    """Called function names."""
+
+    def __init__(self):
+        self.calls = set()
+
+    def visit_func_call(self, node, o=None):
+        if isinstance(node.name, str):
+            self.calls.add(node.name)
+        super().visit_func_call(node, o)
+
+
+class NestingDepth(BaseVisitor):
+    """Deepest statement nesting, tracked with pre/post hooks."""
+
+    def __init__(self):
+        self.depth = self.deepest = 0
+
+    def pre_visit(self, node, o=None):
+        if isinstance(node, Stmt):
+            self.depth += 1
+            self.deepest = max(self.deepest, self.depth)
+
+    def post_visit(self, node, o=None):
+        if isinstance(node, Stmt):
+            self.depth -= 1
+
+
+ANALYSES = [SymbolCollector, UseCounter, DivisionLint, CallGraph, NestingDepth]
+
+
+def run_separately(visitors, program):
+    for visitor in visitors:
+        if isinstance(visitor, NestingDepth):
+            visitor.walk(program)
+        else:
+            visitor.visit(program)
+
+
+def best_times(repeat, funcs):
+    """Best time of each function over ``repeat`` rounds that run them all in
+    turn (so machine noise hits them alike), with the cyclic GC off."""
+    best = [float("inf")] * len(funcs)
+    for _ in range(repeat):
+        for index, func in enumerate(funcs):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                func()
+                best[index] = min(best[index], time.perf_counter() - start)
+            finally:
+                gc.enable()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--functions", type=int, default=2000,
+                        help="functions in the generated program")
+    parser.add_argument("--repeat", type=int, default=10, help="timed passes (best is kept)")
+    args = parser.parse_args()
+    sys.setrecursionlimit(100_000)
+
+    program = parse_source(generate_program(args.functions), "fast")
+    counter = CountingVisitor()
+    counter.walk(program)
+    nodes = counter.count
+    print(f"{nodes:,} nodes")
+
+    accept_visitor, table_visitor = AcceptVisitor(), BaseVisitor()
+    hooked_visitor, walker = CountingAcceptVisitor(), CountingVisitor()
+    labels = [
+        "visit via node.accept",
+        "visit via handler table",
+        "node.accept, hook in visit",
+        "walk, hook in pre_visit",
+    ]
+    times = best_times(args.repeat, [
+        lambda: accept_visitor.visit(program),
+        lambda: table_visitor.visit(program),
+        lambda: hooked_visitor.visit(program),
+        lambda: walker.walk(program),
+    ])
+    results = list(zip(labels, times))
+    baseline = results[0][1]
+    for label, seconds in results:
+        print(f"  {label:<26} {nodes / seconds / 1e6:>6.2f} M nodes/s  {baseline / seconds:>5.2f}x")
+
+    print("Analyses: separate traversals vs one FusedVisitor walk")
+    for count in range(1, len(ANALYSES) + 1):
+        classes = ANALYSES[:count]
+        separate, fused = best_times(args.repeat, [
+            lambda: run_separately([cls() for cls in classes], program),
+            lambda: FusedVisitor([cls() for cls in classes]).walk(program),
+        ])
+        names = ", ".join(cls.__name__ for cls in classes[-1:])
+        print(
+            f"  {count} (+{names:<15}) separate {separate * 1e3:>7.1f} ms, "
+            f"fused {fused * 1e3:>7.1f} ms  {separate / fused:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Synthetic TyC sources for the benchmarks.
+The generated programs only use constructs covered by the test suites, so
+they lex and parse cleanly with every front-end backend.
+"""
+
+import os
+import sys
+
+# Make the project root and build directory importable when run as a script
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+build_dir = os.path.join(project_root, "build")
+sys.path.insert(0, project_root)
+sys.path.insert(0, build_dir)
+
+STRUCT_TEMPLATE = """struct Point{i} {{
+    int x;
+    float y;
+    string label;
+}};
+
+"""
+
+FUNCTION_TEMPLATE = """/* function {i} */
+int compute{i}(int a, float b, Point{s} p) {{
+    auto total = 0;
+    for (int k = 0; k < a; k++) {{
+        if (k % 2 == 0 && total <= 1000) {{
+            total = total + k * {i};
+        }} else {{
+            total = total - (k + 1) / 2;
+        }}
+    }}
+    while (total > 10 || !a) {{
+        total--;
+        p.x = p.x + 1;
+    }}
+    switch (total) {{
+        case 1:
+        case 2:
+            printString("small \\t value");
+            break;
+        default:
+            printFloat(b * 1.5e2 + .25);
+    }}
+    Point{s} q = {{ a, b, "q" }};
+    return total + compute{s}(a - 1, b, q); // recursion
+}}
+
+"""
+
+
+def generate_program(num_functions: int) -> str:
+    """Return a TyC program with ``num_functions`` functions (~650 bytes each)."""
+    parts = [STRUCT_TEMPLATE.format(i=0)]
+    for i in range(num_functions):
+        parts.append(FUNCTION_TEMPLATE.format(i=i, s=0))
+    return "".join(parts)
+
+
+def generate_program_of_size(num_bytes: int) -> str:
+    """Return a TyC program of roughly ``num_bytes`` characters."""
+    per_function = len(FUNCTION_TEMPLATE.format(i=1000, s=0))
+    return generate_program(max(1, num_bytes // per_function))
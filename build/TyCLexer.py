@@ -0,0 +1,290 @@
+# Generated from src/grammar/TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+from lexererr import *
+
+
+def serializedATN():
+    return [
+        4,0,51,384,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,2,
+        1,2,1,2,1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,
+        1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,7,1,7,1,7,1,7,1,7,1,7,
+        1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,
+        1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,
+        1,12,1,12,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,
+        1,14,1,15,1,15,1,15,1,15,1,15,1,16,4,16,203,8,16,11,16,12,16,204,
+        1,16,1,16,5,16,209,8,16,10,16,12,16,212,9,16,1,16,3,16,215,8,16,
+        1,16,1,16,4,16,219,8,16,11,16,12,16,220,1,16,3,16,224,8,16,1,16,
+        4,16,227,8,16,11,16,12,16,228,1,16,3,16,232,8,16,1,17,1,17,3,17,
+        236,8,17,1,17,4,17,239,8,17,11,17,12,17,240,1,18,1,18,1,18,5,18,
+        246,8,18,10,18,12,18,249,9,18,3,18,251,8,18,1,19,1,19,1,19,5,19,
+        256,8,19,10,19,12,19,259,9,19,1,19,1,19,1,19,1,20,1,20,1,20,5,20,
+        267,8,20,10,20,12,20,270,9,20,1,20,1,20,1,20,1,21,1,21,1,21,5,21,
+        278,8,21,10,21,12,21,281,9,21,1,22,1,22,1,22,1,23,1,23,1,24,1,24,
+        1,25,1,25,1,26,1,26,1,27,1,27,1,28,1,28,1,29,1,29,1,30,1,30,1,30,
+        1,31,1,31,1,31,1,32,1,32,1,32,1,33,1,33,1,33,1,34,1,34,1,34,1,35,
+        1,35,1,35,1,36,1,36,1,36,1,37,1,37,1,37,1,38,1,38,1,39,1,39,1,40,
+        1,40,1,41,1,41,1,42,1,42,1,43,1,43,1,44,1,44,1,45,1,45,1,46,1,46,
+        1,47,1,47,1,48,1,48,5,48,346,8,48,10,48,12,48,349,9,48,1,49,1,49,
+        1,49,1,49,5,49,355,8,49,10,49,12,49,358,9,49,1,49,1,49,1,49,1,49,
+        1,49,1,50,1,50,1,50,1,50,5,50,369,8,50,10,50,12,50,372,9,50,1,50,
+        1,50,1,51,4,51,377,8,51,11,51,12,51,378,1,51,1,51,1,52,1,52,1,356,
+        0,53,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,
+        13,27,14,29,15,31,16,33,17,35,0,37,18,39,19,41,20,43,21,45,0,47,
+        22,49,23,51,24,53,25,55,26,57,27,59,28,61,29,63,30,65,31,67,32,69,
+        33,71,34,73,35,75,36,77,37,79,38,81,39,83,40,85,41,87,42,89,43,91,
+        44,93,45,95,46,97,47,99,48,101,49,103,50,105,51,1,0,10,1,0,48,57,
+        2,0,69,69,101,101,2,0,43,43,45,45,1,0,49,57,4,0,10,10,13,13,34,34,
+        92,92,7,0,34,34,92,92,98,98,102,102,110,110,114,114,116,116,3,0,
+        65,90,95,95,97,122,4,0,48,57,65,90,95,95,97,122,2,0,10,10,13,13,
+        3,0,9,10,12,13,32,32,403,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,
+        1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,
+        1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,
+        1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,37,1,0,0,0,0,39,
+        1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,
+        1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,
+        1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,
+        1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,
+        1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,
+        1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,
+        1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,1,107,1,0,0,0,3,113,1,0,0,0,
+        5,118,1,0,0,0,7,127,1,0,0,0,9,135,1,0,0,0,11,140,1,0,0,0,13,144,
+        1,0,0,0,15,147,1,0,0,0,17,154,1,0,0,0,19,161,1,0,0,0,21,167,1,0,
+        0,0,23,171,1,0,0,0,25,177,1,0,0,0,27,184,1,0,0,0,29,189,1,0,0,0,
+        31,196,1,0,0,0,33,231,1,0,0,0,35,233,1,0,0,0,37,250,1,0,0,0,39,252,
+        1,0,0,0,41,263,1,0,0,0,43,274,1,0,0,0,45,282,1,0,0,0,47,285,1,0,
+        0,0,49,287,1,0,0,0,51,289,1,0,0,0,53,291,1,0,0,0,55,293,1,0,0,0,
+        57,295,1,0,0,0,59,297,1,0,0,0,61,299,1,0,0,0,63,302,1,0,0,0,65,305,
+        1,0,0,0,67,308,1,0,0,0,69,311,1,0,0,0,71,314,1,0,0,0,73,317,1,0,
+        0,0,75,320,1,0,0,0,77,323,1,0,0,0,79,325,1,0,0,0,81,327,1,0,0,0,
+        83,329,1,0,0,0,85,331,1,0,0,0,87,333,1,0,0,0,89,335,1,0,0,0,91,337,
+        1,0,0,0,93,339,1,0,0,0,95,341,1,0,0,0,97,343,1,0,0,0,99,350,1,0,
+        0,0,101,364,1,0,0,0,103,376,1,0,0,0,105,382,1,0,0,0,107,108,5,98,
+        0,0,108,109,5,114,0,0,109,110,5,101,0,0,110,111,5,97,0,0,111,112,
+        5,107,0,0,112,2,1,0,0,0,113,114,5,99,0,0,114,115,5,97,0,0,115,116,
+        5,115,0,0,116,117,5,101,0,0,117,4,1,0,0,0,118,119,5,99,0,0,119,120,
+        5,111,0,0,120,121,5,110,0,0,121,122,5,116,0,0,122,123,5,105,0,0,
+        123,124,5,110,0,0,124,125,5,117,0,0,125,126,5,101,0,0,126,6,1,0,
+        0,0,127,128,5,100,0,0,128,129,5,101,0,0,129,130,5,102,0,0,130,131,
+        5,97,0,0,131,132,5,117,0,0,132,133,5,108,0,0,133,134,5,116,0,0,134,
+        8,1,0,0,0,135,136,5,101,0,0,136,137,5,108,0,0,137,138,5,115,0,0,
+        138,139,5,101,0,0,139,10,1,0,0,0,140,141,5,102,0,0,141,142,5,111,
+        0,0,142,143,5,114,0,0,143,12,1,0,0,0,144,145,5,105,0,0,145,146,5,
+        102,0,0,146,14,1,0,0,0,147,148,5,114,0,0,148,149,5,101,0,0,149,150,
+        5,116,0,0,150,151,5,117,0,0,151,152,5,114,0,0,152,153,5,110,0,0,
+        153,16,1,0,0,0,154,155,5,115,0,0,155,156,5,119,0,0,156,157,5,105,
+        0,0,157,158,5,116,0,0,158,159,5,99,0,0,159,160,5,104,0,0,160,18,
+        1,0,0,0,161,162,5,119,0,0,162,163,5,104,0,0,163,164,5,105,0,0,164,
+        165,5,108,0,0,165,166,5,101,0,0,166,20,1,0,0,0,167,168,5,105,0,0,
+        168,169,5,110,0,0,169,170,5,116,0,0,170,22,1,0,0,0,171,172,5,102,
+        0,0,172,173,5,108,0,0,173,174,5,111,0,0,174,175,5,97,0,0,175,176,
+        5,116,0,0,176,24,1,0,0,0,177,178,5,115,0,0,178,179,5,116,0,0,179,
+        180,5,114,0,0,180,181,5,105,0,0,181,182,5,110,0,0,182,183,5,103,
+        0,0,183,26,1,0,0,0,184,185,5,118,0,0,185,186,5,111,0,0,186,187,5,
+        105,0,0,187,188,5,100,0,0,188,28,1,0,0,0,189,190,5,115,0,0,190,191,
+        5,116,0,0,191,192,5,114,0,0,192,193,5,117,0,0,193,194,5,99,0,0,194,
+        195,5,116,0,0,195,30,1,0,0,0,196,197,5,97,0,0,197,198,5,117,0,0,
+        198,199,5,116,0,0,199,200,5,111,0,0,200,32,1,0,0,0,201,203,7,0,0,
+        0,202,201,1,0,0,0,203,204,1,0,0,0,204,202,1,0,0,0,204,205,1,0,0,
+        0,205,206,1,0,0,0,206,210,5,46,0,0,207,209,7,0,0,0,208,207,1,0,0,
+        0,209,212,1,0,0,0,210,208,1,0,0,0,210,211,1,0,0,0,211,214,1,0,0,
+        0,212,210,1,0,0,0,213,215,3,35,17,0,214,213,1,0,0,0,214,215,1,0,
+        0,0,215,232,1,0,0,0,216,218,5,46,0,0,217,219,7,0,0,0,218,217,1,0,
+        0,0,219,220,1,0,0,0,220,218,1,0,0,0,220,221,1,0,0,0,221,223,1,0,
+        0,0,222,224,3,35,17,0,223,222,1,0,0,0,223,224,1,0,0,0,224,232,1,
+        0,0,0,225,227,7,0,0,0,226,225,1,0,0,0,227,228,1,0,0,0,228,226,1,
+        0,0,0,228,229,1,0,0,0,229,230,1,0,0,0,230,232,3,35,17,0,231,202,
+        1,0,0,0,231,216,1,0,0,0,231,226,1,0,0,0,232,34,1,0,0,0,233,235,7,
+        1,0,0,234,236,7,2,0,0,235,234,1,0,0,0,235,236,1,0,0,0,236,238,1,
+        0,0,0,237,239,7,0,0,0,238,237,1,0,0,0,239,240,1,0,0,0,240,238,1,
+        0,0,0,240,241,1,0,0,0,241,36,1,0,0,0,242,251,5,48,0,0,243,247,7,
+        3,0,0,244,246,7,0,0,0,245,244,1,0,0,0,246,249,1,0,0,0,247,245,1,
+        0,0,0,247,248,1,0,0,0,248,251,1,0,0,0,249,247,1,0,0,0,250,242,1,
+        0,0,0,250,243,1,0,0,0,251,38,1,0,0,0,252,257,5,34,0,0,253,256,3,
+        45,22,0,254,256,8,4,0,0,255,253,1,0,0,0,255,254,1,0,0,0,256,259,
+        1,0,0,0,257,255,1,0,0,0,257,258,1,0,0,0,258,260,1,0,0,0,259,257,
+        1,0,0,0,260,261,5,34,0,0,261,262,6,19,0,0,262,40,1,0,0,0,263,268,
+        5,34,0,0,264,267,3,45,22,0,265,267,8,4,0,0,266,264,1,0,0,0,266,265,
+        1,0,0,0,267,270,1,0,0,0,268,266,1,0,0,0,268,269,1,0,0,0,269,271,
+        1,0,0,0,270,268,1,0,0,0,271,272,5,92,0,0,272,273,8,5,0,0,273,42,
+        1,0,0,0,274,279,5,34,0,0,275,278,3,45,22,0,276,278,8,4,0,0,277,275,
+        1,0,0,0,277,276,1,0,0,0,278,281,1,0,0,0,279,277,1,0,0,0,279,280,
+        1,0,0,0,280,44,1,0,0,0,281,279,1,0,0,0,282,283,5,92,0,0,283,284,
+        7,5,0,0,284,46,1,0,0,0,285,286,5,40,0,0,286,48,1,0,0,0,287,288,5,
+        41,0,0,288,50,1,0,0,0,289,290,5,123,0,0,290,52,1,0,0,0,291,292,5,
+        125,0,0,292,54,1,0,0,0,293,294,5,44,0,0,294,56,1,0,0,0,295,296,5,
+        59,0,0,296,58,1,0,0,0,297,298,5,58,0,0,298,60,1,0,0,0,299,300,5,
+        61,0,0,300,301,5,61,0,0,301,62,1,0,0,0,302,303,5,33,0,0,303,304,
+        5,61,0,0,304,64,1,0,0,0,305,306,5,60,0,0,306,307,5,61,0,0,307,66,
+        1,0,0,0,308,309,5,62,0,0,309,310,5,61,0,0,310,68,1,0,0,0,311,312,
+        5,124,0,0,312,313,5,124,0,0,313,70,1,0,0,0,314,315,5,38,0,0,315,
+        316,5,38,0,0,316,72,1,0,0,0,317,318,5,43,0,0,318,319,5,43,0,0,319,
+        74,1,0,0,0,320,321,5,45,0,0,321,322,5,45,0,0,322,76,1,0,0,0,323,
+        324,5,43,0,0,324,78,1,0,0,0,325,326,5,45,0,0,326,80,1,0,0,0,327,
+        328,5,42,0,0,328,82,1,0,0,0,329,330,5,47,0,0,330,84,1,0,0,0,331,
+        332,5,37,0,0,332,86,1,0,0,0,333,334,5,60,0,0,334,88,1,0,0,0,335,
+        336,5,62,0,0,336,90,1,0,0,0,337,338,5,33,0,0,338,92,1,0,0,0,339,
+        340,5,61,0,0,340,94,1,0,0,0,341,342,5,46,0,0,342,96,1,0,0,0,343,
+        347,7,6,0,0,344,346,7,7,0,0,345,344,1,0,0,0,346,349,1,0,0,0,347,
+        345,1,0,0,0,347,348,1,0,0,0,348,98,1,0,0,0,349,347,1,0,0,0,350,351,
+        5,47,0,0,351,352,5,42,0,0,352,356,1,0,0,0,353,355,9,0,0,0,354,353,
+        1,0,0,0,355,358,1,0,0,0,356,357,1,0,0,0,356,354,1,0,0,0,357,359,
+        1,0,0,0,358,356,1,0,0,0,359,360,5,42,0,0,360,361,5,47,0,0,361,362,
+        1,0,0,0,362,363,6,49,1,0,363,100,1,0,0,0,364,365,5,47,0,0,365,366,
+        5,47,0,0,366,370,1,0,0,0,367,369,8,8,0,0,368,367,1,0,0,0,369,372,
+        1,0,0,0,370,368,1,0,0,0,370,371,1,0,0,0,371,373,1,0,0,0,372,370,
+        1,0,0,0,373,374,6,50,1,0,374,102,1,0,0,0,375,377,7,9,0,0,376,375,
+        1,0,0,0,377,378,1,0,0,0,378,376,1,0,0,0,378,379,1,0,0,0,379,380,
+        1,0,0,0,380,381,6,51,1,0,381,104,1,0,0,0,382,383,9,0,0,0,383,106,
+        1,0,0,0,22,0,204,210,214,220,223,228,231,235,240,247,250,255,257,
+        266,268,277,279,347,356,370,378,2,1,19,0,6,0,0
+    ]
+
+class TyCLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    BREAK = 1
+    CASE = 2
+    CONTINUE = 3
+    DEFAULT = 4
+    ELSE = 5
+    FOR = 6
+    IF = 7
+    RETURN = 8
+    SWITCH = 9
+    WHILE = 10
+    INT = 11
+    FLOAT = 12
+    STRING = 13
+    VOID = 14
+    STRUCT = 15
+    AUTO = 16
+    FLOAT_LIT = 17
+    INT_LIT = 18
+    STRING_LIT = 19
+    ILLEGAL_ESCAPE = 20
+    UNCLOSE_STRING = 21
+    LPAREN = 22
+    RPAREN = 23
+    LBRACE = 24
+    RBRACE = 25
+    COMMA = 26
+    SEMI = 27
+    COLON = 28
+    EQUAL = 29
+    NOTEQUAL = 30
+    LE = 31
+    GE = 32
+    OR = 33
+    AND = 34
+    INC = 35
+    DEC = 36
+    ADD = 37
+    SUB = 38
+    MUL = 39
+    DIV = 40
+    MOD = 41
+    LT = 42
+    GT = 43
+    NOT = 44
+    ASSIGN = 45
+    DOT = 46
+    ID = 47
+    BLOCK_COMMENT = 48
+    LINE_COMMENT = 49
+    WS = 50
+    ERROR_CHAR = 51
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'break'", "'case'", "'continue'", "'default'", "'else'", "'for'", 
+            "'if'", "'return'", "'switch'", "'while'", "'int'", "'float'", 
+            "'string'", "'void'", "'struct'", "'auto'", "'('", "')'", "'{'", 
+            "'}'", "','", "';'", "':'", "'=='", "'!='", "'<='", "'>='", 
+            "'||'", "'&&'", "'++'", "'--'", "'+'", "'-'", "'*'", "'/'", 
+            "'%'", "'<'", "'>'", "'!'", "'='", "'.'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", "FOR", "IF", 
+            "RETURN", "SWITCH", "WHILE", "INT", "FLOAT", "STRING", "VOID", 
+            "STRUCT", "AUTO", "FLOAT_LIT", "INT_LIT", "STRING_LIT", "ILLEGAL_ESCAPE", 
+            "UNCLOSE_STRING", "LPAREN", "RPAREN", "LBRACE", "RBRACE", "COMMA", 
+            "SEMI", "COLON", "EQUAL", "NOTEQUAL", "LE", "GE", "OR", "AND", 
+            "INC", "DEC", "ADD", "SUB", "MUL", "DIV", "MOD", "LT", "GT", 
+            "NOT", "ASSIGN", "DOT", "ID", "BLOCK_COMMENT", "LINE_COMMENT", 
+            "WS", "ERROR_CHAR" ]
+
+    ruleNames = [ "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", "FOR", 
+                  "IF", "RETURN", "SWITCH", "WHILE", "INT", "FLOAT", "STRING", 
+                  "VOID", "STRUCT", "AUTO", "FLOAT_LIT", "EXPONENT", "INT_LIT", 
+                  "STRING_LIT", "ILLEGAL_ESCAPE", "UNCLOSE_STRING", "ESC_SEQ", 
+                  "LPAREN", "RPAREN", "LBRACE", "RBRACE", "COMMA", "SEMI", 
+                  "COLON", "EQUAL", "NOTEQUAL", "LE", "GE", "OR", "AND", 
+                  "INC", "DEC", "ADD", "SUB", "MUL", "DIV", "MOD", "LT", 
+                  "GT", "NOT", "ASSIGN", "DOT", "ID", "BLOCK_COMMENT", "LINE_COMMENT", 
+                  "WS", "ERROR_CHAR" ]
+
+    grammarFileName = "TyC.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    def emit(self): 
+        tk = self.type
+        if tk == self.UNCLOSE_STRING:       
+            result = super().emit();
+            raise UncloseString(result.text);
+        elif tk == self.ILLEGAL_ESCAPE:
+            result = super().emit();
+            raise IllegalEscape(result.text);
+        elif tk == self.ERROR_CHAR:
+            result = super().emit();
+            raise ErrorToken(result.text); 
+        else:
+            return super().emit();
+
+
+    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
+        if self._actions is None:
+            actions = dict()
+            actions[19] = self.STRING_LIT_action 
+            self._actions = actions
+        action = self._actions.get(ruleIndex, None)
+        if action is not None:
+            action(localctx, actionIndex)
+        else:
+            raise Exception("No registered action for:" + str(ruleIndex))
+
+
+    def STRING_LIT_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 0:
+             self.text = self.text[1:-1] 
+     
+
+
@@ -0,0 +1,2321 @@
+# Generated from src/grammar/TyC.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,51,296,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,1,0,1,0,1,0,5,0,52,8,0,10,0,12,
+        0,55,9,0,1,0,1,0,1,1,1,1,1,1,1,1,5,1,63,8,1,10,1,12,1,66,9,1,1,1,
+        1,1,1,1,1,2,1,2,1,2,1,2,1,3,1,3,3,3,77,8,3,1,3,1,3,1,3,3,3,82,8,
+        3,1,3,1,3,1,3,1,4,1,4,1,4,5,4,90,8,4,10,4,12,4,93,9,4,1,5,1,5,1,
+        5,1,6,1,6,5,6,100,8,6,10,6,12,6,103,9,6,1,6,1,6,1,7,1,7,1,7,1,7,
+        1,7,1,7,1,7,1,7,1,7,3,7,116,8,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,
+        1,7,3,7,127,8,7,1,7,1,7,3,7,131,8,7,1,7,1,7,3,7,135,8,7,1,7,1,7,
+        1,7,1,7,1,7,1,7,1,7,1,7,5,7,145,8,7,10,7,12,7,148,9,7,1,7,1,7,1,
+        7,1,7,1,7,1,7,1,7,1,7,3,7,158,8,7,1,7,1,7,1,7,1,7,3,7,164,8,7,1,
+        8,1,8,1,8,1,9,1,9,1,9,1,9,3,9,173,8,9,1,9,1,9,1,9,1,9,3,9,179,8,
+        9,3,9,181,8,9,1,10,1,10,1,10,1,10,5,10,187,8,10,10,10,12,10,190,
+        9,10,3,10,192,8,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,11,4,11,
+        202,8,11,11,11,12,11,203,1,11,5,11,207,8,11,10,11,12,11,210,9,11,
+        1,12,1,12,3,12,214,8,12,1,13,1,13,1,13,1,13,5,13,220,8,13,10,13,
+        12,13,223,9,13,1,14,1,14,1,14,1,14,5,14,229,8,14,10,14,12,14,232,
+        9,14,1,15,1,15,1,15,1,15,1,15,5,15,239,8,15,10,15,12,15,242,9,15,
+        3,15,244,8,15,1,16,1,16,1,16,1,16,1,16,5,16,251,8,16,10,16,12,16,
+        254,9,16,3,16,256,8,16,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,18,5,
+        18,266,8,18,10,18,12,18,269,9,18,3,18,271,8,18,1,18,1,18,1,18,3,
+        18,276,8,18,1,19,1,19,1,20,1,20,3,20,282,8,20,1,21,1,21,1,21,1,21,
+        1,21,1,21,3,21,290,8,21,1,22,1,22,1,23,1,23,1,23,0,0,24,0,2,4,6,
+        8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,46,0,4,2,
+        0,35,38,44,44,3,0,29,34,37,43,45,45,1,0,17,19,2,0,11,13,47,47,318,
+        0,53,1,0,0,0,2,58,1,0,0,0,4,70,1,0,0,0,6,76,1,0,0,0,8,86,1,0,0,0,
+        10,94,1,0,0,0,12,97,1,0,0,0,14,163,1,0,0,0,16,165,1,0,0,0,18,180,
+        1,0,0,0,20,182,1,0,0,0,22,201,1,0,0,0,24,213,1,0,0,0,26,215,1,0,
+        0,0,28,224,1,0,0,0,30,243,1,0,0,0,32,255,1,0,0,0,34,257,1,0,0,0,
+        36,275,1,0,0,0,38,277,1,0,0,0,40,281,1,0,0,0,42,289,1,0,0,0,44,291,
+        1,0,0,0,46,293,1,0,0,0,48,52,3,16,8,0,49,52,3,2,1,0,50,52,3,6,3,
+        0,51,48,1,0,0,0,51,49,1,0,0,0,51,50,1,0,0,0,52,55,1,0,0,0,53,51,
+        1,0,0,0,53,54,1,0,0,0,54,56,1,0,0,0,55,53,1,0,0,0,56,57,5,0,0,1,
+        57,1,1,0,0,0,58,59,5,15,0,0,59,60,5,47,0,0,60,64,5,24,0,0,61,63,
+        3,4,2,0,62,61,1,0,0,0,63,66,1,0,0,0,64,62,1,0,0,0,64,65,1,0,0,0,
+        65,67,1,0,0,0,66,64,1,0,0,0,67,68,5,25,0,0,68,69,5,27,0,0,69,3,1,
+        0,0,0,70,71,3,46,23,0,71,72,5,47,0,0,72,73,5,27,0,0,73,5,1,0,0,0,
+        74,77,3,46,23,0,75,77,5,14,0,0,76,74,1,0,0,0,76,75,1,0,0,0,76,77,
+        1,0,0,0,77,78,1,0,0,0,78,79,5,47,0,0,79,81,5,22,0,0,80,82,3,8,4,
+        0,81,80,1,0,0,0,81,82,1,0,0,0,82,83,1,0,0,0,83,84,5,23,0,0,84,85,
+        3,12,6,0,85,7,1,0,0,0,86,91,3,10,5,0,87,88,5,26,0,0,88,90,3,10,5,
+        0,89,87,1,0,0,0,90,93,1,0,0,0,91,89,1,0,0,0,91,92,1,0,0,0,92,9,1,
+        0,0,0,93,91,1,0,0,0,94,95,3,46,23,0,95,96,5,47,0,0,96,11,1,0,0,0,
+        97,101,5,24,0,0,98,100,3,14,7,0,99,98,1,0,0,0,100,103,1,0,0,0,101,
+        99,1,0,0,0,101,102,1,0,0,0,102,104,1,0,0,0,103,101,1,0,0,0,104,105,
+        5,25,0,0,105,13,1,0,0,0,106,164,3,12,6,0,107,164,3,16,8,0,108,109,
+        5,7,0,0,109,110,5,22,0,0,110,111,3,26,13,0,111,112,5,23,0,0,112,
+        115,3,14,7,0,113,114,5,5,0,0,114,116,3,14,7,0,115,113,1,0,0,0,115,
+        116,1,0,0,0,116,164,1,0,0,0,117,118,5,10,0,0,118,119,5,22,0,0,119,
+        120,3,26,13,0,120,121,5,23,0,0,121,122,3,14,7,0,122,164,1,0,0,0,
+        123,124,5,6,0,0,124,126,5,22,0,0,125,127,3,24,12,0,126,125,1,0,0,
+        0,126,127,1,0,0,0,127,128,1,0,0,0,128,130,5,27,0,0,129,131,3,26,
+        13,0,130,129,1,0,0,0,130,131,1,0,0,0,131,132,1,0,0,0,132,134,5,27,
+        0,0,133,135,3,26,13,0,134,133,1,0,0,0,134,135,1,0,0,0,135,136,1,
+        0,0,0,136,137,5,23,0,0,137,164,3,14,7,0,138,139,5,9,0,0,139,140,
+        5,22,0,0,140,141,3,26,13,0,141,142,5,23,0,0,142,146,5,24,0,0,143,
+        145,3,22,11,0,144,143,1,0,0,0,145,148,1,0,0,0,146,144,1,0,0,0,146,
+        147,1,0,0,0,147,149,1,0,0,0,148,146,1,0,0,0,149,150,5,25,0,0,150,
+        164,1,0,0,0,151,152,5,1,0,0,152,164,5,27,0,0,153,154,5,3,0,0,154,
+        164,5,27,0,0,155,157,5,8,0,0,156,158,3,26,13,0,157,156,1,0,0,0,157,
+        158,1,0,0,0,158,159,1,0,0,0,159,164,5,27,0,0,160,161,3,28,14,0,161,
+        162,5,27,0,0,162,164,1,0,0,0,163,106,1,0,0,0,163,107,1,0,0,0,163,
+        108,1,0,0,0,163,117,1,0,0,0,163,123,1,0,0,0,163,138,1,0,0,0,163,
+        151,1,0,0,0,163,153,1,0,0,0,163,155,1,0,0,0,163,160,1,0,0,0,164,
+        15,1,0,0,0,165,166,3,18,9,0,166,167,5,27,0,0,167,17,1,0,0,0,168,
+        169,3,46,23,0,169,172,5,47,0,0,170,171,5,45,0,0,171,173,3,26,13,
+        0,172,170,1,0,0,0,172,173,1,0,0,0,173,181,1,0,0,0,174,175,5,16,0,
+        0,175,178,5,47,0,0,176,177,5,45,0,0,177,179,3,26,13,0,178,176,1,
+        0,0,0,178,179,1,0,0,0,179,181,1,0,0,0,180,168,1,0,0,0,180,174,1,
+        0,0,0,181,19,1,0,0,0,182,191,5,24,0,0,183,188,3,26,13,0,184,185,
+        5,26,0,0,185,187,3,26,13,0,186,184,1,0,0,0,187,190,1,0,0,0,188,186,
+        1,0,0,0,188,189,1,0,0,0,189,192,1,0,0,0,190,188,1,0,0,0,191,183,
+        1,0,0,0,191,192,1,0,0,0,192,193,1,0,0,0,193,194,5,25,0,0,194,21,
+        1,0,0,0,195,196,5,2,0,0,196,197,3,26,13,0,197,198,5,28,0,0,198,202,
+        1,0,0,0,199,200,5,4,0,0,200,202,5,28,0,0,201,195,1,0,0,0,201,199,
+        1,0,0,0,202,203,1,0,0,0,203,201,1,0,0,0,203,204,1,0,0,0,204,208,
+        1,0,0,0,205,207,3,14,7,0,206,205,1,0,0,0,207,210,1,0,0,0,208,206,
+        1,0,0,0,208,209,1,0,0,0,209,23,1,0,0,0,210,208,1,0,0,0,211,214,3,
+        18,9,0,212,214,3,26,13,0,213,211,1,0,0,0,213,212,1,0,0,0,214,25,
+        1,0,0,0,215,221,3,30,15,0,216,217,3,38,19,0,217,218,3,30,15,0,218,
+        220,1,0,0,0,219,216,1,0,0,0,220,223,1,0,0,0,221,219,1,0,0,0,221,
+        222,1,0,0,0,222,27,1,0,0,0,223,221,1,0,0,0,224,230,3,32,16,0,225,
+        226,3,38,19,0,226,227,3,30,15,0,227,229,1,0,0,0,228,225,1,0,0,0,
+        229,232,1,0,0,0,230,228,1,0,0,0,230,231,1,0,0,0,231,29,1,0,0,0,232,
+        230,1,0,0,0,233,234,3,34,17,0,234,235,3,30,15,0,235,244,1,0,0,0,
+        236,240,3,40,20,0,237,239,3,36,18,0,238,237,1,0,0,0,239,242,1,0,
+        0,0,240,238,1,0,0,0,240,241,1,0,0,0,241,244,1,0,0,0,242,240,1,0,
+        0,0,243,233,1,0,0,0,243,236,1,0,0,0,244,31,1,0,0,0,245,246,3,34,
+        17,0,246,247,3,30,15,0,247,256,1,0,0,0,248,252,3,42,21,0,249,251,
+        3,36,18,0,250,249,1,0,0,0,251,254,1,0,0,0,252,250,1,0,0,0,252,253,
+        1,0,0,0,253,256,1,0,0,0,254,252,1,0,0,0,255,245,1,0,0,0,255,248,
+        1,0,0,0,256,33,1,0,0,0,257,258,7,0,0,0,258,35,1,0,0,0,259,260,5,
+        46,0,0,260,276,5,47,0,0,261,270,5,22,0,0,262,267,3,26,13,0,263,264,
+        5,26,0,0,264,266,3,26,13,0,265,263,1,0,0,0,266,269,1,0,0,0,267,265,
+        1,0,0,0,267,268,1,0,0,0,268,271,1,0,0,0,269,267,1,0,0,0,270,262,
+        1,0,0,0,270,271,1,0,0,0,271,272,1,0,0,0,272,276,5,23,0,0,273,276,
+        5,35,0,0,274,276,5,36,0,0,275,259,1,0,0,0,275,261,1,0,0,0,275,273,
+        1,0,0,0,275,274,1,0,0,0,276,37,1,0,0,0,277,278,7,1,0,0,278,39,1,
+        0,0,0,279,282,3,42,21,0,280,282,3,20,10,0,281,279,1,0,0,0,281,280,
+        1,0,0,0,282,41,1,0,0,0,283,284,5,22,0,0,284,285,3,26,13,0,285,286,
+        5,23,0,0,286,290,1,0,0,0,287,290,3,44,22,0,288,290,5,47,0,0,289,
+        283,1,0,0,0,289,287,1,0,0,0,289,288,1,0,0,0,290,43,1,0,0,0,291,292,
+        7,2,0,0,292,45,1,0,0,0,293,294,7,3,0,0,294,47,1,0,0,0,34,51,53,64,
+        76,81,91,101,115,126,130,134,146,157,163,172,178,180,188,191,201,
+        203,208,213,221,230,240,243,252,255,267,270,275,281,289
+    ]
+
+class TyCParser ( Parser ):
+
+    grammarFileName = "TyC.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "'break'", "'case'", "'continue'", "'default'", 
+                     "'else'", "'for'", "'if'", "'return'", "'switch'", 
+                     "'while'", "'int'", "'float'", "'string'", "'void'", 
+                     "'struct'", "'auto'", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "<INVALID>", "<INVALID>", "'('", "')'", "'{'", "'}'", 
+                     "','", "';'", "':'", "'=='", "'!='", "'<='", "'>='", 
+                     "'||'", "'&&'", "'++'", "'--'", "'+'", "'-'", "'*'", 
+                     "'/'", "'%'", "'<'", "'>'", "'!'", "'='", "'.'" ]
+
+    symbolicNames = [ "<INVALID>", "BREAK", "CASE", "CONTINUE", "DEFAULT", 
+                      "ELSE", "FOR", "IF", "RETURN", "SWITCH", "WHILE", 
+                      "INT", "FLOAT", "STRING", "VOID", "STRUCT", "AUTO", 
+                      "FLOAT_LIT", "INT_LIT", "STRING_LIT", "ILLEGAL_ESCAPE", 
+                      "UNCLOSE_STRING", "LPAREN", "RPAREN", "LBRACE", "RBRACE", 
+                      "COMMA", "SEMI", "COLON", "EQUAL", "NOTEQUAL", "LE", 
+                      "GE", "OR", "AND", "INC", "DEC", "ADD", "SUB", "MUL", 
+                      "DIV", "MOD", "LT", "GT", "NOT", "ASSIGN", "DOT", 
+                      "ID", "BLOCK_COMMENT", "LINE_COMMENT", "WS", "ERROR_CHAR" ]
+
+    RULE_program = 0
+    RULE_structdec = 1
+    RULE_structmem = 2
+    RULE_functiondec = 3
+    RULE_parameterlist = 4
+    RULE_parameter = 5
+    RULE_block = 6
+    RULE_stmt = 7
+    RULE_varDeclStmt = 8
+    RULE_varDecl = 9
+    RULE_structInit = 10
+    RULE_switchCase = 11
+    RULE_forInit = 12
+    RULE_expr = 13
+    RULE_stmtExpr = 14
+    RULE_operand = 15
+    RULE_leadingOperand = 16
+    RULE_prefixOp = 17
+    RULE_postfixOp = 18
+    RULE_binaryOp = 19
+    RULE_primary = 20
+    RULE_atom = 21
+    RULE_literal = 22
+    RULE_type = 23
+
+    ruleNames =  [ "program", "structdec", "structmem", "functiondec", "parameterlist", 
+                   "parameter", "block", "stmt", "varDeclStmt", "varDecl", 
+                   "structInit", "switchCase", "forInit", "expr", "stmtExpr", 
+                   "operand", "leadingOperand", "prefixOp", "postfixOp", 
+                   "binaryOp", "primary", "atom", "literal", "type" ]
+
+    EOF = Token.EOF
+    BREAK=1
+    CASE=2
+    CONTINUE=3
+    DEFAULT=4
+    ELSE=5
+    FOR=6
+    IF=7
+    RETURN=8
+    SWITCH=9
+    WHILE=10
+    INT=11
+    FLOAT=12
+    STRING=13
+    VOID=14
+    STRUCT=15
+    AUTO=16
+    FLOAT_LIT=17
+    INT_LIT=18
+    STRING_LIT=19
+    ILLEGAL_ESCAPE=20
+    UNCLOSE_STRING=21
+    LPAREN=22
+    RPAREN=23
+    LBRACE=24
+    RBRACE=25
+    COMMA=26
+    SEMI=27
+    COLON=28
+    EQUAL=29
+    NOTEQUAL=30
+    LE=31
+    GE=32
+    OR=33
+    AND=34
+    INC=35
+    DEC=36
+    ADD=37
+    SUB=38
+    MUL=39
+    DIV=40
+    MOD=41
+    LT=42
+    GT=43
+    NOT=44
+    ASSIGN=45
+    DOT=46
+    ID=47
+    BLOCK_COMMENT=48
+    LINE_COMMENT=49
+    WS=50
+    ERROR_CHAR=51
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def EOF(self):
+            return self.getToken(TyCParser.EOF, 0)
+
+        def varDeclStmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.VarDeclStmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.VarDeclStmtContext,i)
+
+
+        def structdec(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StructdecContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StructdecContext,i)
+
+
+        def functiondec(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.FunctiondecContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.FunctiondecContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = TyCParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 53
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 140737488484352) != 0):
+                self.state = 51
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,0,self._ctx)
+                if la_ == 1:
+                    self.state = 48
+                    self.varDeclStmt()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 49
+                    self.structdec()
+                    pass
+
+                elif la_ == 3:
+                    self.state = 50
+                    self.functiondec()
+                    pass
+
+
+                self.state = 55
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 56
+            self.match(TyCParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructdecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STRUCT(self):
+            return self.getToken(TyCParser.STRUCT, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def structmem(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StructmemContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StructmemContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structdec
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructdec" ):
+                return visitor.visitStructdec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structdec(self):
+
+        localctx = TyCParser.StructdecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_structdec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 58
+            self.match(TyCParser.STRUCT)
+            self.state = 59
+            self.match(TyCParser.ID)
+            self.state = 60
+            self.match(TyCParser.LBRACE)
+            self.state = 64
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 140737488369664) != 0):
+                self.state = 61
+                self.structmem()
+                self.state = 66
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 67
+            self.match(TyCParser.RBRACE)
+            self.state = 68
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructmemContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structmem
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructmem" ):
+                return visitor.visitStructmem(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structmem(self):
+
+        localctx = TyCParser.StructmemContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_structmem)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 70
+            self.type_()
+            self.state = 71
+            self.match(TyCParser.ID)
+            self.state = 72
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FunctiondecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def VOID(self):
+            return self.getToken(TyCParser.VOID, 0)
+
+        def parameterlist(self):
+            return self.getTypedRuleContext(TyCParser.ParameterlistContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_functiondec
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFunctiondec" ):
+                return visitor.visitFunctiondec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def functiondec(self):
+
+        localctx = TyCParser.FunctiondecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_functiondec)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 76
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            if la_ == 1:
+                self.state = 74
+                self.type_()
+
+            elif la_ == 2:
+                self.state = 75
+                self.match(TyCParser.VOID)
+
+
+            self.state = 78
+            self.match(TyCParser.ID)
+            self.state = 79
+            self.match(TyCParser.LPAREN)
+            self.state = 81
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 140737488369664) != 0):
+                self.state = 80
+                self.parameterlist()
+
+
+            self.state = 83
+            self.match(TyCParser.RPAREN)
+            self.state = 84
+            self.block()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParameterlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def parameter(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ParameterContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ParameterContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_parameterlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParameterlist" ):
+                return visitor.visitParameterlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def parameterlist(self):
+
+        localctx = TyCParser.ParameterlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_parameterlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 86
+            self.parameter()
+            self.state = 91
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==26:
+                self.state = 87
+                self.match(TyCParser.COMMA)
+                self.state = 88
+                self.parameter()
+                self.state = 93
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParameterContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_parameter
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParameter" ):
+                return visitor.visitParameter(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def parameter(self):
+
+        localctx = TyCParser.ParameterContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_parameter)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 94
+            self.type_()
+            self.state = 95
+            self.match(TyCParser.ID)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_block
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlock" ):
+                return visitor.visitBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def block(self):
+
+        localctx = TyCParser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 97
+            self.match(TyCParser.LBRACE)
+            self.state = 101
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 158845092446154) != 0):
+                self.state = 98
+                self.stmt()
+                self.state = 103
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 104
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_stmt
+
+     
+        def copyFrom(self, ctx:ParserRuleContext):
+            super().copyFrom(ctx)
+
+
+
+    class ReturnContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def RETURN(self):
+            return self.getToken(TyCParser.RETURN, 0)
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturn" ):
+                return visitor.visitReturn(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class SwitchContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def SWITCH(self):
+            return self.getToken(TyCParser.SWITCH, 0)
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+        def switchCase(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.SwitchCaseContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.SwitchCaseContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitch" ):
+                return visitor.visitSwitch(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BlockstmtContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def block(self):
+            return self.getTypedRuleContext(TyCParser.BlockContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockstmt" ):
+                return visitor.visitBlockstmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ExprstmtContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def stmtExpr(self):
+            return self.getTypedRuleContext(TyCParser.StmtExprContext,0)
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprstmt" ):
+                return visitor.visitExprstmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class VarDecContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def varDeclStmt(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclStmtContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDec" ):
+                return visitor.visitVarDec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ForContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def FOR(self):
+            return self.getToken(TyCParser.FOR, 0)
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+        def SEMI(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.SEMI)
+            else:
+                return self.getToken(TyCParser.SEMI, i)
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+        def forInit(self):
+            return self.getTypedRuleContext(TyCParser.ForInitContext,0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFor" ):
+                return visitor.visitFor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class BreakContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def BREAK(self):
+            return self.getToken(TyCParser.BREAK, 0)
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBreak" ):
+                return visitor.visitBreak(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class WhileContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def WHILE(self):
+            return self.getToken(TyCParser.WHILE, 0)
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+        def stmt(self):
+            return self.getTypedRuleContext(TyCParser.StmtContext,0)
+
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitWhile" ):
+                return visitor.visitWhile(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class ContinueContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def CONTINUE(self):
+            return self.getToken(TyCParser.CONTINUE, 0)
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitContinue" ):
+                return visitor.visitContinue(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+    class IfContext(StmtContext):
+
+        def __init__(self, parser, ctx:ParserRuleContext): # actually a TyCParser.StmtContext
+            super().__init__(parser)
+            self.copyFrom(ctx)
+
+        def IF(self):
+            return self.getToken(TyCParser.IF, 0)
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+        def ELSE(self):
+            return self.getToken(TyCParser.ELSE, 0)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIf" ):
+                return visitor.visitIf(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def stmt(self):
+
+        localctx = TyCParser.StmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_stmt)
+        self._la = 0 # Token type
+        try:
+            self.state = 163
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,13,self._ctx)
+            if la_ == 1:
+                localctx = TyCParser.BlockstmtContext(self, localctx)
+                self.enterOuterAlt(localctx, 1)
+                self.state = 106
+                self.block()
+                pass
+
+            elif la_ == 2:
+                localctx = TyCParser.VarDecContext(self, localctx)
+                self.enterOuterAlt(localctx, 2)
+                self.state = 107
+                self.varDeclStmt()
+                pass
+
+            elif la_ == 3:
+                localctx = TyCParser.IfContext(self, localctx)
+                self.enterOuterAlt(localctx, 3)
+                self.state = 108
+                self.match(TyCParser.IF)
+                self.state = 109
+                self.match(TyCParser.LPAREN)
+                self.state = 110
+                self.expr()
+                self.state = 111
+                self.match(TyCParser.RPAREN)
+                self.state = 112
+                self.stmt()
+                self.state = 115
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,7,self._ctx)
+                if la_ == 1:
+                    self.state = 113
+                    self.match(TyCParser.ELSE)
+                    self.state = 114
+                    self.stmt()
+
+
+                pass
+
+            elif la_ == 4:
+                localctx = TyCParser.WhileContext(self, localctx)
+                self.enterOuterAlt(localctx, 4)
+                self.state = 117
+                self.match(TyCParser.WHILE)
+                self.state = 118
+                self.match(TyCParser.LPAREN)
+                self.state = 119
+                self.expr()
+                self.state = 120
+                self.match(TyCParser.RPAREN)
+                self.state = 121
+                self.stmt()
+                pass
+
+            elif la_ == 5:
+                localctx = TyCParser.ForContext(self, localctx)
+                self.enterOuterAlt(localctx, 5)
+                self.state = 123
+                self.match(TyCParser.FOR)
+                self.state = 124
+                self.match(TyCParser.LPAREN)
+                self.state = 126
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 158845092444160) != 0):
+                    self.state = 125
+                    self.forInit()
+
+
+                self.state = 128
+                self.match(TyCParser.SEMI)
+                self.state = 130
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 158845092364288) != 0):
+                    self.state = 129
+                    self.expr()
+
+
+                self.state = 132
+                self.match(TyCParser.SEMI)
+                self.state = 134
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 158845092364288) != 0):
+                    self.state = 133
+                    self.expr()
+
+
+                self.state = 136
+                self.match(TyCParser.RPAREN)
+                self.state = 137
+                self.stmt()
+                pass
+
+            elif la_ == 6:
+                localctx = TyCParser.SwitchContext(self, localctx)
+                self.enterOuterAlt(localctx, 6)
+                self.state = 138
+                self.match(TyCParser.SWITCH)
+                self.state = 139
+                self.match(TyCParser.LPAREN)
+                self.state = 140
+                self.expr()
+                self.state = 141
+                self.match(TyCParser.RPAREN)
+                self.state = 142
+                self.match(TyCParser.LBRACE)
+                self.state = 146
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==2 or _la==4:
+                    self.state = 143
+                    self.switchCase()
+                    self.state = 148
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 149
+                self.match(TyCParser.RBRACE)
+                pass
+
+            elif la_ == 7:
+                localctx = TyCParser.BreakContext(self, localctx)
+                self.enterOuterAlt(localctx, 7)
+                self.state = 151
+                self.match(TyCParser.BREAK)
+                self.state = 152
+                self.match(TyCParser.SEMI)
+                pass
+
+            elif la_ == 8:
+                localctx = TyCParser.ContinueContext(self, localctx)
+                self.enterOuterAlt(localctx, 8)
+                self.state = 153
+                self.match(TyCParser.CONTINUE)
+                self.state = 154
+                self.match(TyCParser.SEMI)
+                pass
+
+            elif la_ == 9:
+                localctx = TyCParser.ReturnContext(self, localctx)
+                self.enterOuterAlt(localctx, 9)
+                self.state = 155
+                self.match(TyCParser.RETURN)
+                self.state = 157
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 158845092364288) != 0):
+                    self.state = 156
+                    self.expr()
+
+
+                self.state = 159
+                self.match(TyCParser.SEMI)
+                pass
+
+            elif la_ == 10:
+                localctx = TyCParser.ExprstmtContext(self, localctx)
+                self.enterOuterAlt(localctx, 10)
+                self.state = 160
+                self.stmtExpr()
+                self.state = 161
+                self.match(TyCParser.SEMI)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclStmtContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclContext,0)
+
+
+        def SEMI(self):
+            return self.getToken(TyCParser.SEMI, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_varDeclStmt
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDeclStmt" ):
+                return visitor.visitVarDeclStmt(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDeclStmt(self):
+
+        localctx = TyCParser.VarDeclStmtContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_varDeclStmt)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 165
+            self.varDecl()
+            self.state = 166
+            self.match(TyCParser.SEMI)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarDeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def type_(self):
+            return self.getTypedRuleContext(TyCParser.TypeContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def AUTO(self):
+            return self.getToken(TyCParser.AUTO, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_varDecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarDecl" ):
+                return visitor.visitVarDecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varDecl(self):
+
+        localctx = TyCParser.VarDeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_varDecl)
+        self._la = 0 # Token type
+        try:
+            self.state = 180
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [11, 12, 13, 47]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 168
+                self.type_()
+                self.state = 169
+                self.match(TyCParser.ID)
+                self.state = 172
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==45:
+                    self.state = 170
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 171
+                    self.expr()
+
+
+                pass
+            elif token in [16]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 174
+                self.match(TyCParser.AUTO)
+                self.state = 175
+                self.match(TyCParser.ID)
+                self.state = 178
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==45:
+                    self.state = 176
+                    self.match(TyCParser.ASSIGN)
+                    self.state = 177
+                    self.expr()
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StructInitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(TyCParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(TyCParser.RBRACE, 0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_structInit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStructInit" ):
+                return visitor.visitStructInit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def structInit(self):
+
+        localctx = TyCParser.StructInitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_structInit)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 182
+            self.match(TyCParser.LBRACE)
+            self.state = 191
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 158845092364288) != 0):
+                self.state = 183
+                self.expr()
+                self.state = 188
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==26:
+                    self.state = 184
+                    self.match(TyCParser.COMMA)
+                    self.state = 185
+                    self.expr()
+                    self.state = 190
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 193
+            self.match(TyCParser.RBRACE)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class SwitchCaseContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CASE(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.CASE)
+            else:
+                return self.getToken(TyCParser.CASE, i)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def COLON(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COLON)
+            else:
+                return self.getToken(TyCParser.COLON, i)
+
+        def DEFAULT(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.DEFAULT)
+            else:
+                return self.getToken(TyCParser.DEFAULT, i)
+
+        def stmt(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.StmtContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.StmtContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_switchCase
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSwitchCase" ):
+                return visitor.visitSwitchCase(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def switchCase(self):
+
+        localctx = TyCParser.SwitchCaseContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_switchCase)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 201 
+            self._errHandler.sync(self)
+            _alt = 1
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt == 1:
+                    self.state = 201
+                    self._errHandler.sync(self)
+                    token = self._input.LA(1)
+                    if token in [2]:
+                        self.state = 195
+                        self.match(TyCParser.CASE)
+                        self.state = 196
+                        self.expr()
+                        self.state = 197
+                        self.match(TyCParser.COLON)
+                        pass
+                    elif token in [4]:
+                        self.state = 199
+                        self.match(TyCParser.DEFAULT)
+                        self.state = 200
+                        self.match(TyCParser.COLON)
+                        pass
+                    else:
+                        raise NoViableAltException(self)
+
+
+                else:
+                    raise NoViableAltException(self)
+                self.state = 203 
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,20,self._ctx)
+
+            self.state = 208
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 158845092446154) != 0):
+                self.state = 205
+                self.stmt()
+                self.state = 210
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForInitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varDecl(self):
+            return self.getTypedRuleContext(TyCParser.VarDeclContext,0)
+
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_forInit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForInit" ):
+                return visitor.visitForInit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forInit(self):
+
+        localctx = TyCParser.ForInitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_forInit)
+        try:
+            self.state = 213
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,22,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 211
+                self.varDecl()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 212
+                self.expr()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def operand(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.OperandContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.OperandContext,i)
+
+
+        def binaryOp(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.BinaryOpContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.BinaryOpContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_expr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr" ):
+                return visitor.visitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expr(self):
+
+        localctx = TyCParser.ExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_expr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 215
+            self.operand()
+            self.state = 221
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 52672942047232) != 0):
+                self.state = 216
+                self.binaryOp()
+                self.state = 217
+                self.operand()
+                self.state = 223
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StmtExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def leadingOperand(self):
+            return self.getTypedRuleContext(TyCParser.LeadingOperandContext,0)
+
+
+        def binaryOp(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.BinaryOpContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.BinaryOpContext,i)
+
+
+        def operand(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.OperandContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.OperandContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_stmtExpr
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStmtExpr" ):
+                return visitor.visitStmtExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stmtExpr(self):
+
+        localctx = TyCParser.StmtExprContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_stmtExpr)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 224
+            self.leadingOperand()
+            self.state = 230
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 52672942047232) != 0):
+                self.state = 225
+                self.binaryOp()
+                self.state = 226
+                self.operand()
+                self.state = 232
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OperandContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def prefixOp(self):
+            return self.getTypedRuleContext(TyCParser.PrefixOpContext,0)
+
+
+        def operand(self):
+            return self.getTypedRuleContext(TyCParser.OperandContext,0)
+
+
+        def primary(self):
+            return self.getTypedRuleContext(TyCParser.PrimaryContext,0)
+
+
+        def postfixOp(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.PostfixOpContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.PostfixOpContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_operand
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOperand" ):
+                return visitor.visitOperand(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def operand(self):
+
+        localctx = TyCParser.OperandContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_operand)
+        self._la = 0 # Token type
+        try:
+            self.state = 243
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [35, 36, 37, 38, 44]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 233
+                self.prefixOp()
+                self.state = 234
+                self.operand()
+                pass
+            elif token in [17, 18, 19, 22, 24, 47]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 236
+                self.primary()
+                self.state = 240
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 70471827587072) != 0):
+                    self.state = 237
+                    self.postfixOp()
+                    self.state = 242
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LeadingOperandContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def prefixOp(self):
+            return self.getTypedRuleContext(TyCParser.PrefixOpContext,0)
+
+
+        def operand(self):
+            return self.getTypedRuleContext(TyCParser.OperandContext,0)
+
+
+        def atom(self):
+            return self.getTypedRuleContext(TyCParser.AtomContext,0)
+
+
+        def postfixOp(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.PostfixOpContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.PostfixOpContext,i)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_leadingOperand
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLeadingOperand" ):
+                return visitor.visitLeadingOperand(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def leadingOperand(self):
+
+        localctx = TyCParser.LeadingOperandContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_leadingOperand)
+        self._la = 0 # Token type
+        try:
+            self.state = 255
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [35, 36, 37, 38, 44]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 245
+                self.prefixOp()
+                self.state = 246
+                self.operand()
+                pass
+            elif token in [17, 18, 19, 22, 47]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 248
+                self.atom()
+                self.state = 252
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 70471827587072) != 0):
+                    self.state = 249
+                    self.postfixOp()
+                    self.state = 254
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrefixOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def NOT(self):
+            return self.getToken(TyCParser.NOT, 0)
+
+        def ADD(self):
+            return self.getToken(TyCParser.ADD, 0)
+
+        def SUB(self):
+            return self.getToken(TyCParser.SUB, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_prefixOp
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrefixOp" ):
+                return visitor.visitPrefixOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def prefixOp(self):
+
+        localctx = TyCParser.PrefixOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_prefixOp)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 257
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 18107582119936) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DOT(self):
+            return self.getToken(TyCParser.DOT, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(TyCParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(TyCParser.ExprContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(TyCParser.COMMA)
+            else:
+                return self.getToken(TyCParser.COMMA, i)
+
+        def INC(self):
+            return self.getToken(TyCParser.INC, 0)
+
+        def DEC(self):
+            return self.getToken(TyCParser.DEC, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_postfixOp
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixOp" ):
+                return visitor.visitPostfixOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixOp(self):
+
+        localctx = TyCParser.PostfixOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_postfixOp)
+        self._la = 0 # Token type
+        try:
+            self.state = 275
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [46]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 259
+                self.match(TyCParser.DOT)
+                self.state = 260
+                self.match(TyCParser.ID)
+                pass
+            elif token in [22]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 261
+                self.match(TyCParser.LPAREN)
+                self.state = 270
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 158845092364288) != 0):
+                    self.state = 262
+                    self.expr()
+                    self.state = 267
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+                    while _la==26:
+                        self.state = 263
+                        self.match(TyCParser.COMMA)
+                        self.state = 264
+                        self.expr()
+                        self.state = 269
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+
+
+
+                self.state = 272
+                self.match(TyCParser.RPAREN)
+                pass
+            elif token in [35]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 273
+                self.match(TyCParser.INC)
+                pass
+            elif token in [36]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 274
+                self.match(TyCParser.DEC)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BinaryOpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def MUL(self):
+            return self.getToken(TyCParser.MUL, 0)
+
+        def DIV(self):
+            return self.getToken(TyCParser.DIV, 0)
+
+        def MOD(self):
+            return self.getToken(TyCParser.MOD, 0)
+
+        def ADD(self):
+            return self.getToken(TyCParser.ADD, 0)
+
+        def SUB(self):
+            return self.getToken(TyCParser.SUB, 0)
+
+        def LT(self):
+            return self.getToken(TyCParser.LT, 0)
+
+        def GT(self):
+            return self.getToken(TyCParser.GT, 0)
+
+        def LE(self):
+            return self.getToken(TyCParser.LE, 0)
+
+        def GE(self):
+            return self.getToken(TyCParser.GE, 0)
+
+        def EQUAL(self):
+            return self.getToken(TyCParser.EQUAL, 0)
+
+        def NOTEQUAL(self):
+            return self.getToken(TyCParser.NOTEQUAL, 0)
+
+        def AND(self):
+            return self.getToken(TyCParser.AND, 0)
+
+        def OR(self):
+            return self.getToken(TyCParser.OR, 0)
+
+        def ASSIGN(self):
+            return self.getToken(TyCParser.ASSIGN, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_binaryOp
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBinaryOp" ):
+                return visitor.visitBinaryOp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def binaryOp(self):
+
+        localctx = TyCParser.BinaryOpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_binaryOp)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 277
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 52672942047232) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimaryContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def atom(self):
+            return self.getTypedRuleContext(TyCParser.AtomContext,0)
+
+
+        def structInit(self):
+            return self.getTypedRuleContext(TyCParser.StructInitContext,0)
+
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_primary
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimary" ):
+                return visitor.visitPrimary(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primary(self):
+
+        localctx = TyCParser.PrimaryContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_primary)
+        try:
+            self.state = 281
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [17, 18, 19, 22, 47]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 279
+                self.atom()
+                pass
+            elif token in [24]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 280
+                self.structInit()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AtomContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(TyCParser.LPAREN, 0)
+
+        def expr(self):
+            return self.getTypedRuleContext(TyCParser.ExprContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(TyCParser.RPAREN, 0)
+
+        def literal(self):
+            return self.getTypedRuleContext(TyCParser.LiteralContext,0)
+
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_atom
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAtom" ):
+                return visitor.visitAtom(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def atom(self):
+
+        localctx = TyCParser.AtomContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_atom)
+        try:
+            self.state = 289
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [22]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 283
+                self.match(TyCParser.LPAREN)
+                self.state = 284
+                self.expr()
+                self.state = 285
+                self.match(TyCParser.RPAREN)
+                pass
+            elif token in [17, 18, 19]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 287
+                self.literal()
+                pass
+            elif token in [47]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 288
+                self.match(TyCParser.ID)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LiteralContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT_LIT(self):
+            return self.getToken(TyCParser.INT_LIT, 0)
+
+        def FLOAT_LIT(self):
+            return self.getToken(TyCParser.FLOAT_LIT, 0)
+
+        def STRING_LIT(self):
+            return self.getToken(TyCParser.STRING_LIT, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_literal
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLiteral" ):
+                return visitor.visitLiteral(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def literal(self):
+
+        localctx = TyCParser.LiteralContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_literal)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 291
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 917504) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class TypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(TyCParser.INT, 0)
+
+        def FLOAT(self):
+            return self.getToken(TyCParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(TyCParser.STRING, 0)
+
+        def ID(self):
+            return self.getToken(TyCParser.ID, 0)
+
+        def getRuleIndex(self):
+            return TyCParser.RULE_type
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitType" ):
+                return visitor.visitType(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def type_(self):
+
+        localctx = TyCParser.TypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_type)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 293
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 140737488369664) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+
+
@@ -0,0 +1,178 @@
+# Generated from src/grammar/TyC.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .TyCParser import TyCParser
+else:
+    from TyCParser import TyCParser
+
+# This class defines a complete generic visitor for a parse tree produced by TyCParser.
+
+class TyCVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by TyCParser#program.
+    def visitProgram(self, ctx:TyCParser.ProgramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structdec.
+    def visitStructdec(self, ctx:TyCParser.StructdecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structmem.
+    def visitStructmem(self, ctx:TyCParser.StructmemContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#functiondec.
+    def visitFunctiondec(self, ctx:TyCParser.FunctiondecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#parameterlist.
+    def visitParameterlist(self, ctx:TyCParser.ParameterlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#parameter.
+    def visitParameter(self, ctx:TyCParser.ParameterContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#block.
+    def visitBlock(self, ctx:TyCParser.BlockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#Blockstmt.
+    def visitBlockstmt(self, ctx:TyCParser.BlockstmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#VarDec.
+    def visitVarDec(self, ctx:TyCParser.VarDecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#If.
+    def visitIf(self, ctx:TyCParser.IfContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#While.
+    def visitWhile(self, ctx:TyCParser.WhileContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#For.
+    def visitFor(self, ctx:TyCParser.ForContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#Switch.
+    def visitSwitch(self, ctx:TyCParser.SwitchContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#Break.
+    def visitBreak(self, ctx:TyCParser.BreakContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#Continue.
+    def visitContinue(self, ctx:TyCParser.ContinueContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#Return.
+    def visitReturn(self, ctx:TyCParser.ReturnContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#Exprstmt.
+    def visitExprstmt(self, ctx:TyCParser.ExprstmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#varDeclStmt.
+    def visitVarDeclStmt(self, ctx:TyCParser.VarDeclStmtContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#varDecl.
+    def visitVarDecl(self, ctx:TyCParser.VarDeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#structInit.
+    def visitStructInit(self, ctx:TyCParser.StructInitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#switchCase.
+    def visitSwitchCase(self, ctx:TyCParser.SwitchCaseContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#forInit.
+    def visitForInit(self, ctx:TyCParser.ForInitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#expr.
+    def visitExpr(self, ctx:TyCParser.ExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#stmtExpr.
+    def visitStmtExpr(self, ctx:TyCParser.StmtExprContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#operand.
+    def visitOperand(self, ctx:TyCParser.OperandContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#leadingOperand.
+    def visitLeadingOperand(self, ctx:TyCParser.LeadingOperandContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#prefixOp.
+    def visitPrefixOp(self, ctx:TyCParser.PrefixOpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#postfixOp.
+    def visitPostfixOp(self, ctx:TyCParser.PostfixOpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#binaryOp.
+    def visitBinaryOp(self, ctx:TyCParser.BinaryOpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#primary.
+    def visitPrimary(self, ctx:TyCParser.PrimaryContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#atom.
+    def visitAtom(self, ctx:TyCParser.AtomContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#literal.
+    def visitLiteral(self, ctx:TyCParser.LiteralContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by TyCParser#type.
+    def visitType(self, ctx:TyCParser.TypeContext):
+        return self.visitChildren(ctx)
+
+
+
+del TyCParser
\ No newline at end of file
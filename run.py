@@ -13,6 +13,12 @@ Usage:
     python run.py test-lexer
     python run.py test-parser
     python run.py test-ast
+    python run.py dfa-snapshot
+    python run.py profile-grammar
+    python run.py compile-many PATHS...
+    python run.py daemon --workers 4
+    python run.py daemon-client parse FILES...
+    python run.py startup parse FILES...
     python run.py clean
 
     # On macOS/Linux:
@@ -22,6 +28,12 @@ Usage:
     python3 run.py test-lexer
     python3 run.py test-parser
     python3 run.py test-ast
+    python3 run.py dfa-snapshot
+    python3 run.py profile-grammar
+    python3 run.py compile-many PATHS...
+    python3 run.py daemon --workers 4
+    python3 run.py daemon-client parse FILES...
+    python3 run.py startup parse FILES...
     python3 run.py clean
 """
 
@@ -94,7 +106,7 @@ class TyCBuilder:
             self.venv_python3 = self.venv_dir / "bin" / "python"
             self.venv_pip = self.venv_dir / "bin" / "pip"
 
-    def run_command(self, cmd, cwd=None, check=True, capture_output=False):
+    def run_command(self, cmd, cwd=None, check=True, capture_output=False, env=None):
         """Run a shell command."""
         try:
             if isinstance(cmd, str):
@@ -105,6 +117,7 @@ class TyCBuilder:
                     check=check,
                     capture_output=capture_output,
                     text=True,
+                    env=env,
                 )
             else:
                 result = subprocess.run(
@@ -113,6 +126,7 @@ class TyCBuilder:
                     check=check,
                     capture_output=capture_output,
                     text=True,
+                    env=env,
                 )
             return result
         except subprocess.CalledProcessError as e:
@@ -196,6 +210,38 @@ class TyCBuilder:
             )
         )
         print()
+        print(self.colors.green("Performance:"))
+        print(
+            self.colors.yellow(
+                "  python3 run.py dfa-snapshot - Save a warm prediction DFA to build/"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py profile-grammar [FILES...] - Per-decision parser profile"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py compile-many PATHS... - Compile many sources to JSON lines"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py daemon [--workers N] - Serve compile requests from a warm front end"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py daemon-client OP FILES... - Send tokenize/parse/ast/check requests"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py startup OP FILES... - Tokenize/parse/ast with lazy imports"
+            )
+        )
+        print()
         print(self.colors.green("Cleaning:"))
         print(
             self.colors.yellow(
@@ -346,6 +392,17 @@ class TyCBuilder:
         if lexererr_src.exists():
             shutil.copy2(lexererr_src, lexererr_dst)
 
+        # Checked-hash bytecode is read even where Python may not write any,
+        # see src/frontend/startup.py
+        if self.venv_python3.exists():
+            env = os.environ.copy()
+            env["PYTHONPATH"] = os.pathsep.join([str(self.root_dir), str(self.build_dir)])
+            self.run_command(
+                [str(self.venv_python3), "-m", "src.frontend.startup", "precompile"],
+                env=env,
+                check=False,
+            )
+
         print(self.colors.green("ANTLR grammar files compiled to build/"))
 
     def clean_cache(self):
@@ -493,6 +550,63 @@ class TyCBuilder:
         )
         self.clean_cache()
 
+    def dfa_snapshot(self):
+        """Warm the lexer/parser DFA on the test corpora and save it to build/."""
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        print(self.colors.yellow("Training prediction DFA snapshot..."))
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join([str(self.root_dir), str(self.build_dir)])
+        self.run_command(
+            [str(self.venv_python3), "-m", "src.frontend.dfa_snapshot"], env=env
+        )
+
+    def profile_grammar(self, extra_args=()):
+        """Profile every parser decision over a corpus (text and JSON report)."""
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        print(self.colors.yellow("Profiling parser decisions..."))
+        self.report_dir.mkdir(exist_ok=True)
+        json_path = self.report_dir / "grammar_profile.json"
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join([str(self.root_dir), str(self.build_dir)])
+        self.run_command(
+            [
+                str(self.venv_python3),
+                "-m",
+                "src.frontend.profiling",
+                "--json",
+                str(json_path),
+            ]
+            + list(extra_args),
+            env=env,
+        )
+
+    def run_module(self, module, extra_args=()):
+        """Run ``python -m module`` with the project and build/ importable."""
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join([str(self.root_dir), str(self.build_dir)])
+        result = self.run_command(
+            [str(self.venv_python3), "-m", module] + list(extra_args),
+            env=env,
+            check=False,
+        )
+        sys.exit(result.returncode)
+
 
 def main():
     """Main entry point."""
@@ -517,11 +631,21 @@ def main():
             "test-lexer",
             "test-parser",
             "test-ast",
+            "dfa-snapshot",
+            "profile-grammar",
+            "compile-many",
+            "daemon",
+            "daemon-client",
+            "startup",
         ],
         help="Command to execute",
     )
 
-    args = parser.parse_args()
+    # Anything after the command is passed on to the commands that take arguments
+    args, extra_args = parser.parse_known_args()
+    passes_args = ("profile-grammar", "compile-many", "daemon", "daemon-client", "startup")
+    if extra_args and args.command not in passes_args:
+        parser.error(f"unrecognized arguments: {' '.join(extra_args)}")
 
     builder = TyCBuilder()
 
@@ -537,6 +661,12 @@ def main():
         "test-lexer": builder.test_lexer,
         "test-parser": builder.test_parser,
         "test-ast": builder.test_ast,
+        "dfa-snapshot": builder.dfa_snapshot,
+        "profile-grammar": lambda: builder.profile_grammar(extra_args),
+        "compile-many": lambda: builder.run_module("src.frontend.batch", extra_args),
+        "daemon": lambda: builder.run_module("src.frontend.daemon", extra_args),
+        "daemon-client": lambda: builder.run_module("src.frontend.daemon_client", extra_args),
+        "startup": lambda: builder.run_module("src.frontend.startup", extra_args),
     }
 
     if args.command in commands:
@@ -9,8 +9,218 @@ from build.TyCVisitor import TyCVisitor
 from build.TyCParser import TyCParser
 from src.utils.nodes import *
 
+# Binary operator precedence, higher binds tighter
+BINARY_PRECEDENCE = {
+    "*": 7, "/": 7, "%": 7,
+    "+": 6, "-": 6,
+    "<": 5, ">": 5, "<=": 5, ">=": 5,
+    "==": 4, "!=": 4,
+    "&&": 3,
+    "||": 2,
+    "=": 1,
+}
 
 class ASTGeneration(TyCVisitor):
-    """AST Generation visitor for TyC language."""
+    """AST Generation visitor for TyC language.
 
-    pass
+    Identifier names and struct types are shared through ``interner``, an
+    InternTable that each visited program starts afresh.
+    """
+
+    def __init__(self):
+        self.interner = InternTable()
+
+    def _name(self, ctx) -> str:
+        return self.interner.name(ctx.ID().getText())
+
+    # Program and declarations
+
+    def visitProgram(self, ctx: TyCParser.ProgramContext):
+        self.interner = InternTable()
+        return Program([self.visit(child) for child in ctx.getChildren()
+                        if not hasattr(child, "symbol")])
+
+    def visitStructdec(self, ctx: TyCParser.StructdecContext):
+        return StructDecl(self._name(ctx), [self.visit(m) for m in ctx.structmem()])
+
+    def visitStructmem(self, ctx: TyCParser.StructmemContext):
+        return MemberDecl(self.visit(ctx.type_()), self._name(ctx))
+
+    def visitFunctiondec(self, ctx: TyCParser.FunctiondecContext):
+        if ctx.type_():
+            return_type = self.visit(ctx.type_())
+        elif ctx.VOID():
+            return_type = VoidType()
+        else:
+            return_type = None  # inferred
+        params = self.visit(ctx.parameterlist()) if ctx.parameterlist() else []
+        return FuncDecl(return_type, self._name(ctx), params, self.visit(ctx.block()))
+
+    def visitParameterlist(self, ctx: TyCParser.ParameterlistContext):
+        return [self.visit(p) for p in ctx.parameter()]
+
+    def visitParameter(self, ctx: TyCParser.ParameterContext):
+        return Param(self.visit(ctx.type_()), self._name(ctx))
+
+    def visitType(self, ctx: TyCParser.TypeContext):
+        if ctx.INT():
+            return IntType()
+        if ctx.FLOAT():
+            return FloatType()
+        if ctx.STRING():
+            return StringType()
+        return self.interner.struct_type(ctx.ID().getText())
+
+    # Statements
+
+    def visitBlock(self, ctx: TyCParser.BlockContext):
+        return BlockStmt([self.visit(s) for s in ctx.stmt()])
+
+    def visitBlockstmt(self, ctx: TyCParser.BlockstmtContext):
+        return self.visit(ctx.block())
+
+    def visitVarDec(self, ctx: TyCParser.VarDecContext):
+        return self.visit(ctx.varDeclStmt())
+
+    def visitVarDeclStmt(self, ctx: TyCParser.VarDeclStmtContext):
+        return self.visit(ctx.varDecl())
+
+    def visitVarDecl(self, ctx: TyCParser.VarDeclContext):
+        var_type = self.visit(ctx.type_()) if ctx.type_() else None  # None is auto
+        init = self.visit(ctx.expr()) if ctx.expr() else None
+        return VarDecl(var_type, self._name(ctx), init)
+
+    def visitStructInit(self, ctx: TyCParser.StructInitContext):
+        return StructLiteral([self.visit(e) for e in ctx.expr()])
+
+    def visitIf(self, ctx: TyCParser.IfContext):
+        stmts = ctx.stmt()
+        else_stmt = self.visit(stmts[1]) if len(stmts) > 1 else None
+        return IfStmt(self.visit(ctx.expr()), self.visit(stmts[0]), else_stmt)
+
+    def visitWhile(self, ctx: TyCParser.WhileContext):
+        return WhileStmt(self.visit(ctx.expr()), self.visit(ctx.stmt()))
+
+    def visitFor(self, ctx: TyCParser.ForContext):
+        init = self.visit(ctx.forInit()) if ctx.forInit() else None
+        # forInit? SEMI expr? SEMI expr? RPAREN: tell the optional
+        # expressions apart by the separator each one follows
+        condition = update = None
+        semis = 0
+        for child in ctx.getChildren():
+            if hasattr(child, "symbol"):
+                semis += child.symbol.type == TyCParser.SEMI
+            elif isinstance(child, TyCParser.ExprContext):
+                if semis == 1:
+                    condition = self.visit(child)
+                else:
+                    update = self.visit(child)
+        return ForStmt(init, condition, update, self.visit(ctx.stmt()))
+
+    def visitForInit(self, ctx: TyCParser.ForInitContext):
+        if ctx.varDecl():
+            return self.visit(ctx.varDecl())
+        return expr_stmt(self.visit(ctx.expr()))
+
+    def visitSwitch(self, ctx: TyCParser.SwitchContext):
+        cases = []
+        default_case = None
+        for switch_case in ctx.switchCase():
+            for label in self.visit(switch_case):
+                if isinstance(label, DefaultStmt):
+                    default_case = label
+                else:
+                    cases.append(label)
+        return SwitchStmt(self.visit(ctx.expr()), cases, default_case)
+
+    def visitSwitchCase(self, ctx: TyCParser.SwitchCaseContext):
+        """Return one CaseStmt/DefaultStmt per label; the statements belong
+        to the last label, the ones before it fall through with none."""
+        labels = []
+        exprs = iter(ctx.expr())
+        for child in ctx.getChildren():
+            if not hasattr(child, "symbol"):
+                continue
+            if child.symbol.type == TyCParser.CASE:
+                labels.append(CaseStmt(self.visit(next(exprs)), []))
+            elif child.symbol.type == TyCParser.DEFAULT:
+                labels.append(DefaultStmt([]))
+        labels[-1].statements = [self.visit(s) for s in ctx.stmt()]
+        return labels
+
+    def visitBreak(self, ctx: TyCParser.BreakContext):
+        return BreakStmt()
+
+    def visitContinue(self, ctx: TyCParser.ContinueContext):
+        return ContinueStmt()
+
+    def visitReturn(self, ctx: TyCParser.ReturnContext):
+        return ReturnStmt(self.visit(ctx.expr()) if ctx.expr() else None)
+
+    def visitExprstmt(self, ctx: TyCParser.ExprstmtContext):
+        return expr_stmt(self.visit(ctx.stmtExpr()))
+
+    # Expressions
+
+    def visitExpr(self, ctx: TyCParser.ExprContext):
+        """Build the operand/operator sequence by precedence climbing:
+        operators of higher precedence bind first, equal ones group to
+        the left except '=', which groups to the right."""
+        children = list(ctx.getChildren())
+        operands = [self.visit(child) for child in children[0::2]]
+        operators = [child.getText() for child in children[1::2]]
+        output, pending = operands[:1], []
+
+        def apply():
+            operator = pending.pop()
+            right = output.pop()
+            left = output.pop()
+            if operator == "=":
+                output.append(AssignExpr(left, right))
+            else:
+                output.append(BinaryOp(left, operator, right))
+
+        for operator, operand in zip(operators, operands[1:]):
+            precedence = BINARY_PRECEDENCE[operator]
+            while pending and (BINARY_PRECEDENCE[pending[-1]] > precedence or (
+                    BINARY_PRECEDENCE[pending[-1]] == precedence and operator != "=")):
+                apply()
+            pending.append(operator)
+            output.append(operand)
+        while pending:
+            apply()
+        return output[0]
+
+    visitStmtExpr = visitExpr
+
+    def visitOperand(self, ctx: TyCParser.OperandContext):
+        if ctx.prefixOp():
+            return PrefixOp(ctx.prefixOp().getText(), self.visit(ctx.operand()))
+        return reduce(self._postfix, ctx.postfixOp(), self.visit(ctx.getChild(0)))
+
+    visitLeadingOperand = visitOperand
+
+    def _postfix(self, operand, ctx: TyCParser.PostfixOpContext):
+        if ctx.ID():
+            return MemberAccess(operand, self._name(ctx))
+        if ctx.LPAREN():
+            return FuncCall(call_name(operand), [self.visit(e) for e in ctx.expr()])
+        return PostfixOp(ctx.getText(), operand)
+
+    def visitPrimary(self, ctx: TyCParser.PrimaryContext):
+        return self.visit(ctx.getChild(0))
+
+    def visitAtom(self, ctx: TyCParser.AtomContext):
+        if ctx.expr():
+            return self.visit(ctx.expr())
+        if ctx.literal():
+            return self.visit(ctx.literal())
+        return Identifier(self._name(ctx))
+
+    def visitLiteral(self, ctx: TyCParser.LiteralContext):
+        text = ctx.getText()
+        if ctx.INT_LIT():
+            return IntLiteral(int(text))
+        if ctx.FLOAT_LIT():
+            return FloatLiteral(float(text))
+        return StringLiteral(text)
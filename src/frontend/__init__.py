@@ -0,0 +1,3 @@
+"""
+Front-end components for TyC compiler
+"""
@@ -0,0 +1,84 @@
+"""
+Backend selection for the TyC front end.
+This module decides which lexer implementation feeds the parser, and which
+parser turns tokens into the AST: the generated TyCParser followed by
+ASTGeneration, or the hand-written DescentParser. The defaults can be
+overridden with the TYC_LEXER and TYC_PARSER environment variables, e.g.
+``TYC_LEXER=fast TYC_PARSER=descent python -m pytest``.
+"""
+
+import os
+
+LEXER_BACKENDS = ("antlr", "fast")
+DEFAULT_LEXER_BACKEND = os.environ.get("TYC_LEXER", "antlr")
+
+PARSER_BACKENDS = ("antlr", "descent")
+DEFAULT_PARSER_BACKEND = os.environ.get("TYC_PARSER", "antlr")
+
+
+def resolve_lexer_backend(backend=None):
+    """Return a validated lexer backend name, falling back to the default."""
+    backend = backend or DEFAULT_LEXER_BACKEND
+    if backend not in LEXER_BACKENDS:
+        raise ValueError(
+            f"Unknown lexer backend '{backend}', expected one of {LEXER_BACKENDS}"
+        )
+    return backend
+
+
+def resolve_parser_backend(backend=None):
+    """Return a validated parser backend name, falling back to the default."""
+    backend = backend or DEFAULT_PARSER_BACKEND
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend '{backend}', expected one of {PARSER_BACKENDS}"
+        )
+    return backend
+
+
+def create_lexer(source, backend=None):
+    """Create a token source for ``source`` using the selected backend.
+
+    ``source`` is either the program text or an already constructed
+    CharStream such as ByteCharStream.
+    """
+    backend = resolve_lexer_backend(backend)
+    if backend == "fast":
+        from src.frontend.fast_lexer import TyCFastLexer
+
+        return TyCFastLexer(source)
+
+    from antlr4 import InputStream
+    from build.TyCLexer import TyCLexer
+
+    if isinstance(source, str):
+        source = InputStream(source)
+    return TyCLexer(source)
+
+
+def create_lexer_for_file(path, backend=None):
+    """Create a token source reading the ASCII source file at ``path``.
+
+    The file is memory-mapped through ByteCharStream, so neither lexer
+    holds a decoded copy of the whole file: the generated lexer reads it one
+    character at a time, TyCFastLexer matches its bytes in place.
+    """
+    from src.frontend.char_stream import ByteCharStream
+
+    return create_lexer(ByteCharStream.from_path(path), backend)
+
+
+def create_token_stream(source, backend=None, compact=False):
+    """Create the token stream TyCParser reads ``source`` from.
+
+    With ``compact=True`` tokens are kept in a CompactTokenBuffer and only
+    materialized as token objects when the parser consumes them.
+    """
+    if compact:
+        from src.frontend.token_buffer import CompactTokenBuffer, CompactTokenStream
+
+        return CompactTokenStream(CompactTokenBuffer.from_source(source, backend))
+
+    from antlr4 import CommonTokenStream
+
+    return CommonTokenStream(create_lexer(source, backend))
@@ -0,0 +1,340 @@
+"""
+Batch compilation for TyC.
+compile_many runs many source files through the front end (lexing, parsing
+and AST construction) in a pool of worker processes and yields one result
+record per file. The pool is forked from a process that has already
+imported the generated lexer and parser, loaded the DFA snapshot and
+parsed a few warm-up inputs. Every worker therefore starts from that
+process's warm prediction DFA and shares its memory copy-on-write instead
+of rebuilding it.
+
+``python3 run.py compile-many`` writes the records as JSON lines::
+
+    python3 run.py compile-many programs/ --workers 8 --digest > results.jsonl
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+from lexererr import LexerError
+from src.frontend.descent import DescentParser
+from src.frontend.session import FrontEndSession
+from src.utils.errors import SyntaxException
+from src.utils.merkle import hex_hash
+
+SOURCE_SUFFIX = ".tyc"
+# Files per worker that are read, parsed or waiting in the pool at once
+IN_FLIGHT_PER_WORKER = 4
+
+
+def collect_files(paths: Iterable) -> List[Path]:
+    """The source files named by ``paths``.
+
+    A directory stands for every ``.tyc`` file below it (sorted), a ``.tyc``
+    file for itself, and any other file is a manifest listing one path per
+    line, relative to the manifest's directory; blank lines and lines
+    starting with ``#`` are skipped.
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob(f"*{SOURCE_SUFFIX}")))
+        elif path.suffix == SOURCE_SUFFIX:
+            files.append(path)
+        else:
+            for line in path.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    files.append(path.parent / line)
+    return files
+
+
+class BatchCompiler:
+    """Compile one source at a time into a result record.
+
+    A record is a dict with the file ``path``, a ``status`` of ``"ok"``,
+    ``"read_error"``, ``"lexer_error"``, ``"syntax_error"``, ``"ast_error"``
+    or ``"internal_error"``, the error ``message`` (None when ok), per-stage
+    ``timings`` in milliseconds and, with ``digest``, the ``hex_hash`` of the
+    AST. With the ANTLR parser the stages are ``read``, ``lex``, ``parse``
+    and ``ast``; DescentParser builds the AST while it parses, so it reports
+    ``read`` and ``parse`` only.
+
+    ``"internal_error"`` is a failure of the compiler rather than of the
+    source: running out of stack or memory, an exception other than a lexer
+    or syntax error before the AST stage, or a worker process that died.
+    """
+
+    def __init__(self, lexer_backend: str = None, parser_backend: str = None,
+                 digest: bool = False):
+        self.session = FrontEndSession(lexer_backend, parser_backend=parser_backend)
+        self.digest = digest
+        self._ast_generator = None
+
+    @property
+    def options(self) -> tuple:
+        session = self.session
+        return session.lexer_backend, session.parser_backend, self.digest
+
+    def warm_up(self, sources: Iterable[str]) -> None:
+        """Build the lexer/parser pipeline, then compile ``sources`` to fill
+        the prediction DFA."""
+        if self.session.parser_backend != "descent":
+            self.session._pipeline("")
+            self._ast_generation()
+        for source in sources:
+            self.compile_source(source)
+
+    def compile_path(self, path) -> dict:
+        path = str(path)
+        start = time.perf_counter()
+        try:
+            source = Path(path).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            return self._record(path, "read_error", str(e), {}, None)
+        timings = {"read": time.perf_counter() - start}
+        return self._compile(path, source, timings)
+
+    def compile_source(self, source: str, path: str = None) -> dict:
+        return self._compile(path, source, {})
+
+    def _compile(self, path, source, timings):
+        stage = "lex"
+        start = time.perf_counter()
+
+        def lap(name):
+            nonlocal start
+            now = time.perf_counter()
+            timings[name] = now - start
+            start = now
+
+        session = self.session
+        try:
+            if session.parser_backend == "descent":
+                stage = "parse"
+                ast = DescentParser(source, session.lexer_backend).parse()
+                lap("parse")
+            else:
+                pipeline = session._pipeline(source)
+                if not session.compact_tokens:
+                    pipeline.token_stream.fill()
+                lap("lex")
+                stage = "parse"
+                tree = session._parse_tree(source, pipeline.parser)
+                lap("parse")
+                stage = "ast"
+                ast = self._ast_generation().visit(tree)
+                lap("ast")
+        except LexerError as e:
+            return self._record(path, "lexer_error", str(e), timings, None)
+        except SyntaxException as e:
+            return self._record(path, "syntax_error", str(e), timings, None)
+        except (RecursionError, MemoryError) as e:
+            return self._record(path, "internal_error", str(e), timings, None)
+        except Exception as e:
+            status = "ast_error" if stage == "ast" else "internal_error"
+            return self._record(path, status, str(e), timings, None)
+        digest = hex_hash(ast) if self.digest else None
+        return self._record(path, "ok", None, timings, digest)
+
+    def _ast_generation(self):
+        if self._ast_generator is None:
+            from src.astgen.ast_generation import ASTGeneration
+
+            self._ast_generator = ASTGeneration()
+        return self._ast_generator
+
+    @staticmethod
+    def _record(path, status, message, timings, digest) -> dict:
+        return {
+            "path": path,
+            "status": status,
+            "message": message,
+            "timings": {stage: round(seconds * 1e3, 3) for stage, seconds in timings.items()},
+            "digest": digest,
+        }
+
+
+# The compiler of this process; a forked worker inherits the parent's
+_compiler = None
+
+
+def _init_worker(options: tuple, warmup: tuple) -> None:
+    global _compiler
+    if _compiler is None or _compiler.options != options:
+        # not forked from a warm parent (spawn start method)
+        _compiler = BatchCompiler(*options)
+        _compiler.warm_up(warmup)
+
+
+def _compile_path(path) -> dict:
+    return _compiler.compile_path(path)
+
+
+def _fork_context():
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def pool_compiler() -> BatchCompiler:
+    """The BatchCompiler of a start_pool worker process."""
+    return _compiler
+
+
+def start_pool(compiler: BatchCompiler, workers: int, warmup: tuple = (),
+               mp_context=None) -> ProcessPoolExecutor:
+    """Start ``workers`` processes forked from this one, where
+    ``pool_compiler()`` is ``compiler`` (already warmed up on ``warmup``).
+
+    The processes are started before this returns. With another
+    ``mp_context`` than fork, each worker builds and warms up its own
+    compiler. End the pool with stop_pool.
+    """
+    global _compiler
+    _compiler = compiler
+    # objects that exist now are left alone by the collector, so the forked
+    # workers do not write to (and copy) the pages holding the warm DFA
+    gc.freeze()
+    executor = ProcessPoolExecutor(
+        workers, mp_context=mp_context or _fork_context(),
+        initializer=_init_worker, initargs=(compiler.options, warmup),
+    )
+    for future in [executor.submit(os.getpid) for _ in range(workers)]:
+        future.result()
+    return executor
+
+
+def stop_pool(executor: ProcessPoolExecutor) -> None:
+    global _compiler
+    executor.shutdown(cancel_futures=True)
+    gc.unfreeze()
+    _compiler = None
+
+
+def compile_many(paths: Iterable, workers: int = None, ordered: bool = False,
+                 digest: bool = False, lexer_backend: str = None,
+                 parser_backend: str = None, warmup: Iterable[str] = (),
+                 mp_context=None) -> Iterator[dict]:
+    """Compile every file in ``paths`` and yield its BatchCompiler record.
+
+    Records come in completion order, or in the order of ``paths`` with
+    ``ordered``. The ``warmup`` sources are compiled in this process before
+    the ``workers`` processes (all CPUs by default) are forked from it, see
+    start_pool. With ``workers=1`` the files are compiled in this process.
+
+    If a worker dies, every file then in the pool gets an
+    ``"internal_error"`` record and a new pool compiles the rest.
+    """
+    paths = list(paths)
+    warmup = tuple(warmup)
+    compiler = BatchCompiler(lexer_backend, parser_backend, digest)
+    compiler.warm_up(warmup)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for path in paths:
+            yield compiler.compile_path(path)
+        return
+
+    executor = start_pool(compiler, workers, warmup, mp_context)
+
+    def restart():
+        nonlocal executor
+        stop_pool(executor)
+        executor = start_pool(compiler, workers, warmup, mp_context)
+        return executor
+
+    try:
+        yield from _stream(executor, paths, workers * IN_FLIGHT_PER_WORKER, ordered, restart)
+    finally:
+        stop_pool(executor)
+
+
+def _stream(executor, paths, limit, ordered, restart):
+    """Yield the records of ``paths`` with at most ``limit`` files submitted
+    and not yet yielded (held back ``ordered`` records included).
+
+    When the pool breaks, ``restart()`` returns the executor to go on with.
+    """
+    pending = {}  # future -> index
+    done = {}  # index -> record, held back until its turn when ordered
+    submitted = next_index = 0
+    while next_index < len(paths):
+        while submitted < len(paths) and len(pending) + len(done) < limit:
+            pending[executor.submit(_compile_path, paths[submitted])] = submitted
+            submitted += 1
+        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+        if any(isinstance(future.exception(), BrokenProcessPool) for future in finished):
+            # Every file in the pool fails with it; which one killed the
+            # worker is not known
+            finished = wait(pending).done
+            executor = restart()
+        for future in finished:
+            index = pending.pop(future)
+            try:
+                record = future.result()
+            except BrokenProcessPool as e:
+                record = BatchCompiler._record(str(paths[index]), "internal_error", str(e), {}, None)
+            if ordered:
+                done[index] = record
+            else:
+                next_index += 1
+                yield record
+        while next_index in done:
+            yield done.pop(next_index)
+            next_index += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile many TyC sources to JSON lines")
+    parser.add_argument("paths", nargs="+", help="directories, .tyc files or manifests")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--ordered", action="store_true", help="write records in input order")
+    parser.add_argument("--digest", action="store_true", help="add the structural hash of each AST")
+    parser.add_argument("--warmup", type=int, default=16, metavar="N",
+                        help="compile the first N inputs before forking the workers")
+    parser.add_argument("--lexer", choices=["antlr", "fast"], default=None)
+    parser.add_argument("--parser", choices=["antlr", "descent"], default=None)
+    parser.add_argument("--output", metavar="PATH", help="write the JSON lines here instead of stdout")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.paths)
+    warmup = []
+    for path in files[:args.warmup]:
+        try:
+            warmup.append(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            pass
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    statuses = Counter()
+    start = time.perf_counter()
+    try:
+        for record in compile_many(
+            files, args.workers, args.ordered, args.digest, args.lexer, args.parser, warmup
+        ):
+            statuses[record["status"]] += 1
+            output.write(json.dumps(record) + "\n")
+    finally:
+        if args.output:
+            output.close()
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(statuses.items()))
+    print(
+        f"Compiled {len(files)} files in {time.perf_counter() - start:.2f} s ({summary or 'none'})",
+        file=sys.stderr,
+    )
+    return 0 if statuses["ok"] == len(files) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
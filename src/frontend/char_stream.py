@@ -0,0 +1,125 @@
+"""
+Byte-oriented character stream for TyC sources.
+The TyC character set is ASCII, so a source file can be lexed straight from
+its bytes: one byte is one character and byte offsets are character
+offsets. ByteCharStream implements the CharStream protocol used by the
+generated TyCLexer on top of bytes, memoryview or mmap, instead of the
+Python list of code points that antlr4.InputStream builds.
+"""
+
+import mmap
+import os
+
+from antlr4.Token import Token
+
+
+class ByteCharStream:
+    """CharStream over an ASCII byte buffer.
+
+    ``LA`` returns byte values, which are the ASCII code points. Bytes outside
+    ASCII are not valid TyC; they are exposed as Latin-1 characters so that
+    the lexer reports them through ErrorToken like any other bad character.
+    """
+
+    __slots__ = ("name", "_data", "_index", "_size", "_mmap", "_file")
+
+    def __init__(self, data, name: str = "<bytes>"):
+        self.name = name
+        self._data = memoryview(data).cast("B")
+        self._index = 0
+        self._size = len(self._data)
+        self._mmap = None
+        self._file = None
+
+    @classmethod
+    def from_path(cls, path) -> "ByteCharStream":
+        """Memory-map the file at ``path``; the file is never decoded as a whole."""
+        f = open(path, "rb")
+        try:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                # mmap refuses empty files
+                f.close()
+                return cls(b"", name=str(path))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            f.close()
+            raise
+        stream = cls(mapped, name=str(path))
+        stream._mmap = mapped
+        stream._file = f
+        return stream
+
+    def close(self):
+        """Release the memory map (if any). The stream is unusable afterwards."""
+        self._data.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def buffer(self) -> memoryview:
+        """The source bytes, for scanners that match them in place."""
+        return self._data
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def sourceName(self):
+        return self.name
+
+    def reset(self):
+        self._index = 0
+
+    def consume(self):
+        if self._index >= self._size:
+            raise Exception("cannot consume EOF")
+        self._index += 1
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0  # undefined
+        if offset < 0:
+            offset += 1  # e.g., translate LA(-1) to use offset=0
+        pos = self._index + offset - 1
+        if pos < 0 or pos >= self._size:
+            return Token.EOF
+        return self._data[pos]
+
+    def LT(self, offset: int):
+        return self.LA(offset)
+
+    def mark(self):
+        return -1
+
+    def release(self, marker: int):
+        pass
+
+    def seek(self, _index: int):
+        if _index <= self._index:
+            self._index = _index
+            return
+        self._index = min(_index, self._size)
+
+    def getText(self, start: int, stop: int):
+        if stop >= self._size:
+            stop = self._size - 1
+        if start >= self._size:
+            return ""
+        return self._data[start : stop + 1].tobytes().decode("latin-1")
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
@@ -0,0 +1,266 @@
+"""
+Content-addressed on-disk cache for front-end results.
+Token streams, parse results and ASTs are stored under a key that hashes the
+source text together with a fingerprint of everything that determines the
+result: TyC.g4, the generated recognizers, the ANTLR runtime version and the
+lexer, parser and AST generation code. Editing any of them changes every key,
+so stale entries are never returned; they simply age out. Sessions add their
+lexer and parser backends to the key, as the backends may differ in results.
+
+Entries are written atomically (temporary file plus ``os.replace``), so any
+number of processes may share a cache directory. Hits refresh the entry's
+modification time, and when the directory grows past its size limits the
+least recently used entries are deleted.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+
+from src.utils import binary_ast
+from src.utils.flat_ast import unflatten
+from src.utils.nodes import ASTNode
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_DIR = Path(os.environ.get("TYC_CACHE_DIR", PROJECT_ROOT / "build" / "cache"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Sources whose contents decide the front end's output
+FINGERPRINT_FILES = (
+    "src/grammar/TyC.g4",
+    "src/grammar/lexererr.py",
+    "src/utils/error_listener.py",
+    "src/utils/nodes.py",
+    "src/astgen/ast_generation.py",
+    "src/utils/flat_ast.py",
+    "src/utils/serializer.py",
+    "src/utils/binary_ast.py",
+    "src/frontend/fast_lexer.py",
+    "src/frontend/descent.py",
+    "src/frontend/session.py",
+    "src/frontend/strategy.py",
+    "src/frontend/token_buffer.py",
+    "src/frontend/backends.py",
+)
+
+# Eviction trims the cache to this fraction of its limits
+LOW_WATER = 0.9
+
+# Entry payload tags
+_BINARY_AST = b"A"
+_PICKLE = b"P"
+_TMP_SUFFIX = ".tmp"
+
+_MISSING = object()
+
+
+def front_end_fingerprint() -> str:
+    """Hash of the grammar, generated ATNs, ANTLR version and front-end code."""
+    from src.frontend.dfa_snapshot import antlr_runtime_version, lexer_module, parser_module
+
+    digest = hashlib.sha256()
+    for name in FINGERPRINT_FILES:
+        digest.update(name.encode())
+        try:
+            digest.update((PROJECT_ROOT / name).read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+    digest.update(repr(lexer_module.serializedATN()).encode())
+    digest.update(repr(parser_module.serializedATN()).encode())
+    digest.update(antlr_runtime_version().encode())
+    digest.update(f"binary-ast-{binary_ast.FORMAT_VERSION}".encode())
+    digest.update(binary_ast.SCHEMA_HASH)
+    return digest.hexdigest()
+
+
+class CacheStats:
+    """Hit, miss, write and eviction counters of one CompileCache."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    def summary(self) -> str:
+        rate = self.hits / self.lookups if self.lookups else 0.0
+        return (
+            f"{self.lookups} lookups, {self.hits} hits ({rate:.1%}), "
+            f"{self.misses} misses, {self.writes} writes, {self.evictions} evictions"
+        )
+
+
+class CompileCache:
+    """Directory of cached front-end results, keyed by source content.
+
+    ``get(kind, source)`` returns the value stored by ``put(kind, source,
+    value)`` for the same ``kind`` (``"tokens"``, ``"parse"`` or ``"ast"``)
+    and source text, or ``default``; both take the ``backends`` that produced
+    the value, such as a session's ``(lexer_backend, parser_backend)``. ASTs are stored in the binary AST format
+    and other values are pickled. The directory is kept under ``max_bytes``
+    and, if given, ``max_entries`` by evicting the least recently used
+    entries.
+    """
+
+    def __init__(
+        self,
+        directory=None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = None,
+        fingerprint: str = None,
+    ):
+        self.directory = Path(directory or DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.fingerprint = fingerprint or front_end_fingerprint()
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        # Running totals since the last scan; other processes also write, so
+        # eviction rescans the directory before deleting anything
+        self._bytes = None
+        self._entries = None
+
+    def key(self, kind: str, source: str, backends: tuple = ()) -> str:
+        digest = hashlib.sha256(self.fingerprint.encode())
+        digest.update(b"\0" + kind.encode() + b"\0")
+        digest.update(",".join(backends).encode() + b"\0")
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / key[2:]
+
+    def get(self, kind: str, source: str, default=None, backends: tuple = ()):
+        path = self.path(self.key(kind, source, backends))
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            value = self._decode(data)
+        except FileNotFoundError:
+            self._count("misses")
+            return default
+        except Exception:
+            # Corrupt or unreadable entry: drop it and recompute
+            self._remove(path)
+            self._count("misses")
+            return default
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return value
+
+    def put(self, kind: str, source: str, value, backends: tuple = ()) -> None:
+        data = self._encode(value)
+        path = self.path(self.key(kind, source, backends))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=_TMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        with self._lock:
+            self.stats.writes += 1
+            if self._bytes is None:
+                self._scan()
+            else:
+                self._bytes += len(data)
+                self._entries += 1
+            if self._over_limit(self._bytes, self._entries):
+                self._evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache is under its
+        limits (with some headroom); returns the number deleted."""
+        with self._lock:
+            return self._evict()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def _evict(self) -> int:
+        entries = self._scan()
+        if not self._over_limit(self._bytes, self._entries):
+            return 0
+        entries.sort(key=lambda entry: entry[0])
+        max_bytes = self.max_bytes * LOW_WATER
+        max_entries = None if self.max_entries is None else self.max_entries * LOW_WATER
+        evicted = 0
+        for _, size, path in entries:
+            if self._bytes <= max_bytes and (max_entries is None or self._entries <= max_entries):
+                break
+            if self._remove(path):
+                evicted += 1
+            self._bytes -= size
+            self._entries -= 1
+        self.stats.evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            for _, _, path in self._scan():
+                self._remove(path)
+            self._bytes = self._entries = 0
+
+    def _over_limit(self, total_bytes: int, entries: int) -> bool:
+        return total_bytes > self.max_bytes or (
+            self.max_entries is not None and entries > self.max_entries
+        )
+
+    def _scan(self) -> list:
+        """List ``(mtime, size, path)`` of every entry and reset the totals."""
+        entries = []
+        if self.directory.is_dir():
+            for shard in os.scandir(self.directory):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.name.endswith(_TMP_SUFFIX):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, Path(entry.path)))
+        self._bytes = sum(size for _, size, _ in entries)
+        self._entries = len(entries)
+        return entries
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _encode(value) -> bytes:
+        if isinstance(value, ASTNode):
+            return _BINARY_AST + binary_ast.encode(value)
+        return _PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode(data: bytes):
+        tag, payload = data[:1], memoryview(data)[1:]
+        if tag == _BINARY_AST:
+            return unflatten(binary_ast.loads(payload))
+        if tag == _PICKLE:
+            return pickle.loads(payload)
+        raise ValueError("unknown cache entry")
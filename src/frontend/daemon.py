@@ -0,0 +1,275 @@
+"""
+Compiler daemon for TyC.
+A fresh process pays for Python startup, importing the generated lexer and
+parser (which deserializes their ATNs) and warming the prediction DFA
+before it handles its first source. CompilerDaemon pays that once: it keeps
+a warm front end and a pool of worker processes forked from it (see
+``batch.start_pool``), and serves requests over a Unix domain socket;
+``daemon_client.py`` is the client side.
+
+Every message, in both directions, is a 4-byte big-endian length followed
+by that many bytes of UTF-8 JSON. A request is an object with an ``op``, a
+``source`` for the compiling ops, and an optional ``id`` that is echoed in
+the response:
+
+- ``tokenize``: the token string of ``Tokenizer``
+- ``parse``: ``"success"`` or the error message, as ``Parser`` returns them
+- ``ast``: ``str()`` of the AST, or the ``ASTGenerator`` error message
+- ``check``: the ``BatchCompiler`` record (status, message, timings, digest)
+- ``ping``, ``stop``: answered by the daemon itself
+
+A response is ``{"id": ..., "ok": true, "result": ...}``, or ``"ok": false``
+with an ``error`` message and its ``error_type`` (a LexerError raised by
+``tokenize``, a malformed request, or a failure of the daemon itself such
+as a worker process that died; the daemon then replaces its pool of
+workers). A client may send several requests
+without waiting; responses come back as they complete. At most
+MAX_PENDING_PER_WORKER requests per worker are in flight at once, over all
+connections. Beyond that the daemon stops reading requests until one
+finishes, so fast clients are slowed down by their sockets instead of
+queueing work without bound.
+
+Usage:
+    python3 run.py daemon --workers 4 &
+    python3 run.py daemon-client parse program.tyc
+    python3 run.py daemon-client stop
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from lexererr import LexerError
+from src.frontend.daemon_client import (
+    COMPILE_OPS,
+    DEFAULT_SOCKET_PATH,
+    HEADER,
+    MAX_MESSAGE_SIZE,
+    DaemonClient,
+    ProtocolError,
+    decode_message,
+    encode_message,
+)
+
+# Requests in flight at once, per worker process
+MAX_PENDING_PER_WORKER = 4
+
+
+async def read_message(reader: asyncio.StreamReader):
+    """The next message from ``reader``, or None at the end of the stream."""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if e.partial:
+            raise ProtocolError("truncated message header") from None
+        return None
+    (size,) = HEADER.unpack(header)
+    if size > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"message of {size} bytes exceeds {MAX_MESSAGE_SIZE}")
+    try:
+        return decode_message(await reader.readexactly(size))
+    except asyncio.IncompleteReadError:
+        raise ProtocolError("truncated message") from None
+
+
+def execute(compiler, op: str, source: str) -> dict:
+    """The ``ok``/``result`` or ``error`` part of the response to ``op``,
+    from the BatchCompiler ``compiler``."""
+    session = compiler.session
+    if op == "tokenize":
+        try:
+            return {"ok": True, "result": session.tokenize(source)}
+        except LexerError as e:
+            return {"ok": False, "error": str(e), "error_type": type(e).__name__}
+    if op == "parse":
+        return {"ok": True, "result": session.parse(source)}
+    if op == "ast":
+        return {"ok": True, "result": str(session.build_ast(source))}
+    return {"ok": True, "result": compiler.compile_source(source)}
+
+
+def _execute_in_worker(op: str, source: str) -> dict:
+    from src.frontend.batch import pool_compiler
+
+    return execute(pool_compiler(), op, source)
+
+
+class CompilerDaemon:
+    """Serve compile requests on the Unix socket ``path``.
+
+    The front end is built and warmed up on the ``warmup`` sources before
+    ``workers`` processes (all CPUs by default) are forked to do the
+    compiling. ``run()`` serves until a ``stop`` request or ``stop()``.
+    """
+
+    def __init__(self, path=DEFAULT_SOCKET_PATH, workers: int = None,
+                 lexer_backend: str = None, parser_backend: str = None,
+                 digest: bool = True, warmup=()):
+        self.path = Path(path)
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = self.workers * MAX_PENDING_PER_WORKER
+        self.options = (lexer_backend, parser_backend, digest)
+        self.warmup = tuple(warmup)
+        self.requests = 0
+        self._compiler = None
+        self._pool = None
+        self._slots = None
+        self._stopped = None
+        self._clients = {}  # connection handler task -> (reader, writer)
+
+    def run(self) -> None:
+        asyncio.run(self.serve())
+
+    async def serve(self) -> None:
+        # the client side of this module does not need the front end
+        from src.frontend.batch import BatchCompiler, start_pool, stop_pool
+
+        self._compiler = BatchCompiler(*self.options)
+        self._compiler.warm_up(self.warmup)
+        self._pool = start_pool(self._compiler, self.workers, self.warmup)
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._stopped = asyncio.Event()
+        self._remove_stale_socket()
+        server = await asyncio.start_unix_server(self._handle_client, path=str(self.path))
+        try:
+            async with server:
+                await self._stopped.wait()
+            # requests already read are answered; then each handler sees the
+            # end of its stream
+            for reader, writer in self._clients.values():
+                writer.transport.pause_reading()
+                reader.feed_eof()
+            await asyncio.gather(*self._clients, return_exceptions=True)
+        finally:
+            stop_pool(self._pool)
+            self._pool = None
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def stop(self) -> None:
+        if self._stopped is not None:
+            self._stopped.set()
+
+    def _remove_stale_socket(self):
+        if not self.path.exists():
+            return
+        try:
+            with DaemonClient(self.path, timeout=1.0) as client:
+                client.request("ping")
+        except OSError:
+            self.path.unlink()  # left behind by a daemon that died
+            return
+        raise RuntimeError(f"a daemon is already serving {self.path}")
+
+    async def _handle_client(self, reader, writer):
+        handler = asyncio.current_task()
+        self._clients[handler] = reader, writer
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    message = await read_message(reader)
+                except ProtocolError as e:
+                    await self._send(writer, write_lock, {
+                        "id": None, "ok": False, "error": str(e), "error_type": "ProtocolError",
+                    })
+                    break
+                if message is None:
+                    break
+                # backpressure: the next request is not read until a slot
+                # is free for this one
+                await self._slots.acquire()
+                task = asyncio.create_task(self._respond(message, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.wait(tasks)
+        except ConnectionError:
+            pass
+        finally:
+            del self._clients[handler]
+            writer.close()
+
+    def _restart_pool(self):
+        from src.frontend.batch import start_pool, stop_pool
+
+        stop_pool(self._pool)
+        self._pool = start_pool(self._compiler, self.workers, self.warmup)
+
+    async def _respond(self, message, writer, write_lock):
+        try:
+            try:
+                response = await self._dispatch(message)
+            except Exception as e:
+                # answered, so that the client does not wait forever
+                response = {"ok": False, "error": str(e), "error_type": type(e).__name__}
+            response["id"] = message.get("id")
+            await self._send(writer, write_lock, response)
+        except ConnectionError:
+            pass
+        finally:
+            self._slots.release()
+            if message.get("op") == "stop":
+                self.stop()
+
+    async def _dispatch(self, message: dict) -> dict:
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, "result": {"pid": os.getpid(), "requests": self.requests}}
+        if op == "stop":
+            return {"ok": True, "result": "stopping"}
+        if op not in COMPILE_OPS:
+            return {"ok": False, "error": f"unknown op {op!r}", "error_type": "ProtocolError"}
+        source = message.get("source")
+        if not isinstance(source, str):
+            return {"ok": False, "error": "'source' must be a string", "error_type": "ProtocolError"}
+        self.requests += 1
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+        try:
+            future = loop.run_in_executor(pool, _execute_in_worker, op, source)
+        except BrokenProcessPool:
+            # a worker died while this request was not in the pool
+            if self._pool is pool:
+                self._restart_pool()
+            future = loop.run_in_executor(self._pool, _execute_in_worker, op, source)
+        try:
+            return await future
+        except BrokenProcessPool:
+            # every request in the pool fails with it, and the first of them
+            # starts a new pool for the requests to come
+            if self._pool is pool:
+                self._restart_pool()
+            raise
+
+    @staticmethod
+    async def _send(writer, write_lock, response):
+        async with write_lock:
+            writer.write(encode_message(response))
+            await writer.drain()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the TyC compiler daemon")
+    parser.add_argument("--socket", default=str(DEFAULT_SOCKET_PATH), help="Unix socket path")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--lexer", choices=["antlr", "fast"], default=None)
+    parser.add_argument("--parser", choices=["antlr", "descent"], default=None)
+    parser.add_argument("--warmup", nargs="*", default=[], metavar="FILE",
+                        help="sources to compile before forking the workers")
+    args = parser.parse_args(argv)
+
+    warmup = [Path(f).read_text(encoding="utf-8") for f in args.warmup]
+    daemon = CompilerDaemon(args.socket, args.workers, args.lexer, args.parser, warmup=warmup)
+    print(f"Serving on {daemon.path} with {daemon.workers} workers", file=sys.stderr)
+    daemon.run()
+
+
+if __name__ == "__main__":
+    main()
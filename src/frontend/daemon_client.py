@@ -0,0 +1,164 @@
+"""
+Client of the TyC compiler daemon (src/frontend/daemon.py), and the message
+framing both sides use: a 4-byte big-endian length followed by that many
+bytes of UTF-8 JSON. This module imports neither asyncio nor the front end,
+so a command line client starts in the time of a bare interpreter.
+
+Usage:
+    python -m src.frontend.daemon_client parse program.tyc
+    python -m src.frontend.daemon_client check *.tyc
+    python -m src.frontend.daemon_client stop
+"""
+
+import argparse
+import json
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SOCKET_PATH = PROJECT_ROOT / "build" / "tyc-daemon.sock"
+
+HEADER = struct.Struct(">I")
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+COMPILE_OPS = ("tokenize", "parse", "ast", "check")
+
+
+class ProtocolError(Exception):
+    """A message that is not a length-prefixed JSON object of allowed size."""
+
+
+class DaemonError(Exception):
+    """An ``"ok": false`` response; ``error_type`` names the error."""
+
+    def __init__(self, message: str, error_type: str = None):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def encode_message(message: dict) -> bytes:
+    data = json.dumps(message).encode("utf-8")
+    if len(data) > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"message of {len(data)} bytes exceeds {MAX_MESSAGE_SIZE}")
+    return HEADER.pack(len(data)) + data
+
+
+def decode_message(data: bytes) -> dict:
+    try:
+        message = json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ProtocolError(f"invalid JSON: {e}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError("a message must be a JSON object")
+    return message
+
+
+class DaemonClient:
+    """Blocking client for a CompilerDaemon, one request at a time."""
+
+    def __init__(self, path=DEFAULT_SOCKET_PATH, timeout: float = None):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(str(path))
+        except OSError:
+            self._socket.close()
+            raise
+        self._next_id = 0
+
+    def request(self, op: str, source: str = None):
+        """Send one request and return its ``result``, or raise DaemonError."""
+        self._next_id += 1
+        message = {"id": self._next_id, "op": op}
+        if source is not None:
+            message["source"] = source
+        self._socket.sendall(encode_message(message))
+        response = decode_message(self._receive(HEADER.unpack(self._receive(HEADER.size))[0]))
+        if not response.get("ok"):
+            raise DaemonError(response.get("error"), response.get("error_type"))
+        return response.get("result")
+
+    def _receive(self, size: int) -> bytes:
+        chunks = []
+        while size:
+            chunk = self._socket.recv(min(size, 1 << 20))
+            if not chunk:
+                raise ConnectionError("the daemon closed the connection")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def tokenize(self, source: str) -> str:
+        return self.request("tokenize", source)
+
+    def parse(self, source: str) -> str:
+        return self.request("parse", source)
+
+    def ast(self, source: str) -> str:
+        return self.request("ast", source)
+
+    def check(self, source: str) -> dict:
+        return self.request("check", source)
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def wait_for_daemon(path=DEFAULT_SOCKET_PATH, timeout: float = 30.0) -> None:
+    """Wait until a daemon answers ``ping`` on ``path``; TimeoutError if
+    none does within ``timeout`` seconds."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with DaemonClient(path, timeout=timeout) as client:
+                client.request("ping")
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"no daemon answered on {path}") from None
+            time.sleep(0.05)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send requests to the TyC compiler daemon")
+    parser.add_argument("--socket", default=str(DEFAULT_SOCKET_PATH), help="Unix socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for op in COMPILE_OPS:
+        command = commands.add_parser(op, help=f"send a {op} request per file")
+        command.add_argument("files", nargs="+")
+    commands.add_parser("ping", help="check that the daemon is up")
+    commands.add_parser("stop", help="stop the daemon")
+    args = parser.parse_args(argv)
+
+    failed = False
+    with DaemonClient(args.socket) as client:
+        if args.command in ("ping", "stop"):
+            print(json.dumps(client.request(args.command)))
+            return 0
+        for path in args.files:
+            try:
+                result = client.request(args.command, Path(path).read_text(encoding="utf-8"))
+            except DaemonError as e:
+                print(f"{path}: {e}")
+                failed = True
+                continue
+            if args.command == "check":
+                result["path"] = path
+                failed |= result["status"] != "ok"
+                result = json.dumps(result)
+            elif args.command == "parse":
+                failed |= result != "success"
+            print(result if len(args.files) == 1 else f"{path}: {result}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,499 @@
+"""
+Recursive-descent front end for TyC.
+DescentParser builds the AST of src/utils/nodes.py straight from the token
+stream, without the ANTLR parse tree that ASTGeneration would otherwise
+visit and throw away. Statements are parsed by recursive descent with the
+lookahead the grammar needs (at most three tokens) and expressions by
+precedence climbing over the levels of the left-recursive ``expr`` rule.
+
+Syntax errors are reported like NewErrorListener reports them for the
+generated TyCParser, at the same token: the first one that cannot continue
+a valid program. The runtime's error recovery also decides how far the
+lexer has run when the error is reported, which matters when a lexer error
+follows the syntax error: a mismatched token looks one token ahead, and a
+failed prediction lexes the rest of the input. Both are mirrored.
+"""
+
+from typing import Iterator
+
+from src.frontend.backends import create_lexer, resolve_lexer_backend
+from src.frontend.fast_lexer import TyCFastLexer as T
+from src.utils.errors import SyntaxException
+from src.utils.nodes import *
+
+EOF = -1
+
+TYPE_START = frozenset({T.INT, T.FLOAT, T.STRING, T.ID})
+DECL_START = TYPE_START | {T.VOID, T.STRUCT, T.AUTO}
+PRIMARY_START = frozenset({T.LPAREN, T.INT_LIT, T.FLOAT_LIT, T.STRING_LIT, T.ID, T.LBRACE})
+EXPR_START = PRIMARY_START | {T.INC, T.DEC, T.ADD, T.SUB, T.NOT}
+VAR_DECL_START = frozenset({T.INT, T.FLOAT, T.STRING, T.AUTO})
+STMT_START = EXPR_START | VAR_DECL_START | {
+    T.LBRACE, T.IF, T.WHILE, T.FOR, T.SWITCH, T.BREAK, T.CONTINUE, T.RETURN,
+}
+
+# Binary operators: token type -> (precedence, precedence of the right
+# operand). Levels are those ASTGeneration applies to the expr rule; ASSIGN
+# is the only right-associative one. Postfix operators bind at 10-12 and
+# prefix operators parse their operand at 9 (++/--) and 8 (+, -, !).
+BINARY = {
+    T.MUL: (7, 8), T.DIV: (7, 8), T.MOD: (7, 8),
+    T.ADD: (6, 7), T.SUB: (6, 7),
+    T.LT: (5, 6), T.GT: (5, 6), T.LE: (5, 6), T.GE: (5, 6),
+    T.EQUAL: (4, 5), T.NOTEQUAL: (4, 5),
+    T.AND: (3, 4),
+    T.OR: (2, 3),
+    T.ASSIGN: (1, 1),
+}
+# Tokens that continue an expression statement after its first identifier
+EXPR_CONTINUE = frozenset(BINARY) | {T.DOT, T.LPAREN, T.INC, T.DEC, T.SEMI}
+
+
+def scan_tokens(source: str, backend: str = None):
+    """Yield ``(type, text, line, column)`` for every token of ``source``,
+    ending with EOF; lexer errors are raised when their token is reached."""
+    if resolve_lexer_backend(backend) == "fast":
+        lexer = T(source)
+        # a ByteCharStream is scanned in place and decoded token by token
+        source = lexer.source
+        for ttype, start, stop, line, column in lexer.scan():
+            if ttype == T.STRING_LIT:
+                text = source[start + 1:stop]
+            elif ttype == EOF:
+                text = "<EOF>"
+            else:
+                text = source[start:stop + 1]
+            yield ttype, text, line, column
+        return
+
+    lexer = create_lexer(source, backend)
+    while True:
+        token = lexer.nextToken()
+        yield token.type, token.text, token.line, token.column
+        if token.type == EOF:
+            return
+
+
+class DescentParser:
+    """Parse one TyC source into a Program.
+
+    ``parse()`` returns the AST or raises SyntaxException, or the LexerError
+    of the first bad token the parser reaches. Identifier names and struct
+    types are shared through the InternTable ``interner``, a new one unless
+    the caller passes one in.
+    """
+
+    def __init__(self, source: str, lexer_backend: str = None, interner: InternTable = None):
+        self._scanner = scan_tokens(source, lexer_backend)
+        self._tokens = []
+        self._pos = 0
+        self.interner = InternTable() if interner is None else interner
+
+    # Token buffer
+
+    def _fetch(self, index):
+        tokens = self._tokens
+        while len(tokens) <= index:
+            if tokens and tokens[-1][0] == EOF:
+                return tokens[-1]
+            tokens.append(next(self._scanner))
+        return tokens[index]
+
+    def _la(self, k=1):
+        return self._fetch(self._pos + k - 1)[0]
+
+    def _next(self):
+        token = self._fetch(self._pos)
+        self._pos += 1
+        return token
+
+    def _expect(self, ttype):
+        token = self._fetch(self._pos)
+        if token[0] != ttype:
+            self._mismatch()
+        self._pos += 1
+        return token[1]
+
+    def _name(self):
+        return self.interner.name(self._expect(T.ID))
+
+    # Errors
+
+    def _error(self, k=1):
+        _, text, line, column = self._fetch(self._pos + k - 1)
+        return SyntaxException(f"Error on line {line} col {column}: {text}")
+
+    def _mismatch(self):
+        """A token the grammar does not allow here; the runtime's single
+        token deletion looks at the next token before reporting."""
+        self._la(2)
+        raise self._error()
+
+    def _no_viable(self, k):
+        """No alternative matches at token ``k``; reporting the failed
+        prediction makes the runtime lex the remaining input first."""
+        error = self._error(k)
+        while self._fetch(len(self._tokens))[0] != EOF:
+            pass
+        raise error
+
+    # Declarations
+
+    def parse(self) -> Program:
+        return Program(list(self.declarations()))
+
+    def declarations(self, resumed: bool = False) -> Iterator[Decl]:
+        """Yield the top-level declarations one at a time, as they are parsed.
+
+        The tokens of a declaration are dropped once it has been yielded, so
+        the parser holds the tokens of one declaration (plus lookahead). An
+        error is raised when the stream reaches it, after the declarations
+        before it have been yielded. A ``resumed`` parse continues a program
+        after earlier declarations, and reports a bad first token the way
+        the runtime reports it after a declaration.
+        """
+        tokens = self._tokens
+        more = self._sync(DECL_START, EOF, loop_back=resumed)
+        while more:
+            la = self._la()
+            if la == T.STRUCT:
+                decl = self._struct_decl()
+            elif la == T.VOID or self._is_function():
+                decl = self._func_decl()
+            else:
+                decl = self._var_decl_stmt()
+            del tokens[:self._pos]
+            self._pos = 0
+            yield decl
+            more = self._sync(DECL_START, EOF, loop_back=True)
+
+    def _is_function(self):
+        """Tell ``type ID (`` and ``ID (`` from a variable declaration."""
+        if self._la() == T.AUTO:
+            return False
+        la2 = self._la(2)
+        if self._la() == T.ID and la2 == T.LPAREN:
+            return True
+        if la2 != T.ID:
+            self._no_viable(2)
+        la3 = self._la(3)
+        if la3 == T.LPAREN:
+            return True
+        if la3 not in (T.ASSIGN, T.SEMI):
+            self._no_viable(3)
+        return False
+
+    def _struct_decl(self):
+        self._next()
+        name = self._name()
+        self._expect(T.LBRACE)
+        members = []
+        more = self._sync(TYPE_START, T.RBRACE)
+        while more:
+            member_type = self._type()
+            members.append(MemberDecl(member_type, self._name()))
+            self._expect(T.SEMI)
+            more = self._sync(TYPE_START, T.RBRACE, loop_back=True)
+        self._next()
+        self._expect(T.SEMI)
+        return StructDecl(name, members)
+
+    def _sync(self, first, follow, loop_back=False):
+        """Loop/option guard: True on ``first``, False on ``follow``, and a
+        syntax error on anything else. After a loop iteration the runtime
+        reports the unwanted token without looking past it."""
+        la = self._la()
+        if la in first:
+            return True
+        if la != follow:
+            if loop_back:
+                raise self._error()
+            self._mismatch()
+        return False
+
+    def _func_decl(self):
+        la = self._la()
+        if la == T.VOID:
+            self._next()
+            return_type = VoidType()
+        elif la == T.ID and self._la(2) == T.LPAREN:
+            return_type = None  # inferred
+        else:
+            return_type = self._type()
+        name = self._name()
+        self._expect(T.LPAREN)
+        params = []
+        if self._sync(TYPE_START, T.RPAREN):
+            params.append(self._param())
+            while self._la() == T.COMMA:
+                self._next()
+                params.append(self._param())
+        self._expect(T.RPAREN)
+        return FuncDecl(return_type, name, params, self._function_body())
+
+    def _function_body(self):
+        return self._block()
+
+    def _param(self):
+        param_type = self._type()
+        return Param(param_type, self._name())
+
+    def _type(self):
+        ttype, text, _, _ = self._fetch(self._pos)
+        if ttype not in TYPE_START:
+            self._mismatch()
+        self._pos += 1
+        if ttype == T.INT:
+            return IntType()
+        if ttype == T.FLOAT:
+            return FloatType()
+        if ttype == T.STRING:
+            return StringType()
+        return self.interner.struct_type(text)
+
+    # Statements
+
+    def _block(self):
+        self._expect(T.LBRACE)
+        stmts = []
+        more = self._sync(STMT_START, T.RBRACE)
+        while more:
+            stmts.append(self._stmt())
+            more = self._sync(STMT_START, T.RBRACE, loop_back=True)
+        self._next()
+        return BlockStmt(stmts)
+
+    def _stmt(self):
+        la = self._la()
+        if la == T.LBRACE:
+            return self._block()
+        if la == T.IF:
+            return self._if()
+        if la == T.WHILE:
+            self._next()
+            condition = self._paren_expr()
+            return WhileStmt(condition, self._stmt_body())
+        if la == T.FOR:
+            return self._for()
+        if la == T.SWITCH:
+            return self._switch()
+        if la == T.BREAK:
+            self._next()
+            self._expect(T.SEMI)
+            return BreakStmt()
+        if la == T.CONTINUE:
+            self._next()
+            self._expect(T.SEMI)
+            return ContinueStmt()
+        if la == T.RETURN:
+            self._next()
+            expr = self._expr(0) if self._sync(EXPR_START, T.SEMI) else None
+            self._expect(T.SEMI)
+            return ReturnStmt(expr)
+        if la in VAR_DECL_START:
+            return self._var_decl_stmt()
+        if la == T.ID:
+            la2 = self._la(2)
+            if la2 == T.ID:
+                return self._var_decl_stmt()
+            if la2 not in EXPR_CONTINUE:
+                self._no_viable(2)
+        expr = self._expr(0)
+        self._expect(T.SEMI)
+        return expr_stmt(expr)
+
+    def _stmt_body(self):
+        if self._la() not in STMT_START:
+            self._mismatch()
+        return self._stmt()
+
+    def _paren_expr(self):
+        self._expect(T.LPAREN)
+        expr = self._expr(0)
+        self._expect(T.RPAREN)
+        return expr
+
+    def _if(self):
+        self._next()
+        condition = self._paren_expr()
+        then_stmt = self._stmt_body()
+        else_stmt = None
+        if self._la() == T.ELSE:  # the nearest if takes the else
+            self._next()
+            else_stmt = self._stmt_body()
+        return IfStmt(condition, then_stmt, else_stmt)
+
+    def _for(self):
+        self._next()
+        self._expect(T.LPAREN)
+        init = condition = update = None
+        if self._sync(EXPR_START | VAR_DECL_START, T.SEMI):
+            if self._la() in VAR_DECL_START or (self._la() == T.ID and self._la(2) == T.ID):
+                init = self._var_decl()
+            else:
+                init = expr_stmt(self._expr(0))
+        self._expect(T.SEMI)
+        if self._sync(EXPR_START, T.SEMI):
+            condition = self._expr(0)
+        self._expect(T.SEMI)
+        if self._sync(EXPR_START, T.RPAREN):
+            update = self._expr(0)
+        self._expect(T.RPAREN)
+        return ForStmt(init, condition, update, self._stmt_body())
+
+    def _switch(self):
+        self._next()
+        expr = self._paren_expr()
+        self._expect(T.LBRACE)
+        cases = []
+        default_case = None
+        labels = (T.CASE, T.DEFAULT)
+        more = self._sync(labels, T.RBRACE)
+        while more:
+            # a run of labels shares the statements that follow the last one
+            while self._la() in labels:
+                if self._next()[0] == T.CASE:
+                    label = CaseStmt(self._expr(0), [])
+                    cases.append(label)
+                else:
+                    label = default_case = DefaultStmt([])
+                self._expect(T.COLON)
+            while self._la() in STMT_START:
+                label.statements.append(self._stmt())
+            more = self._sync(labels, T.RBRACE, loop_back=True)
+        self._next()
+        return SwitchStmt(expr, cases, default_case)
+
+    def _var_decl_stmt(self):
+        decl = self._var_decl()
+        self._expect(T.SEMI)
+        return decl
+
+    def _var_decl(self):
+        if self._la() == T.AUTO:
+            self._next()
+            var_type = None
+        else:
+            var_type = self._type()
+        name = self._name()
+        init = None
+        if self._la() == T.ASSIGN:
+            self._next()
+            init = self._expr(0)
+        return VarDecl(var_type, name, init)
+
+    # Expressions
+
+    def _expr(self, precedence):
+        """Precedence climbing: parse an expression whose operators all bind
+        at least as tightly as ``precedence``."""
+        ttype, text, _, _ = self._fetch(self._pos)
+        if ttype not in EXPR_START:
+            self._mismatch()
+        self._pos += 1
+        if ttype == T.ID:
+            left = Identifier(self.interner.name(text))
+        elif ttype == T.INT_LIT:
+            left = IntLiteral(int(text))
+        elif ttype == T.FLOAT_LIT:
+            left = FloatLiteral(float(text))
+        elif ttype == T.STRING_LIT:
+            left = StringLiteral(text)
+        elif ttype == T.LPAREN:
+            left = self._expr(0)
+            self._expect(T.RPAREN)
+        elif ttype == T.LBRACE:
+            left = StructLiteral(self._expr_list(T.RBRACE))
+        elif ttype in (T.INC, T.DEC):
+            left = PrefixOp(text, self._expr(9))
+        else:
+            left = PrefixOp(text, self._expr(8))
+
+        binary = BINARY
+        while True:
+            ttype, text, _, _ = self._fetch(self._pos)
+            if ttype in binary:
+                op_precedence, right_precedence = binary[ttype]
+                if op_precedence < precedence:
+                    return left
+                self._pos += 1
+                if ttype == T.ASSIGN:
+                    left = AssignExpr(left, self._expr(right_precedence))
+                else:
+                    left = BinaryOp(left, text, self._expr(right_precedence))
+            elif ttype == T.DOT:
+                self._pos += 1
+                left = MemberAccess(left, self._name())
+            elif ttype == T.LPAREN:
+                self._pos += 1
+                left = FuncCall(call_name(left), self._expr_list(T.RPAREN))
+            elif ttype == T.INC or ttype == T.DEC:
+                self._pos += 1
+                left = PostfixOp(text, left)
+            else:
+                return left
+
+    def _expr_list(self, close):
+        """Parse ``(expr (COMMA expr)*)? close`` after an opening bracket."""
+        values = []
+        if self._sync(EXPR_START, close):
+            values.append(self._expr(0))
+            more = self._sync((T.COMMA,), close)
+            while more:
+                self._next()
+                values.append(self._expr(0))
+                more = self._sync((T.COMMA,), close, loop_back=True)
+        self._next()
+        return values
+
+
+class PositionedParser(DescentParser):
+    """DescentParser reading ``source`` with TyCFastLexer from offset ``pos``,
+    which is at ``line`` and ``column``; ``_end`` is the offset after the
+    last token fetched."""
+
+    def __init__(self, source: str, pos: int = 0, line: int = 1, column: int = 0,
+                 interner: InternTable = None):
+        super().__init__("", "fast", interner)
+        self._source = source
+        self._end = pos
+        self._scanner = self._scan(pos, line, column)
+
+    def _scan(self, pos, line, column):
+        source = self._source
+        for ttype, start, stop, line, column in T(source).scan(pos, line, column):
+            self._end = stop + 1
+            if ttype == T.STRING_LIT:
+                text = source[start + 1:stop]
+            elif ttype == EOF:
+                text = "<EOF>"
+            else:
+                text = source[start:stop + 1]
+            yield ttype, text, line, column
+
+
+def parse_source(source: str, lexer_backend: str = None) -> Program:
+    """Parse ``source`` with DescentParser and return its Program."""
+    return DescentParser(source, lexer_backend).parse()
+
+
+def iter_declarations(source, lexer_backend: str = None) -> Iterator[Decl]:
+    """Yield the top-level declarations of ``source`` one at a time, see
+    ``DescentParser.declarations``. ``source`` may also be a CharStream such
+    as ByteCharStream."""
+    return DescentParser(source, lexer_backend).declarations()
+
+
+def iter_file_declarations(path: str, lexer_backend: str = None) -> Iterator[Decl]:
+    """Yield the top-level declarations of the source file at ``path``.
+
+    Either lexer reads the file through a memory-mapped ByteCharStream, so
+    the whole file is never held as one decoded ``str``.
+    """
+    from src.frontend.char_stream import ByteCharStream
+
+    stream = ByteCharStream.from_path(path)
+    try:
+        yield from iter_declarations(stream, lexer_backend)
+    finally:
+        stream.close()
@@ -0,0 +1,488 @@
+"""
+Persisted prediction DFA for TyCLexer and TyCParser.
+The ANTLR runtime builds the DFA of every lexer and parser decision lazily,
+so a fresh process runs the ATN simulation again for every input shape until
+its cache is warm. This module saves the warmed ``decisionsToDFA`` of both
+recognizers to ``build/`` and restores them at startup.
+
+The snapshot is plain data (integers, strings, tuples and lists) referring
+to ATN states by number, stored with ``marshal`` so that loading it cannot
+construct arbitrary objects the way unpickling can. It is tagged with the
+hashes of TyC.g4 and of the generated ATNs plus the ANTLR runtime version.
+A snapshot whose tag does not match the current build, or whose data does
+not decode against the current ATNs, is ignored.
+
+Usage:
+    python3 run.py dfa-snapshot     # train on the test corpora and save
+"""
+
+import hashlib
+import marshal
+import os
+import tempfile
+from pathlib import Path
+
+import antlr4
+from antlr4.PredictionContext import (
+    ArrayPredictionContext,
+    PredictionContext,
+    SingletonPredictionContext,
+)
+from antlr4.atn.ATNConfig import ATNConfig, LexerATNConfig
+from antlr4.atn.ATNConfigSet import ATNConfigSet, OrderedATNConfigSet
+from antlr4.atn.LexerAction import LexerIndexedCustomAction
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.SemanticContext import (
+    AND,
+    OR,
+    PrecedencePredicate,
+    Predicate,
+    SemanticContext,
+)
+from antlr4.dfa.DFA import DFA
+from antlr4.dfa.DFAState import DFAState, PredPrediction
+
+from build import TyCLexer as lexer_module
+from build import TyCParser as parser_module
+
+TyCLexer = lexer_module.TyCLexer
+TyCParser = parser_module.TyCParser
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+GRAMMAR_PATH = PROJECT_ROOT / "src" / "grammar" / "TyC.g4"
+DEFAULT_SNAPSHOT_PATH = PROJECT_ROOT / "build" / "tyc_dfa.snapshot"
+
+# Bump when the encoding below changes
+FORMAT_VERSION = 2
+
+# Edge targets that are not DFA states
+_NO_EDGE = -1
+_ERROR_EDGE = -2
+
+
+def antlr_runtime_version() -> str:
+    # importlib.metadata takes longer to import than the ANTLR runtime
+    # itself, so read the version off the .dist-info whose RECORD lists the
+    # imported antlr4 package; several runtimes may be installed side by side
+    prefix, suffix = "antlr4_python3_runtime-", ".dist-info"
+    package = Path(antlr4.__file__).resolve()
+    site_packages = package.parents[1]
+    entry = package.relative_to(site_packages).as_posix() + ","
+    owners = []
+    for info in site_packages.glob(f"{prefix}*{suffix}"):
+        try:
+            with open(info / "RECORD", encoding="utf-8") as record:
+                if any(line.startswith(entry) for line in record):
+                    owners.append(info.name[len(prefix):-len(suffix)])
+        except OSError:
+            continue
+    if len(owners) == 1:
+        return owners[0]
+    try:
+        from importlib.metadata import version
+
+        return version("antlr4-python3-runtime")
+    except Exception:
+        return "unknown"
+
+
+def snapshot_key() -> dict:
+    """Identify the grammar, generated code and runtime a snapshot is valid for."""
+
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    try:
+        grammar = digest(GRAMMAR_PATH.read_bytes())
+    except OSError:
+        grammar = None
+    return {
+        "format": FORMAT_VERSION,
+        "antlr": antlr_runtime_version(),
+        "grammar": grammar,
+        "lexer_atn": digest(repr(lexer_module.serializedATN()).encode()),
+        "parser_atn": digest(repr(parser_module.serializedATN()).encode()),
+    }
+
+
+class _Encoder:
+    """Flatten the DFAs of one recognizer into plain data."""
+
+    def __init__(self, atn):
+        self.atn = atn
+        self.contexts = []
+        self._context_ids = {}
+        self.executors = []
+        self._executor_ids = {}
+
+    def context(self, ctx) -> int:
+        # Iterative post-order walk: parents are always encoded first
+        if ctx is None:
+            return _NO_EDGE
+        stack = [ctx]
+        while stack:
+            top = stack[-1]
+            if id(top) in self._context_ids:
+                stack.pop()
+                continue
+            if top is PredictionContext.EMPTY:
+                parents = []
+            elif isinstance(top, SingletonPredictionContext):
+                parents = [top.parentCtx]
+            else:
+                parents = list(top.parents)
+            pending = [p for p in parents if p is not None and id(p) not in self._context_ids]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            if top is PredictionContext.EMPTY:
+                entry = ("E",)
+            elif isinstance(top, SingletonPredictionContext):
+                entry = ("S", self._context_id(top.parentCtx), top.returnState)
+            else:
+                entry = (
+                    "A",
+                    [self._context_id(p) for p in top.parents],
+                    list(top.returnStates),
+                )
+            self._context_ids[id(top)] = len(self.contexts)
+            self.contexts.append(entry)
+        return self._context_ids[id(ctx)]
+
+    def _context_id(self, ctx) -> int:
+        return _NO_EDGE if ctx is None else self._context_ids[id(ctx)]
+
+    def semantic(self, sem):
+        if sem is None or sem is SemanticContext.NONE:
+            return None
+        if isinstance(sem, PrecedencePredicate):
+            return ("PP", sem.precedence)
+        if isinstance(sem, Predicate):
+            return ("P", sem.ruleIndex, sem.predIndex, sem.isCtxDependent)
+        kind = "AND" if isinstance(sem, AND) else "OR"
+        return (kind, [self.semantic(opnd) for opnd in sem.opnds])
+
+    def executor(self, executor) -> int:
+        if executor is None:
+            return _NO_EDGE
+        index = self._executor_ids.get(id(executor))
+        if index is None:
+            actions = []
+            for action in executor.lexerActions:
+                if isinstance(action, LexerIndexedCustomAction):
+                    actions.append((action.offset, self.atn.lexerActions.index(action.action)))
+                else:
+                    actions.append((None, self.atn.lexerActions.index(action)))
+            index = self._executor_ids[id(executor)] = len(self.executors)
+            self.executors.append(actions)
+        return index
+
+    def config(self, config):
+        entry = (
+            config.state.stateNumber,
+            config.alt,
+            self.context(config.context),
+            self.semantic(config.semanticContext),
+            config.reachesIntoOuterContext,
+            config.precedenceFilterSuppressed,
+        )
+        if isinstance(config, LexerATNConfig):
+            entry += (
+                config.passedThroughNonGreedyDecision,
+                self.executor(config.lexerActionExecutor),
+            )
+        return entry
+
+    def config_set(self, configs):
+        return (
+            isinstance(configs, OrderedATNConfigSet),
+            [self.config(config) for config in configs.configs],
+            configs.fullCtx,
+            configs.uniqueAlt,
+            None if configs.conflictingAlts is None else sorted(configs.conflictingAlts),
+            configs.hasSemanticContext,
+            configs.dipsIntoOuterContext,
+            configs.readonly,
+        )
+
+    def dfa(self, dfa):
+        states = list(dfa.states)
+        if dfa.precedenceDfa:
+            # The precedence start state is not part of dfa.states
+            states.insert(0, dfa.s0)
+        ids = {id(state): i for i, state in enumerate(states)}
+
+        def target(state):
+            if state is None:
+                return _NO_EDGE
+            if state.stateNumber == 0x7FFFFFFF:
+                return _ERROR_EDGE
+            return ids[id(state)]
+
+        encoded = []
+        for state in states:
+            predicates = None
+            if state.predicates is not None:
+                predicates = [(self.semantic(p.pred), p.alt) for p in state.predicates]
+            encoded.append(
+                (
+                    state.stateNumber,
+                    self.config_set(state.configs),
+                    None if state.edges is None else [target(t) for t in state.edges],
+                    state.isAcceptState,
+                    state.prediction,
+                    self.executor(state.lexerActionExecutor),
+                    state.requiresFullContext,
+                    predicates,
+                )
+            )
+        return (dfa.precedenceDfa, target(dfa.s0), encoded)
+
+    def encode(self, decisions):
+        dfas = [self.dfa(dfa) for dfa in decisions]
+        return {"contexts": self.contexts, "executors": self.executors, "dfas": dfas}
+
+
+class _Decoder:
+    """Rebuild DFA objects from the output of _Encoder."""
+
+    def __init__(self, atn, data, error_state):
+        self.atn = atn
+        self.error_state = error_state
+        self.contexts = []
+        for entry in data["contexts"]:
+            if entry[0] == "E":
+                ctx = PredictionContext.EMPTY
+            elif entry[0] == "S":
+                ctx = SingletonPredictionContext.create(self._context(entry[1]), entry[2])
+            else:
+                ctx = ArrayPredictionContext(
+                    [self._context(p) for p in entry[1]], list(entry[2])
+                )
+            self.contexts.append(ctx)
+        self.executors = []
+        for actions in data["executors"]:
+            lexer_actions = []
+            for offset, index in actions:
+                action = atn.lexerActions[index]
+                if offset is not None:
+                    action = LexerIndexedCustomAction(offset, action)
+                lexer_actions.append(action)
+            self.executors.append(LexerActionExecutor(lexer_actions))
+        self.data = data
+
+    def _context(self, index):
+        return None if index == _NO_EDGE else self.contexts[index]
+
+    def _executor(self, index):
+        return None if index == _NO_EDGE else self.executors[index]
+
+    def semantic(self, entry):
+        if entry is None:
+            return SemanticContext.NONE
+        kind = entry[0]
+        if kind == "PP":
+            return PrecedencePredicate(entry[1])
+        if kind == "P":
+            return Predicate(entry[1], entry[2], entry[3])
+        # Restore the operands as saved; the AND/OR constructors would
+        # simplify them again
+        sem = object.__new__(AND if kind == "AND" else OR)
+        sem.opnds = [self.semantic(opnd) for opnd in entry[1]]
+        return sem
+
+    def config(self, entry):
+        lexer = len(entry) > 6
+        config = object.__new__(LexerATNConfig if lexer else ATNConfig)
+        config.state = self.atn.states[entry[0]]
+        config.alt = entry[1]
+        config.context = self._context(entry[2])
+        config.semanticContext = self.semantic(entry[3])
+        config.reachesIntoOuterContext = entry[4]
+        config.precedenceFilterSuppressed = entry[5]
+        if lexer:
+            config.passedThroughNonGreedyDecision = entry[6]
+            config.lexerActionExecutor = self._executor(entry[7])
+        return config
+
+    def config_set(self, entry):
+        ordered, configs, fullCtx, uniqueAlt, conflicting, hasSem, dips, readonly = entry
+        config_set = OrderedATNConfigSet() if ordered else ATNConfigSet(fullCtx)
+        if readonly:
+            config_set.configs = [self.config(config) for config in configs]
+            config_set.setReadonly(True)
+        else:
+            for config in configs:
+                config_set.add(self.config(config))
+        config_set.fullCtx = fullCtx
+        config_set.uniqueAlt = uniqueAlt
+        config_set.conflictingAlts = None if conflicting is None else set(conflicting)
+        config_set.hasSemanticContext = hasSem
+        config_set.dipsIntoOuterContext = dips
+        return config_set
+
+    def dfa(self, decision, entry) -> DFA:
+        precedence_dfa, s0, encoded = entry
+        dfa = DFA(self.atn.decisionToState[decision], decision)
+        states = []
+        for number, configs, _, accept, prediction, executor, full_ctx, predicates in encoded:
+            state = DFAState(number, self.config_set(configs))
+            state.isAcceptState = accept
+            state.prediction = prediction
+            state.lexerActionExecutor = self._executor(executor)
+            state.requiresFullContext = full_ctx
+            if predicates is not None:
+                state.predicates = [
+                    PredPrediction(self.semantic(pred), alt) for pred, alt in predicates
+                ]
+            states.append(state)
+
+        def target(index):
+            if index == _NO_EDGE:
+                return None
+            if index == _ERROR_EDGE:
+                return self.error_state
+            return states[index]
+
+        for state, entry in zip(states, encoded):
+            if entry[2] is not None:
+                state.edges = [target(index) for index in entry[2]]
+        dfa.s0 = target(s0)
+        for i, state in enumerate(states):
+            if precedence_dfa and i == 0:
+                continue
+            dfa.states[state] = state
+        return dfa
+
+    def decode(self):
+        return [self.dfa(i, entry) for i, entry in enumerate(self.data["dfas"])]
+
+
+def _recognizers():
+    return (
+        ("lexer", TyCLexer, LexerATNSimulator.ERROR),
+        ("parser", TyCParser, ParserATNSimulator.ERROR),
+    )
+
+
+def dump_dfa_state() -> dict:
+    """Return the current DFA of TyCLexer and TyCParser as plain data."""
+    data = {"key": snapshot_key()}
+    for name, recognizer, _ in _recognizers():
+        data[name] = _Encoder(recognizer.atn).encode(recognizer.decisionsToDFA)
+    return data
+
+
+def restore_dfa_state(data: dict):
+    """Replace the DFA of TyCLexer and TyCParser with ``data``.
+
+    Both recognizers are decoded before either is replaced, so data that
+    does not decode leaves the DFA untouched. The DFA objects are swapped
+    inside the class-level ``decisionsToDFA`` lists, which existing lexer
+    and parser instances share.
+    """
+    decoded = [
+        (recognizer, _Decoder(recognizer.atn, data[name], error_state).decode())
+        for name, recognizer, error_state in _recognizers()
+    ]
+    for recognizer, dfas in decoded:
+        if len(dfas) != len(recognizer.decisionsToDFA):
+            raise ValueError("snapshot does not cover every decision")
+    for recognizer, dfas in decoded:
+        recognizer.decisionsToDFA[:] = dfas
+
+
+def clear_dfa_state():
+    """Drop every cached DFA state, as in a freshly started process."""
+    for _, recognizer, _ in _recognizers():
+        recognizer.decisionsToDFA[:] = [
+            DFA(state, i) for i, state in enumerate(recognizer.atn.decisionToState)
+        ]
+
+
+def save_dfa_snapshot(path=DEFAULT_SNAPSHOT_PATH) -> Path:
+    """Write the current DFA to ``path`` (atomically)."""
+    path = Path(path)
+    data = marshal.dumps(dump_dfa_state())
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        os.chmod(tmp, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+
+def load_dfa_snapshot(path=DEFAULT_SNAPSHOT_PATH) -> bool:
+    """Pre-populate the DFA from ``path``.
+
+    Returns False, leaving the DFA untouched, if there is no snapshot or it
+    was made for a different grammar, generated code or ANTLR version.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        # Missing, truncated or not a snapshot at all
+        return False
+    if not isinstance(data, dict) or data.get("key") != snapshot_key():
+        return False
+    try:
+        restore_dfa_state(data)
+    except (LookupError, TypeError, ValueError, AttributeError):
+        # Tagged for this build but not a snapshot _Encoder wrote
+        return False
+    return True
+
+
+_snapshot_state = {"attempted": False, "loaded": False}
+
+
+def ensure_dfa_snapshot_loaded() -> bool:
+    """Load the default snapshot once per process; returns whether it was used."""
+    if not _snapshot_state["attempted"]:
+        _snapshot_state["attempted"] = True
+        _snapshot_state["loaded"] = load_dfa_snapshot()
+    return _snapshot_state["loaded"]
+
+
+def train(sources):
+    """Warm the DFA by lexing and parsing every source."""
+    from src.frontend.session import FrontEndSession
+
+    FrontEndSession(load_dfa=False).parse_many(sources)
+
+
+def dfa_size() -> tuple:
+    """Number of (lexer, parser) DFA states currently cached."""
+    return tuple(
+        sum(len(dfa.states) for dfa in recognizer.decisionsToDFA)
+        for _, recognizer, _ in _recognizers()
+    )
+
+
+def main():
+    from tests.utils import collect_check_inputs
+
+    sources = [
+        source
+        for test_file in ("test_lexer.py", "test_parser.py", "test_ast_gen.py")
+        for _, source in collect_check_inputs(test_file)
+    ]
+    train(sources)
+    path = save_dfa_snapshot()
+    lexer_states, parser_states = dfa_size()
+    print(
+        f"Saved {lexer_states} lexer and {parser_states} parser DFA states "
+        f"from {len(sources)} inputs to {path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
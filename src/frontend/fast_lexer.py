@@ -0,0 +1,416 @@
+"""
+Hand-written lexer for TyC programming language.
+This module contains a table-driven scanner that produces exactly the same
+tokens as the TyCLexer generated from TyC.g4, without running the ANTLR
+lexer ATN simulator one character at a time. The ANTLR runtime is only
+imported once the lexer is asked for token objects, so ``scan()`` and
+``tokenize()`` start without it. A ByteCharStream is scanned in place, so a
+memory-mapped file is never decoded as a whole, only token by token.
+"""
+
+import re
+from typing import Iterator, Tuple
+
+from lexererr import ErrorToken, IllegalEscape, UncloseString
+
+# antlr4.Token.Token.EOF and DEFAULT_CHANNEL
+EOF = -1
+DEFAULT_CHANNEL = 0
+
+
+class TyCFastLexer:
+    """Drop-in replacement for the generated TyCLexer.
+
+    The scanner is driven by one compiled regular expression whose
+    alternatives are ordered so that the first match is also the longest
+    match, which is how the ANTLR lexer resolves overlapping rules. Token
+    types and the lexical error exceptions are identical to TyCLexer.
+    """
+
+    # Token types (must match build/TyC.tokens)
+    BREAK = 1
+    CASE = 2
+    CONTINUE = 3
+    DEFAULT = 4
+    ELSE = 5
+    FOR = 6
+    IF = 7
+    RETURN = 8
+    SWITCH = 9
+    WHILE = 10
+    INT = 11
+    FLOAT = 12
+    STRING = 13
+    VOID = 14
+    STRUCT = 15
+    AUTO = 16
+    FLOAT_LIT = 17
+    INT_LIT = 18
+    STRING_LIT = 19
+    ILLEGAL_ESCAPE = 20
+    UNCLOSE_STRING = 21
+    LPAREN = 22
+    RPAREN = 23
+    LBRACE = 24
+    RBRACE = 25
+    COMMA = 26
+    SEMI = 27
+    COLON = 28
+    EQUAL = 29
+    NOTEQUAL = 30
+    LE = 31
+    GE = 32
+    OR = 33
+    AND = 34
+    INC = 35
+    DEC = 36
+    ADD = 37
+    SUB = 38
+    MUL = 39
+    DIV = 40
+    MOD = 41
+    LT = 42
+    GT = 43
+    NOT = 44
+    ASSIGN = 45
+    DOT = 46
+    ID = 47
+    BLOCK_COMMENT = 48
+    LINE_COMMENT = 49
+    WS = 50
+    ERROR_CHAR = 51
+
+    symbolicNames = [
+        "<INVALID>",
+        "BREAK", "CASE", "CONTINUE", "DEFAULT", "ELSE", "FOR", "IF",
+        "RETURN", "SWITCH", "WHILE", "INT", "FLOAT", "STRING", "VOID",
+        "STRUCT", "AUTO", "FLOAT_LIT", "INT_LIT", "STRING_LIT", "ILLEGAL_ESCAPE",
+        "UNCLOSE_STRING", "LPAREN", "RPAREN", "LBRACE", "RBRACE", "COMMA",
+        "SEMI", "COLON", "EQUAL", "NOTEQUAL", "LE", "GE", "OR", "AND",
+        "INC", "DEC", "ADD", "SUB", "MUL", "DIV", "MOD", "LT", "GT", "NOT",
+        "ASSIGN", "DOT", "ID", "BLOCK_COMMENT", "LINE_COMMENT", "WS", "ERROR_CHAR",
+    ]
+
+    grammarFileName = "TyC.g4"
+
+    def __init__(self, input=None):
+        self.setInputStream(input)
+
+    @property
+    def _factory(self):
+        from antlr4.CommonTokenFactory import CommonTokenFactory
+
+        return CommonTokenFactory.DEFAULT
+
+    def setInputStream(self, input):
+        """Reset the lexer onto a new source: a str, a ByteCharStream, whose
+        bytes are matched in place, or any other CharStream, which is read
+        into a str."""
+        buffer = getattr(input, "buffer", None)
+        if buffer is not None:
+            self._text = _ByteText(buffer)
+            self._pattern, self._target = _BYTE_TOKEN_RE, buffer
+            self._literal_types = _BYTE_LITERAL_TYPES
+        else:
+            if input is None:
+                input = ""
+            elif not isinstance(input, str):
+                input = str(input)
+            self._text = self._target = input
+            self._pattern, self._literal_types = _TOKEN_RE, _LITERAL_TYPES
+        self._input = input
+        self._tokenFactorySourcePair = (self, None)
+        # Created by the first nextToken(): scan() and tokenize() do not use
+        # it, and while it exists the buffer of a ByteCharStream cannot be
+        # released
+        self._scanner = None
+        self.line = 1
+        self.column = 0
+        self._hitEOF = False
+
+    def reset(self):
+        self.setInputStream(self._input)
+
+    @property
+    def source(self):
+        """The text being scanned: the str, or for a ByteCharStream a view
+        whose slices and ``getText`` decode only the requested range."""
+        return self._text
+
+    def getSourceName(self):
+        return "<unknown>"
+
+    def getInputStream(self):
+        return None
+
+    def nextToken(self):
+        """Return the next token, raising the lexererr exceptions on errors."""
+        if _new_token is None:
+            _load_token_class()
+        if self._hitEOF:
+            return self._emit_eof()
+        if self._scanner is None:
+            self._scanner = self._pattern.scanner(self._target)
+        m = self._scanner.match()
+        kind = m.lastindex
+        ttype = _GROUP_TYPES[kind]
+        lexeme = m.group(kind)
+        if self._target is not self._text:
+            lexeme = lexeme.decode("latin-1")
+        start, stop = m.span(kind)
+
+        # Advance over the skipped whitespace and comments
+        text = self._text
+        trivia = m.start()
+        if trivia != start:
+            newlines = text.count("\n", trivia, start)
+            if newlines:
+                self.line += newlines
+                self.column = start - text.rindex("\n", trivia, start) - 1
+            else:
+                self.column += start - trivia
+        line, column = self.line, self.column
+        self.column = column + stop - start
+
+        if ttype == _LOOKUP:
+            ttype = _LITERAL_TYPES.get(lexeme, self.ID)
+        elif ttype == self.STRING_LIT:
+            lexeme = lexeme[1:-1]
+        elif ttype == EOF:
+            self._hitEOF = True
+            return self._emit_eof()
+        elif ttype in _ERRORS:
+            _ERRORS[ttype](lexeme)
+
+        # Fill the token slots directly; CommonToken.__init__ is a noticeable
+        # share of the per-token cost when driving a CommonTokenStream.
+        token = _new_token(CommonToken)
+        token.source = self._tokenFactorySourcePair
+        token.type = ttype
+        token.channel = DEFAULT_CHANNEL
+        token.start = start
+        token.stop = stop - 1
+        token.tokenIndex = -1
+        token.line = line
+        token.column = column
+        token._text = lexeme
+        return token
+
+    def _emit_eof(self):
+        n = len(self._text)
+        token = CommonToken(self._tokenFactorySourcePair, EOF, 0, n, n - 1)
+        token.line = self.line
+        token.column = self.column
+        token.text = "<EOF>"
+        return token
+
+    def tokenize(self) -> Iterator[Tuple[int, str]]:
+        """Yield (type, text) pairs for the whole input without building
+        CommonToken objects. Lexical errors are raised at the same token
+        where TyCLexer would raise them."""
+        group_types = _GROUP_TYPES
+        literal_types = _LITERAL_TYPES
+        errors = _ERRORS
+        ID, STRING_LIT = self.ID, self.STRING_LIT
+        decode = self._target is not self._text
+        for m in self._pattern.finditer(self._target):
+            kind = m.lastindex
+            ttype = group_types[kind]
+            lexeme = m.group(kind)
+            if decode:
+                lexeme = lexeme.decode("latin-1")
+            if ttype == _LOOKUP:
+                ttype = literal_types.get(lexeme, ID)
+            elif ttype == STRING_LIT:
+                lexeme = lexeme[1:-1]
+            elif ttype == EOF:
+                return
+            elif ttype in errors:
+                errors[ttype](lexeme)
+            yield ttype, lexeme
+
+    def scan(self, pos: int = 0, line: int = 1, column: int = 0) -> Iterator[Tuple[int, int, int, int, int]]:
+        """Yield (type, start, stop, line, column) for every token of the input,
+        ending with EOF, without building token objects or token text.
+
+        ``stop`` is inclusive and STRING_LIT spans include the quotes, exactly
+        as in the CommonTokens produced by TyCLexer. Lexical errors are raised
+        at the same token where TyCLexer would raise them. A scan can start at
+        offset ``pos`` (a token boundary) with the ``line`` and ``column`` of
+        that offset."""
+        text = self._text
+        group_types = _GROUP_TYPES
+        literal_types = self._literal_types
+        errors = _ERRORS
+        ID = self.ID
+        for m in self._pattern.finditer(self._target, pos):
+            kind = m.lastindex
+            start, stop = m.span(kind)
+            trivia = m.start()
+            if trivia != start:
+                newlines = text.count("\n", trivia, start)
+                if newlines:
+                    line += newlines
+                    column = start - text.rindex("\n", trivia, start) - 1
+                else:
+                    column += start - trivia
+            ttype = group_types[kind]
+            if ttype == _LOOKUP:
+                ttype = literal_types.get(m.group(kind), ID)
+            elif ttype == EOF:
+                yield EOF, start, start - 1, line, column
+                return
+            elif ttype in errors:
+                errors[ttype](text[start:stop])
+            yield ttype, start, stop - 1, line, column
+            column += stop - start
+
+
+# ============================================================================
+# Scanner tables
+# ============================================================================
+
+# antlr4.Token.CommonToken and its __new__, set by the first nextToken()
+CommonToken = _new_token = None
+
+
+def _load_token_class():
+    global CommonToken, _new_token
+    from antlr4.Token import CommonToken
+
+    _new_token = CommonToken.__new__
+
+
+# Group type that is resolved through _LITERAL_TYPES (keywords, operators)
+_LOOKUP = 0
+
+_KEYWORDS = {
+    "break": TyCFastLexer.BREAK,
+    "case": TyCFastLexer.CASE,
+    "continue": TyCFastLexer.CONTINUE,
+    "default": TyCFastLexer.DEFAULT,
+    "else": TyCFastLexer.ELSE,
+    "for": TyCFastLexer.FOR,
+    "if": TyCFastLexer.IF,
+    "return": TyCFastLexer.RETURN,
+    "switch": TyCFastLexer.SWITCH,
+    "while": TyCFastLexer.WHILE,
+    "int": TyCFastLexer.INT,
+    "float": TyCFastLexer.FLOAT,
+    "string": TyCFastLexer.STRING,
+    "void": TyCFastLexer.VOID,
+    "struct": TyCFastLexer.STRUCT,
+    "auto": TyCFastLexer.AUTO,
+}
+
+_LITERAL_TYPES = {
+    **_KEYWORDS,
+    "(": TyCFastLexer.LPAREN,
+    ")": TyCFastLexer.RPAREN,
+    "{": TyCFastLexer.LBRACE,
+    "}": TyCFastLexer.RBRACE,
+    ",": TyCFastLexer.COMMA,
+    ";": TyCFastLexer.SEMI,
+    ":": TyCFastLexer.COLON,
+    "==": TyCFastLexer.EQUAL,
+    "!=": TyCFastLexer.NOTEQUAL,
+    "<=": TyCFastLexer.LE,
+    ">=": TyCFastLexer.GE,
+    "||": TyCFastLexer.OR,
+    "&&": TyCFastLexer.AND,
+    "++": TyCFastLexer.INC,
+    "--": TyCFastLexer.DEC,
+    "+": TyCFastLexer.ADD,
+    "-": TyCFastLexer.SUB,
+    "*": TyCFastLexer.MUL,
+    "/": TyCFastLexer.DIV,
+    "%": TyCFastLexer.MOD,
+    "<": TyCFastLexer.LT,
+    ">": TyCFastLexer.GT,
+    "!": TyCFastLexer.NOT,
+    "=": TyCFastLexer.ASSIGN,
+    ".": TyCFastLexer.DOT,
+}
+
+_STRING_BODY = r'"(?:\\[bfrn"t\\]|[^"\\\r\n])*'
+_EXPONENT = r"(?:[eE][+-]?[0-9]+)"
+
+# Whitespace and comments are skipped as a prefix of every match, so each
+# match yields exactly one token.
+_TRIVIA = r"(?:[ \t\r\n\f]+|/\*[\s\S]*?\*/|//[^\r\n]*)*"
+
+# Alternatives are ordered so that the first one to match is the longest
+# match, mirroring the ANTLR lexer's maximal munch: floats before ints and
+# '.', two-character operators before one-character ones, a closed string
+# before the error rules, and the catch-all ERROR_CHAR before end of input.
+# An unterminated '/*' is not trivia and falls through to DIV and MUL.
+_RULES = [
+    (
+        TyCFastLexer.FLOAT_LIT,
+        rf"[0-9]+\.[0-9]*{_EXPONENT}?|\.[0-9]+{_EXPONENT}?|[0-9]+{_EXPONENT}",
+    ),
+    (TyCFastLexer.INT_LIT, r"0|[1-9][0-9]*"),
+    (_LOOKUP, r"[a-zA-Z_][a-zA-Z_0-9]*"),
+    (TyCFastLexer.STRING_LIT, _STRING_BODY + '"'),
+    (TyCFastLexer.ILLEGAL_ESCAPE, _STRING_BODY + r'\\[^bfrn"t\\]'),
+    (TyCFastLexer.UNCLOSE_STRING, _STRING_BODY),
+    (_LOOKUP, r"==|!=|<=|>=|\|\||&&|\+\+|--|[-+*/%<>!=.(){},;:]"),
+    (TyCFastLexer.ERROR_CHAR, r"[\s\S]"),
+    (EOF, r"\Z"),
+]
+
+_TOKEN_RE = re.compile(
+    _TRIVIA + "(?:" + "|".join(f"({pattern})" for _, pattern in _RULES) + ")"
+)
+
+# The same scanner over the bytes of an ASCII source; its groups are bytes
+_BYTE_TOKEN_RE = re.compile(_TOKEN_RE.pattern.encode("ascii"))
+_BYTE_LITERAL_TYPES = {lexeme.encode("ascii"): ttype for lexeme, ttype in _LITERAL_TYPES.items()}
+
+# Indexed by Match.lastindex (group 1 is the first rule)
+_GROUP_TYPES = [None] + [ttype for ttype, _ in _RULES]
+
+
+class _ByteText:
+    """The bytes of a ByteCharStream seen as text, with the str operations
+    the lexer uses. Only the requested ranges are copied and decoded (as
+    Latin-1, like ByteCharStream), never the whole buffer."""
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        return self._buffer[index].tobytes().decode("latin-1")
+
+    def getText(self, start, stop):
+        return self[start:stop + 1]
+
+    def count(self, sub, start, end):
+        return self[start:end].count(sub)
+
+    def rindex(self, sub, start, end):
+        return start + self[start:end].rindex(sub)
+
+
+def _raise_unclose_string(lexeme):
+    raise UncloseString(lexeme)
+
+
+def _raise_illegal_escape(lexeme):
+    raise IllegalEscape(lexeme)
+
+
+def _raise_error_token(lexeme):
+    raise ErrorToken(lexeme)
+
+
+_ERRORS = {
+    TyCFastLexer.UNCLOSE_STRING: _raise_unclose_string,
+    TyCFastLexer.ILLEGAL_ESCAPE: _raise_illegal_escape,
+    TyCFastLexer.ERROR_CHAR: _raise_error_token,
+}
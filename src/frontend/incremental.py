@@ -0,0 +1,156 @@
+"""
+Incremental reparsing for TyC.
+A program is a flat sequence of top-level declarations, and a declaration
+ends at a ``;`` or at the ``}`` of a function body, so after an edit only
+the declarations around the changed text need to be lexed and parsed again.
+IncrementalDocument reparses from the end of the last declaration before
+the edit until it reaches the start of a declaration past the edit; from
+there on the text, and therefore the tokens, are those of the old source.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+from lexererr import LexerError
+from src.frontend.descent import DescentParser
+from src.frontend.fast_lexer import TyCFastLexer as T
+from src.utils.errors import SyntaxException
+from src.utils.nodes import InternTable, Program
+
+EOF = -1
+
+
+def split_declarations(source: str, pos: int = 0, resume_at=None) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+    """Character spans of the top-level declarations of ``source`` from
+    offset ``pos``, found from the tokens and braces alone.
+
+    Returns ``(spans, None)`` at the end of the input, or ``(spans, index)``
+    as soon as ``resume_at(offset)`` returns an index for the start of a
+    declaration. Text that is not a declaration ends up in a span that fails
+    to parse; lexer errors are raised.
+    """
+    spans = []
+    start = None
+    depth = 0
+    for ttype, tstart, tstop, _, _ in T(source).scan(pos):
+        if start is None:
+            if ttype == EOF:
+                return spans, None
+            if resume_at is not None:
+                index = resume_at(tstart)
+                if index is not None:
+                    return spans, index
+            start, struct, function, assigned = tstart, ttype == T.STRUCT, False, False
+        if ttype == T.LBRACE:
+            depth += 1
+        elif ttype == T.RBRACE:
+            depth -= 1
+            if depth == 0 and function:
+                spans.append((start, tstop + 1))
+                start = None
+        elif ttype == EOF:
+            spans.append((start, tstart))
+            return spans, None
+        elif depth == 0:
+            if ttype == T.SEMI:
+                spans.append((start, tstop + 1))
+                start = None
+            elif ttype == T.ASSIGN:
+                assigned = True
+            elif ttype == T.LPAREN and not (assigned or struct):
+                function = True
+    return spans, None
+
+
+class IncrementalDocument:
+    """A TyC source and its AST, kept up to date across text edits.
+
+    ``edit(start, end, text)`` replaces ``source[start:end]`` with ``text``
+    and returns the new Program, the one ``parse_source`` returns for the new
+    source. Declarations away from the edit are the same Decl objects as
+    before, including any structural hashes cached on them. Nodes carry no
+    source positions, so the document keeps them: ``spans[i]`` is the
+    ``(start, end)`` character range of ``program.decls[i]``, and spans after
+    the edit are shifted by the change in length. ``reparsed`` counts the
+    declarations the last edit parsed again.
+
+    An edit that leaves the source invalid raises the SyntaxException or
+    LexerError of a full parse; finding that error parses the whole new
+    source. The document still takes the new source, so later offsets refer
+    to the text the editor holds, and keeps the error in ``error``. While
+    ``error`` is set, ``program`` and ``spans`` are stale: they belong to the
+    last source that parsed, and the next edit parses the whole source again.
+    """
+
+    def __init__(self, source: str, lexer_backend: str = None):
+        self.lexer_backend = lexer_backend
+        self.interner = InternTable()
+        self.source = ""
+        self.program = Program([])
+        self.spans: List[Tuple[int, int]] = []
+        self.reparsed = 0
+        self.error = None
+        self.edit(0, 0, source)
+
+    def edit(self, start: int, end: int, text: str) -> Program:
+        source, spans = self.source, self.spans
+        if not 0 <= start <= end <= len(source):
+            raise ValueError(f"Edit {start}:{end} is outside the source (length {len(source)})")
+        new_source = source[:start] + text + source[end:]
+        if self.error is not None:
+            # The spans belong to an older source; resynchronize
+            self._replace(new_source)
+            return self.program
+        delta = len(text) - (end - start)
+        edit_end = start + len(text)
+        starts = [span[0] for span in spans]
+        ends = [span[1] for span in spans]
+        # Declarations ending before the edit are kept; lexing restarts after
+        # the last of them, where the old lexer was between two tokens too
+        first = bisect_right(ends, start)
+        after = bisect_left(starts, end, first)
+
+        def resume_at(offset):
+            # an old declaration starting at or after the end of the edit
+            if offset < edit_end:
+                return None
+            index = bisect_left(starts, offset - delta, after)
+            if index < len(starts) and starts[index] == offset - delta:
+                return index
+            return None
+
+        try:
+            new_spans, index = split_declarations(new_source, ends[first - 1] if first else 0, resume_at)
+            decls = []
+            for decl_start, decl_end in new_spans:
+                parser = DescentParser(new_source[decl_start:decl_end], self.lexer_backend, self.interner)
+                parsed = parser.parse().decls
+                if len(parsed) != 1:
+                    raise SyntaxException(f"{len(parsed)} declarations in one span")
+                decls.extend(parsed)
+        except (SyntaxException, LexerError):
+            # Report the error a full parse reports
+            self._replace(new_source)
+            return self.program
+
+        old_decls = self.program.decls
+        if index is None:
+            index = len(old_decls)
+        self.spans = spans[:first] + new_spans + [(s + delta, e + delta) for s, e in spans[index:]]
+        self.program = Program(old_decls[:first] + decls + old_decls[index:])
+        self.source = new_source
+        self.reparsed = len(decls)
+        return self.program
+
+    def _replace(self, source):
+        """Parse ``source`` from scratch, raising its first error."""
+        interner = InternTable()
+        try:
+            program = DescentParser(source, self.lexer_backend, interner).parse()
+            spans, _ = split_declarations(source)
+        except (SyntaxException, LexerError) as e:
+            self.source, self.error, self.reparsed = source, e, 0
+            raise
+        self.spans, self.error = spans, None
+        self.interner, self.program, self.source = interner, program, source
+        self.reparsed = len(program.decls)
@@ -0,0 +1,170 @@
+"""
+Parallel parsing for TyC.
+A program is a flat sequence of top-level declarations, each ending at a
+``;`` or at the ``}`` of a function body, and a declaration parses the same
+wherever it starts. parse_parallel cuts a large source at such boundaries,
+found by a scan over braces, strings and comments only, parses the chunks
+in a process pool and joins their declarations into one Program.
+
+Each chunk is parsed at its absolute line and column and comes back from
+its worker as a FlatAST. The parent does not rebuild the nodes: the
+Program's ``decls`` is a ChunkDecls, which builds each declaration from its
+chunk's FlatAST on first access, through one InternTable, as the root of a
+MappedAST does. At the first chunk that fails, the remaining chunks are
+dropped and the source is parsed serially from the start of that chunk, so
+an error is the one, with the position, that a parse of the whole source
+reports.
+"""
+
+import os
+import re
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List
+
+from lexererr import LexerError
+from src.frontend.descent import PositionedParser, parse_source
+from src.frontend.skeleton import STRINGS_AND_COMMENTS
+from src.utils.errors import SyntaxException
+from src.utils.flat_ast import FlatAST, flatten, unflatten
+from src.utils.nodes import InternTable, Program
+
+# Sources shorter than this are parsed serially, and no chunk is shorter
+MIN_CHUNK_SIZE = 64 * 1024
+# Chunks per worker, so that uneven chunks still keep every worker busy
+CHUNKS_PER_WORKER = 4
+
+# The braces, and the ';' that ends a declaration, outside strings and comments
+_SCAN_RE = re.compile(r'[{};]|' + STRINGS_AND_COMMENTS)
+_TRIVIA_RE = re.compile(r'(?:[ \t\r\n\f]+|/\*[\s\S]*?\*/|//[^\r\n]*)*')
+
+
+def chunk_boundaries(source: str, chunk_size: int) -> List[int]:
+    """Offsets at which to cut ``source`` into chunks of at least
+    ``chunk_size`` characters, each just after the ``;`` or ``}`` that ends
+    a top-level declaration.
+
+    The scan only sees braces, strings and comments, so in a source with
+    errors a cut can fall elsewhere; the chunk before it then fails to parse.
+    """
+    cuts = []
+    depth = 0
+    next_cut = chunk_size
+    for m in _SCAN_RE.finditer(source):
+        token = m.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            # a struct or an initializer list ends at the ';' after it
+            if depth == 0 and m.end() >= next_cut:
+                after = _TRIVIA_RE.match(source, m.end()).end()
+                if not source.startswith(";", after):
+                    cuts.append(m.end())
+                    next_cut = m.end() + chunk_size
+        elif token == ";" and depth == 0 and m.end() >= next_cut:
+            cuts.append(m.end())
+            next_cut = m.end() + chunk_size
+    if cuts and len(source) - cuts[-1] < chunk_size // 2:
+        cuts.pop()  # fold a short tail into the last chunk
+    return cuts
+
+
+class ChunkDecls(Sequence):
+    """Declarations of a parse_parallel Program. Those of parsed chunks are
+    built from the chunk's FlatAST when first accessed, through ``interner``;
+    those of a serially parsed tail are stored as they are."""
+
+    def __init__(self):
+        self.interner = InternTable()
+        # a declaration, or its (FlatAST, node id) until it is built
+        self._items = []
+
+    def add_chunk(self, flat: FlatAST) -> None:
+        self._items.extend((flat, i) for i in flat.iter_children(0))
+
+    def add_nodes(self, decls) -> None:
+        self._items.extend(decls)
+
+    @property
+    def materialized(self) -> int:
+        """Number of declarations built or stored so far."""
+        return sum(1 for item in self._items if not isinstance(item, tuple))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if isinstance(item, tuple):
+            flat, i = item
+            item = self._items[index] = unflatten(flat, i, self.interner)
+        return item
+
+
+def _position(source: str, offset: int):
+    """Line and column of ``offset`` in ``source``."""
+    return source.count("\n", 0, offset) + 1, offset - source.rfind("\n", 0, offset) - 1
+
+
+def _parse_chunk(chunk: str, line: int, column: int) -> FlatAST:
+    """Worker: the declarations of ``chunk``, which starts at ``line`` and
+    ``column``, as a flattened Program, or None if it does not parse on its
+    own."""
+    try:
+        return flatten(Program(list(PositionedParser(chunk, 0, line, column).declarations())))
+    except (SyntaxException, LexerError):
+        return None
+
+
+def parse_parallel(source: str, workers: int = None, executor: Executor = None,
+                   chunk_size: int = None) -> Program:
+    """Parse ``source`` into the Program, or raise the error, of
+    ``parse_source(source, "fast")``, using ``workers`` processes (all CPUs
+    by default) or the given ``executor``. The declarations of the Program
+    are built on first access (see ChunkDecls).
+
+    ``chunk_size`` defaults to an even share of the source per chunk, with
+    CHUNKS_PER_WORKER chunks per worker; sources that yield a single chunk
+    are parsed in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, len(source) // (workers * CHUNKS_PER_WORKER))
+    cuts = chunk_boundaries(source, chunk_size) if workers > 1 or executor else []
+    if not cuts:
+        return parse_source(source, "fast")
+
+    starts = [0] + cuts
+    ends = cuts + [len(source)]
+    own = executor is None
+    if own:
+        executor = ProcessPoolExecutor(workers)
+    try:
+        futures = [
+            executor.submit(_parse_chunk, source[start:end], *_position(source, start))
+            for start, end in zip(starts, ends)
+        ]
+        decls = ChunkDecls()
+        for index, future in enumerate(futures):
+            flat = future.result()
+            if flat is None:
+                for rest in futures[index + 1:]:
+                    rest.cancel()
+                decls.add_nodes(_parse_rest(source, starts[index], decls.interner))
+                break
+            decls.add_chunk(flat)
+    finally:
+        if own:
+            executor.shutdown(cancel_futures=True)
+    return Program(decls)
+
+
+def _parse_rest(source: str, start: int, interner: InternTable):
+    """Parse ``source`` serially from offset ``start``, which follows a
+    declaration, and return its declarations or raise its first error."""
+    parser = PositionedParser(source, start, *_position(source, start), interner)
+    return list(parser.declarations(resumed=True))
@@ -0,0 +1,549 @@
+"""
+Per-decision profiling of TyCParser.
+The Python ANTLR runtime has no ProfilingATNSimulator, so this module ports
+the Java one: ``ProfilingATNSimulator`` records, for every decision that
+goes through ``adaptivePredict``, how often it ran, how many tokens of
+lookahead SLL and full LL needed, how often SLL had to fall back to LL, the
+ambiguities and context sensitivities LL found, and the time spent,
+including the predictions that fail with a syntax error. Decisions the
+generated code resolves with a single ``LA(1)`` switch never reach the
+simulator and are not listed.
+
+Each decision is reported at its own line of TyC.g4. The ATN keeps no
+source positions, so ``_grammar_decision_lines`` walks the grammar in the
+order the ANTLR tool numbers decisions and checks the result against the
+ATN's decision states.
+
+Usage:
+    python3 run.py profile-grammar [--json PATH] [--sort time] [FILES...]
+"""
+
+import argparse
+import inspect
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+from build.TyCLexer import TyCLexer
+from build.TyCParser import TyCParser
+from src.utils.error_listener import NewErrorListener
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+GRAMMAR_PATH = PROJECT_ROOT / "src" / "grammar" / "TyC.g4"
+
+# Human-readable names of the ATN decision state kinds
+_DECISION_KINDS = {
+    "BasicBlockStartState": "alternatives",
+    "StarBlockStartState": "(...)* body",
+    "StarLoopEntryState": "(...)* loop",
+    "PlusBlockStartState": "(...)+ body",
+    "PlusLoopbackState": "(...)+ loop",
+    "TokensStartState": "tokens",
+}
+
+
+class DecisionInfo:
+    """Profile counters of one parser decision (mirrors Java's DecisionInfo)."""
+
+    __slots__ = (
+        "decision",
+        "invocations",
+        "time_ns",
+        "sll_total_look",
+        "sll_min_look",
+        "sll_max_look",
+        "sll_max_look_input",
+        "sll_atn_transitions",
+        "sll_dfa_transitions",
+        "ll_fallback",
+        "ll_total_look",
+        "ll_min_look",
+        "ll_max_look",
+        "ll_atn_transitions",
+        "ambiguities",
+        "context_sensitivities",
+        "errors",
+        "failures",
+        "predicate_evals",
+    )
+
+    def __init__(self, decision: int):
+        self.decision = decision
+        self.invocations = 0
+        self.time_ns = 0
+        self.sll_total_look = 0
+        self.sll_min_look = 0
+        self.sll_max_look = 0
+        self.sll_max_look_input = None
+        self.sll_atn_transitions = 0
+        self.sll_dfa_transitions = 0
+        self.ll_fallback = 0
+        self.ll_total_look = 0
+        self.ll_min_look = 0
+        self.ll_max_look = 0
+        self.ll_atn_transitions = 0
+        self.ambiguities = 0
+        self.context_sensitivities = 0
+        self.errors = 0
+        self.failures = 0
+        self.predicate_evals = 0
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """ParserATNSimulator that fills one DecisionInfo per decision."""
+
+    def __init__(self, parser):
+        super().__init__(parser, parser.atn, parser.decisionsToDFA, parser.sharedContextCache)
+        self.decisions = [DecisionInfo(i) for i in range(len(parser.atn.decisionToState))]
+        self._sll_stop_index = -1
+        self._ll_stop_index = -1
+        self._current_decision = -1
+        self._conflicting_alt_resolved_by_sll = 0
+
+    def adaptivePredict(self, input, decision, outerContext):
+        self._sll_stop_index = -1
+        self._ll_stop_index = -1
+        self._current_decision = decision
+        info = self.decisions[decision]
+        start = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        except BaseException:
+            # a prediction that finds no viable alternative costs as much as
+            # one that succeeds, often more
+            info.failures += 1
+            raise
+        finally:
+            info.time_ns += time.perf_counter_ns() - start
+            info.invocations += 1
+            self._current_decision = -1
+
+            if self._sll_stop_index >= 0:
+                sll_k = self._sll_stop_index - self._startIndex + 1
+                info.sll_total_look += sll_k
+                info.sll_min_look = sll_k if info.sll_min_look == 0 else min(info.sll_min_look, sll_k)
+                if sll_k > info.sll_max_look:
+                    info.sll_max_look = sll_k
+                    info.sll_max_look_input = (self._startIndex, self._sll_stop_index)
+
+            if self._ll_stop_index >= 0:
+                ll_k = self._ll_stop_index - self._startIndex + 1
+                info.ll_total_look += ll_k
+                info.ll_min_look = ll_k if info.ll_min_look == 0 else min(info.ll_min_look, ll_k)
+                info.ll_max_look = max(info.ll_max_look, ll_k)
+
+    def getExistingTargetState(self, previousD, t):
+        # Called each time SLL prediction advances to another token
+        self._sll_stop_index = self._input.index
+        existing = super().getExistingTargetState(previousD, t)
+        if existing is not None:
+            self.decisions[self._current_decision].sll_dfa_transitions += 1
+            if existing is self.ERROR:
+                self.decisions[self._current_decision].errors += 1
+        return existing
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            # Called each time full LL prediction advances to another token
+            self._ll_stop_index = self._input.index
+        reach = super().computeReachSet(closure, t, fullCtx)
+        info = self.decisions[self._current_decision]
+        if fullCtx:
+            info.ll_atn_transitions += 1
+        else:
+            info.sll_atn_transitions += 1
+        if reach is None:
+            info.errors += 1
+        return reach
+
+    def evalSemanticContext(self, predPredictions, outerContext, complete):
+        self.decisions[self._current_decision].predicate_evals += len(predPredictions)
+        return super().evalSemanticContext(predPredictions, outerContext, complete)
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        if conflictingAlts is not None:
+            self._conflicting_alt_resolved_by_sll = min(conflictingAlts)
+        else:
+            self._conflicting_alt_resolved_by_sll = min(configs.getAlts())
+        self.decisions[self._current_decision].ll_fallback += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        if prediction != self._conflicting_alt_resolved_by_sll:
+            self.decisions[self._current_decision].context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.decisions[self._current_decision].ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+def _grammar_rule_lines(path=GRAMMAR_PATH) -> dict:
+    """Map each parser rule name to its (first, last) line in TyC.g4."""
+    lines = {}
+    try:
+        text = Path(path).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return lines
+    current = None
+    for number, line in enumerate(text, start=1):
+        match = re.match(r"([a-z]\w*)\s*(:|$)", line)
+        if match and match.group(1) in TyCParser.ruleNames:
+            current = match.group(1)
+            lines[current] = [number, number]
+        elif current is not None:
+            lines[current][1] = number
+            if line.strip() == ";":
+                current = None
+    return {rule: tuple(span) for rule, span in lines.items()}
+
+
+# Tokens of a .g4 file; actions, with any nested braces, are matched by
+# _g4_tokens itself
+_G4_TOKEN_RE = re.compile(
+    r"""(?P<skip>\s+|//[^\n]*|/\*[\s\S]*?\*/)
+    |(?P<literal>'(?:\\.|[^'\\])*')
+    |(?P<charset>\[(?:\\.|[^\]\\])*\])
+    |(?P<name>\w+)
+    |(?P<op>::|\.\.|\+=|->|[:;|()?*+~#=.,@<>{])""",
+    re.VERBOSE,
+)
+
+
+def _g4_tokens(text):
+    """``(kind, value, line)`` for each token of ``text``; an action
+    ``{...}`` is one ``action`` token and ``{...}?`` one ``predicate``."""
+    tokens = []
+    pos, line = 0, 1
+    while pos < len(text):
+        match = _G4_TOKEN_RE.match(text, pos)
+        if match is None:
+            raise ValueError(f"unexpected {text[pos]!r} on line {line}")
+        kind, value = match.lastgroup, match.group()
+        if value == "{":
+            depth, end = 0, pos
+            while True:
+                depth += {"{": 1, "}": -1}.get(text[end], 0)
+                end += 1
+                if depth == 0:
+                    break
+            kind, value = "action", text[pos:end]
+            if text.startswith("?", end):
+                kind, end = "predicate", end + 1
+            match_end = end
+        else:
+            match_end = match.end()
+        if kind != "skip":
+            tokens.append((kind, value, line))
+        line += text.count("\n", pos, match_end)
+        pos = match_end
+    return tokens
+
+
+class _RuleWalker:
+    """Number the decisions of the parser rules of a grammar as the ANTLR
+    tool does: each block is numbered after the blocks nested in it, a
+    ``(...)*`` block before its loop, and a left-recursive rule as its
+    rewrite ``(primary alternatives) (suffix alternatives)*``."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        # (rule, decision state kind, transitions, line) in decision order
+        self.decisions = []
+
+    def walk(self):
+        tokens = self.tokens
+        while self.pos < len(tokens):
+            kind, value, line = tokens[self.pos]
+            if (kind == "name" and value[0].islower() and self.pos + 1 < len(tokens)
+                    and tokens[self.pos + 1][1] == ":"):
+                self.pos += 2
+                alts = self._block()
+                self._rule(value, line, alts)
+            self.pos += 1
+        return self.decisions
+
+    # Parsing: a block is a list of alternatives, an alternative a list of
+    # (atom, suffix, line), an atom a token ("token"/"rule", name) or a
+    # nested block ("block", alternatives)
+
+    def _peek(self):
+        return self.tokens[self.pos][1] if self.pos < len(self.tokens) else ";"
+
+    def _block(self):
+        alts = [self._alternative()]
+        while self._peek() == "|":
+            self.pos += 1
+            alts.append(self._alternative())
+        return alts
+
+    def _alternative(self):
+        elements = []
+        while self._peek() not in ("|", ")", ";", "#"):
+            kind, value, line = self.tokens[self.pos]
+            self.pos += 1
+            if kind in ("action", "predicate"):
+                continue
+            if kind == "name" and self._peek() in ("=", "+="):
+                self.pos += 1  # an element label
+                continue
+            if value == "~":
+                continue  # ~ applies to the set that follows
+            if value == "(":
+                atom = ("block", self._block())
+                self.pos += 1  # ')'
+            elif kind == "name" and value[0].islower():
+                atom = ("rule", value)
+            else:
+                atom = ("token", value)
+            suffix = None
+            if self._peek() in ("?", "*", "+"):
+                suffix = self._peek()
+                self.pos += 1
+                if self._peek() == "?":
+                    self.pos += 1  # non-greedy
+            elements.append((atom, suffix, line))
+        if self._peek() == "#":
+            self.pos += 2  # alternative label
+        return elements
+
+    # Numbering
+
+    def _rule(self, rule, line, alts):
+        recursive = [alt for alt in alts if alt and alt[0][0] == ("rule", rule)]
+        if not recursive:
+            self._alternatives(rule, alts, None, line)
+            return
+        primary = [alt for alt in alts if alt not in recursive]
+        self._alternatives(rule, primary, None, line)
+        self._alternatives(rule, [alt[1:] for alt in recursive], "*", recursive[0][0][2])
+
+    def _alternatives(self, rule, alts, suffix, line):
+        is_set = len(alts) > 1 and all(
+            len(alt) == 1 and alt[0][0][0] == "token" and alt[0][1] is None for alt in alts
+        )
+        if not is_set:
+            for alt in alts:
+                for atom, element_suffix, element_line in alt:
+                    if atom[0] == "block":
+                        self._alternatives(rule, atom[1], element_suffix, element_line)
+                    elif element_suffix is not None:
+                        self._alternatives(rule, [[(atom, None, element_line)]], element_suffix, element_line)
+        count = 1 if is_set else len(alts)
+        if suffix is None:
+            if count > 1:
+                self.decisions.append((rule, "BasicBlockStartState", count, line))
+        elif suffix == "?":
+            self.decisions.append((rule, "BasicBlockStartState", count + 1, line))
+        elif suffix == "*":
+            if count > 1:
+                self.decisions.append((rule, "StarBlockStartState", count, line))
+            self.decisions.append((rule, "StarLoopEntryState", 2, line))
+        else:
+            if count > 1:
+                self.decisions.append((rule, "PlusBlockStartState", count, line))
+            self.decisions.append((rule, "PlusLoopbackState", 2, line))
+
+
+def _grammar_decision_lines(path=GRAMMAR_PATH) -> dict:
+    """Map each decision number to its line in TyC.g4, or return {} if the
+    grammar cannot be read or does not match the ATN of TyCParser."""
+    try:
+        decisions = _RuleWalker(_g4_tokens(Path(path).read_text(encoding="utf-8"))).walk()
+    except (OSError, ValueError, IndexError):
+        return {}
+    states = TyCParser.atn.decisionToState
+    if len(decisions) != len(states):
+        return {}
+    for (rule, kind, transitions, _), state in zip(decisions, states):
+        if (rule, kind, transitions) != (
+            TyCParser.ruleNames[state.ruleIndex], type(state).__name__, len(state.transitions)
+        ):
+            return {}
+    return {decision: line for decision, (_, _, _, line) in enumerate(decisions)}
+
+
+def _generated_code_lines() -> dict:
+    """Map each decision number to its adaptivePredict call in TyCParser.py."""
+    source = inspect.getsource(sys.modules[TyCParser.__module__])
+    lines = {}
+    for number, line in enumerate(source.splitlines(), start=1):
+        match = re.search(r"adaptivePredict\(self\._input,(\d+),", line)
+        if match:
+            lines.setdefault(int(match.group(1)), number)
+    return lines
+
+
+class GrammarProfiler:
+    """Parse sources with one profiling parser and aggregate the counters."""
+
+    def __init__(self):
+        self.parser = TyCParser(None)
+        self.parser.removeErrorListeners()
+        self.parser.addErrorListener(NewErrorListener.INSTANCE)
+        self.parser._interp = ProfilingATNSimulator(self.parser)
+        self.inputs = 0
+        self.syntax_errors = 0
+        self.tokens = 0
+        self.seconds = 0.0
+
+    @property
+    def decisions(self):
+        return self.parser._interp.decisions
+
+    def parse(self, source: str):
+        token_stream = CommonTokenStream(TyCLexer(InputStream(source)))
+        self.parser.setTokenStream(token_stream)
+        start = time.perf_counter()
+        try:
+            self.parser.program()
+        except Exception:
+            self.syntax_errors += 1
+        self.seconds += time.perf_counter() - start
+        self.inputs += 1
+        self.tokens += len(token_stream.tokens)
+
+    def report(self) -> dict:
+        """Return the profile as JSON-serializable data."""
+        atn = self.parser.atn
+        rule_lines = _grammar_rule_lines()
+        decision_lines = _grammar_decision_lines()
+        code_lines = _generated_code_lines()
+        decisions = []
+        for info in self.decisions:
+            if info.invocations == 0:
+                continue
+            state = atn.decisionToState[info.decision]
+            rule = TyCParser.ruleNames[state.ruleIndex]
+            kind = _DECISION_KINDS.get(type(state).__name__, type(state).__name__)
+            if getattr(state, "isPrecedenceDecision", False):
+                kind = "left recursion"
+            first, last = rule_lines.get(rule, (None, None))
+            decisions.append(
+                {
+                    "decision": info.decision,
+                    "rule": rule,
+                    "kind": kind,
+                    "grammar_line": decision_lines.get(info.decision, first),
+                    "grammar_lines": [first, last],
+                    "generated_line": code_lines.get(info.decision),
+                    "invocations": info.invocations,
+                    "time_ms": info.time_ns / 1e6,
+                    "sll_total_look": info.sll_total_look,
+                    "sll_max_look": info.sll_max_look,
+                    "sll_avg_look": info.sll_total_look / info.invocations,
+                    "sll_atn_transitions": info.sll_atn_transitions,
+                    "sll_dfa_transitions": info.sll_dfa_transitions,
+                    "ll_fallback": info.ll_fallback,
+                    "ll_total_look": info.ll_total_look,
+                    "ll_max_look": info.ll_max_look,
+                    "ll_atn_transitions": info.ll_atn_transitions,
+                    "ambiguities": info.ambiguities,
+                    "context_sensitivities": info.context_sensitivities,
+                    "errors": info.errors,
+                    "failures": info.failures,
+                    "predicate_evals": info.predicate_evals,
+                }
+            )
+        return {
+            "inputs": self.inputs,
+            "syntax_errors": self.syntax_errors,
+            "tokens": self.tokens,
+            "parse_ms": self.seconds * 1000,
+            "decisions": decisions,
+        }
+
+
+SORT_KEYS = {
+    "time": "time_ms",
+    "invocations": "invocations",
+    "lookahead": "sll_total_look",
+    "max-lookahead": "sll_max_look",
+    "fallbacks": "ll_fallback",
+    "decision": "decision",
+}
+
+# (title, report field, width, format spec); text columns are left-aligned
+_COLUMNS = (
+    ("dec", "decision", 4, "d"),
+    ("rule", "rule", 14, "s"),
+    ("line", "grammar_line", 5, "d"),
+    ("kind", "kind", 14, "s"),
+    ("calls", "invocations", 8, "d"),
+    ("time ms", "time_ms", 9, ".1f"),
+    ("SLL look", "sll_total_look", 9, "d"),
+    ("SLL max", "sll_max_look", 8, "d"),
+    ("LL fb", "ll_fallback", 6, "d"),
+    ("LL look", "ll_total_look", 8, "d"),
+    ("LL max", "ll_max_look", 7, "d"),
+    ("ambig", "ambiguities", 6, "d"),
+    ("ctx", "context_sensitivities", 4, "d"),
+    ("fail", "failures", 5, "d"),
+)
+
+
+def _cell(value, width, spec):
+    align = "<" if spec == "s" else ">"
+    if value is None:
+        return f"{'-':{align}{width}}"
+    return f"{value:{align}{width}{spec}}"
+
+
+def format_report(report: dict, sort: str = "time") -> str:
+    """Render a report as a text table, most expensive decisions first."""
+    key = SORT_KEYS[sort]
+    rows = sorted(report["decisions"], key=lambda d: d[key], reverse=key != "decision")
+    lines = [
+        f"{report['inputs']} inputs, {report['tokens']} tokens, "
+        f"{report['syntax_errors']} with syntax errors, {report['parse_ms']:.1f} ms parsing",
+        " ".join(
+            f"{title:<{width}}" if spec == "s" else f"{title:>{width}}"
+            for title, _, width, spec in _COLUMNS
+        ),
+    ]
+    for row in rows:
+        lines.append(" ".join(_cell(row[field], width, spec) for _, field, width, spec in _COLUMNS))
+    return "\n".join(lines)
+
+
+def profile_sources(sources) -> dict:
+    """Profile parsing every source in ``sources``; returns the report data."""
+    profiler = GrammarProfiler()
+    for source in sources:
+        profiler.parse(source)
+    return profiler.report()
+
+
+def _default_corpus():
+    from tests.utils import collect_check_inputs
+
+    return [source for _, source in collect_check_inputs("test_parser.py")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-decision TyCParser profile")
+    parser.add_argument("files", nargs="*", help="TyC sources (default: tests/test_parser.py inputs)")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    parser.add_argument("--sort", choices=sorted(SORT_KEYS), default="time")
+    args = parser.parse_args(argv)
+
+    if args.files:
+        sources = [Path(f).read_text(encoding="utf-8") for f in args.files]
+    else:
+        sources = _default_corpus()
+    report = profile_sources(sources)
+    print(format_report(report, args.sort))
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"JSON report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Reusable front-end session for TyC.
+Building a TyCLexer, token stream and TyCParser (and installing the error
+listener) costs more than lexing or parsing a typical test snippet.
+FrontEndSession keeps one lexer/parser pair per thread and rewinds it between
+inputs, so batches of small sources only pay that setup once.
+"""
+
+import threading
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.Token import Token
+
+from build.TyCParser import TyCParser
+from lexererr import LexerError
+from src.frontend.backends import (
+    create_lexer,
+    resolve_lexer_backend,
+    resolve_parser_backend,
+)
+from src.frontend.strategy import ParseStats, parse_program, resolve_parse_strategy
+from src.utils.error_listener import NewErrorListener
+
+_MISSING = object()
+
+
+class _Pipeline:
+    """The lexer, token stream, parser and AST visitor owned by one thread."""
+
+    __slots__ = ("lexer", "token_stream", "parser", "ast_generator")
+
+    def __init__(self, backend: str, compact_tokens: bool):
+        self.lexer = create_lexer("", backend)
+        self.token_stream = None if compact_tokens else CommonTokenStream(self.lexer)
+        self.parser = TyCParser(self.token_stream)
+        self.parser.removeErrorListeners()
+        self.parser.addErrorListener(NewErrorListener.INSTANCE)
+        self.ast_generator = None
+
+
+class FrontEndSession:
+    """Lex, parse and build ASTs for many sources with recycled instances.
+
+    The batch methods return one result per source, in input order, with the
+    same values the ``tests/utils.py`` wrappers produce: a token string (or
+    the LexerError raised) for ``tokenize``, ``"success"`` or the error
+    message for ``parse`` and the AST or an ``"AST Generation Error: ..."``
+    message for ``build_ast``. A session may be shared between threads;
+    each thread lazily gets its own pipeline. Unless ``load_dfa`` is false,
+    the first session of a process loads the DFA snapshot saved by
+    ``python3 run.py dfa-snapshot``. Parsing uses the two-stage SLL/LL
+    strategy by default; ``stats`` records its per-input fallbacks and
+    stage timings. With ``parser_backend="descent"`` ``parse`` and
+    ``build_ast`` use DescentParser instead of TyCParser and ASTGeneration.
+    With a CompileCache as ``cache``, results of ``str`` sources are looked
+    up there first, under the session's backends, and stored after a miss.
+    """
+
+    def __init__(
+        self,
+        lexer_backend: str = None,
+        compact_tokens: bool = False,
+        load_dfa: bool = True,
+        strategy: str = "two-stage",
+        parser_backend: str = None,
+        cache=None,
+    ):
+        self.lexer_backend = resolve_lexer_backend(lexer_backend)
+        self.parser_backend = resolve_parser_backend(parser_backend)
+        self.cache = cache
+        self._backends = (self.lexer_backend, self.parser_backend)
+        self.compact_tokens = compact_tokens
+        self.strategy = resolve_parse_strategy(strategy)
+        self.stats = ParseStats()
+        self._local = threading.local()
+        if load_dfa:
+            # Start from the persisted prediction DFA if build/ has a valid one
+            from src.frontend.dfa_snapshot import ensure_dfa_snapshot_loaded
+
+            ensure_dfa_snapshot_loaded()
+
+    def _pipeline(self, source) -> _Pipeline:
+        """Return this thread's pipeline, rewound to read ``source``."""
+        pipeline = getattr(self._local, "pipeline", None)
+        if pipeline is None:
+            pipeline = self._local.pipeline = _Pipeline(
+                self.lexer_backend, self.compact_tokens
+            )
+        lexer = pipeline.lexer
+        if self.lexer_backend == "fast":
+            lexer.setInputStream(source)
+        else:
+            lexer.inputStream = InputStream(source) if isinstance(source, str) else source
+        if self.compact_tokens:
+            from src.frontend.token_buffer import CompactTokenBuffer, CompactTokenStream
+
+            buffer = CompactTokenBuffer.from_lexer(lexer, source)
+            pipeline.parser.setTokenStream(CompactTokenStream(buffer))
+        else:
+            pipeline.token_stream.setTokenSource(lexer)
+            pipeline.parser.setTokenStream(pipeline.token_stream)
+        return pipeline
+
+    def tokenize(self, source) -> str:
+        """Return the tokens of ``source`` formatted like Tokenizer."""
+        if self._cached(source):
+            tokens = self.cache.get("tokens", source, _MISSING, self._backends)
+            if tokens is _MISSING:
+                try:
+                    tokens = self._tokenize(source)
+                except LexerError as e:
+                    tokens = e
+                self.cache.put("tokens", source, tokens, self._backends)
+            if isinstance(tokens, LexerError):
+                raise tokens
+            return tokens
+        return self._tokenize(source)
+
+    def _tokenize(self, source) -> str:
+        lexer = self._pipeline(source).lexer
+        names = lexer.symbolicNames
+        if self.lexer_backend == "fast":
+            tokens = [f"{names[ttype]},{text}" for ttype, text in lexer.tokenize()]
+        else:
+            tokens = []
+            token = lexer.nextToken()
+            while token.type != Token.EOF:
+                tokens.append(f"{names[token.type]},{token.text or ''}")
+                token = lexer.nextToken()
+        tokens.append("EOF")
+        return ",".join(tokens)
+
+    def _parse_tree(self, source, parser):
+        return parse_program(
+            parser, lambda: self._pipeline(source), self.strategy, self.stats
+        )
+
+    def parse(self, source) -> str:
+        """Parse ``source``; return ``"success"`` or the error message."""
+        if self._cached(source):
+            result = self.cache.get("parse", source, _MISSING, self._backends)
+            if result is _MISSING:
+                result = self._parse(source)
+                self.cache.put("parse", source, result, self._backends)
+            return result
+        return self._parse(source)
+
+    def _parse(self, source) -> str:
+        try:
+            if self.parser_backend == "descent":
+                from src.frontend.descent import DescentParser
+
+                DescentParser(source, self.lexer_backend).parse()
+            else:
+                self._parse_tree(source, self._pipeline(source).parser)
+            return "success"
+        except Exception as e:
+            return str(e)
+
+    def build_ast(self, source):
+        """Parse ``source`` and run ASTGeneration over the parse tree."""
+        if self._cached(source):
+            ast = self.cache.get("ast", source, _MISSING, self._backends)
+            if ast is _MISSING:
+                ast = self._build_ast(source)
+                self.cache.put("ast", source, ast, self._backends)
+            return ast
+        return self._build_ast(source)
+
+    def _build_ast(self, source):
+        if self.parser_backend == "descent":
+            from src.frontend.descent import DescentParser
+
+            try:
+                return DescentParser(source, self.lexer_backend).parse()
+            except Exception as e:
+                return f"AST Generation Error: {str(e)}"
+        pipeline = self._pipeline(source)
+        if pipeline.ast_generator is None:
+            try:
+                from src.astgen.ast_generation import ASTGeneration
+            except ImportError:
+                return "AST Generation Error: ASTGeneration class not found. Please implement src/astgen/ast_generation.py"
+            pipeline.ast_generator = ASTGeneration()
+        try:
+            return pipeline.ast_generator.visit(self._parse_tree(source, pipeline.parser))
+        except Exception as e:
+            return f"AST Generation Error: {str(e)}"
+
+    def _cached(self, source) -> bool:
+        return self.cache is not None and isinstance(source, str)
+
+    def tokenize_many(self, sources, executor=None) -> list:
+        """Tokenize every source; a lexer error becomes that source's result
+        as its message, like the errors of ``parse_many``."""
+        return self._map(self._tokenize_or_error, sources, executor)
+
+    def parse_many(self, sources, executor=None) -> list:
+        """Parse every source, see ``parse``."""
+        return self._map(self.parse, sources, executor)
+
+    def build_ast_many(self, sources, executor=None) -> list:
+        """Build the AST of every source, see ``build_ast``."""
+        return self._map(self.build_ast, sources, executor)
+
+    def _tokenize_or_error(self, source):
+        try:
+            return self.tokenize(source)
+        except LexerError as e:
+            return str(e)
+
+    @staticmethod
+    def _map(func, sources, executor):
+        # Executor.map yields results in input order, like the builtin map
+        if executor is None:
+            return list(map(func, sources))
+        return list(executor.map(func, sources))
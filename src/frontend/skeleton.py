@@ -0,0 +1,128 @@
+"""
+Skeleton parsing for TyC.
+Tools that only need the global shape of a program (struct declarations,
+function signatures and global variables) do not need function bodies,
+which are most of a typical source. SkeletonParser parses everything else
+with DescentParser, but steps over each function body by matching braces,
+skipping strings and comments, without producing tokens or nodes for it.
+The body is a BlockStmt whose statements are parsed when first used.
+"""
+
+import re
+from collections.abc import Sequence
+
+from src.frontend.descent import PositionedParser
+from src.frontend.fast_lexer import TyCFastLexer as T
+from src.utils.nodes import BlockStmt, InternTable, Program
+
+# The text a brace scan steps over because it can contain a brace: strings
+# (an unclosed one ends at the line end, like UNCLOSE_STRING) and comments.
+# An unterminated '/*' is not a comment, as in the lexer.
+STRINGS_AND_COMMENTS = r'"(?:\\.|[^"\\\r\n])*"?|/\*[\s\S]*?\*/|//[^\r\n]*'
+_BODY_RE = re.compile(r'[{}]|' + STRINGS_AND_COMMENTS)
+
+
+def match_braces(source: str, pos: int) -> int:
+    """Offset just past the ``}`` closing the ``{`` at ``source[pos]``, or -1
+    if the input ends first."""
+    depth = 0
+    for m in _BODY_RE.finditer(source, pos):
+        brace = m.group()
+        if brace == "{":
+            depth += 1
+        elif brace == "}":
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return -1
+
+
+def _position_after(source: str, start: int, end: int, line: int, column: int):
+    """Line and column of offset ``end``, given those of ``start``."""
+    newlines = source.count("\n", start, end)
+    if newlines:
+        return line + newlines, end - source.rindex("\n", start, end) - 1
+    return line, column + end - start
+
+
+class LazyStatements(Sequence):
+    """Statements of a function body skipped by SkeletonParser, parsed on
+    first access.
+
+    ``start``/``end`` is the character range of the body, braces included,
+    and ``line``/``column`` the position of its ``{``. A syntax or lexer error
+    in the body is raised by the access that parses it.
+    """
+
+    __slots__ = ("source", "start", "end", "line", "column", "_interner", "_statements")
+
+    def __init__(self, source: str, start: int, end: int, line: int, column: int,
+                 interner: InternTable):
+        self.source = source
+        self.start, self.end = start, end
+        self.line, self.column = line, column
+        self._interner = interner
+        self._statements = None
+
+    @property
+    def parsed(self) -> bool:
+        return self._statements is not None
+
+    def _parse(self) -> list:
+        statements = self._statements
+        if statements is None:
+            parser = PositionedParser(self.source, self.start, self.line, self.column, self._interner)
+            statements = self._statements = parser._block().statements
+            self.source = None  # only the statements are needed from now on
+        return statements
+
+    def __len__(self):
+        return len(self._parse())
+
+    def __getitem__(self, index):
+        return self._parse()[index]
+
+    def __iter__(self):
+        return iter(self._parse())
+
+    def __reversed__(self):
+        return reversed(self._parse())
+
+    def __reduce__(self):
+        # pickles as the parsed list rather than the whole source
+        return list, (self._parse(),)
+
+
+class SkeletonParser(PositionedParser):
+    """Parse a TyC source into a Program whose function bodies are deferred.
+
+    Struct declarations, global variables and function signatures are the
+    nodes DescentParser builds. Each FuncDecl ``body`` is a BlockStmt whose
+    ``statements`` is a LazyStatements. The source is always read with
+    TyCFastLexer. Syntax errors outside function bodies are raised by
+    ``parse()``, like DescentParser raises them; errors inside a body are
+    raised when the body is first used.
+    """
+
+    def __init__(self, source: str):
+        super().__init__(source)
+        self.skipped = 0
+
+    def _function_body(self):
+        # the parser has not looked past the ')' of the signature yet
+        if self._la() != T.LBRACE or len(self._tokens) != self._pos + 1:
+            return self._block()
+        _, _, line, column = self._tokens[self._pos]
+        source, start = self._source, self._end - 1
+        end = match_braces(source, start)
+        if end < 0:
+            return self._block()
+        self._pos += 1
+        self._scanner = self._scan(end, *_position_after(source, start, end, line, column))
+        self.skipped += 1
+        return BlockStmt(LazyStatements(source, start, end, line, column, self.interner))
+
+
+def parse_skeleton(source: str) -> Program:
+    """Parse ``source`` with SkeletonParser and return its Program."""
+    return SkeletonParser(source).parse()
@@ -0,0 +1,154 @@
+"""
+Startup-optimized entry point for the TyC front end.
+Importing ``tests/utils.py`` or FrontEndSession loads the ANTLR runtime, the
+generated TyCLexer and TyCParser (deserializing their ATNs) and
+ASTGeneration before the first source is read, which dominates a
+short-lived command. The functions here import nothing up front, and on
+first use only what the selected backends need:
+
+- the fast lexer with DescentParser imports no ANTLR code at all (their
+  SyntaxException comes from src/utils/errors.py; error_listener.py, which
+  imports the runtime, is only loaded with a FrontEndSession);
+- the ANTLR backends use a FrontEndSession that does not load the DFA
+  snapshot, since restoring it costs more than it saves one short parse.
+
+The results are those of FrontEndSession, and so of the ``tests/utils.py``
+wrappers. The backends default to TYC_LEXER and TYC_PARSER, see backends.py.
+
+Most of what remains is compiling modules, the generated ones above all,
+when Python may not write bytecode (PYTHONDONTWRITEBYTECODE, read-only
+checkouts). ``precompile`` writes checked-hash bytecode for ``build/`` and
+``src/`` ahead of time: it is read even then, and it is used only while the
+hash of its source still matches, so a regenerated grammar is never run
+from stale bytecode.
+
+Usage:
+    python3 run.py startup parse program.tyc
+    python3 run.py startup ast --lexer fast --parser descent program.tyc
+    python3 run.py startup precompile
+"""
+
+import os
+import sys
+
+from src.frontend.backends import resolve_lexer_backend, resolve_parser_backend
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PRECOMPILED_DIRS = (os.path.join(PROJECT_ROOT, "build"), os.path.join(PROJECT_ROOT, "src"))
+COMMANDS = ("tokenize", "parse", "ast")
+
+_sessions = {}  # (lexer backend, parser backend) -> FrontEndSession
+
+
+def session(lexer_backend: str = None, parser_backend: str = None):
+    """The FrontEndSession of this process for the given backends."""
+    key = resolve_lexer_backend(lexer_backend), resolve_parser_backend(parser_backend)
+    if key not in _sessions:
+        from src.frontend.session import FrontEndSession
+
+        _sessions[key] = FrontEndSession(key[0], load_dfa=False, parser_backend=key[1])
+    return _sessions[key]
+
+
+def tokenize(source: str, lexer_backend: str = None) -> str:
+    """Return the tokens of ``source`` formatted like Tokenizer; lexer
+    errors are raised."""
+    if resolve_lexer_backend(lexer_backend) != "fast":
+        return session(lexer_backend).tokenize(source)
+    from src.frontend.fast_lexer import TyCFastLexer
+
+    lexer = TyCFastLexer(source)
+    names = lexer.symbolicNames
+    tokens = [f"{names[ttype]},{text}" for ttype, text in lexer.tokenize()]
+    tokens.append("EOF")
+    return ",".join(tokens)
+
+
+def _descent_only(lexer_backend, parser_backend) -> bool:
+    return (resolve_lexer_backend(lexer_backend) == "fast"
+            and resolve_parser_backend(parser_backend) == "descent")
+
+
+def parse(source: str, lexer_backend: str = None, parser_backend: str = None) -> str:
+    """Parse ``source``; return ``"success"`` or the error message."""
+    if not _descent_only(lexer_backend, parser_backend):
+        return session(lexer_backend, parser_backend).parse(source)
+    from src.frontend.descent import DescentParser
+
+    try:
+        DescentParser(source, "fast").parse()
+        return "success"
+    except Exception as e:
+        return str(e)
+
+
+def build_ast(source: str, lexer_backend: str = None, parser_backend: str = None):
+    """Return the AST of ``source`` or an ``"AST Generation Error: ..."``
+    message."""
+    if not _descent_only(lexer_backend, parser_backend):
+        return session(lexer_backend, parser_backend).build_ast(source)
+    from src.frontend.descent import DescentParser
+
+    try:
+        return DescentParser(source, "fast").parse()
+    except Exception as e:
+        return f"AST Generation Error: {str(e)}"
+
+
+def run(command: str, source: str, lexer_backend: str = None,
+        parser_backend: str = None) -> tuple:
+    """Run ``command`` on ``source``; return whether it succeeded and the
+    text to print."""
+    if command == "tokenize":
+        from lexererr import LexerError
+
+        try:
+            return True, tokenize(source, lexer_backend)
+        except LexerError as e:
+            return False, str(e)
+    if command == "parse":
+        result = parse(source, lexer_backend, parser_backend)
+        return result == "success", result
+    result = str(build_ast(source, lexer_backend, parser_backend))
+    return not result.startswith("AST Generation Error:"), result
+
+
+def precompile(directories=PRECOMPILED_DIRS) -> bool:
+    """Write checked-hash bytecode for every module below ``directories``;
+    returns whether all of them compiled."""
+    import compileall
+    from py_compile import PycInvalidationMode
+
+    return all([
+        compileall.compile_dir(directory, quiet=1, invalidation_mode=PycInvalidationMode.CHECKED_HASH)
+        for directory in directories
+    ])
+
+
+def main(argv=None):
+    # not needed by the functions above, so not imported with them
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the TyC front end on source files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in COMMANDS:
+        subparser = commands.add_parser(command, help=f"{command} each file")
+        subparser.add_argument("files", nargs="+")
+        subparser.add_argument("--lexer", choices=["antlr", "fast"], default=None)
+        subparser.add_argument("--parser", choices=["antlr", "descent"], default=None)
+    commands.add_parser("precompile", help="write checked-hash bytecode for build/ and src/")
+    args = parser.parse_args(argv)
+
+    if args.command == "precompile":
+        return 0 if precompile() else 1
+    failed = False
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            ok, result = run(args.command, f.read(), args.lexer, args.parser)
+        failed |= not ok
+        print(result if len(args.files) == 1 else f"{path}: {result}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Parse strategies for TyCParser.
+``ll`` runs ``program()`` once in the runtime's default full-LL prediction
+mode. ``two-stage`` first parses with SLL prediction and a bail-out error
+strategy, which is faster but may reject valid input; only when that fails
+is the input parsed again with full LL and the regular error listener, so
+syntax errors are reported exactly as with ``ll``.
+"""
+
+import time
+
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+
+PARSE_STRATEGIES = ("ll", "two-stage")
+
+
+def resolve_parse_strategy(strategy=None):
+    """Return a validated parse strategy name; ``None`` means ``ll``."""
+    strategy = strategy or "ll"
+    if strategy not in PARSE_STRATEGIES:
+        raise ValueError(
+            f"Unknown parse strategy '{strategy}', expected one of {PARSE_STRATEGIES}"
+        )
+    return strategy
+
+
+class ParseRecord:
+    """Timings of one two-stage parse; ``ll_seconds`` is None without fallback."""
+
+    __slots__ = ("sll_seconds", "ll_seconds")
+
+    def __init__(self, sll_seconds: float, ll_seconds: float = None):
+        self.sll_seconds = sll_seconds
+        self.ll_seconds = ll_seconds
+
+    @property
+    def fallback(self) -> bool:
+        return self.ll_seconds is not None
+
+    def __repr__(self):
+        return f"ParseRecord(sll_seconds={self.sll_seconds!r}, ll_seconds={self.ll_seconds!r})"
+
+
+class ParseStats:
+    """Per-input records of the two-stage strategy and their totals."""
+
+    def __init__(self):
+        self.records = []
+
+    def add(self, record: ParseRecord):
+        self.records.append(record)
+
+    def clear(self):
+        self.records = []
+
+    @property
+    def inputs(self) -> int:
+        return len(self.records)
+
+    @property
+    def fallbacks(self) -> int:
+        return sum(1 for record in self.records if record.fallback)
+
+    @property
+    def sll_seconds(self) -> float:
+        return sum(record.sll_seconds for record in self.records)
+
+    @property
+    def ll_seconds(self) -> float:
+        return sum(record.ll_seconds for record in self.records if record.fallback)
+
+    def summary(self) -> str:
+        rate = self.fallbacks / self.inputs if self.inputs else 0.0
+        return (
+            f"{self.inputs} inputs, {self.fallbacks} LL fallbacks ({rate:.1%}), "
+            f"SLL {self.sll_seconds * 1000:.1f} ms, LL {self.ll_seconds * 1000:.1f} ms"
+        )
+
+
+def parse_program(parser, rewind, strategy=None, stats: ParseStats = None):
+    """Run ``parser.program()`` with the given strategy and return the tree.
+
+    ``rewind`` is called before the LL stage and must point ``parser`` at a
+    fresh token stream over the same input: lexer errors and partially
+    consumed tokens from the SLL attempt must not leak into it.
+    """
+    if resolve_parse_strategy(strategy) == "ll":
+        return parser.program()
+
+    interp = parser._interp
+    listeners = parser._listeners
+    error_handler = parser._errHandler
+    start = time.perf_counter()
+    try:
+        parser._listeners = []
+        parser._errHandler = BailErrorStrategy()
+        interp.predictionMode = PredictionMode.SLL
+        tree = parser.program()
+    except Exception:
+        # ParseCancellationException from the bail-out strategy, or a lexer
+        # error; either way LL decides what is reported
+        tree = None
+    finally:
+        parser._listeners = listeners
+        parser._errHandler = error_handler
+        interp.predictionMode = PredictionMode.LL
+    sll_seconds = time.perf_counter() - start
+    if tree is not None:
+        if stats is not None:
+            stats.add(ParseRecord(sll_seconds))
+        return tree
+
+    rewind()
+    start = time.perf_counter()
+    try:
+        return parser.program()
+    finally:
+        if stats is not None:
+            stats.add(ParseRecord(sll_seconds, time.perf_counter() - start))
@@ -0,0 +1,275 @@
+"""
+Compact token storage for TyC front end.
+CompactTokenBuffer keeps the type, start/stop offsets, line and column of
+every token in parallel ``array`` columns (17 bytes per token) instead of one
+CommonToken object per token, and slices token text out of the source only
+when it is asked for. CompactTokenStream adapts the buffer to the TokenStream
+interface so the generated TyCParser can parse from it.
+"""
+
+from array import array
+from io import StringIO
+from itertools import islice
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import CommonToken, Token
+from antlr4.error.Errors import IllegalStateException
+
+from src.frontend.backends import create_lexer
+from src.frontend.fast_lexer import TyCFastLexer
+
+# Token type whose text is the lexeme without its quotes (see TyC.g4)
+STRING_LIT = TyCFastLexer.STRING_LIT
+
+_new_token = CommonToken.__new__
+
+
+def scan_token_source(lexer):
+    """Yield (type, start, stop, line, column) tuples from any token source."""
+    while True:
+        token = lexer.nextToken()
+        yield token.type, token.start, token.stop, token.line, token.column
+        if token.type == Token.EOF:
+            return
+
+
+class CompactTokenBuffer:
+    """Array-backed token store filled lazily from a token scanner.
+
+    Tokens are pulled on demand, so a lexical error is raised when the token
+    that causes it is first needed, exactly as with CommonTokenStream.
+    """
+
+    def __init__(self, source, scanner):
+        self.source = source
+        if isinstance(source, str):
+            self._get_text = lambda start, stop: source[start : stop + 1]
+        else:
+            self._get_text = source.getText
+        self._scanner = scanner
+        self._factory = CommonTokenFactory.DEFAULT
+        self._tokenFactorySourcePair = (self, None)
+        self.fetchedEOF = False
+        self.types = array("b")
+        self.starts = array("i")
+        self.stops = array("i")
+        self.lines = array("i")
+        self.columns = array("i")
+
+    @classmethod
+    def from_source(cls, source, backend=None) -> "CompactTokenBuffer":
+        """Create a buffer lexing ``source`` (str or CharStream) on demand."""
+        return cls.from_lexer(create_lexer(source, backend), source)
+
+    @classmethod
+    def from_lexer(cls, lexer, source) -> "CompactTokenBuffer":
+        """Create a buffer reading tokens of ``source`` from ``lexer``."""
+        if hasattr(lexer, "scan"):
+            return cls(source, lexer.scan())
+        return cls(lexer.inputStream, scan_token_source(lexer))
+
+    def __len__(self):
+        return len(self.types)
+
+    def fetch(self, n: int) -> int:
+        """Pull up to ``n`` more tokens; returns how many were added."""
+        if self.fetchedEOF:
+            return 0
+        fetched = 0
+        scanner = (next(self._scanner),) if n == 1 else islice(self._scanner, n)
+        for ttype, start, stop, line, column in scanner:
+            self.types.append(ttype)
+            self.starts.append(start)
+            self.stops.append(stop)
+            self.lines.append(line)
+            self.columns.append(column)
+            fetched += 1
+            if ttype == Token.EOF:
+                self.fetchedEOF = True
+                self._scanner = None
+                break
+        return fetched
+
+    def sync(self, i: int) -> bool:
+        """Make sure token ``i`` is buffered (if the input has that many)."""
+        n = i - len(self.types) + 1
+        if n > 0:
+            return self.fetch(n) >= n
+        return True
+
+    def fill(self) -> "CompactTokenBuffer":
+        while self.fetch(1000) == 1000:
+            pass
+        return self
+
+    def text(self, i: int) -> str:
+        """Return the text of token ``i``, sliced from the source."""
+        ttype = self.types[i]
+        if ttype == Token.EOF:
+            return "<EOF>"
+        if ttype == STRING_LIT:
+            return self._get_text(self.starts[i] + 1, self.stops[i] - 1)
+        return self._get_text(self.starts[i], self.stops[i])
+
+    def token(self, i: int) -> CommonToken:
+        """Materialize token ``i`` as a CommonToken."""
+        # Fill the slots directly; CommonToken.__init__ would ask the token
+        # source for its current line and column
+        token = _new_token(CommonToken)
+        token.source = self._tokenFactorySourcePair
+        token.type = self.types[i]
+        token.channel = Token.DEFAULT_CHANNEL
+        token.start = self.starts[i]
+        token.stop = self.stops[i]
+        token.tokenIndex = i
+        token.line = self.lines[i]
+        token.column = self.columns[i]
+        token._text = self.text(i)
+        return token
+
+    def nbytes(self) -> int:
+        """Memory used by the token columns (excluding over-allocation)."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.types, self.starts, self.stops, self.lines, self.columns)
+        )
+
+    def to_string(self, symbolic_names) -> str:
+        """Format the tokens like Tokenizer.get_tokens_as_string()."""
+        self.fill()
+        parts = [
+            f"{symbolic_names[self.types[i]]},{self.text(i)}"
+            for i in range(len(self.types))
+            if self.types[i] != Token.EOF
+        ]
+        parts.append("EOF")
+        return ",".join(parts)
+
+    # The parser asks its token stream's tokenSource for these
+    def getSourceName(self):
+        return "<unknown>"
+
+
+class CompactTokenStream:
+    """TokenStream over a CompactTokenBuffer, consumable by TyCParser.
+
+    Follows BufferedTokenStream's semantics (all TyC tokens are on the
+    default channel). ``LA`` reads the type column directly; token objects
+    are only created for ``LT``, i.e. for the tokens the parser consumes.
+    """
+
+    # Materialized tokens kept around for repeated LT() calls on the same index
+    CACHE_SIZE = 64
+
+    def __init__(self, buffer: CompactTokenBuffer):
+        self.buffer = buffer
+        self.tokenSource = buffer
+        self.index = -1
+        self._cache = {}
+
+    def lazyInit(self):
+        if self.index == -1:
+            self.buffer.sync(0)
+            self.index = 0
+
+    def mark(self):
+        return 0
+
+    def release(self, marker: int):
+        pass
+
+    def reset(self):
+        self.seek(0)
+
+    def seek(self, index: int):
+        self.lazyInit()
+        self.index = index
+
+    def get(self, index: int):
+        self.lazyInit()
+        return self._token(index)
+
+    def consume(self):
+        buffer = self.buffer
+        index = self.index
+        if index >= 0:
+            if buffer.fetchedEOF:
+                skipEofCheck = index < len(buffer) - 1
+            else:
+                skipEofCheck = index < len(buffer)
+        else:
+            skipEofCheck = False
+        if not skipEofCheck and self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        if buffer.sync(self.index + 1):
+            self.index += 1
+
+    def LA(self, k: int):
+        if self.index == -1:
+            self.lazyInit()
+        if k == 0:
+            return None
+        if k < 0:
+            i = self.index + k
+            return self.buffer.types[i] if i >= 0 else None
+        i = self.index + k - 1
+        buffer = self.buffer
+        if i >= len(buffer.types):
+            buffer.sync(i)
+            if i >= len(buffer.types):
+                i = len(buffer.types) - 1
+        return buffer.types[i]
+
+    def LT(self, k: int):
+        if k == 1:
+            # The parser asks for the current token far more than any other
+            token = self._cache.get(self.index)
+            if token is not None:
+                return token
+        self.lazyInit()
+        if k == 0:
+            return None
+        if k < 0:
+            i = self.index + k
+            return self._token(i) if i >= 0 else None
+        i = self.index + k - 1
+        buffer = self.buffer
+        buffer.sync(i)
+        if i >= len(buffer):
+            i = len(buffer) - 1
+        return self._token(i)
+
+    def _token(self, i: int):
+        token = self._cache.get(i)
+        if token is None:
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            token = self._cache[i] = self.buffer.token(i)
+        return token
+
+    def getText(self, start=None, stop=None):
+        self.lazyInit()
+        self.fill()
+        if isinstance(start, Token):
+            start = start.tokenIndex
+        elif start is None:
+            start = 0
+        if isinstance(stop, Token):
+            stop = stop.tokenIndex
+        elif stop is None or stop >= len(self.buffer):
+            stop = len(self.buffer) - 1
+        if start < 0 or stop < 0 or stop < start:
+            return ""
+        with StringIO() as buf:
+            for i in range(start, stop + 1):
+                if self.buffer.types[i] == Token.EOF:
+                    break
+                buf.write(self.buffer.text(i))
+            return buf.getvalue()
+
+    def fill(self):
+        self.lazyInit()
+        self.buffer.fill()
+
+    def getSourceName(self):
+        return self.buffer.getSourceName()
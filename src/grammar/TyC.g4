@@ -68,7 +68,7 @@ stmt
     | BREAK SEMI                                            # Break
     | CONTINUE SEMI                                         # Continue
     | RETURN expr? SEMI                                     # Return
-    | expr SEMI                                             # Exprstmt
+    | stmtExpr SEMI                                         # Exprstmt
     ;
 
 varDeclStmt
@@ -94,26 +94,57 @@ forInit
     ;
 
 //expressions
+// binary operators are parsed as a flat operand/operator sequence;
+// ASTGeneration applies their precedence and associativity
 expr
-    : primary                                           # PrimaryExpr
-    | expr DOT ID                                       # MemberAccessExpr
-    | expr LPAREN (expr (COMMA expr)*)? RPAREN          # CallExpr
-    | expr (INC | DEC)                                  # PostfixExpr
-    | (INC | DEC) expr                                  # PrefixExpr
-    | (NOT | ADD | SUB) expr                            # UnaryExpr
-    | expr (MUL | DIV | MOD) expr                       # MultiExpr
-    | expr (ADD | SUB) expr                             # AddExpr
-    | expr (LT | GT | LE | GE) expr                     # RelationalExpr
-    | expr (EQUAL | NOTEQUAL) expr                      # EqualityExpr
-    | expr AND expr                                     # LogicAndExpr
-    | expr OR expr                                      # LogicOrExpr
-    | <assoc=right> expr ASSIGN expr                    # AssignExpr
+    : operand (binaryOp operand)*
+    ;
+
+// an expression statement cannot start with a struct literal, so a
+// statement starting with '{' is always a block (one token of lookahead)
+stmtExpr
+    : leadingOperand (binaryOp operand)*
+    ;
+
+operand
+    : prefixOp operand
+    | primary postfixOp*
+    ;
+
+leadingOperand
+    : prefixOp operand
+    | atom postfixOp*
+    ;
+
+prefixOp
+    : INC | DEC | NOT | ADD | SUB
+    ;
+
+postfixOp
+    : DOT ID
+    | LPAREN (expr (COMMA expr)*)? RPAREN
+    | INC
+    | DEC
+    ;
+
+binaryOp
+    : MUL | DIV | MOD
+    | ADD | SUB
+    | LT | GT | LE | GE
+    | EQUAL | NOTEQUAL
+    | AND
+    | OR
+    | ASSIGN
     ;
 
 primary
+    : atom
+    | structInit
+    ;
+
+atom
     : LPAREN expr RPAREN
     | literal
-    | structInit
     | ID
     ;
 
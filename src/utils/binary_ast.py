@@ -0,0 +1,273 @@
+"""
+Versioned binary AST format, loaded lazily through mmap.
+The file is a fixed header followed by the columns of a FlatAST and its
+string table. Loading maps the file and casts each column to a memoryview
+without copying; nodes are only built when they are accessed.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Optional, Union
+
+from .flat_ast import FIELDS, KIND_CODES, KINDS, NONE, FlatAST, flatten, unflatten
+from .nodes import ASTNode, InternTable, Program
+
+MAGIC = b"TYCAST\x00\x00"
+FORMAT_VERSION = 1
+
+# Identifies the node set; files written for other KINDS/FIELDS are rejected
+SCHEMA_HASH = hashlib.blake2b(
+    repr([(cls.__name__, FIELDS[cls]) for cls in KINDS]).encode(), digest_size=8
+).digest()
+
+# magic, version, byte order of the columns, schema hash, then the number of
+# nodes, children slots, floats, strings, string bytes and big ints
+HEADER = struct.Struct("<8sIB3x8s6Q")
+
+# (attribute, typecode, count field) in file order
+COLUMNS = (
+    ("kind", "B", "nodes"),
+    ("value", "q", "nodes"),
+    ("first_child", "i", "nodes"),
+    ("child_count", "i", "nodes"),
+    ("parent", "i", "nodes"),
+    ("line", "i", "nodes"),
+    ("column", "i", "nodes"),
+    ("children", "i", "children"),
+    ("floats", "d", "floats"),
+    ("string_offsets", "q", "string_offsets"),
+    ("big_int_ids", "i", "big_ints"),
+    ("big_int_strings", "i", "big_ints"),
+    ("string_data", "B", "string_bytes"),
+)
+BYTE_ORDERS = {"little": 0, "big": 1}
+ALIGNMENT = 8
+
+
+class BinaryASTError(ValueError):
+    """A file that is not a binary AST of this format version and node set."""
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _counts(nodes, children, floats, strings, string_bytes, big_ints) -> dict:
+    return {
+        "nodes": nodes,
+        "children": children,
+        "floats": floats,
+        "string_offsets": strings + 1,
+        "string_bytes": string_bytes,
+        "big_ints": big_ints,
+    }
+
+
+def encode(node: Union[ASTNode, FlatAST]) -> bytes:
+    """Serialize an AST (or its FlatAST) to the binary format."""
+    flat = node if isinstance(node, FlatAST) else flatten(node)
+    encoded = [text.encode("utf-8") for text in flat.strings]
+    big_ints = sorted(flat.big_ints.items())
+    offsets = array("q", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    big_int_strings = array("i")
+    for _, number in big_ints:
+        big_int_strings.append(len(encoded))
+        encoded.append(str(number).encode("ascii"))
+        offsets.append(offsets[-1] + len(encoded[-1]))
+    columns = {
+        "kind": flat.kind,
+        "value": flat.value,
+        "first_child": flat.first_child,
+        "child_count": flat.child_count,
+        "parent": flat.parent,
+        "line": flat.line,
+        "column": flat.column,
+        "children": flat.children,
+        "floats": flat.floats,
+        "string_offsets": offsets,
+        "big_int_ids": array("i", [i for i, _ in big_ints]),
+        "big_int_strings": big_int_strings,
+        "string_data": b"".join(encoded),
+    }
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, BYTE_ORDERS[sys.byteorder], SCHEMA_HASH,
+        len(flat), len(flat.children), len(flat.floats), len(encoded),
+        offsets[-1], len(big_ints),
+    )
+    out = bytearray(header)
+    for name, _, _ in COLUMNS:
+        out.extend(bytes(_align(len(out)) - len(out)))
+        out.extend(columns[name])
+    return bytes(out)
+
+
+def dump(node: Union[ASTNode, FlatAST], path: str) -> None:
+    """Write ``node`` to ``path`` in the binary format."""
+    with open(path, "wb") as f:
+        f.write(encode(node))
+
+
+def loads(data) -> "MappedAST":
+    """Open a binary AST held in a bytes-like object without copying it."""
+    return MappedAST(data)
+
+
+def load(path: str) -> "MappedAST":
+    """Memory-map the binary AST at ``path``; close the result when done."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses empty files
+            raise BinaryASTError("truncated binary AST header")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return MappedAST(data, mapping=data)
+    except BinaryASTError:
+        data.close()
+        raise
+
+
+class StringTable(Sequence):
+    """Strings of a MappedAST, decoded on first access."""
+
+    def __init__(self, offsets: memoryview, data: memoryview, count: int):
+        self._offsets = offsets
+        self._data = data
+        self._count = count
+        self._decoded = [None] * count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        text = self._decoded[index]
+        if text is None:
+            start, stop = self._offsets[index], self._offsets[index + 1]
+            text = self._decoded[index] = str(self._data[start:stop], "utf-8")
+        return text
+
+
+class LazyNodeList(Sequence):
+    """Child list whose nodes are materialized from a MappedAST on access."""
+
+    def __init__(self, ast: "MappedAST", ids: list):
+        self._ast = ast
+        self._ids = ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._ast.node(i) for i in self._ids[index]]
+        return self._ast.node(self._ids[index])
+
+
+class MappedAST(FlatAST):
+    """A FlatAST whose columns are memoryviews over a binary AST buffer.
+
+    ``root`` is the top-level node; for a Program its ``decls`` is a
+    LazyNodeList, so each declaration is built when it is first accessed.
+    ``node(i)`` builds (and caches) the subtree of any node id.
+    """
+
+    def __init__(self, data, mapping: Optional[mmap.mmap] = None):
+        self._mapping = mapping
+        self._buffer = memoryview(data)
+        if len(self._buffer) < HEADER.size:
+            raise BinaryASTError("truncated binary AST header")
+        magic, version, byte_order, schema, *counts = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise BinaryASTError("not a binary AST file")
+        if version != FORMAT_VERSION:
+            raise BinaryASTError(f"binary AST format {version}, expected {FORMAT_VERSION}")
+        if byte_order != BYTE_ORDERS[sys.byteorder]:
+            raise BinaryASTError("binary AST written with a different byte order")
+        if schema != SCHEMA_HASH:
+            raise BinaryASTError("binary AST written for a different node set")
+        counts = _counts(*counts)
+
+        views: Dict[str, memoryview] = {}
+        offset = HEADER.size
+        for name, typecode, count in COLUMNS:
+            offset = _align(offset)
+            size = counts[count] * array(typecode).itemsize
+            if offset + size > len(self._buffer):
+                raise BinaryASTError("truncated binary AST")
+            views[name] = self._buffer[offset:offset + size].cast(typecode)
+            offset += size
+        self._views = views
+
+        self.kind = views["kind"]
+        self.value = views["value"]
+        self.first_child = views["first_child"]
+        self.child_count = views["child_count"]
+        self.parent = views["parent"]
+        self.line = views["line"]
+        self.column = views["column"]
+        self.children = views["children"]
+        self.floats = views["floats"]
+        self.strings = StringTable(
+            views["string_offsets"], views["string_data"], counts["string_offsets"] - 1
+        )
+        self.big_ints = {
+            i: int(self.strings[index])
+            for i, index in zip(views["big_int_ids"], views["big_int_strings"])
+        }
+        self._nodes: Dict[int, ASTNode] = {}
+        self._interner = InternTable()
+        self._kind_offset = _align(HEADER.size)
+
+    def iter_kind(self, cls: type):
+        token = bytes([KIND_CODES[cls]])
+        base, end = self._kind_offset, self._kind_offset + len(self)
+        haystack = self._mapping if self._mapping is not None else self._buffer.obj
+        if not hasattr(haystack, "find"):
+            haystack = self._buffer.tobytes()
+        find = haystack.find
+        i = find(token, base, end)
+        while i != NONE:
+            yield i - base
+            i = find(token, i + 1, end)
+
+    def node(self, i: int) -> ASTNode:
+        """The node with id ``i``, built with its subtree on first access."""
+        node = self._nodes.get(i)
+        if node is None:
+            node = self._nodes[i] = unflatten(self, i, self._interner)
+        return node
+
+    @property
+    def root(self) -> ASTNode:
+        if len(self) and KINDS[self.kind[0]] is Program:
+            root = self._nodes.get(0)
+            if root is None:
+                root = self._nodes[0] = Program(LazyNodeList(self, list(self.iter_children(0))))
+            return root
+        return self.node(0)
+
+    @property
+    def materialized(self) -> int:
+        """Number of subtrees built so far."""
+        return len(self._nodes)
+
+    def close(self) -> None:
+        """Release the buffer; nodes already built stay valid."""
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        self._buffer.release()
+        if self._mapping is not None:
+            self._mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,10 +1,6 @@
 from antlr4.error.ErrorListener import ConsoleErrorListener
 
-
-class SyntaxException(Exception):
-    def __init__(self, msg):
-        self.message = msg
-        super().__init__(msg)
+from src.utils.errors import SyntaxException
 
 
 class NewErrorListener(ConsoleErrorListener):
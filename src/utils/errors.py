@@ -0,0 +1,11 @@
+"""
+Syntax errors of the TyC front end. Kept apart from error_listener.py, so
+that the fast lexer and DescentParser can raise them without loading the
+ANTLR runtime.
+"""
+
+
+class SyntaxException(Exception):
+    def __init__(self, msg):
+        self.message = msg
+        super().__init__(msg)
@@ -0,0 +1,327 @@
+"""
+Flat struct-of-arrays encoding of TyC ASTs.
+A FlatAST stores every node of a tree as an integer id in pre-order, with its
+kind, string/literal value, child range and source position in parallel
+``array`` columns, so whole-tree scans need no node objects.
+"""
+
+from array import array
+from typing import Iterator, Optional, Tuple
+
+from . import nodes
+from .nodes import ASTNode, FloatLiteral, FuncCall, InternTable, IntLiteral, StringLiteral, StructType
+
+# Node classes by kind code
+KINDS = (
+    nodes.Program,
+    nodes.StructDecl,
+    nodes.MemberDecl,
+    nodes.FuncDecl,
+    nodes.Param,
+    nodes.IntType,
+    nodes.FloatType,
+    nodes.StringType,
+    nodes.VoidType,
+    nodes.StructType,
+    nodes.BlockStmt,
+    nodes.VarDecl,
+    nodes.AssignStmt,
+    nodes.IfStmt,
+    nodes.WhileStmt,
+    nodes.ForStmt,
+    nodes.SwitchStmt,
+    nodes.CaseStmt,
+    nodes.DefaultStmt,
+    nodes.BreakStmt,
+    nodes.ContinueStmt,
+    nodes.ReturnStmt,
+    nodes.ExprStmt,
+    nodes.BinaryOp,
+    nodes.PrefixOp,
+    nodes.PostfixOp,
+    nodes.AssignExpr,
+    nodes.MemberAccess,
+    nodes.FuncCall,
+    nodes.Identifier,
+    nodes.StructLiteral,
+    nodes.IntLiteral,
+    nodes.FloatLiteral,
+    nodes.StringLiteral,
+)
+KIND_CODES = {cls: code for code, cls in enumerate(KINDS)}
+
+# Constructor fields of each kind, in argument order. A bare name is a child
+# node that may be None, "*name" a list of child nodes (at most one per kind),
+# "$name" a string kept in the string table and "=value" a literal value.
+# FuncCall.name is a string or, for callees like ``s.f``, an expression node.
+FIELDS = {
+    nodes.Program: ("*decls",),
+    nodes.StructDecl: ("$name", "*members"),
+    nodes.MemberDecl: ("member_type", "$name"),
+    nodes.FuncDecl: ("return_type", "$name", "*params", "body"),
+    nodes.Param: ("param_type", "$name"),
+    nodes.IntType: (),
+    nodes.FloatType: (),
+    nodes.StringType: (),
+    nodes.VoidType: (),
+    nodes.StructType: ("$struct_name",),
+    nodes.BlockStmt: ("*statements",),
+    nodes.VarDecl: ("var_type", "$name", "init_value"),
+    nodes.AssignStmt: ("assign_expr",),
+    nodes.IfStmt: ("condition", "then_stmt", "else_stmt"),
+    nodes.WhileStmt: ("condition", "body"),
+    nodes.ForStmt: ("init", "condition", "update", "body"),
+    nodes.SwitchStmt: ("expr", "*cases", "default_case"),
+    nodes.CaseStmt: ("expr", "*statements"),
+    nodes.DefaultStmt: ("*statements",),
+    nodes.BreakStmt: (),
+    nodes.ContinueStmt: (),
+    nodes.ReturnStmt: ("expr",),
+    nodes.ExprStmt: ("expr",),
+    nodes.BinaryOp: ("left", "$operator", "right"),
+    nodes.PrefixOp: ("$operator", "operand"),
+    nodes.PostfixOp: ("$operator", "operand"),
+    nodes.AssignExpr: ("lhs", "rhs"),
+    nodes.MemberAccess: ("obj", "$member"),
+    nodes.FuncCall: ("$name", "*args"),
+    nodes.Identifier: ("$name",),
+    nodes.StructLiteral: ("*values",),
+    nodes.IntLiteral: ("=value",),
+    nodes.FloatLiteral: ("=value",),
+    nodes.StringLiteral: ("$value",),
+}
+
+# Number of plain (single child) fields of each kind
+SINGLE_CHILDREN = {
+    cls: sum(1 for field in fields if field[0] not in "$*=")
+    for cls, fields in FIELDS.items()
+}
+
+# FIELDS split into (marker, attribute) pairs, "" marking a single child
+_PLANS = {
+    cls: tuple(
+        (field[0], field[1:]) if field[0] in "$*=" else ("", field) for field in fields
+    )
+    for cls, fields in FIELDS.items()
+}
+
+NONE = -1
+INT64_MIN, INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+class FlatAST:
+    """A tree of ``nodes.py`` instances as parallel typed arrays.
+
+    Node ``i`` (0 is the root, ids are in pre-order, so every node comes
+    before its descendants) has:
+
+    - ``kind[i]``: index into ``KINDS``
+    - ``value[i]``: ``strings`` index of its ``$`` field, the IntLiteral value,
+      the ``floats`` index of a FloatLiteral, or -1
+    - ``children[first_child[i]:first_child[i] + child_count[i]]``: its child
+      ids in field order, -1 for a None field
+    - ``parent[i]``: parent id, -1 for the root
+    - ``line[i]``, ``column[i]``: source position, -1 when unset
+
+    IntLiteral values outside the int64 range are kept in ``big_ints``.
+    """
+
+    def __init__(self):
+        self.kind = array("B")
+        self.value = array("q")
+        self.first_child = array("i")
+        self.child_count = array("i")
+        self.parent = array("i")
+        self.line = array("i")
+        self.column = array("i")
+        self.children = array("i")
+        self.floats = array("d")
+        self.strings = []
+        self.big_ints = {}
+
+    def __len__(self):
+        return len(self.kind)
+
+    # Traversal
+
+    def node_class(self, i: int) -> type:
+        return KINDS[self.kind[i]]
+
+    def child_slots(self, i: int) -> range:
+        """Indices into ``children`` holding the child ids of node ``i``."""
+        start = self.first_child[i]
+        return range(start, start + self.child_count[i])
+
+    def iter_children(self, i: int) -> Iterator[int]:
+        """Ids of the children of node ``i``, skipping None fields."""
+        children = self.children
+        for slot in self.child_slots(i):
+            child = children[slot]
+            if child != NONE:
+                yield child
+
+    def subtree_end(self, i: int) -> int:
+        """Id following the last descendant of node ``i``; the subtree of ``i``
+        is the id range ``[i, subtree_end(i))``."""
+        children = self.children
+        while True:
+            slots = self.child_slots(i)
+            last = max((children[slot] for slot in slots), default=NONE)
+            if last == NONE:
+                return i + 1
+            i = last
+
+    def iter_kind(self, cls: type) -> Iterator[int]:
+        """Ids of all nodes of class ``cls``, in pre-order."""
+        code = KIND_CODES[cls]
+        kind = self.kind
+        i = _find(kind, code, 0)
+        while i != NONE:
+            yield i
+            i = _find(kind, code, i + 1)
+
+    def text(self, i: int) -> Optional[str]:
+        """String field of node ``i`` (name, operator, string literal), if any."""
+        value = self.value[i]
+        if value == NONE or self.kind[i] in (_INT_LITERAL, _FLOAT_LITERAL):
+            return None
+        return self.strings[value]
+
+    def literal(self, i: int):
+        """Value of an IntLiteral, FloatLiteral or StringLiteral node."""
+        kind = self.kind[i]
+        if kind == _INT_LITERAL:
+            return self.big_ints.get(i, self.value[i])
+        if kind == _FLOAT_LITERAL:
+            return self.floats[self.value[i]]
+        if kind == _STRING_LITERAL:
+            return self.strings[self.value[i]]
+        raise ValueError(f"node {i} is a {KINDS[kind].__name__}, not a literal")
+
+    def position(self, i: int) -> Tuple[Optional[int], Optional[int]]:
+        line, column = self.line[i], self.column[i]
+        return (None if line == NONE else line, None if column == NONE else column)
+
+
+_INT_LITERAL = KIND_CODES[IntLiteral]
+_FLOAT_LITERAL = KIND_CODES[FloatLiteral]
+_STRING_LITERAL = KIND_CODES[StringLiteral]
+_FUNC_CALL = KIND_CODES[FuncCall]
+
+
+def _find(kind: array, code: int, start: int) -> int:
+    try:
+        return kind.index(code, start)
+    except ValueError:
+        return NONE
+
+
+def flatten(root: ASTNode) -> FlatAST:
+    """Encode the tree under ``root`` as a FlatAST (``root`` becomes node 0)."""
+    flat = FlatAST()
+    kind, value, parent = flat.kind, flat.value, flat.parent
+    first_child, child_count, children = flat.first_child, flat.child_count, flat.children
+    line, column = flat.line, flat.column
+    strings = flat.strings
+    string_ids = {}
+
+    def intern(text):
+        index = string_ids.get(text)
+        if index is None:
+            index = string_ids[text] = len(strings)
+            strings.append(text)
+        return index
+
+    # (node, parent id, children slot to patch with the node's id)
+    stack = [(root, NONE, NONE)]
+    while stack:
+        node, parent_id, slot = stack.pop()
+        i = len(kind)
+        if slot != NONE:
+            children[slot] = i
+        cls = type(node)
+        kind.append(KIND_CODES[cls])
+        parent.append(parent_id)
+        node_line, node_column = node.line, node.column
+        line.append(NONE if node_line is None else node_line)
+        column.append(NONE if node_column is None else node_column)
+
+        node_value = NONE
+        child_nodes = []
+        for marker, name in _PLANS[cls]:
+            if not marker:
+                child_nodes.append(getattr(node, name))
+            elif marker == "*":
+                child_nodes.extend(getattr(node, name))
+            elif marker == "$":
+                text = getattr(node, name)
+                if isinstance(text, str):
+                    node_value = intern(text)
+                else:  # FuncCall on a callee expression
+                    child_nodes.append(text)
+            else:
+                literal = node.value
+                if cls is FloatLiteral:
+                    node_value = len(flat.floats)
+                    flat.floats.append(literal)
+                elif INT64_MIN <= literal <= INT64_MAX:
+                    node_value = literal
+                else:
+                    node_value = 0
+                    flat.big_ints[i] = literal
+        value.append(node_value)
+
+        first = len(children)
+        first_child.append(first)
+        child_count.append(len(child_nodes))
+        children.extend([NONE] * len(child_nodes))
+        for offset in range(len(child_nodes) - 1, -1, -1):
+            child = child_nodes[offset]
+            if child is not None:
+                stack.append((child, i, first + offset))
+    return flat
+
+
+def unflatten(flat: FlatAST, root: int = 0, interner: InternTable = None) -> ASTNode:
+    """Rebuild the ``nodes.py`` tree encoded by ``flat`` under node ``root``
+    (the whole tree by default) and return its root node. StructTypes are
+    shared per name through ``interner`` (a new InternTable by default)."""
+    if interner is None:
+        interner = InternTable()
+    end = flat.subtree_end(root)
+    built = [None] * (end - root)
+    kind, value, children = flat.kind, flat.value, flat.children
+    first_child, child_count = flat.first_child, flat.child_count
+    line, column = flat.line, flat.column
+    strings = flat.strings
+    # children have larger ids than their parent, so build in reverse pre-order
+    for i in range(end - 1, root - 1, -1):
+        cls = KINDS[kind[i]]
+        slot = first_child[i]
+        # a "$" FuncCall name stored as a child takes the first slot
+        callee = kind[i] == _FUNC_CALL and value[i] == NONE
+        list_length = child_count[i] - SINGLE_CHILDREN[cls] - callee
+        args = []
+        for marker, _ in _PLANS[cls]:
+            if not marker:
+                child = children[slot]
+                args.append(None if child == NONE else built[child - root])
+                slot += 1
+            elif marker == "*":
+                args.append([built[child - root] for child in children[slot:slot + list_length]])
+                slot += list_length
+            elif marker == "$":
+                if callee:
+                    args.append(built[children[slot] - root])
+                    slot += 1
+                else:
+                    args.append(strings[value[i]])
+            else:
+                args.append(flat.literal(i))
+        node = interner.struct_type(*args) if cls is StructType else cls(*args)
+        if line[i] != NONE:
+            node.line = line[i]
+        if column[i] != NONE:
+            node.column = column[i]
+        built[i - root] = node
+    return built[0]
@@ -0,0 +1,184 @@
+"""
+Structural (Merkle) hashes of TyC ASTs.
+The hash of a node covers its class, its string and literal fields and the
+hashes of its children, but not its source position, so two subtrees have
+the same hash exactly when they print the same. Hashes are BLAKE2b digests
+and therefore stable across processes and runs; they can serve as cache keys.
+"""
+
+from hashlib import blake2b
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .flat_ast import FIELDS
+from .nodes import ASTNode
+
+HASH_SIZE = 16
+# Bumped whenever the hashed encoding changes
+HASH_VERSION = 1
+# Copied for every node, which is faster than setting up a new BLAKE2b state
+_EMPTY = blake2b(digest_size=HASH_SIZE, person=f"tyc-ast-{HASH_VERSION}".encode())
+
+# FIELDS as (marker, attribute) pairs, "" marking a single child
+_PLANS = {
+    cls: tuple(
+        (field[0], field[1:]) if field[0] in "$*=" else ("", field) for field in fields
+    )
+    for cls, fields in FIELDS.items()
+}
+
+
+def _plan(cls: type) -> tuple:
+    for base in cls.__mro__:
+        if base in _PLANS:
+            plan = _PLANS[cls] = _PLANS[base]
+            return plan
+    raise TypeError(f"{cls.__name__} is not a TyC AST node class")
+
+
+def _unhashed(node: ASTNode) -> List[ASTNode]:
+    """Nodes of the subtree of ``node`` without a cached hash, in pre-order
+    (so every node comes before its children); hashed subtrees are skipped."""
+    found = []
+    stack = [node]
+    plans = _PLANS
+    while stack:
+        node = stack.pop()
+        found.append(node)
+        for marker, name in plans.get(node.__class__) or _plan(node.__class__):
+            value = getattr(node, name)
+            if marker == "*":
+                stack += [child for child in value if child._hash is None]
+            elif marker != "=" and isinstance(value, ASTNode) and value._hash is None:
+                stack.append(value)
+    return found
+
+
+def _digest(node: ASTNode, plan: tuple) -> bytes:
+    """Hash of ``node`` from the hashes of its children."""
+    digest = _EMPTY.copy()
+    update = digest.update
+    update(node.__class__.__name__.encode())
+    for marker, name in plan:
+        value = getattr(node, name)
+        if marker == "*":
+            update(b"*%d:" % len(value))
+            for child in value:
+                update(child._hash)
+        elif isinstance(value, ASTNode):
+            update(b"+")
+            update(value._hash)
+        elif value is None:
+            update(b"-")
+        elif marker == "=":
+            update(b"=%s;" % repr(value).encode())
+        else:
+            text = value.encode("utf-8", "surrogatepass")
+            update(b"$%d:" % len(text))
+            update(text)
+    return digest.digest()
+
+
+def structural_hash(node: ASTNode) -> bytes:
+    """The structural hash of ``node``, computed bottom-up without recursion
+    on first use and cached on every node of the subtree.
+
+    Nodes are mutable: after changing a hashed subtree, call ``clear_hashes``
+    on its root (and on every ancestor whose hash was taken).
+    """
+    cached = node._hash
+    if cached is not None:
+        return cached
+    plans = _PLANS
+    # children come after their parent in pre-order, so the reverse order
+    # hashes every child before its parent (a node that occurs more than once,
+    # like an interned type, is hashed again, which is cheaper than checking)
+    for item in reversed(_unhashed(node)):
+        item._hash = _digest(item, plans[item.__class__])
+    return node._hash
+
+
+def hex_hash(node: ASTNode) -> str:
+    """``structural_hash(node)`` as a hexadecimal string."""
+    return structural_hash(node).hex()
+
+
+def same_structure(a: ASTNode, b: ASTNode) -> bool:
+    """Whether ``a`` and ``b`` are the same tree apart from positions, i.e.
+    ``str(a) == str(b)``, in O(1) once both hashes are cached."""
+    return a is b or structural_hash(a) == structural_hash(b)
+
+
+def iter_subtree(node: ASTNode) -> Iterator[ASTNode]:
+    """Every node of the subtree of ``node``, in pre-order."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        children = []
+        for marker, name in _PLANS.get(node.__class__) or _plan(node.__class__):
+            value = getattr(node, name)
+            if marker == "*":
+                children.extend(value)
+            elif isinstance(value, ASTNode):
+                children.append(value)
+        children.reverse()
+        stack.extend(children)
+
+
+def clear_hashes(node: ASTNode) -> None:
+    """Drop the cached hashes of the subtree of ``node``."""
+    for item in iter_subtree(node):
+        if item._hash is not None:
+            del item._hash
+
+
+class HashIndex:
+    """Subtrees of an AST (usually a Program) by structural hash.
+
+    ``index[h]`` lists the nodes with hash ``h`` in pre-order; with
+    ``classes``, only nodes of those classes are indexed. ``duplicates()``
+    groups identical subtrees, e.g. function bodies that occur more than once.
+    """
+
+    def __init__(self, root: ASTNode, classes: Optional[Iterable[type]] = None):
+        self.root = root
+        self.classes = None if classes is None else tuple(classes)
+        structural_hash(root)
+        self._nodes: Dict[bytes, List[ASTNode]] = {}
+        for node in iter_subtree(root):
+            if self.classes is None or isinstance(node, self.classes):
+                self._nodes.setdefault(node._hash, []).append(node)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key) -> bool:
+        return self._key(key) in self._nodes
+
+    def __getitem__(self, key) -> List[ASTNode]:
+        return self._nodes[self._key(key)]
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._nodes)
+
+    def get(self, key, default=None):
+        return self._nodes.get(self._key(key), default)
+
+    @staticmethod
+    def _key(key) -> bytes:
+        """A hash, its hex string, or a node whose hash is looked up."""
+        if isinstance(key, ASTNode):
+            return structural_hash(key)
+        if isinstance(key, str):
+            return bytes.fromhex(key)
+        return key
+
+    def duplicates(self, cls: Optional[type] = None) -> Dict[bytes, List[ASTNode]]:
+        """Hashes with more than one indexed node (of class ``cls``)."""
+        groups = {}
+        for key, found in self._nodes.items():
+            if cls is not None:
+                found = [node for node in found if isinstance(node, cls)]
+            if len(found) > 1:
+                groups[key] = found
+        return groups
@@ -4,28 +4,47 @@ This module defines all the AST node types used to represent
 the abstract syntax tree for TyC programs.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, List, Optional, TYPE_CHECKING
+from typing import Any, List, Optional, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     from .visitor import ASTVisitor
 
 
-class ASTNode(ABC):
-    """Base class for all AST nodes."""
+class ASTNode:
+    """Base class for all AST nodes.
 
-    def __init__(self):
-        self.line = None
-        self.column = None
+    Every node class declares ``__slots__`` for its fields, so nodes carry no
+    instance ``__dict__``, and the hierarchy is a plain class hierarchy rather
+    than an ABC; ``accept`` must still be overridden by each concrete node.
+    Constructors only store their own fields: ``line`` and ``column`` read as
+    None until a front end sets them, and so does ``_hash``, the structural
+    hash ``merkle.structural_hash`` caches on the node.
+    """
+
+    __slots__ = ("line", "column", "_hash")
+
+    def __getattr__(self, name):
+        # only reached for slots that were never assigned
+        if name in ("line", "column", "_hash"):
+            return None
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def __setstate__(self, state):
+        # unpickling looks this up on every node; defining it keeps the
+        # lookup from falling through to __getattr__
+        for part in state if isinstance(state, tuple) else (state,):
+            for name, value in (part or {}).items():
+                setattr(self, name, value)
 
-    @abstractmethod
     def accept(self, visitor: "ASTVisitor", o: Any = None):
         """Accept a visitor for the Visitor pattern."""
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} does not accept visitors")
 
     def __str__(self):
-        """Default string representation."""
-        return f"{self.__class__.__name__}()"
+        """Canonical text of the tree, written iteratively by ``serializer``."""
+        from .serializer import dumps
+
+        return dumps(self)
 
 
 # ============================================================================
@@ -36,58 +55,52 @@ class ASTNode(ABC):
 class Program(ASTNode):
     """Root node representing the entire TyC program."""
 
+    __slots__ = ("decls",)
+
     def __init__(self, decls: List["Decl"]):
-        super().__init__()
         self.decls = decls
 
     def accept(self, visitor, o=None):
         return visitor.visit_program(self, o)
 
-    def __str__(self):
-        decls_str = ", ".join(str(d) for d in self.decls) if self.decls else ""
-        return f"Program([{decls_str}])"
-
 
 class Decl(ASTNode):
     """Base class for declarations (struct or function)."""
 
-    pass
+    __slots__ = ()
 
 
 class StructDecl(Decl):
     """Struct declaration node."""
 
+    __slots__ = ("name", "members")
+
     def __init__(self, name: str, members: List["MemberDecl"]):
-        super().__init__()
         self.name = name
         self.members = members
 
     def accept(self, visitor, o=None):
         return visitor.visit_struct_decl(self, o)
 
-    def __str__(self):
-        members_str = ", ".join(str(m) for m in self.members) if self.members else ""
-        return f"StructDecl({self.name}, [{members_str}])"
-
 
 class MemberDecl(ASTNode):
     """Struct member declaration node."""
 
+    __slots__ = ("member_type", "name")
+
     def __init__(self, member_type: "Type", name: str):
-        super().__init__()
         self.member_type = member_type
         self.name = name
 
     def accept(self, visitor, o=None):
         return visitor.visit_member_decl(self, o)
 
-    def __str__(self):
-        return f"MemberDecl({self.member_type}, {self.name})"
-
 
 class FuncDecl(Decl):
     """Function declaration node."""
 
+    __slots__ = ("return_type", "name", "params", "body")
+
     def __init__(
         self,
         return_type: Optional["Type"],
@@ -95,7 +108,6 @@ class FuncDecl(Decl):
         params: List["Param"],
         body: "BlockStmt",
     ):
-        super().__init__()
         self.return_type = return_type
         self.name = name
         self.params = params
@@ -104,26 +116,19 @@ class FuncDecl(Decl):
     def accept(self, visitor, o=None):
         return visitor.visit_func_decl(self, o)
 
-    def __str__(self):
-        return_type_str = str(self.return_type) if self.return_type else "auto"
-        params_str = ", ".join(str(p) for p in self.params) if self.params else ""
-        return f"FuncDecl({return_type_str}, {self.name}, [{params_str}], {self.body})"
-
 
 class Param(ASTNode):
     """Function parameter node."""
 
+    __slots__ = ("param_type", "name")
+
     def __init__(self, param_type: "Type", name: str):
-        super().__init__()
         self.param_type = param_type
         self.name = name
 
     def accept(self, visitor, o=None):
         return visitor.visit_param(self, o)
 
-    def __str__(self):
-        return f"Param({self.param_type}, {self.name})"
-
 
 # ============================================================================
 # Type System
@@ -131,75 +136,99 @@ class Param(ASTNode):
 
 
 class Type(ASTNode):
-    """Base class for type annotations."""
+    """Base class for type annotations.
+
+    Types are hash-consed: a type class without fields has one canonical
+    instance (``IntType() is IntType()``), and the front ends share one
+    StructType per name through the InternTable of the compilation. Within
+    one AST two types are therefore equal exactly when they are the same
+    object, and a type checker may compare them with ``is``. Shared type
+    nodes carry no source position.
+    """
+
+    __slots__ = ()
 
-    pass
+    def __new__(cls, *args):
+        if cls.__slots__:
+            return object.__new__(cls)
+        # a field-less type: one instance per class (not inherited)
+        instance = cls.__dict__.get("_canonical")
+        if instance is None:
+            instance = object.__new__(cls)
+            cls._canonical = instance
+        return instance
 
 
 class IntType(Type):
     """Integer type node."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_int_type(self, o)
 
-    def __str__(self):
-        return "IntType()"
-
 
 class FloatType(Type):
     """Float type node."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_float_type(self, o)
 
-    def __str__(self):
-        return "FloatType()"
-
 
 class StringType(Type):
     """String type node."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_type(self, o)
 
-    def __str__(self):
-        return "StringType()"
-
 
 class VoidType(Type):
     """Void type node."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_void_type(self, o)
 
-    def __str__(self):
-        return "VoidType()"
-
 
 class StructType(Type):
     """Struct type node."""
 
+    __slots__ = ("struct_name",)
+
     def __init__(self, struct_name: str):
-        super().__init__()
         self.struct_name = struct_name
 
     def accept(self, visitor, o=None):
         return visitor.visit_struct_type(self, o)
 
-    def __str__(self):
-        return f"StructType({self.struct_name})"
+
+class InternTable:
+    """Canonical StructTypes and identifier strings of one compilation.
+
+    ``name(text)`` returns the first string equal to ``text`` it was given,
+    so every occurrence of an identifier shares one string object, and
+    ``struct_type(name)`` returns the one StructType for ``name``.
+    """
+
+    __slots__ = ("names", "struct_types")
+
+    def __init__(self):
+        self.names = {}
+        self.struct_types = {}
+
+    def name(self, text: str) -> str:
+        return self.names.setdefault(text, text)
+
+    def struct_type(self, name: str) -> StructType:
+        struct_type = self.struct_types.get(name)
+        if struct_type is None:
+            struct_type = self.struct_types[name] = StructType(self.name(name))
+        return struct_type
 
 
 # ============================================================================
@@ -210,38 +239,34 @@ class StructType(Type):
 class Stmt(ASTNode):
     """Base class for all statement nodes."""
 
-    pass
+    __slots__ = ()
 
 
 class BlockStmt(Stmt):
     """Block statement containing statements."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Stmt]):
-        super().__init__()
         self.statements = statements
 
     def accept(self, visitor, o=None):
         return visitor.visit_block_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = (
-            ", ".join(str(s) for s in self.statements) if self.statements else ""
-        )
-        return f"BlockStmt([{stmts_str}])"
-
 
 class VarDecl(Stmt):
     """Variable declaration statement.
     If var_type is None, it means 'auto' (type inference).
     """
 
+    __slots__ = ("var_type", "name", "init_value")
+
     def __init__(
         self,
         var_type: Optional["Type"],
         name: str,
         init_value: Optional["Expr"] = None,
     ):
-        super().__init__()
         self.var_type = var_type  # None means 'auto'
         self.name = name
         self.init_value = init_value
@@ -249,33 +274,27 @@ class VarDecl(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_var_decl(self, o)
 
-    def __str__(self):
-        type_str = "auto" if self.var_type is None else str(self.var_type)
-        init_str = f" = {self.init_value}" if self.init_value else ""
-        return f"VarDecl({type_str}, {self.name}{init_str})"
-
 
 class AssignStmt(Stmt):
     """Assignment statement - contains an assignment expression."""
 
+    __slots__ = ("assign_expr",)
+
     def __init__(self, assign_expr: "AssignExpr"):
-        super().__init__()
         self.assign_expr = assign_expr
 
     def accept(self, visitor, o=None):
         return visitor.visit_assign_stmt(self, o)
 
-    def __str__(self):
-        return f"AssignStmt({self.assign_expr})"
-
 
 class IfStmt(Stmt):
     """If statement."""
 
+    __slots__ = ("condition", "then_stmt", "else_stmt")
+
     def __init__(
         self, condition: "Expr", then_stmt: Stmt, else_stmt: Optional[Stmt] = None
     ):
-        super().__init__()
         self.condition = condition
         self.then_stmt = then_stmt
         self.else_stmt = else_stmt
@@ -283,38 +302,33 @@ class IfStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_if_stmt(self, o)
 
-    def __str__(self):
-        else_str = f", else {self.else_stmt}" if self.else_stmt else ""
-        return f"IfStmt(if {self.condition} then {self.then_stmt}{else_str})"
-
 
 class WhileStmt(Stmt):
     """While statement."""
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: "Expr", body: Stmt):
-        super().__init__()
         self.condition = condition
         self.body = body
 
     def accept(self, visitor, o=None):
         return visitor.visit_while_stmt(self, o)
 
-    def __str__(self):
-        return f"WhileStmt(while {self.condition} do {self.body})"
-
 
 class ForStmt(Stmt):
     """For statement."""
 
+    __slots__ = ("init", "condition", "update", "body")
+
     def __init__(
         self,
-        init: Optional["VarDecl"],
+        init: Optional[Union["VarDecl", "AssignStmt", "ExprStmt"]],
         condition: Optional["Expr"],
         update: Optional["Expr"],
         body: Stmt,
     ):
-        super().__init__()
-        self.init = init  # VarDecl or None
+        self.init = init  # VarDecl, AssignStmt (i = 0), ExprStmt (any other expr) or None
         self.condition = condition
         self.update = update  # Expr or None (PrefixOp, PostfixOp, or AssignExpr)
         self.body = body
@@ -322,23 +336,18 @@ class ForStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_for_stmt(self, o)
 
-    def __str__(self):
-        init_str = str(self.init) if self.init else "None"
-        cond_str = str(self.condition) if self.condition else "None"
-        update_str = str(self.update) if self.update else "None"
-        return f"ForStmt(for {init_str}; {cond_str}; {update_str} do {self.body})"
-
 
 class SwitchStmt(Stmt):
     """Switch statement."""
 
+    __slots__ = ("expr", "cases", "default_case")
+
     def __init__(
         self,
         expr: "Expr",
         cases: List["CaseStmt"],
         default_case: Optional["DefaultStmt"] = None,
     ):
-        super().__init__()
         self.expr = expr
         self.cases = cases
         self.default_case = default_case
@@ -346,101 +355,73 @@ class SwitchStmt(Stmt):
     def accept(self, visitor, o=None):
         return visitor.visit_switch_stmt(self, o)
 
-    def __str__(self):
-        cases_str = ", ".join(str(c) for c in self.cases) if self.cases else ""
-        default_str = f", default {self.default_case}" if self.default_case else ""
-        return f"SwitchStmt(switch {self.expr} cases [{cases_str}]{default_str})"
-
 
 class CaseStmt(ASTNode):
     """Case statement in switch."""
 
+    __slots__ = ("expr", "statements")
+
     def __init__(self, expr: "Expr", statements: List[Stmt]):
-        super().__init__()
         self.expr = expr
         self.statements = statements
 
     def accept(self, visitor, o=None):
         return visitor.visit_case_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = (
-            ", ".join(str(s) for s in self.statements) if self.statements else ""
-        )
-        return f"CaseStmt(case {self.expr}: [{stmts_str}])"
-
 
 class DefaultStmt(ASTNode):
     """Default statement in switch."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Stmt]):
-        super().__init__()
         self.statements = statements
 
     def accept(self, visitor, o=None):
         return visitor.visit_default_stmt(self, o)
 
-    def __str__(self):
-        stmts_str = (
-            ", ".join(str(s) for s in self.statements) if self.statements else ""
-        )
-        return f"DefaultStmt(default: [{stmts_str}])"
-
 
 class BreakStmt(Stmt):
     """Break statement."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_break_stmt(self, o)
 
-    def __str__(self):
-        return "BreakStmt()"
-
 
 class ContinueStmt(Stmt):
     """Continue statement."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_continue_stmt(self, o)
 
-    def __str__(self):
-        return "ContinueStmt()"
-
 
 class ReturnStmt(Stmt):
     """Return statement."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Optional["Expr"] = None):
-        super().__init__()
         self.expr = expr
 
     def accept(self, visitor, o=None):
         return visitor.visit_return_stmt(self, o)
 
-    def __str__(self):
-        expr_str = f" {self.expr}" if self.expr else ""
-        return f"ReturnStmt(return{expr_str})"
-
 
 class ExprStmt(Stmt):
     """Expression statement."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: "Expr"):
-        super().__init__()
         self.expr = expr
 
     def accept(self, visitor, o=None):
         return visitor.visit_expr_stmt(self, o)
 
-    def __str__(self):
-        return f"ExprStmt({self.expr})"
-
 
 # ============================================================================
 # Expressions
@@ -450,14 +431,15 @@ class ExprStmt(Stmt):
 class Expr(ASTNode):
     """Base class for all expression nodes."""
 
-    pass
+    __slots__ = ()
 
 
 class BinaryOp(Expr):
     """Binary operation expression."""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expr, operator: str, right: Expr):
-        super().__init__()
         self.left = left
         self.operator = operator
         self.right = right
@@ -465,56 +447,47 @@ class BinaryOp(Expr):
     def accept(self, visitor, o=None):
         return visitor.visit_binary_op(self, o)
 
-    def __str__(self):
-        return f"BinaryOp({self.left}, {self.operator}, {self.right})"
-
 
 class PrefixOp(Expr):
     """Prefix unary operation expression (++x, --x, +x, -x, !x)."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
-        super().__init__()
         self.operator = operator  # '++', '--', '+', '-', '!'
         self.operand = operand
 
     def accept(self, visitor, o=None):
         return visitor.visit_prefix_op(self, o)
 
-    def __str__(self):
-        return f"PrefixOp({self.operator}{self.operand})"
-
 
 class PostfixOp(Expr):
     """Postfix unary operation expression (x++, x--)."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
-        super().__init__()
         self.operator = operator  # '++', '--'
         self.operand = operand
 
     def accept(self, visitor, o=None):
         return visitor.visit_postfix_op(self, o)
 
-    def __str__(self):
-        return f"PostfixOp({self.operand}{self.operator})"
-
 
 class AssignExpr(Expr):
     """Assignment expression (can be used in expressions like (a = 5) + 7).
     lhs can be Identifier or MemberAccess.
     """
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs: "Expr", rhs: "Expr"):
-        super().__init__()
         self.lhs = lhs  # Identifier or MemberAccess
         self.rhs = rhs
 
     def accept(self, visitor, o=None):
         return visitor.visit_assign_expr(self, o)
 
-    def __str__(self):
-        return f"AssignExpr({self.lhs} = {self.rhs})"
-
 
 class MemberAccess(Expr):
     """Member access expression (struct member access).
@@ -522,62 +495,52 @@ class MemberAccess(Expr):
     Can be nested: MemberAccess(MemberAccess(obj, "member1"), "member2")
     """
 
+    __slots__ = ("obj", "member")
+
     def __init__(self, obj: Expr, member: str):
-        super().__init__()
         self.obj = obj
         self.member = member
 
     def accept(self, visitor, o=None):
         return visitor.visit_member_access(self, o)
 
-    def __str__(self):
-        return f"MemberAccess({self.obj}.{self.member})"
-
 
 class FuncCall(Expr):
     """Function call expression."""
 
-    def __init__(self, name: str, args: List[Expr]):
-        super().__init__()
-        self.name = name
+    __slots__ = ("name", "args")
+
+    def __init__(self, name: Union[str, Expr], args: List[Expr]):
+        self.name = name  # function name, or the callee Expr (s.f(), f()()), see call_name
         self.args = args
 
     def accept(self, visitor, o=None):
         return visitor.visit_func_call(self, o)
 
-    def __str__(self):
-        args_str = ", ".join(str(arg) for arg in self.args) if self.args else ""
-        return f"FuncCall({self.name}, [{args_str}])"
-
 
 class Identifier(Expr):
     """Identifier expression."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
-        super().__init__()
         self.name = name
 
     def accept(self, visitor, o=None):
         return visitor.visit_identifier(self, o)
 
-    def __str__(self):
-        return f"Identifier({self.name})"
-
 
 class StructLiteral(Expr):
     """Struct literal expression (initialization with {})."""
 
+    __slots__ = ("values",)
+
     def __init__(self, values: List[Expr]):
-        super().__init__()
         self.values = values
 
     def accept(self, visitor, o=None):
         return visitor.visit_struct_literal(self, o)
 
-    def __str__(self):
-        values_str = ", ".join(str(v) for v in self.values) if self.values else ""
-        return f"StructLiteral({{{values_str}}})"
-
 
 # ============================================================================
 # Literal Expressions
@@ -587,45 +550,49 @@ class StructLiteral(Expr):
 class Literal(Expr):
     """Base class for literal expressions."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
-        super().__init__()
         self.value = value
 
 
 class IntLiteral(Literal):
     """Integer literal expression."""
 
-    def __init__(self, value: int):
-        super().__init__(value)
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_int_literal(self, o)
 
-    def __str__(self):
-        return f"IntLiteral({self.value})"
-
 
 class FloatLiteral(Literal):
     """Float literal expression."""
 
-    def __init__(self, value: float):
-        super().__init__(value)
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_float_literal(self, o)
 
-    def __str__(self):
-        return f"FloatLiteral({self.value})"
-
 
 class StringLiteral(Literal):
     """String literal expression."""
 
-    def __init__(self, value: str):
-        super().__init__(value)
+    __slots__ = ()
 
     def accept(self, visitor, o=None):
         return visitor.visit_string_literal(self, o)
 
-    def __str__(self):
-        return f"StringLiteral({self.value!r})"
+
+# Helpers shared by ASTGeneration and DescentParser
+
+def expr_stmt(expr: Expr) -> Stmt:
+    """Wrap an expression used as a statement; assignments get AssignStmt."""
+    if isinstance(expr, AssignExpr):
+        return AssignStmt(expr)
+    return ExprStmt(expr)
+
+
+def call_name(callee: Expr):
+    """FuncCall name for a callee: the identifier's name, or the callee
+    expression itself when it is not a plain identifier (``s.f()``)."""
+    return callee.name if isinstance(callee, Identifier) else callee
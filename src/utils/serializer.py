@@ -0,0 +1,140 @@
+"""
+Iterative serializer for TyC ASTs.
+Writes the canonical text of ``str(node)`` with an explicit work stack, so
+output time is linear in its length and independent of the tree depth.
+"""
+
+from typing import Callable, List, TextIO
+
+from . import nodes
+from .nodes import ASTNode
+
+# Chunks buffered by ``dump`` before each ``write`` call
+DUMP_BUFFER_CHUNKS = 4096
+
+
+def _join(items: list, parts: list) -> list:
+    """Append ``items`` to ``parts`` separated by ``", "``."""
+    if items:
+        parts.append(items[0])
+        for item in items[1:]:
+            parts.append(", ")
+            parts.append(item)
+    return parts
+
+
+def _optional(value, default: str = "None"):
+    return value if value else default
+
+
+# Each expander returns the text of a node without child nodes as one string,
+# or the parts of its text in order: strings are written as they are, nodes
+# are expanded in turn and other values are written with ``str``. Every part
+# list starts with a string.
+_EXPANDERS = {
+    nodes.Program: lambda n: _join(n.decls, ["Program(["]) + ["])"],
+    nodes.StructDecl: lambda n: _join(n.members, [f"StructDecl({n.name}, ["]) + ["])"],
+    nodes.MemberDecl: lambda n: ["MemberDecl(", n.member_type, f", {n.name})"],
+    nodes.FuncDecl: lambda n: _join(
+        n.params, ["FuncDecl(", _optional(n.return_type, "auto"), f", {n.name}, ["]
+    ) + ["], ", n.body, ")"],
+    nodes.Param: lambda n: ["Param(", n.param_type, f", {n.name})"],
+    nodes.IntType: lambda n: "IntType()",
+    nodes.FloatType: lambda n: "FloatType()",
+    nodes.StringType: lambda n: "StringType()",
+    nodes.VoidType: lambda n: "VoidType()",
+    nodes.StructType: lambda n: f"StructType({n.struct_name})",
+    nodes.BlockStmt: lambda n: _join(n.statements, ["BlockStmt(["]) + ["])"],
+    nodes.VarDecl: lambda n: [
+        "VarDecl(", "auto" if n.var_type is None else n.var_type, f", {n.name}",
+    ] + ([" = ", n.init_value, ")"] if n.init_value else [")"]),
+    nodes.AssignStmt: lambda n: ["AssignStmt(", n.assign_expr, ")"],
+    nodes.IfStmt: lambda n: ["IfStmt(if ", n.condition, " then ", n.then_stmt] + (
+        [", else ", n.else_stmt, ")"] if n.else_stmt else [")"]
+    ),
+    nodes.WhileStmt: lambda n: ["WhileStmt(while ", n.condition, " do ", n.body, ")"],
+    nodes.ForStmt: lambda n: [
+        "ForStmt(for ", _optional(n.init), "; ", _optional(n.condition), "; ",
+        _optional(n.update), " do ", n.body, ")",
+    ],
+    nodes.SwitchStmt: lambda n: _join(n.cases, ["SwitchStmt(switch ", n.expr, " cases ["]) + (
+        ["], default ", n.default_case, ")"] if n.default_case else ["])"]
+    ),
+    nodes.CaseStmt: lambda n: _join(n.statements, ["CaseStmt(case ", n.expr, ": ["]) + ["])"],
+    nodes.DefaultStmt: lambda n: _join(n.statements, ["DefaultStmt(default: ["]) + ["])"],
+    nodes.BreakStmt: lambda n: "BreakStmt()",
+    nodes.ContinueStmt: lambda n: "ContinueStmt()",
+    nodes.ReturnStmt: lambda n: ["ReturnStmt(return ", n.expr, ")"] if n.expr else "ReturnStmt(return)",
+    nodes.ExprStmt: lambda n: ["ExprStmt(", n.expr, ")"],
+    nodes.BinaryOp: lambda n: ["BinaryOp(", n.left, f", {n.operator}, ", n.right, ")"],
+    nodes.PrefixOp: lambda n: [f"PrefixOp({n.operator}", n.operand, ")"],
+    nodes.PostfixOp: lambda n: ["PostfixOp(", n.operand, f"{n.operator})"],
+    nodes.AssignExpr: lambda n: ["AssignExpr(", n.lhs, " = ", n.rhs, ")"],
+    nodes.MemberAccess: lambda n: ["MemberAccess(", n.obj, f".{n.member})"],
+    # the name is a node for callees like ``s.f``
+    nodes.FuncCall: lambda n: _join(n.args, ["FuncCall(", n.name, ", ["]) + ["])"],
+    nodes.Identifier: lambda n: f"Identifier({n.name})",
+    nodes.StructLiteral: lambda n: _join(n.values, ["StructLiteral({"]) + ["})"],
+    nodes.IntLiteral: lambda n: f"IntLiteral({n.value})",
+    nodes.FloatLiteral: lambda n: f"FloatLiteral({n.value})",
+    nodes.StringLiteral: lambda n: f"StringLiteral({n.value!r})",
+}
+
+
+def _expander(cls: type) -> Callable:
+    """Expander for a class outside ``_EXPANDERS`` (a subclass or a base)."""
+    if cls.__str__ is not ASTNode.__str__:
+        # a subclass with its own text
+        return cls.__str__
+    for base in cls.__mro__[1:]:
+        if base in _EXPANDERS:
+            return _EXPANDERS[base]
+    return lambda n: f"{cls.__name__}()"
+
+
+def _serialize(root, write: Callable[[str], None]) -> None:
+    expanders = _EXPANDERS
+    stack = [root]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        item = pop()
+        cls = item.__class__
+        if cls is str:
+            write(item)
+            continue
+        expand = expanders.get(cls)
+        if expand is None:
+            if not isinstance(item, ASTNode):
+                write(str(item))
+                continue
+            expand = expanders[cls] = _expander(cls)
+        parts = expand(item)
+        if parts.__class__ is str:
+            write(parts)
+            continue
+        write(parts[0])
+        parts.reverse()
+        parts.pop()
+        extend(parts)
+
+
+def dumps(node: ASTNode) -> str:
+    """Return the canonical text of ``node``, identical to ``str(node)``."""
+    chunks: List[str] = []
+    _serialize(node, chunks.append)
+    return "".join(chunks)
+
+
+def dump(node: ASTNode, fp: TextIO) -> None:
+    """Write the canonical text of ``node`` to the text stream ``fp``."""
+    chunks: List[str] = []
+    append = chunks.append
+
+    def write(text):
+        append(text)
+        if len(chunks) >= DUMP_BUFFER_CHUNKS:
+            fp.write("".join(chunks))
+            chunks.clear()
+
+    _serialize(node, write)
+    fp.write("".join(chunks))
@@ -2,21 +2,77 @@
 Visitor interface for AST traversal in TyC programming language.
 This module defines the abstract visitor pattern interface for traversing
 and processing AST nodes.
+
+``visit`` dispatches through a table of handlers instead of calling
+``node.accept``, which would call the handler in turn: the ``visit_*``
+method each node class's ``accept`` calls is resolved once per visitor
+class and node class, and bound once per visitor.
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from . import nodes
 
 if TYPE_CHECKING:
     from .nodes import *
 
 
+class _MethodName:
+    """Stands in for a visitor to learn which method an ``accept`` calls."""
+
+    def __getattr__(self, name):
+        return lambda node, o: name
+
+
+def _handler_name(node_class: type) -> Optional[str]:
+    """Name of the ``visit_*`` method ``node_class.accept`` calls, or None
+    when ``accept`` is not one of nodes.py (it is then called as it is)."""
+    accept = node_class.accept
+    if getattr(accept, "__module__", None) != nodes.__name__:
+        return None
+    try:
+        name = accept(object.__new__(node_class), _MethodName())
+    except NotImplementedError:
+        return None
+    return name if isinstance(name, str) and name.startswith("visit_") else None
+
+
+# visitor class -> node class -> unbound handler, None meaning node.accept
+_DISPATCH: Dict[type, Dict[type, Optional[Callable]]] = {}
+
+
 class ASTVisitor(ABC):
     """Abstract base class for AST visitors."""
 
     def visit(self, node: "ASTNode", o: Any = None):
-        """Visit a node using the visitor pattern."""
-        return node.accept(self, o)
+        """Visit a node using the visitor pattern: call the ``visit_*``
+        method that ``node.accept`` would call, from the handler table."""
+        try:
+            handler = self._handlers[node.__class__]
+        except (AttributeError, KeyError):
+            handler = self._bind_handler(node.__class__)
+        return handler(node, o)
+
+    def _bind_handler(self, node_class: type) -> Callable:
+        """Resolve and cache the handler of ``node_class`` for this visitor."""
+        functions = _DISPATCH.setdefault(type(self), {})
+        try:
+            function = functions[node_class]
+        except KeyError:
+            name = _handler_name(node_class)
+            function = functions[node_class] = None if name is None else getattr(type(self), name)
+        if function is None:
+            handler = lambda node, o: node.accept(self, o)
+        else:
+            handler = function.__get__(self)
+        try:
+            handlers = self._handlers
+        except AttributeError:
+            handlers = self._handlers = {}
+        handlers[node_class] = handler
+        return handler
 
     # Program and declarations
     @abstractmethod
@@ -160,9 +216,142 @@ class ASTVisitor(ABC):
         pass
 
 
+# Fields BaseVisitor descends into, in visiting order; "*name" is a list and
+# "$name" a child only when it is a node (FuncCall.name may be a plain str)
+CHILD_FIELDS = {
+    nodes.Program: ("*decls",),
+    nodes.StructDecl: ("*members",),
+    nodes.MemberDecl: ("member_type",),
+    nodes.FuncDecl: ("return_type", "*params", "body"),
+    nodes.Param: ("param_type",),
+    nodes.IntType: (),
+    nodes.FloatType: (),
+    nodes.StringType: (),
+    nodes.VoidType: (),
+    nodes.StructType: (),
+    nodes.BlockStmt: ("*statements",),
+    nodes.VarDecl: ("var_type", "init_value"),
+    nodes.AssignStmt: ("assign_expr",),
+    nodes.IfStmt: ("condition", "then_stmt", "else_stmt"),
+    nodes.WhileStmt: ("condition", "body"),
+    nodes.ForStmt: ("init", "condition", "update", "body"),
+    nodes.SwitchStmt: ("expr", "*cases", "default_case"),
+    nodes.CaseStmt: ("expr", "*statements"),
+    nodes.DefaultStmt: ("*statements",),
+    nodes.BreakStmt: (),
+    nodes.ContinueStmt: (),
+    nodes.ReturnStmt: ("expr",),
+    nodes.ExprStmt: ("expr",),
+    nodes.BinaryOp: ("left", "right"),
+    nodes.PrefixOp: ("operand",),
+    nodes.PostfixOp: ("operand",),
+    nodes.AssignExpr: ("lhs", "rhs"),
+    nodes.MemberAccess: ("obj",),
+    nodes.FuncCall: ("$name", "*args"),
+    nodes.Identifier: (),
+    nodes.StructLiteral: ("*values",),
+    nodes.IntLiteral: (),
+    nodes.FloatLiteral: (),
+    nodes.StringLiteral: (),
+}
+
+def _reversed_children(fields: tuple) -> Optional[Callable]:
+    """Function returning the children a node with ``fields`` has, in reverse
+    visiting order and with None for absent ones; None for a leaf."""
+    if not fields:
+        return None
+    names = [field.lstrip("*$") for field in fields]
+    markers = [field[0] if field[0] in "*$" else "" for field in fields]
+    if len(fields) == 1 and not markers[0]:
+        get = attrgetter(names[0])
+        return lambda node: (get(node),)
+    if len(fields) == 1 and markers[0] == "*":
+        get = attrgetter(names[0])
+        return lambda node: get(node)[::-1]
+    if not any(markers):
+        return attrgetter(*reversed(names))
+
+    def children(node):
+        found = []
+        for name, marker in zip(names, markers):
+            value = getattr(node, name)
+            if marker == "*":
+                found.extend(value)
+            elif marker == "$":
+                found.append(value if isinstance(value, nodes.ASTNode) else None)
+            else:
+                found.append(value)
+        found.reverse()
+        return found
+
+    return children
+
+
+# Child functions by node class, extended to subclasses on use
+_CHILDREN = {cls: _reversed_children(fields) for cls, fields in CHILD_FIELDS.items()}
+
+
+def _children_of(node_class: type) -> Optional[Callable]:
+    for base in node_class.__mro__:
+        if base in CHILD_FIELDS:
+            children = _CHILDREN[node_class] = _CHILDREN[base]
+            return children
+    raise TypeError(f"{node_class.__name__} is not a TyC AST node class")
+
+
+# Marks where the post hook of the node below it on the walk stack is due
+_LEAVE = object()
+# Marks where a fused walk returns to the active visitors below it
+_RESTORE = object()
+
+
 class BaseVisitor(ASTVisitor):
     """Base visitor that provides default implementations for all visit methods.
-    Subclasses can override only the methods they need to customize."""
+    Subclasses can override only the methods they need to customize.
+
+    ``walk`` is a second traversal mode: it visits the same nodes in the same
+    order as the default methods, with an explicit stack instead of Python
+    recursion, and calls ``pre_visit``/``post_visit`` around each node.
+    """
+
+    def walk(self, node: "ASTNode", o: Any = None) -> None:
+        """Traverse ``node`` and its descendants in pre-order without
+        recursion. ``pre_visit(node, o)`` runs before the children of a node
+        and may return False to skip them; ``post_visit(node, o)`` runs after
+        them (or right away for skipped children). The ``visit_*`` methods
+        are not called."""
+        pre = None if type(self).pre_visit is BaseVisitor.pre_visit else self.pre_visit
+        post = None if type(self).post_visit is BaseVisitor.post_visit else self.post_visit
+        table = _CHILDREN
+        stack = [node]
+        pop, push, extend = stack.pop, stack.append, stack.extend
+        while stack:
+            node = pop()
+            if node is None:
+                continue
+            if node is _LEAVE:
+                post(pop(), o)
+                continue
+            if pre is not None and pre(node, o) is False:
+                if post is not None:
+                    post(node, o)
+                continue
+            if post is not None:
+                push(node)
+                push(_LEAVE)
+            try:
+                children = table[node.__class__]
+            except KeyError:
+                children = _children_of(node.__class__)
+            if children is not None:
+                extend(children(node))
+
+    def pre_visit(self, node: "ASTNode", o: Any = None) -> Optional[bool]:
+        """Called by ``walk`` before the children of ``node``; return False
+        to skip them."""
+
+    def post_visit(self, node: "ASTNode", o: Any = None) -> None:
+        """Called by ``walk`` after the children of ``node``."""
 
     def visit_program(self, node: "Program", o: Any = None):
         for decl in node.decls:
@@ -279,6 +468,8 @@ class BaseVisitor(ASTVisitor):
         self.visit(node.obj, o)
 
     def visit_func_call(self, node: "FuncCall", o: Any = None):
+        if isinstance(node.name, nodes.ASTNode):
+            self.visit(node.name, o)
         for arg in node.args:
             self.visit(arg, o)
 
@@ -297,3 +488,188 @@ class BaseVisitor(ASTVisitor):
 
     def visit_string_literal(self, node: "StringLiteral", o: Any = None):
         pass
+
+
+def _descend_nothing(node: "ASTNode", o: Any = None) -> None:
+    """Stands in for ``visit`` during a fused walk, which does the descending."""
+
+
+def _returned_value(handler: Callable):
+    name = getattr(handler, "__qualname__", repr(handler))
+    raise TypeError(
+        f"{name} returned a value; a fused walk discards handler results, so "
+        "visitors that compute values from their children cannot be fused"
+    )
+
+
+class FusedVisitor:
+    """Drive several BaseVisitors through a single traversal.
+
+    ``walk(node)`` traverses like ``BaseVisitor.walk`` and, at every node,
+    runs each visitor in turn with its own context object (``contexts[i]``,
+    None by default): ``pre_visit``, then the ``visit_*`` handler the
+    visitor overrides for the node's class, if any. After the children,
+    the visitors' ``post_visit`` hooks run in reverse order. A visitor whose
+    ``pre_visit`` returns False skips that node's handler and its subtree;
+    the others continue.
+
+    The walk descends for all visitors: while it runs, a visitor's own
+    ``visit`` calls (including those of the BaseVisitor defaults reached
+    through ``super()``) return None without descending. A visitor whose
+    handlers always descend, directly or through the defaults, therefore
+    sees the same handler calls in the same order as when it visits the
+    tree alone; one that skips subtrees should do so from ``pre_visit``.
+
+    Handlers must not depend on what visiting a child returns, and must
+    themselves return None: a visitor that computes values bottom-up, such
+    as type inference returning the type of each expression, cannot be
+    fused, and a handler returning a value raises TypeError. Visitors whose
+    class overrides ``visit`` itself are rejected with TypeError, since the
+    fused walk never calls it.
+    """
+
+    def __init__(self, visitors, contexts=None):
+        self.visitors = list(visitors)
+        self.contexts = [None] * len(self.visitors) if contexts is None else list(contexts)
+        if len(self.contexts) != len(self.visitors):
+            raise ValueError("need one context per visitor")
+        for visitor in self.visitors:
+            if not isinstance(visitor, BaseVisitor):
+                raise TypeError(f"{type(visitor).__name__} is not a BaseVisitor")
+            if type(visitor).visit is not BaseVisitor.visit:
+                raise TypeError(
+                    f"{type(visitor).__name__} overrides visit, which a fused walk does not call"
+                )
+        self._pre = [self._hook(visitor, "pre_visit") for visitor in self.visitors]
+        self._post = [self._hook(visitor, "post_visit") for visitor in self.visitors]
+        # node class -> per visitor handler (None where it would only descend)
+        self._handlers: Dict[type, tuple] = {}
+
+    @staticmethod
+    def _hook(visitor: BaseVisitor, name: str) -> Optional[Callable]:
+        if getattr(type(visitor), name) is getattr(BaseVisitor, name):
+            return None
+        return getattr(visitor, name)
+
+    def _handlers_for(self, node_class: type) -> tuple:
+        name = _handler_name(node_class)
+        default = getattr(BaseVisitor, name, None) if name else None
+        handlers = []
+        for visitor in self.visitors:
+            if name is None:
+                handlers.append(lambda node, o, visitor=visitor: node.accept(visitor, o))
+            else:
+                function = getattr(type(visitor), name)
+                handlers.append(None if function is default else function.__get__(visitor))
+        handlers = self._handlers[node_class] = tuple(handlers)
+        return handlers
+
+    def walk(self, node: "ASTNode") -> None:
+        """Traverse ``node`` once for all visitors."""
+        saved = [visitor.__dict__.get("visit") for visitor in self.visitors]
+        for visitor in self.visitors:
+            visitor.visit = _descend_nothing
+        try:
+            if any(self._pre) or any(self._post):
+                self._walk_with_hooks(node)
+            else:
+                self._walk(node)
+        finally:
+            for visitor, visit in zip(self.visitors, saved):
+                if visit is None:
+                    del visitor.visit
+                else:
+                    visitor.visit = visit
+
+    def _walk(self, node):
+        """Traversal without hooks: every visitor sees every node."""
+        table = _CHILDREN
+        # node class -> (handler, context) pairs of the visitors handling it
+        calls = {}
+        stack = [node]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
+            if node is None:
+                continue
+            cls = node.__class__
+            try:
+                pairs = calls[cls]
+            except KeyError:
+                handlers = self._handlers.get(cls) or self._handlers_for(cls)
+                pairs = calls[cls] = tuple(
+                    (handler, context)
+                    for handler, context in zip(handlers, self.contexts)
+                    if handler is not None
+                )
+            for handler, context in pairs:
+                if handler(node, context) is not None:
+                    _returned_value(handler)
+            try:
+                children = table[cls]
+            except KeyError:
+                children = _children_of(cls)
+            if children is not None:
+                extend(children(node))
+
+    def _walk_with_hooks(self, node):
+        """Traversal that tracks which visitors are still active. The active
+        set only changes below a pruning ``pre_visit``; a _RESTORE marker
+        under the pruned node's children brings the previous set back."""
+        contexts, pres, posts = self.contexts, self._pre, self._post
+        table, plans = _CHILDREN, self._handlers
+        everyone = active = tuple(range(len(self.visitors)))
+        all_posts = tuple(i for i in everyone if posts[i] is not None)
+        # a post entry is node, indices of its post hooks, _LEAVE
+        stack = [node]
+        pop, push, extend = stack.pop, stack.append, stack.extend
+        while stack:
+            node = pop()
+            if node is None:
+                continue
+            if node is _LEAVE:
+                leaving = pop()
+                node = pop()
+                for i in reversed(leaving):
+                    posts[i](node, contexts[i])
+                continue
+            if node is _RESTORE:
+                active = pop()
+                continue
+            cls = node.__class__
+            try:
+                handlers = plans[cls]
+            except KeyError:
+                handlers = self._handlers_for(cls)
+            pruned = None
+            for i in active:
+                pre = pres[i]
+                if pre is not None and pre(node, contexts[i]) is False:
+                    if pruned is None:
+                        pruned = []
+                    pruned.append(i)
+                    continue
+                handler = handlers[i]
+                if handler is not None and handler(node, contexts[i]) is not None:
+                    _returned_value(handler)
+            if all_posts:
+                leaving = all_posts if active is everyone else tuple(
+                    i for i in active if posts[i] is not None
+                )
+                if leaving:
+                    push(node)
+                    push(leaving)
+                    push(_LEAVE)
+            if pruned is not None:
+                kept = tuple(i for i in active if i not in pruned)
+                if not kept:
+                    continue
+                push(active)
+                push(_RESTORE)
+                active = kept
+            try:
+                children = table[cls]
+            except KeyError:
+                children = _children_of(cls)
+            if children is not None:
+                extend(children(node))
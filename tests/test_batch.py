@@ -0,0 +1,149 @@
+"""
+Tests for batch compilation (src/frontend/batch.py).
+Each record must agree with FrontEndSession on whether and how a source
+fails, in completion order or in input order, in one process or many.
+"""
+
+import json
+import os
+
+import pytest
+from tests.utils import collect_check_inputs
+from src.frontend import batch
+from src.frontend.batch import BatchCompiler, collect_files, compile_many, main
+from src.frontend.descent import parse_source
+from src.frontend.session import FrontEndSession
+from src.utils.merkle import hex_hash
+
+PARSER_SOURCES = [source for _, source in collect_check_inputs("test_parser.py")]
+SOURCES = {
+    "ok.tyc": "int main() { return 0; }\n",
+    "syntax.tyc": "int 5;\n",
+    "lexer.tyc": "int x = 1 # 2;\n",
+    "auto.tyc": "void main() { auto x = 1; printInt(x); }\n",
+}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    for name, source in SOURCES.items():
+        (tmp_path / name).write_text(source, encoding="utf-8")
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    for index, source in enumerate(PARSER_SOURCES[:60]):
+        (nested / f"p{index:03}.tyc").write_text(source, encoding="utf-8")
+    (nested / "notes.txt").write_text("not a source\n")
+    return tmp_path
+
+
+def expected(path):
+    source = open(path, encoding="utf-8").read()
+    result = FrontEndSession().parse(source)
+    return "ok" if result == "success" else result
+
+
+def outcome(record):
+    return "ok" if record["status"] == "ok" else record["message"]
+
+
+class TestCollectFiles:
+
+    def test_directories_and_manifests(self, corpus):
+        files = collect_files([corpus])
+        assert len(files) == len(SOURCES) + 60
+        assert files == sorted(files) and all(f.suffix == ".tyc" for f in files)
+
+        manifest = corpus / "nightly.txt"
+        manifest.write_text("# smoke test\nok.tyc\n\nnested/p001.tyc\n")
+        assert collect_files([manifest, corpus / "lexer.tyc"]) == [
+            corpus / "ok.tyc", corpus / "nested" / "p001.tyc", corpus / "lexer.tyc",
+        ]
+
+
+class TestBatchCompiler:
+
+    def test_records(self, corpus):
+        compiler = BatchCompiler(digest=True)
+        ok = compiler.compile_path(corpus / "ok.tyc")
+        assert ok["status"] == "ok" and ok["message"] is None
+        assert set(ok["timings"]) == {"read", "lex", "parse", "ast"}
+        assert ok["digest"] == hex_hash(parse_source(SOURCES["ok.tyc"]))
+
+        syntax = compiler.compile_path(corpus / "syntax.tyc")
+        assert (syntax["status"], syntax["message"]) == ("syntax_error", "Error on line 1 col 4: 5")
+        lexer = compiler.compile_path(corpus / "lexer.tyc")
+        assert (lexer["status"], lexer["message"]) == ("lexer_error", "Error Token #")
+        missing = compiler.compile_path(corpus / "missing.tyc")
+        assert missing["status"] == "read_error" and missing["path"].endswith("missing.tyc")
+        json.dumps([ok, syntax, lexer, missing])
+
+    @pytest.mark.parametrize("error", [RecursionError, MemoryError, KeyError])
+    def test_internal_errors(self, monkeypatch, error):
+        class Failing:
+            def __init__(self, *args):
+                raise error("in the compiler")
+
+        monkeypatch.setattr(batch, "DescentParser", Failing)
+        record = BatchCompiler(parser_backend="descent").compile_source("int x;")
+        assert record["status"] == "internal_error"
+
+    @pytest.mark.parametrize("parser_backend", ["antlr", "descent"])
+    def test_matches_session(self, parser_backend):
+        compiler = BatchCompiler(parser_backend=parser_backend)
+        session = FrontEndSession(parser_backend=parser_backend)
+        for source in PARSER_SOURCES:
+            result = session.parse(source)
+            assert outcome(compiler.compile_source(source)) == ("ok" if result == "success" else result)
+
+
+class TestCompileMany:
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_ordered(self, corpus, workers):
+        files = collect_files([corpus])
+        records = list(compile_many(files, workers=workers, ordered=True, warmup=PARSER_SOURCES[:5]))
+        assert [record["path"] for record in records] == [str(f) for f in files]
+        assert [outcome(record) for record in records] == [expected(f) for f in files]
+
+    def test_completion_order(self, corpus):
+        files = collect_files([corpus])
+        records = list(compile_many(files, workers=2, digest=True))
+        assert sorted(record["path"] for record in records) == sorted(map(str, files))
+        by_path = {record["path"]: record for record in records}
+        for path in files:
+            assert outcome(by_path[str(path)]) == expected(path)
+        assert by_path[str(corpus / "ok.tyc")]["digest"] == hex_hash(parse_source(SOURCES["ok.tyc"]))
+
+    @pytest.mark.parametrize("ordered", [False, True])
+    def test_dead_worker(self, corpus, monkeypatch, ordered):
+        crash = corpus / "crash.tyc"
+        crash.write_text("int x;\n")
+        compile_path = BatchCompiler.compile_path
+
+        def crashing(self, path):
+            if str(path) == str(crash):
+                os._exit(1)
+            return compile_path(self, path)
+
+        # the forked workers inherit the patched method
+        monkeypatch.setattr(BatchCompiler, "compile_path", crashing)
+        files = [crash] + collect_files([corpus / "nested"])
+        records = list(compile_many(files, workers=2, ordered=ordered))
+        assert sorted(record["path"] for record in records) == sorted(map(str, files))
+        by_path = {record["path"]: record for record in records}
+        assert by_path[str(crash)]["status"] == "internal_error"
+        # files in the pool when it broke fail with it, the rest are compiled
+        for path in files[1:]:
+            record = by_path[str(path)]
+            assert record["status"] == "internal_error" or outcome(record) == expected(path)
+        assert all(by_path[str(path)]["status"] != "internal_error" for path in files[-20:])
+
+    def test_cli(self, corpus, capsys):
+        output = corpus / "results.jsonl"
+        status = main([str(corpus / "ok.tyc"), str(corpus / "syntax.tyc"), "--workers", "2",
+                       "--ordered", "--output", str(output)])
+        assert status == 1
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [record["status"] for record in records] == ["ok", "syntax_error"]
+        assert "Compiled 2 files" in capsys.readouterr().err
+        assert main([str(corpus / "ok.tyc"), "--workers", "1"]) == 0
@@ -0,0 +1,86 @@
+"""
+Tests for the binary AST format (src/utils/binary_ast.py).
+"""
+
+import struct
+
+import pytest
+from tests.utils import ASTGenerator, collect_check_inputs
+from src.utils import binary_ast
+from src.utils.binary_ast import BinaryASTError
+from src.utils.flat_ast import flatten
+from src.utils.nodes import *
+
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+PROGRAM = "\n".join(source for _, source in PARSER_CORPUS[:20])
+
+
+def parse(source):
+    return ASTGenerator(source).generate()
+
+
+class TestBinaryAST:
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_round_trip(self, name, source):
+        ast = parse(source)
+        if isinstance(ast, str):
+            pytest.skip("syntax error")
+        assert str(binary_ast.loads(binary_ast.encode(ast)).root) == str(ast)
+
+    def test_round_trip_edge_values(self):
+        ast = Program([FuncDecl(None, "f", [], BlockStmt([
+            VarDecl(None, "x", IntLiteral(10 ** 30)),
+            ExprStmt(FuncCall(MemberAccess(Identifier("p"), "m"), [
+                FloatLiteral(1e-300), StringLiteral("été"), IntLiteral(-1),
+            ])),
+            ForStmt(None, None, None, BlockStmt([])),
+        ]))])
+        ast.decls[0].line, ast.decls[0].column = 3, 1
+        mapped = binary_ast.loads(binary_ast.encode(ast))
+        assert str(mapped.root) == str(ast)
+        assert (mapped.root.decls[0].line, mapped.root.decls[0].column) == (3, 1)
+        assert str(binary_ast.loads(binary_ast.encode(Identifier("x"))).root) == "Identifier(x)"
+
+    def test_file_is_loaded_lazily(self, tmp_path):
+        ast = parse(PROGRAM)
+        path = tmp_path / "program.tycast"
+        binary_ast.dump(ast, str(path))
+        with binary_ast.load(str(path)) as mapped:
+            assert len(mapped) == len(flatten(ast))
+            root = mapped.root
+            assert mapped.materialized == 1
+            assert len(root.decls) == len(ast.decls)
+            assert mapped.materialized == 1
+            assert str(root.decls[5]) == str(ast.decls[5])
+            assert mapped.materialized == 2
+            assert root.decls[5] is root.decls[5]
+            assert str(root) == str(ast)
+            assert [mapped.text(i) for i in mapped.iter_kind(FuncDecl)] == [
+                decl.name for decl in ast.decls if isinstance(decl, FuncDecl)
+            ]
+            decl = root.decls[0]
+        assert str(decl) == str(ast.decls[0])
+
+    def test_rejects_other_files(self):
+        data = binary_ast.encode(parse("int x;"))
+        with pytest.raises(BinaryASTError, match="not a binary AST"):
+            binary_ast.loads(b"int x;" + bytes(100))
+        with pytest.raises(BinaryASTError, match="truncated"):
+            binary_ast.loads(data[:10])
+        with pytest.raises(BinaryASTError, match="truncated"):
+            binary_ast.loads(data[:-1])
+        newer = bytearray(data)
+        struct.pack_into("<I", newer, 8, binary_ast.FORMAT_VERSION + 1)
+        with pytest.raises(BinaryASTError, match="format"):
+            binary_ast.loads(bytes(newer))
+        other_schema = bytearray(data)
+        other_schema[16:24] = bytes(8)
+        with pytest.raises(BinaryASTError, match="node set"):
+            binary_ast.loads(bytes(other_schema))
+
+    def test_rejects_empty_file(self, tmp_path):
+        path = tmp_path / "empty.tycast"
+        path.write_bytes(b"")
+        with pytest.raises(BinaryASTError, match="truncated"):
+            binary_ast.load(str(path))
@@ -0,0 +1,108 @@
+"""
+Tests for the byte-oriented ByteCharStream.
+The generated TyCLexer must produce the same tokens from a ByteCharStream
+as from antlr4.InputStream for every ASCII input of the test corpora, and
+TyCFastLexer must scan the bytes in place with the same result as from str.
+"""
+
+import pytest
+from tests.utils import Tokenizer, Parser, collect_check_inputs
+from antlr4 import CommonTokenStream, InputStream
+from build.TyCLexer import TyCLexer
+from src.frontend.backends import create_lexer_for_file
+from src.frontend.char_stream import ByteCharStream
+from src.frontend.fast_lexer import TyCFastLexer
+from lexererr import *
+
+ASCII_CORPUS = [
+    (name, source)
+    for name, source in collect_check_inputs("test_lexer.py")
+    + collect_check_inputs("test_parser.py")
+    if source.isascii()
+]
+
+
+def tokenize(source, backend="antlr"):
+    try:
+        return Tokenizer(source, backend).get_tokens_as_string()
+    except LexerError as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def token_tuples(lexer):
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    return [
+        (t.type, t.text, t.start, t.stop, t.line, t.column) for t in stream.tokens
+    ]
+
+
+class TestByteCharStream:
+
+    @pytest.mark.parametrize("name,source", ASCII_CORPUS, ids=[n for n, _ in ASCII_CORPUS])
+    def test_corpus_matches_input_stream(self, name, source):
+        stream = ByteCharStream(source.encode("ascii"))
+        assert tokenize(stream) == tokenize(source)
+
+    @pytest.mark.parametrize("name,source", ASCII_CORPUS, ids=[n for n, _ in ASCII_CORPUS])
+    def test_fast_lexer_corpus_matches_str(self, name, source, monkeypatch):
+        # the bytes are matched in place, never decoded as a whole
+        monkeypatch.setattr(ByteCharStream, "__str__", None)
+        stream = ByteCharStream(source.encode("ascii"))
+        assert tokenize(stream, "fast") == tokenize(source, "fast")
+
+    def test_token_positions(self):
+        source = 'struct P { int x; };\n/* c\n */ void f() {\n\tprintString("a\\n");\n}'
+        expected = token_tuples(TyCLexer(InputStream(source)))
+        actual = token_tuples(TyCLexer(ByteCharStream(source.encode("ascii"))))
+        assert actual == expected
+        assert token_tuples(TyCFastLexer(ByteCharStream(source.encode("ascii")))) == expected
+        lexer = TyCFastLexer(ByteCharStream(source.encode("ascii")))
+        assert list(lexer.scan()) == list(TyCFastLexer(source).scan())
+
+    def test_from_path(self, tmp_path):
+        source = "int main() { return 1 + 2.5e3; }\n"
+        path = tmp_path / "main.tyc"
+        path.write_bytes(source.encode("ascii"))
+        with ByteCharStream.from_path(path) as stream:
+            assert stream.size == len(source)
+            assert stream.getText(4, 7) == "main"
+            assert tokenize(stream) == tokenize(source)
+
+    def test_from_empty_path(self, tmp_path):
+        path = tmp_path / "empty.tyc"
+        path.write_bytes(b"")
+        with ByteCharStream.from_path(path) as stream:
+            assert tokenize(stream) == "EOF"
+
+    def test_file_entry_point_parses(self, tmp_path):
+        path = tmp_path / "prog.tyc"
+        path.write_bytes(b"void main() { auto x = 1; printInt(x); }")
+        for backend in ("antlr", "fast"):
+            lexer = create_lexer_for_file(path, backend)
+            tokens = token_tuples(lexer)
+            assert [t[1] for t in tokens[:3]] == ["void", "main", "("]
+
+    def test_parse_from_bytes(self):
+        source = "int f(int a) { if (a) return a; else { a = a - 1; } }"
+        stream = ByteCharStream(source.encode("ascii"))
+        assert Parser(stream).parse() == Parser(source).parse() == "success"
+
+    def test_error_token_from_bytes(self):
+        with pytest.raises(ErrorToken):
+            Tokenizer(ByteCharStream(b"x @y"), "antlr").get_tokens_as_string()
+
+    def test_non_ascii_byte_is_error_token(self):
+        with pytest.raises(ErrorToken):
+            Tokenizer(ByteCharStream(b"x \xff"), "antlr").get_tokens_as_string()
+
+    def test_seek_and_lookahead(self):
+        stream = ByteCharStream(b"ab")
+        assert stream.LA(1) == ord("a")
+        stream.consume()
+        assert stream.LA(-1) == ord("a")
+        assert stream.LA(1) == ord("b")
+        stream.seek(5)
+        assert stream.index == 2 and stream.LA(1) == -1
+        with pytest.raises(Exception):
+            stream.consume()
@@ -0,0 +1,150 @@
+"""
+Tests for the on-disk compilation cache.
+A session with a CompileCache must return the same tokens, parse results and
+ASTs as one without, from a cold and from a warm cache.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tests.utils import collect_check_inputs
+from src.frontend.compile_cache import (
+    FINGERPRINT_FILES,
+    PROJECT_ROOT,
+    CompileCache,
+    front_end_fingerprint,
+)
+from src.frontend.session import FrontEndSession
+from lexererr import *
+
+LEXER_SOURCES = [source for _, source in collect_check_inputs("test_lexer.py")]
+PARSER_SOURCES = [source for _, source in collect_check_inputs("test_parser.py")]
+
+
+def entries(cache):
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(cache.directory)
+        for name in names
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CompileCache(tmp_path / "cache")
+
+
+class TestCompileCache:
+
+    def test_get_put(self, cache):
+        assert cache.get("parse", "int x;") is None
+        cache.put("parse", "int x;", "success")
+        assert cache.get("parse", "int x;") == "success"
+        assert cache.get("tokens", "int x;", "missing") == "missing"
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.writes) == (1, 2, 1)
+        assert cache.stats.lookups == 3
+        assert "1 hits" in cache.stats.summary()
+
+    @pytest.mark.parametrize("parser_backend", ["antlr", "descent"])
+    def test_session_results_match(self, cache, parser_backend):
+        plain = FrontEndSession("fast", parser_backend=parser_backend)
+        expected_parse = plain.parse_many(PARSER_SOURCES)
+        expected_ast = [str(ast) for ast in plain.build_ast_many(PARSER_SOURCES)]
+        for _ in range(2):
+            session = FrontEndSession("fast", parser_backend=parser_backend, cache=cache)
+            assert session.parse_many(PARSER_SOURCES) == expected_parse
+            assert [str(ast) for ast in session.build_ast_many(PARSER_SOURCES)] == expected_ast
+        assert cache.stats.hits == cache.stats.misses == cache.stats.writes
+
+    def test_cached_lexer_errors(self, cache):
+        expected = FrontEndSession().tokenize_many(LEXER_SOURCES)
+        for _ in range(2):
+            session = FrontEndSession(cache=cache)
+            assert session.tokenize_many(LEXER_SOURCES) == expected
+        with pytest.raises(UncloseString, match="Unclosed String"):
+            FrontEndSession(cache=cache).tokenize('"open')
+        with pytest.raises(UncloseString, match="Unclosed String"):
+            FrontEndSession(cache=cache).tokenize('"open')
+
+    def test_ast_positions_survive(self, cache):
+        session = FrontEndSession(cache=cache)
+        first = session.build_ast("int x = 1;\nvoid f() { y = x; }")
+        second = session.build_ast("int x = 1;\nvoid f() { y = x; }")
+        assert first is not second
+        assert str(first) == str(second)
+        assert (second.decls[1].line, second.decls[1].column) == (first.decls[1].line, first.decls[1].column)
+
+    def test_fingerprint_is_part_of_the_key(self, tmp_path):
+        assert front_end_fingerprint() == front_end_fingerprint()
+        old = CompileCache(tmp_path, fingerprint="old")
+        old.put("parse", "int x;", "success")
+        new = CompileCache(tmp_path, fingerprint="new")
+        assert new.get("parse", "int x;") is None
+        assert CompileCache(tmp_path, fingerprint="old").get("parse", "int x;") == "success"
+
+    def test_backends_are_part_of_the_key(self, cache):
+        cache.put("parse", "int x;", "success", ("fast", "descent"))
+        assert cache.get("parse", "int x;", None, ("fast", "descent")) == "success"
+        assert cache.get("parse", "int x;", None, ("fast", "antlr")) is None
+        assert cache.get("parse", "int x;") is None
+        FrontEndSession("fast", parser_backend="descent", cache=cache).parse("int y;")
+        assert cache.get("parse", "int y;", None, ("fast", "descent")) == "success"
+        assert cache.get("parse", "int y;", None, ("fast", "antlr")) is None
+
+    def test_fingerprint_covers_the_front_end(self):
+        for name in ("src/utils/flat_ast.py", "src/utils/binary_ast.py",
+                     "src/frontend/session.py", "src/frontend/backends.py"):
+            assert name in FINGERPRINT_FILES
+        for name in FINGERPRINT_FILES:
+            assert (PROJECT_ROOT / name).is_file(), name
+
+    def test_lru_eviction_by_entries(self, tmp_path):
+        cache = CompileCache(tmp_path, max_entries=10)
+        for i in range(10):
+            cache.put("parse", f"int x{i};", "success")
+            path = cache.path(cache.key("parse", f"int x{i};"))
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+        # a hit makes x0 the most recently used entry
+        assert cache.get("parse", "int x0;") == "success"
+        cache.put("parse", "int x10;", "success")
+        assert cache.stats.evictions == 2
+        assert len(entries(cache)) == 9
+        assert cache.get("parse", "int x0;") == "success"
+        assert cache.get("parse", "int x1;") is None
+        assert cache.get("parse", "int x2;") is None
+        assert cache.get("parse", "int x3;") == "success"
+
+    def test_lru_eviction_by_bytes(self, tmp_path):
+        cache = CompileCache(tmp_path, max_bytes=10_000)
+        for i in range(40):
+            cache.put("tokens", f"source {i}", "x" * 500)
+        assert sum(os.path.getsize(path) for path in entries(cache)) <= 10_000
+        assert cache.stats.evictions > 0
+        assert cache.get("tokens", "source 39") == "x" * 500
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        cache.put("ast", "int x;", FrontEndSession().build_ast("int x;"))
+        path = cache.path(cache.key("ast", "int x;"))
+        path.write_bytes(b"A" + b"\0" * 10)
+        assert cache.get("ast", "int x;") is None
+        assert not path.exists()
+        assert str(FrontEndSession(cache=cache).build_ast("int x;")) == "Program([VarDecl(IntType(), x)])"
+
+    def test_clear(self, cache):
+        for i in range(5):
+            cache.put("parse", f"int x{i};", "success")
+        cache.clear()
+        assert entries(cache) == []
+        assert cache.get("parse", "int x0;") is None
+
+    def test_shared_between_threads(self, tmp_path):
+        expected = FrontEndSession().parse_many(PARSER_SOURCES)
+        cache = CompileCache(tmp_path, max_entries=len(PARSER_SOURCES) // 2)
+        session = FrontEndSession(cache=cache)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for _ in range(2):
+                assert session.parse_many(PARSER_SOURCES, pool) == expected
+        assert not any(path.endswith(".tmp") for path in entries(cache))
+        assert len(entries(cache)) <= len(PARSER_SOURCES) // 2
+        assert cache.stats.lookups == 2 * len(PARSER_SOURCES)
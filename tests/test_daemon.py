@@ -0,0 +1,168 @@
+"""
+Tests for the compiler daemon and its client (src/frontend/daemon.py,
+src/frontend/daemon_client.py).
+Responses must equal what the tests/utils.py wrappers return for the same
+sources, for pipelined and concurrent clients, and malformed requests must
+be answered with errors rather than stopping the daemon.
+"""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from tests.utils import ASTGenerator, Parser, Tokenizer, collect_check_inputs
+from src.frontend.daemon_client import (
+    HEADER,
+    MAX_MESSAGE_SIZE,
+    DaemonClient,
+    DaemonError,
+    decode_message,
+    encode_message,
+    main,
+    wait_for_daemon,
+)
+from lexererr import *
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LEXER_SOURCES = [source for _, source in collect_check_inputs("test_lexer.py")][:80]
+PARSER_SOURCES = [source for _, source in collect_check_inputs("test_parser.py")][:80]
+
+
+@pytest.fixture(scope="module")
+def daemon(tmp_path_factory):
+    path = tmp_path_factory.mktemp("daemon") / "tyc.sock"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PROJECT_ROOT), str(PROJECT_ROOT / "build")]))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.frontend.daemon", "--socket", str(path), "--workers", "2"],
+        cwd=PROJECT_ROOT, env=env, stderr=subprocess.PIPE,
+    )
+    try:
+        wait_for_daemon(path, timeout=60)
+    except TimeoutError:
+        process.kill()
+        raise
+    yield path
+    with DaemonClient(path) as client:
+        assert client.request("stop") == "stopping"
+    assert process.wait(timeout=30) == 0
+    assert not path.exists()
+
+
+def tokenize(source):
+    try:
+        return Tokenizer(source).get_tokens_as_string()
+    except LexerError as e:
+        return type(e).__name__, str(e)
+
+
+def receive(sock):
+    def exactly(size):
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError
+            data += chunk
+        return data
+
+    return decode_message(exactly(HEADER.unpack(exactly(HEADER.size))[0]))
+
+
+class TestDaemon:
+
+    def test_matches_wrappers(self, daemon):
+        with DaemonClient(daemon) as client:
+            for source in LEXER_SOURCES:
+                try:
+                    result = client.tokenize(source)
+                except DaemonError as e:
+                    result = e.error_type, str(e)
+                assert result == tokenize(source)
+            for source in PARSER_SOURCES:
+                assert client.parse(source) == Parser(source).parse()
+                assert client.ast(source) == str(ASTGenerator(source).generate())
+
+    def test_check(self, daemon):
+        with DaemonClient(daemon) as client:
+            record = client.check("int main() { return 0; }")
+            assert record["status"] == "ok" and len(record["digest"]) == 32
+            record = client.check("int 5;")
+            assert (record["status"], record["message"]) == ("syntax_error", "Error on line 1 col 4: 5")
+
+    def test_pipelined_requests(self, daemon):
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(str(daemon))
+            sources = PARSER_SOURCES[:40]
+            sock.sendall(b"".join(
+                encode_message({"id": index, "op": "parse", "source": source})
+                for index, source in enumerate(sources)
+            ))
+            responses = {}
+            for _ in sources:
+                response = receive(sock)
+                responses[response["id"]] = response["result"]
+        assert responses == {index: Parser(source).parse() for index, source in enumerate(sources)}
+
+    def test_concurrent_clients(self, daemon):
+        def run(source):
+            with DaemonClient(daemon) as client:
+                return [client.parse(source) for _ in range(5)]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(run, PARSER_SOURCES[:16]))
+        assert results == [[Parser(source).parse()] * 5 for source in PARSER_SOURCES[:16]]
+
+    def test_bad_requests(self, daemon):
+        with DaemonClient(daemon) as client:
+            with pytest.raises(DaemonError, match="unknown op 'compile'") as error:
+                client.request("compile", "int x;")
+            assert error.value.error_type == "ProtocolError"
+            with pytest.raises(DaemonError, match="'source' must be a string"):
+                client.request("parse")
+            assert client.request("ping")["requests"] >= 0
+
+        for payload in (HEADER.pack(3) + b"{{{", HEADER.pack(2) + b"[]", HEADER.pack(MAX_MESSAGE_SIZE + 1)):
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.connect(str(daemon))
+                sock.sendall(payload)
+                response = receive(sock)
+                assert not response["ok"] and response["error_type"] == "ProtocolError"
+                assert sock.recv(1) == b""  # the daemon hangs up
+
+    def test_dead_worker(self, daemon):
+        def workers(client):
+            pid = client.request("ping")["pid"]
+            return set(Path(f"/proc/{pid}/task/{pid}/children").read_text().split())
+
+        if not Path(f"/proc/{os.getpid()}/task/{os.getpid()}/children").exists():
+            pytest.skip("needs /proc/<pid>/task/<pid>/children")
+        with DaemonClient(daemon) as client:
+            killed = workers(client)
+            # the pool terminates the other workers once it sees one die
+            os.kill(int(min(killed)), signal.SIGKILL)
+            # a request in flight when the pool breaks fails with it; the
+            # daemon starts a new pool for the next ones
+            try:
+                result = client.request("parse", "int 5;")
+            except DaemonError as e:
+                assert e.error_type == "BrokenProcessPool"
+                result = client.request("parse", "int 5;")
+            assert result == Parser("int 5;").parse()
+            assert workers(client).isdisjoint(killed)
+
+    def test_client_cli(self, daemon, tmp_path, capsys):
+        good = tmp_path / "good.tyc"
+        good.write_text("int main() { return 0; }")
+        bad = tmp_path / "bad.tyc"
+        bad.write_text("int 5;")
+        assert main(["--socket", str(daemon), "parse", str(good)]) == 0
+        assert capsys.readouterr().out == "success\n"
+        assert main(["--socket", str(daemon), "parse", str(good), str(bad)]) == 1
+        assert capsys.readouterr().out.splitlines() == [
+            f"{good}: success", f"{bad}: Error on line 1 col 4: 5",
+        ]
@@ -0,0 +1,139 @@
+"""
+Differential tests for the recursive-descent parser backend.
+DescentParser must build the same AST as TyCParser + ASTGeneration and
+report the same syntax and lexer errors, with either lexer backend.
+"""
+
+import pytest
+from tests.utils import ASTGenerator, Parser, collect_check_inputs
+from src.frontend.backends import resolve_parser_backend
+from src.frontend.descent import DescentParser, iter_declarations, iter_file_declarations, parse_source
+from src.frontend.session import FrontEndSession
+from src.utils.error_listener import SyntaxException
+from src.utils.nodes import Program
+
+LEXER_CORPUS = collect_check_inputs("test_lexer.py")
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+PROGRAM = """
+struct Point { int x; int y; };
+int area(Point p) { if (p.x > 0) { return p.x * p.y; } return 0; }
+Point origin = {0, 0};
+"""
+
+
+def generate(source, lexer_backend=None, parser_backend=None):
+    return str(ASTGenerator(source, lexer_backend, parser_backend=parser_backend).generate())
+
+
+class TestDescentParser:
+
+    @pytest.mark.parametrize("lexer_backend", ["antlr", "fast"])
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_parser_corpus_matches_antlr(self, name, source, lexer_backend):
+        assert generate(source, lexer_backend, "descent") == generate(source, lexer_backend)
+        assert Parser(source, lexer_backend, parser_backend="descent").parse() == Parser(
+            source, lexer_backend
+        ).parse()
+
+    def test_lexer_corpus_matches_antlr(self):
+        for _, source in LEXER_CORPUS:
+            assert generate(source, parser_backend="descent") == generate(source), source
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "int x = 1 + 2 * 3 - 4 / 5 % 6;",
+            "void f() { a = b = c || d && e == f < g; }",
+            "void f() { x = -!y + ++z.w--; s.m().n = p(1)(2); }",
+            "void f() { for (auto i = 0; ; i++) { } for (;;) ; }",
+            "void f() { switch (x) { case 1: case 2: y++; default: break; } }",
+            "void f() { if (a) if (b) c(); else d(); }",
+            "struct P { int x; P next; }; P p = {1, {2.5, \"s\"}};",
+            "f() { return; } int g(int a, float b) { return a; }",
+        ],
+    )
+    def test_ast_matches_antlr(self, source):
+        assert generate(source, parser_backend="descent") == generate(source)
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "void",
+            "int",
+            "int x = ;",
+            "void f() { {1, 2}; }",
+            "void f() { x y z; }",
+            "void f() { for (int i = 0 i < 1;) ; }",
+            "void f() { switch (x) { case 1 x++; } }",
+            "void f(int a,) { }",
+            "int x = 1 @",
+            'void f() { x = "open',
+            "void f() { x = 1; } }",
+        ],
+    )
+    def test_errors_match_antlr(self, source):
+        expected = Parser(source).parse()
+        assert expected != "success"
+        assert Parser(source, parser_backend="descent").parse() == expected
+        assert generate(source, parser_backend="descent") == generate(source)
+
+    def test_precedence(self):
+        program = parse_source("int x = a = 1 + 2 * -b.c++ < 3 || !d && e;")
+        assert str(program.decls[0].init_value) == (
+            "AssignExpr(Identifier(a) = BinaryOp(BinaryOp(BinaryOp(IntLiteral(1), +, "
+            "BinaryOp(IntLiteral(2), *, PrefixOp(-PostfixOp(MemberAccess(Identifier(b).c)++)))), "
+            "<, IntLiteral(3)), ||, BinaryOp(PrefixOp(!Identifier(d)), &&, Identifier(e))))"
+        )
+
+    def test_session_backend(self):
+        session = FrontEndSession(parser_backend="descent")
+        sources = [source for _, source in PARSER_CORPUS]
+        assert session.parse_many(sources) == [Parser(source).parse() for source in sources]
+        assert [str(ast) for ast in session.build_ast_many(sources[:20])] == [
+            generate(source) for source in sources[:20]
+        ]
+        assert session.stats.inputs == 0
+
+    def test_unknown_parser_backend(self):
+        assert resolve_parser_backend("descent") == "descent"
+        with pytest.raises(ValueError):
+            Parser("int x;", parser_backend="yacc")
+
+
+class TestStreaming:
+
+    @pytest.mark.parametrize("lexer_backend", ["antlr", "fast"])
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_matches_parse(self, name, source, lexer_backend):
+        decls, error = [], None
+        try:
+            decls.extend(iter_declarations(source, lexer_backend))
+        except Exception as e:
+            error = str(e)
+        try:
+            expected = str(parse_source(source, lexer_backend))
+        except Exception as e:
+            assert error == str(e)
+        else:
+            assert error is None and str(Program(decls)) == expected
+
+    def test_declarations_before_an_error_are_yielded(self):
+        stream = iter_declarations("int a; void f() { } int b = ; int c;")
+        assert [type(next(stream)).__name__ for _ in range(2)] == ["VarDecl", "FuncDecl"]
+        with pytest.raises(SyntaxException, match="Error on line 1 col 28: ;"):
+            next(stream)
+
+    def test_tokens_are_released(self):
+        parser = DescentParser(PROGRAM * 50, "fast")
+        held = []
+        for _ in parser.declarations():
+            held.append(len(parser._tokens))
+        assert len(held) == 150 and max(held) <= 3
+
+    @pytest.mark.parametrize("lexer_backend", ["antlr", "fast"])
+    def test_file(self, tmp_path, lexer_backend):
+        path = tmp_path / "program.tyc"
+        path.write_text(PROGRAM * 5)
+        decls = list(iter_file_declarations(str(path), lexer_backend))
+        assert len(decls) == 15
+        assert str(Program(decls)) == str(parse_source(PROGRAM * 5))
@@ -0,0 +1,110 @@
+"""
+Tests for the persisted prediction DFA.
+A restored snapshot must reproduce the saved DFA exactly, parse every input
+of the test corpora with the same results, and be ignored when it was made
+for a different grammar or runtime.
+"""
+
+import marshal
+import importlib.metadata
+import types
+
+import pytest
+from tests.utils import Parser, collect_check_inputs
+from src.frontend import dfa_snapshot
+from src.frontend.session import FrontEndSession
+
+SOURCES = [
+    source
+    for test_file in ("test_lexer.py", "test_parser.py")
+    for _, source in collect_check_inputs(test_file)
+]
+
+
+@pytest.fixture
+def isolated_dfa():
+    """Give the test fresh DFAs and put the process-wide ones back afterwards."""
+    saved = dfa_snapshot.dump_dfa_state()
+    dfa_snapshot.clear_dfa_state()
+    yield
+    dfa_snapshot.restore_dfa_state(saved)
+
+
+class TestDFASnapshot:
+
+    def test_restore_round_trip(self, isolated_dfa):
+        dfa_snapshot.train(SOURCES)
+        data = dfa_snapshot.dump_dfa_state()
+        dfa_snapshot.clear_dfa_state()
+        dfa_snapshot.restore_dfa_state(data)
+        assert dfa_snapshot.dump_dfa_state() == data
+
+    def test_loaded_snapshot_parses_corpus(self, isolated_dfa, tmp_path):
+        path = tmp_path / "tyc_dfa.snapshot"
+        dfa_snapshot.train(SOURCES)
+        size = dfa_snapshot.dfa_size()
+        dfa_snapshot.save_dfa_snapshot(path)
+        dfa_snapshot.clear_dfa_state()
+        assert dfa_snapshot.dfa_size() == (0, 0)
+
+        assert dfa_snapshot.load_dfa_snapshot(path)
+        assert dfa_snapshot.dfa_size() == size
+        expected = [Parser(source).parse() for source in SOURCES]
+        assert FrontEndSession(load_dfa=False).parse_many(SOURCES) == expected
+        # Every prediction was answered from the loaded DFA
+        assert dfa_snapshot.dfa_size() == size
+
+    def test_stale_snapshot_is_ignored(self, isolated_dfa, tmp_path):
+        path = tmp_path / "tyc_dfa.snapshot"
+        dfa_snapshot.train(SOURCES[:10])
+        data = dfa_snapshot.dump_dfa_state()
+        data["key"]["grammar"] = "0" * 64
+        path.write_bytes(marshal.dumps(data))
+        dfa_snapshot.clear_dfa_state()
+        assert not dfa_snapshot.load_dfa_snapshot(path)
+        assert dfa_snapshot.dfa_size() == (0, 0)
+
+    def test_key_tracks_runtime_version(self, monkeypatch):
+        key = dfa_snapshot.snapshot_key()
+        monkeypatch.setattr(dfa_snapshot, "antlr_runtime_version", lambda: "0.0")
+        assert dfa_snapshot.snapshot_key() != key
+
+    def test_runtime_version_of_the_imported_package(self, monkeypatch, tmp_path):
+        package = tmp_path / "antlr4" / "__init__.py"
+        package.parent.mkdir()
+        package.write_text("")
+        monkeypatch.setattr(dfa_snapshot, "antlr4", types.SimpleNamespace(__file__=str(package)))
+
+        def install(release, owns):
+            info = tmp_path / f"antlr4_python3_runtime-{release}.dist-info"
+            info.mkdir()
+            files = ["antlr4/__init__.py,sha256=x,0"] if owns else []
+            (info / "RECORD").write_text("\n".join(files + [f"{info.name}/RECORD,,"]) + "\n")
+
+        # a stale .dist-info left next to the one that installed antlr4
+        install("4.9.3", owns=False)
+        install("4.13.2", owns=True)
+        assert dfa_snapshot.antlr_runtime_version() == "4.13.2"
+        # more than one claims it: ask importlib.metadata
+        install("4.13.1", owns=True)
+        monkeypatch.setattr(importlib.metadata, "version", lambda name: "from metadata")
+        assert dfa_snapshot.antlr_runtime_version() == "from metadata"
+
+    def test_missing_or_corrupt_snapshot(self, tmp_path):
+        assert not dfa_snapshot.load_dfa_snapshot(tmp_path / "missing.snapshot")
+        path = tmp_path / "corrupt.snapshot"
+        path.write_bytes(b"not a snapshot")
+        assert not dfa_snapshot.load_dfa_snapshot(path)
+
+    def test_malformed_snapshot_leaves_dfa_untouched(self, isolated_dfa, tmp_path):
+        path = tmp_path / "malformed.snapshot"
+        dfa_snapshot.train(SOURCES[:10])
+        size = dfa_snapshot.dfa_size()
+        data = dfa_snapshot.dump_dfa_state()
+        data["parser"]["dfas"] = [(False, 0, [(10**6,)])]
+        path.write_bytes(marshal.dumps(data))
+        assert not dfa_snapshot.load_dfa_snapshot(path)
+        data["parser"] = {"contexts": [], "executors": [], "dfas": []}
+        path.write_bytes(marshal.dumps(data))
+        assert not dfa_snapshot.load_dfa_snapshot(path)
+        assert dfa_snapshot.dfa_size() == size
@@ -0,0 +1,77 @@
+"""
+Differential tests for the hand-written TyC lexer.
+Every input of tests/test_lexer.py and tests/test_parser.py is run through
+both the generated TyCLexer and TyCFastLexer and the results must agree.
+"""
+
+import pytest
+from tests.utils import Tokenizer, Parser, collect_check_inputs
+from build.TyCLexer import TyCLexer
+from src.frontend.fast_lexer import TyCFastLexer
+from lexererr import *
+
+LEXER_CORPUS = collect_check_inputs("test_lexer.py")
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+
+
+def tokenize(source, backend):
+    """Return the token string, or the lexer error raised for ``source``."""
+    try:
+        return Tokenizer(source, backend).get_tokens_as_string()
+    except LexerError as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def token_tuples(lexer):
+    tokens = []
+    while True:
+        token = lexer.nextToken()
+        tokens.append(
+            (token.type, token.text, token.start, token.stop, token.line, token.column)
+        )
+        if token.type == -1:
+            return tokens
+
+
+class TestFastLexer:
+
+    @pytest.mark.parametrize("name,source", LEXER_CORPUS, ids=[n for n, _ in LEXER_CORPUS])
+    def test_lexer_corpus(self, name, source):
+        assert tokenize(source, "fast") == tokenize(source, "antlr")
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_parser_corpus_tokens(self, name, source):
+        assert tokenize(source, "fast") == tokenize(source, "antlr")
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_parser_corpus_parse(self, name, source):
+        assert Parser(source, "fast").parse() == Parser(source, "antlr").parse()
+
+    def test_token_positions(self):
+        source = '/* a\n b */ int x = "s\\t";\n\tfoo(1.5e3, .2) // end\r\n  x++ '
+        from antlr4 import InputStream
+
+        expected = token_tuples(TyCLexer(InputStream(source)))
+        assert token_tuples(TyCFastLexer(source)) == expected
+
+    def test_token_types_match_generated_lexer(self):
+        assert TyCFastLexer.symbolicNames == TyCLexer.symbolicNames
+        for ttype, name in enumerate(TyCLexer.symbolicNames[1:], start=1):
+            assert getattr(TyCFastLexer, name) == ttype == getattr(TyCLexer, name)
+
+    def test_error_raised_lazily(self):
+        lexer = TyCFastLexer("int x @")
+        assert lexer.nextToken().text == "int"
+        assert lexer.nextToken().text == "x"
+        with pytest.raises(ErrorToken):
+            lexer.nextToken()
+
+    def test_illegal_escape_newline(self):
+        source = '"abc\\\n"'
+        assert tokenize(source, "fast") == tokenize(source, "antlr")
+
+    def test_non_ascii_char(self):
+        assert tokenize("x é", "fast") == tokenize("x é", "antlr")
+
+    def test_unclosed_block_comment(self):
+        assert tokenize("a /* b", "fast") == tokenize("a /* b", "antlr")
@@ -0,0 +1,98 @@
+"""
+Tests for the flat struct-of-arrays AST encoding (src/utils/flat_ast.py).
+"""
+
+import pickle
+
+import pytest
+from tests.utils import ASTGenerator, collect_check_inputs
+from src.utils import nodes
+from src.utils.flat_ast import FIELDS, KINDS, FlatAST, flatten, unflatten
+from src.utils.nodes import *
+
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+
+
+def parse(source):
+    return ASTGenerator(source).generate()
+
+
+class TestFlatAST:
+
+    def test_every_node_class_has_a_kind(self):
+        assert set(KINDS) == set(FIELDS) == {
+            cls for cls in vars(nodes).values() if isinstance(cls, type)
+            and issubclass(cls, ASTNode) and cls is not ASTNode and "accept" in vars(cls)
+        }
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_round_trip(self, name, source):
+        ast = parse(source)
+        if isinstance(ast, str):
+            pytest.skip("syntax error")
+        flat = flatten(ast)
+        assert str(unflatten(flat)) == str(ast)
+
+    def test_round_trip_edge_values(self):
+        ast = Program([
+            FuncDecl(None, "f", [Param(StructType("P"), "p")], BlockStmt([
+                VarDecl(None, "x", IntLiteral(10 ** 30)),
+                VarDecl(IntType(), "y"),
+                ExprStmt(FuncCall(MemberAccess(Identifier("p"), "m"), [
+                    IntLiteral(-5), FloatLiteral(1e-300), StringLiteral("a\\tb"),
+                ])),
+                ForStmt(None, None, None, BlockStmt([])),
+                SwitchStmt(Identifier("x"), [], DefaultStmt([BreakStmt()])),
+            ])),
+        ])
+        flat = flatten(ast)
+        assert str(unflatten(flat)) == str(ast)
+        assert flat.big_ints == {next(flat.iter_kind(IntLiteral)): 10 ** 30}
+        assert [flat.literal(i) for i in flat.iter_kind(IntLiteral)] == [10 ** 30, -5]
+
+    def test_subtree_root(self):
+        expr = BinaryOp(Identifier("a"), "+", IntLiteral(1))
+        assert str(unflatten(flatten(expr))) == str(expr)
+
+    def test_traversal(self):
+        flat = flatten(parse("int f(int a) { return a * 2 + g(a); }"))
+        assert flat.node_class(0) is Program
+        assert [flat.node_class(i).__name__ for i in range(len(flat))] == [
+            "Program", "FuncDecl", "IntType", "Param", "IntType", "BlockStmt",
+            "ReturnStmt", "BinaryOp", "BinaryOp", "Identifier", "IntLiteral",
+            "FuncCall", "Identifier",
+        ]
+        assert list(flat.iter_children(1)) == [2, 3, 5]
+        assert list(flat.iter_children(7)) == [8, 11]
+        assert [flat.text(i) for i in flat.iter_kind(Identifier)] == ["a", "a"]
+        assert flat.text(7) == "+" and flat.text(11) == "g"
+        assert flat.literal(10) == 2
+        assert flat.parent[10] == 8 and flat.parent[0] == -1
+        with pytest.raises(ValueError):
+            flat.literal(7)
+
+    def test_none_children_keep_their_slot(self):
+        flat = flatten(parse("void f() { for (;;) {} }"))
+        (for_id,) = flat.iter_kind(ForStmt)
+        slots = [flat.children[slot] for slot in flat.child_slots(for_id)]
+        assert slots[:3] == [-1, -1, -1]
+        assert flat.node_class(slots[3]) is BlockStmt
+        assert list(flat.iter_children(for_id)) == slots[3:]
+
+    def test_positions(self):
+        ident = Identifier("x")
+        ident.line, ident.column = 4, 2
+        flat = flatten(ExprStmt(ident))
+        assert flat.position(0) == (None, None)
+        assert flat.position(1) == (4, 2)
+        rebuilt = unflatten(flat)
+        assert (rebuilt.expr.line, rebuilt.expr.column) == (4, 2)
+        assert rebuilt.line is None
+
+    def test_pickle(self):
+        flat = flatten(parse(PARSER_CORPUS[0][1]))
+        assert str(unflatten(pickle.loads(pickle.dumps(flat)))) == str(unflatten(flat))
+
+    def test_empty(self):
+        assert len(FlatAST()) == 0
+        assert str(unflatten(flatten(Program([])))) == "Program([])"
@@ -0,0 +1,183 @@
+"""
+Tests for incremental reparsing (src/frontend/incremental.py).
+After every edit, IncrementalDocument must hold the AST a full parse of the
+new source builds, or raise the error a full parse raises, while reusing
+the declarations the edit does not reach.
+"""
+
+import random
+
+import pytest
+from tests.utils import collect_check_inputs
+from src.frontend.descent import parse_source
+from src.frontend.incremental import IncrementalDocument, split_declarations
+from lexererr import *
+
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+SOURCE = """struct Point { int x; int y; };
+int origin = 0;
+/* area of p */
+int area(Point p) { return p.x * p.y; }
+Point corner = {1, 2};
+void log(string s) { printString(s); }
+auto total = area(corner) + 1;
+"""
+
+
+def full_parse(source):
+    """``(str of the AST, None)`` or ``(None, (error type, message))``."""
+    try:
+        return str(parse_source(source)), None
+    except (Exception, LexerError) as e:
+        return None, (type(e).__name__, str(e))
+
+
+def check(document):
+    """The document is consistent with a full parse of its source."""
+    assert str(document.program) == str(parse_source(document.source))
+    assert len(document.spans) == len(document.program.decls)
+    for (start, end), decl in zip(document.spans, document.program.decls):
+        assert str(parse_source(document.source[start:end]).decls[0]) == str(decl)
+
+
+def apply(document, start, end, text):
+    source, program = document.source, document.program
+    new_source = source[:start] + text + source[end:]
+    expected, error = full_parse(new_source)
+    if error is None:
+        assert str(document.edit(start, end, text)) == expected
+        assert document.error is None
+        check(document)
+    else:
+        with pytest.raises(Exception) as raised:
+            document.edit(start, end, text)
+        assert (type(raised.value).__name__, str(raised.value)) == error
+        # the document follows the text and keeps the last program until it parses
+        assert document.source == new_source and document.program is program
+        assert document.error is raised.value
+
+
+class TestSplitDeclarations:
+
+    def test_spans(self):
+        spans, index = split_declarations(SOURCE)
+        assert index is None
+        assert [SOURCE[start:end] for start, end in spans] == [
+            "struct Point { int x; int y; };",
+            "int origin = 0;",
+            "int area(Point p) { return p.x * p.y; }",
+            "Point corner = {1, 2};",
+            "void log(string s) { printString(s); }",
+            "auto total = area(corner) + 1;",
+        ]
+
+    def test_resume(self):
+        spans, index = split_declarations(SOURCE, 0, lambda offset: 7 if offset > 40 else None)
+        assert index == 7
+        assert len(spans) == 2
+
+
+class TestIncrementalDocument:
+
+    def test_initial_parse(self):
+        document = IncrementalDocument(SOURCE)
+        check(document)
+        assert document.reparsed == 6
+
+    def test_untouched_declarations_are_reused(self):
+        document = IncrementalDocument(SOURCE)
+        before = list(document.program.decls)
+        at = SOURCE.index("p.x * p.y")
+        program = document.edit(at, at + len("p.x"), "p.y")
+        assert document.reparsed == 1
+        assert [a is b for a, b in zip(before, program.decls)] == [True, True, False, True, True, True]
+        assert str(program.decls[2]) == str(parse_source("int area(Point p) { return p.y * p.y; }").decls[0])
+        check(document)
+
+    def test_spans_are_shifted(self):
+        document = IncrementalDocument(SOURCE)
+        spans = document.spans
+        document.edit(0, 0, "int a = 1;\n\n")
+        assert document.reparsed == 1
+        assert document.spans[1:] == [(start + 12, end + 12) for start, end in spans]
+        check(document)
+
+    def test_edit_in_a_gap(self):
+        document = IncrementalDocument(SOURCE)
+        at = SOURCE.index("area of p")
+        document.edit(at, at + 4, "size")
+        assert document.reparsed == 0
+        check(document)
+
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            ("/* area of p */", "/* area of p "),  # the comment swallows a declaration
+            ("0;\n", "0;\n/*"),  # an unterminated comment
+            ("int origin = 0;\n", ""),
+            ("int origin = 0;", "int origin = 0 int other = 1;"),
+            ("}\nPoint corner", " int z; }\nPoint corner"),  # merged into area
+            ("origin", "originx"),
+            ("auto total", "auto"),
+            ("{1, 2}", "{1, {3, 4}}"),
+            ("\n", "\"\n"),  # unclosed string
+            ("void log", "log"),
+            ("struct Point", "structPoint"),
+        ],
+    )
+    def test_edits(self, old, new):
+        document = IncrementalDocument(SOURCE)
+        at = SOURCE.index(old)
+        apply(document, at, at + len(old), new)
+
+    def test_invalid_edit_range(self):
+        document = IncrementalDocument(SOURCE)
+        with pytest.raises(ValueError):
+            document.edit(5, 4, "")
+        with pytest.raises(ValueError):
+            document.edit(0, len(SOURCE) + 1, "")
+
+    def test_recovers_after_an_error(self):
+        document = IncrementalDocument(SOURCE)
+        at = SOURCE.index("int origin")
+        apply(document, at, at, "int broken ")
+        assert document.reparsed == 0
+        # offsets after an error refer to the text that failed to parse
+        apply(document, at + len("int broken"), at + len("int broken "), "; ")
+        assert document.reparsed == 7
+        apply(document, at, at, "int fixed; ")
+        assert document.reparsed == 1
+
+    def test_errors_do_not_desynchronize_offsets(self):
+        document = IncrementalDocument("int a = 1;\nvoid f() { a = 2; }\n")
+        apply(document, 11, 11, "int ")
+        apply(document, 15, 15, "b;")
+        assert document.source == "int a = 1;\nint b;void f() { a = 2; }\n"
+
+    def test_typing_a_declaration(self):
+        document = IncrementalDocument(SOURCE)
+        at = SOURCE.index("void log")
+        for offset, char in enumerate("Point far = {p.x, 10};\n"):
+            apply(document, at + offset, at + offset, char)
+        assert document.source == SOURCE[:at] + "Point far = {p.x, 10};\n" + SOURCE[at:]
+        # deleting it again one character at a time from the end
+        for offset in reversed(range(len("Point far = {p.x, 10};\n"))):
+            apply(document, at + offset, at + offset + 1, "")
+        assert document.source == SOURCE
+        check(document)
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS[:80], ids=[n for n, _ in PARSER_CORPUS[:80]])
+    def test_random_edits(self, name, source):
+        if full_parse(source)[1] is not None:
+            pytest.skip("not a valid program")
+        rng = random.Random(name)
+        document = IncrementalDocument(source)
+        for _ in range(20):
+            start = rng.randrange(len(document.source) + 1)
+            end = min(len(document.source), start + rng.choice([0, 0, 1, 1, 2, 5]))
+            text = "".join(rng.choice(" ;{}()=/*\"x1\n") for _ in range(rng.choice([0, 1, 1, 2])))
+            if rng.random() < 0.5:
+                # move text around instead of inserting noise
+                at = rng.randrange(len(document.source) + 1)
+                text = document.source[at:at + rng.randrange(1, 12)]
+            apply(document, start, end, text)
@@ -0,0 +1,165 @@
+"""
+Tests for structural (Merkle) hashes (src/utils/merkle.py).
+Two subtrees must hash alike exactly when they print alike, whatever their
+positions, the front end that built them or the process that hashed them.
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+from tests.utils import ASTGenerator, collect_check_inputs
+from src.frontend.descent import parse_source
+from src.utils.merkle import (
+    HASH_SIZE, HashIndex, clear_hashes, hex_hash, iter_subtree, same_structure, structural_hash,
+)
+from src.utils.nodes import *
+
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE = """
+struct Point { int x; int y; };
+int area(Point p) { return p.x * p.y; }
+int twice(int n) { return n + n; }
+float half(float f) { return f / 2.0; }
+int volume(Point p) { return p.x * p.y; }
+"""
+
+
+def parse(source, backend="antlr"):
+    return ASTGenerator(source, parser_backend=backend).generate()
+
+
+def chain(depth):
+    expr = Identifier("x")
+    for _ in range(depth):
+        expr = BinaryOp(expr, "+", IntLiteral(1))
+    return Program([ReturnStmt(expr)])
+
+
+class TestStructuralHash:
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_backends_agree(self, name, source):
+        ast = parse(source)
+        if isinstance(ast, str):
+            pytest.skip("not a valid program")
+        assert structural_hash(parse(source, "descent")) == structural_hash(ast)
+
+    def test_hash_follows_str(self):
+        by_hash, by_text = {}, {}
+        for _, source in PARSER_CORPUS:
+            ast = parse(source, "descent")
+            if isinstance(ast, str):
+                continue
+            for node in iter_subtree(ast):
+                by_hash.setdefault(structural_hash(node), set()).add(str(node))
+                by_text.setdefault(str(node), set()).add(structural_hash(node))
+        assert all(len(texts) == 1 for texts in by_hash.values())
+        assert all(len(hashes) == 1 for hashes in by_text.values())
+
+    def test_positions_are_ignored(self):
+        compact = parse_source("int f(){return 1+2;}")
+        spread = parse_source("\n\n  int f ( )\n{\n   return 1 +\n 2 ;\n}")
+        for line, node in enumerate(iter_subtree(spread)):
+            node.line, node.column = line + 3, 2 * line
+        assert structural_hash(compact) == structural_hash(spread)
+        assert len(structural_hash(compact)) == HASH_SIZE
+
+    def test_fields_are_distinguished(self):
+        variants = [
+            "int f() { return 1 + 2; }",
+            "int f() { return 1 - 2; }",
+            "int f() { return 2 + 1; }",
+            "int f() { return 1.0 + 2; }",
+            'int f() { return "1" + 2; }',
+            "int g() { return 1 + 2; }",
+            "float f() { return 1 + 2; }",
+            "int f(int a) { return 1 + 2; }",
+            "int f() { return (1 + 2); 0; }",
+            "int f() { return; }",
+        ]
+        hashes = {structural_hash(parse_source(source)) for source in variants}
+        assert len(hashes) == len(variants)
+        assert structural_hash(Identifier("ab")) != structural_hash(StringLiteral("ab"))
+        assert structural_hash(IntLiteral(1)) != structural_hash(FloatLiteral(1.0))
+        assert structural_hash(StructDecl("a", [])) != structural_hash(StructDecl("", []))
+
+    def test_stable_across_processes(self):
+        script = (
+            "import tests.utils\n"
+            "from src.frontend.descent import parse_source\n"
+            "from src.utils.merkle import hex_hash\n"
+            f"print(hex_hash(parse_source({SOURCE!r})))\n"
+        )
+        digests = {
+            subprocess.run(
+                [sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True, text=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        assert digests == {hex_hash(parse_source(SOURCE))}
+
+    def test_cached_and_cleared(self):
+        ast = parse_source(SOURCE)
+        before = structural_hash(ast)
+        assert all(node._hash is not None for node in iter_subtree(ast))
+        ast.decls[2].body.statements[0].expr.operator = "*"
+        assert structural_hash(ast) == before  # stale until cleared
+        clear_hashes(ast)
+        assert structural_hash(ast) != before
+        ast.decls[2].body.statements[0].expr.operator = "+"
+        clear_hashes(ast)
+        assert structural_hash(ast) == before
+
+    def test_pickle_keeps_hash(self):
+        ast = parse_source(SOURCE)
+        digest = structural_hash(ast)
+        copy = pickle.loads(pickle.dumps(ast))
+        assert copy._hash == digest
+        clear_hashes(copy)
+        assert structural_hash(copy) == digest
+
+    def test_deep_tree(self):
+        assert structural_hash(chain(100_000)) != structural_hash(chain(99_999))
+
+    def test_same_structure(self):
+        ast = parse_source(SOURCE)
+        area, volume = ast.decls[1], ast.decls[4]
+        assert same_structure(area.body, volume.body)
+        assert not same_structure(area, volume)
+        assert area.body != volume.body  # node equality is unchanged
+
+
+class TestHashIndex:
+
+    def test_duplicate_bodies(self):
+        ast = parse_source(SOURCE)
+        index = HashIndex(ast)
+        groups = index.duplicates(BlockStmt)
+        assert list(groups.values()) == [[ast.decls[1].body, ast.decls[4].body]]
+        assert index[ast.decls[1].body] == [ast.decls[1].body, ast.decls[4].body]
+
+    def test_lookup(self):
+        ast = parse_source(SOURCE)
+        index = HashIndex(ast, classes=[FuncDecl])
+        assert len(index) == 4
+        twice = ast.decls[2]
+        assert index[structural_hash(twice)] == [twice]
+        assert index[hex_hash(twice)] == [twice]
+        assert twice in index
+        assert parse_source("int twice(int n) { return n + n; }").decls[0] in index
+        assert ast.decls[0] not in index
+        assert index.get(ast.decls[0]) is None
+        assert index.duplicates() == {}
+
+    def test_every_subtree_is_indexed(self):
+        ast = parse_source(SOURCE)
+        index = HashIndex(ast)
+        assert sum(len(index[key]) for key in index) == len(list(iter_subtree(ast)))
+        # two members, three return types and a parameter
+        assert len(index[IntType()]) == 6
+        assert len(index[StructType("Point")]) == 2
@@ -0,0 +1,125 @@
+"""
+Tests for the slotted AST node classes in src/utils/nodes.py.
+"""
+
+import copy
+import pickle
+
+import pytest
+from tests.utils import ASTGenerator, collect_check_inputs
+from src.frontend.descent import parse_source
+from src.utils import binary_ast, nodes
+from src.utils.flat_ast import flatten, unflatten
+from src.utils.nodes import (
+    ASTNode, BinaryOp, FloatType, Identifier, IntLiteral, IntType, InternTable, Program,
+    StructType,
+)
+
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+NODE_CLASSES = [
+    cls for cls in vars(nodes).values()
+    if isinstance(cls, type) and issubclass(cls, ASTNode)
+]
+
+
+class TestNodes:
+
+    @pytest.mark.parametrize("cls", NODE_CLASSES, ids=lambda cls: cls.__name__)
+    def test_every_class_is_slotted(self, cls):
+        assert "__slots__" in vars(cls)
+        assert not hasattr(object.__new__(cls), "__dict__")
+
+    def test_no_instance_dict(self):
+        node = BinaryOp(IntLiteral(1), "+", Identifier("x"))
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.type = "int"
+
+    def test_position_defaults_to_none(self):
+        node = Identifier("x")
+        assert (node.line, node.column) == (None, None)
+        node.line, node.column = 3, 7
+        assert (node.line, node.column) == (3, 7)
+        with pytest.raises(AttributeError):
+            node.lines
+
+    def test_abstract_bases_do_not_accept(self):
+        with pytest.raises(NotImplementedError):
+            nodes.Expr().accept(None)
+
+    def test_pickle_round_trip(self):
+        for _, source in PARSER_CORPUS[:20]:
+            ast = ASTGenerator(source).generate()
+            assert str(pickle.loads(pickle.dumps(ast))) == str(ast)
+        node = pickle.loads(pickle.dumps(Program([])))
+        assert node.line is None
+
+
+STRUCT_SOURCE = """struct P { int x; P next; };
+P make(P p, int n) { P q = p; q.next = p; return make(q.next, n + x); }
+int x = 1;
+"""
+
+
+def iter_nodes(root):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        for name in node.__slots__:
+            value = getattr(node, name)
+            if isinstance(value, ASTNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(value)
+
+
+class TestInterning:
+
+    def test_primitive_types_are_canonical(self):
+        assert IntType() is IntType()
+        assert IntType() is not FloatType()
+        assert pickle.loads(pickle.dumps(IntType())) is IntType()
+        assert copy.deepcopy(FloatType()) is FloatType()
+        assert StructType("P") is not StructType("P")
+
+    def test_subclass_has_its_own_instance(self):
+        class Wide(IntType):
+            __slots__ = ()
+
+        assert Wide() is Wide()
+        assert Wide() is not IntType()
+
+    def test_intern_table(self):
+        table = InternTable()
+        name = "".join(["ma", "in"])
+        assert table.name(name) is name
+        assert table.name("main") is name
+        assert table.struct_type("P") is table.struct_type("P")
+        assert table.struct_type("P").struct_name is table.name("P")
+        assert InternTable().struct_type("P") is not table.struct_type("P")
+
+    @pytest.mark.parametrize("parser_backend", ["antlr", "descent"])
+    def test_front_ends_share_types_and_names(self, parser_backend):
+        program = ASTGenerator(STRUCT_SOURCE, parser_backend=parser_backend).generate()
+        struct_types = [node for node in iter_nodes(program) if type(node) is StructType]
+        assert len(struct_types) == 4
+        assert all(node is struct_types[0] for node in struct_types)
+        names = {}
+        for node in iter_nodes(program):
+            for name in ("name", "member", "struct_name"):
+                text = getattr(node, name, None)
+                if isinstance(text, str):
+                    assert names.setdefault(text, text) is text
+        assert {"P", "x", "next", "make", "p", "q", "n"} <= set(names)
+        other = ASTGenerator(STRUCT_SOURCE, parser_backend=parser_backend).generate()
+        assert other.decls[0].members[1].member_type is not struct_types[0]
+        assert str(other) == str(program)
+
+    def test_decoded_asts_share_struct_types(self):
+        program = parse_source(STRUCT_SOURCE)
+        for rebuilt in (unflatten(flatten(program)), binary_ast.loads(binary_ast.encode(program)).root):
+            first, second = rebuilt.decls[0], rebuilt.decls[1]
+            assert first.members[1].member_type is second.return_type
+            assert second.params[0].param_type is second.return_type
+            assert first.members[0].member_type is IntType()
@@ -0,0 +1,138 @@
+"""
+Tests for parallel parsing (src/frontend/parallel.py).
+However a source is cut into chunks, parse_parallel must return the AST a
+full parse builds, or raise the error, at the position, a full parse raises.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from tests.utils import collect_check_inputs
+from src.frontend.descent import parse_source
+from src.frontend.parallel import chunk_boundaries, parse_parallel
+from src.utils.flat_ast import flatten
+from src.utils.nodes import StructType
+from lexererr import *
+
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+SOURCE = """struct Point { int x; int y; };
+int origin = 0;
+/* area of p; } */
+int area(Point p) { return p.x * p.y; }
+Point corner = {1, 2};
+void log(string s) { printString("};"); }
+auto total = area(corner) + 1;
+"""
+
+
+@pytest.fixture(scope="module")
+def threads():
+    with ThreadPoolExecutor(2) as executor:
+        yield executor
+
+
+def outcome(parse, source):
+    try:
+        return str(parse(source))
+    except (Exception, LexerError) as e:
+        return type(e).__name__, str(e)
+
+
+class TestChunkBoundaries:
+
+    def test_cuts_after_declarations(self):
+        cuts = chunk_boundaries(SOURCE, 1)
+        ends = [SOURCE.index(text) + len(text) for text in (
+            "int y; };", "int origin = 0;", "p.x * p.y; }", "{1, 2};", '"};"); }',
+            "area(corner) + 1;",
+        )]
+        assert cuts == ends
+        assert chunk_boundaries(SOURCE, len(SOURCE)) == []
+
+    def test_chunk_size(self):
+        cuts = chunk_boundaries(SOURCE, 40)
+        assert all(b - a >= 40 for a, b in zip([0] + cuts, cuts))
+        assert len(SOURCE) - cuts[-1] >= 20  # a short tail joins the last chunk
+
+
+class TestParseParallel:
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_matches_full_parse(self, name, source, threads):
+        parallel = lambda s: parse_parallel(s, executor=threads, chunk_size=1)
+        assert outcome(parallel, source) == outcome(parse_source, source)
+
+    def test_concatenated_corpus(self, threads):
+        sources = [source for _, source in PARSER_CORPUS if outcome(parse_source, source)[0] != "SyntaxException"]
+        source = "\n".join(sources[:40])
+        for chunk_size in (1, 100, 1000):
+            program = parse_parallel(source, executor=threads, chunk_size=chunk_size)
+            assert str(program) == str(parse_source(source))
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            "int 5;",  # a syntax error
+            "int f() { return 1 }",
+            "struct S { int a; }",  # no ';' after the struct
+            'string s = "abc\n;',  # an unclosed string
+            "int x = 1 # 2;",  # an error character
+            "void g() { int a = 1; ",  # the input ends in a body
+        ],
+    )
+    def test_errors_at_absolute_positions(self, error, threads):
+        source = SOURCE * 3 + "\n  " + error + "\n" + SOURCE * 3
+        parallel = lambda s: parse_parallel(s, executor=threads, chunk_size=50)
+        expected = outcome(parse_source, source)
+        assert isinstance(expected, tuple)
+        assert outcome(parallel, source) == expected
+
+    @pytest.mark.parametrize(
+        "bad,expected",
+        [
+            ("int f() { return 1 +; }", ("SyntaxException", "Error on line 8 col 20: ;")),
+            # reported after the rest of the input is lexed, so the lexer
+            # error in a later chunk comes first
+            ("int f() { x y; }", ("ErrorToken", "Error Token #")),
+        ],
+    )
+    def test_earliest_error_wins(self, bad, expected, threads):
+        source = SOURCE + bad + "\n" + SOURCE + "int y = 1 # 2;\n" + SOURCE
+        parallel = lambda s: parse_parallel(s, executor=threads, chunk_size=50)
+        assert outcome(parse_source, source) == expected
+        assert outcome(parallel, source) == expected
+
+    def test_shared_interning(self, threads):
+        program = parse_parallel(SOURCE * 4, executor=threads, chunk_size=1)
+        points = [
+            node for decl in program.decls for node in (getattr(decl, "var_type", None),)
+            if isinstance(node, StructType)
+        ]
+        assert len(points) == 4 and all(point is points[0] for point in points)
+
+    def test_positions_match_full_parse(self, threads):
+        source = SOURCE * 4
+        parallel = flatten(parse_parallel(source, executor=threads, chunk_size=1))
+        serial = flatten(parse_source(source))
+        assert list(parallel.line) == list(serial.line)
+        assert list(parallel.column) == list(serial.column)
+
+    def test_declarations_are_built_on_access(self, threads):
+        program = parse_parallel(SOURCE * 4, executor=threads, chunk_size=1)
+        decls = program.decls
+        assert len(decls) == 24 and decls.materialized == 0
+        assert decls[-1] is decls[-1] and decls.materialized == 1
+        assert list(map(str, decls[1:3])) == list(map(str, parse_source(SOURCE).decls[1:3]))
+        assert decls.materialized == 3
+
+    def test_process_pool(self):
+        source = SOURCE * 50
+        with ProcessPoolExecutor(2) as executor:
+            program = parse_parallel(source, executor=executor, chunk_size=200)
+        assert str(program) == str(parse_source(source))
+        assert str(parse_parallel(source, workers=2, chunk_size=200)) == str(program)
+
+    def test_small_sources_are_parsed_serially(self):
+        # a single chunk needs no pool at all
+        assert str(parse_parallel(SOURCE)) == str(parse_source(SOURCE))
+        assert str(parse_parallel(SOURCE, workers=1, chunk_size=1)) == str(parse_source(SOURCE))
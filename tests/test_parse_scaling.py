@@ -0,0 +1,115 @@
+"""
+Scaling test for statement-level '{': it always starts a block and is decided
+with one token of lookahead, so parse time is linear in the number of
+statements however deeply the blocks are nested. Struct literals stay
+primary expressions; only an expression statement cannot start with one.
+"""
+
+import gc
+import sys
+import threading
+import time
+
+import pytest
+from tests.utils import ASTGenerator, Parser
+from src.frontend.session import FrontEndSession
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def nested_blocks(statements):
+    return "void main() " + "{ x++; " * statements + "}" * statements
+
+
+def run_deep(func):
+    """Run ``func`` in a thread whose stack fits the parser's recursion."""
+    result = {}
+    limit = sys.getrecursionlimit()
+    stack_size = threading.stack_size(512 * 1024 * 1024)
+    sys.setrecursionlimit(10 * max(SIZES))
+    # full collections over the growing parse tree are not what is measured
+    gc.disable()
+    try:
+        thread = threading.Thread(target=lambda: result.update(value=func()))
+        thread.start()
+        thread.join()
+    finally:
+        gc.enable()
+        threading.stack_size(stack_size)
+        sys.setrecursionlimit(limit)
+    return result["value"]
+
+
+class TestParseScaling:
+
+    def test_statement_level_brace_is_a_block(self):
+        assert Parser("void f() { { x = 1; } }").parse() == "success"
+        assert Parser("void f() { Point p = {1, {2, 3}}; }").parse() == "success"
+        assert Parser("void f() { {1, 2}; }").parse() == "Error on line 1 col 13: ,"
+
+    @pytest.mark.parametrize("parser_backend", ["antlr", "descent"])
+    @pytest.mark.parametrize("source,ast", [
+        ("void f() { p = {1, 2}; }",
+         "Program([FuncDecl(VoidType(), f, [], BlockStmt([AssignStmt(AssignExpr(Identifier(p) = StructLiteral({IntLiteral(1), IntLiteral(2)})))]))])"),
+        ("void f() { a = b = {}; }",
+         "Program([FuncDecl(VoidType(), f, [], BlockStmt([AssignStmt(AssignExpr(Identifier(a) = AssignExpr(Identifier(b) = StructLiteral({}))))]))])"),
+        ("P f() { return {1, {2}}; }",
+         "Program([FuncDecl(StructType(P), f, [], BlockStmt([ReturnStmt(return StructLiteral({IntLiteral(1), StructLiteral({IntLiteral(2)})}))]))])"),
+        ("void f() { h({1}, x); }",
+         "Program([FuncDecl(VoidType(), f, [], BlockStmt([ExprStmt(FuncCall(h, [StructLiteral({IntLiteral(1)}), Identifier(x)]))]))])"),
+    ])
+    def test_struct_literal_values(self, source, ast, parser_backend):
+        assert Parser(source, parser_backend=parser_backend).parse() == "success"
+        assert str(ASTGenerator(source, parser_backend=parser_backend).generate()) == ast
+
+    @pytest.mark.parametrize("parser_backend", ["antlr", "descent"])
+    @pytest.mark.parametrize("body", [
+        "x = {1} + 2;",
+        "auto a = {1,2}.x;",
+        "if ({1}) {}",
+        "a = ({1});",
+        "a = 1 + {1};",
+        "x = !{1};",
+        "a = {1} = 2;",
+        "({1}).x = 2;",
+    ])
+    def test_struct_literal_is_an_expression(self, body, parser_backend):
+        source = "void f() { %s }" % body
+        assert Parser(source, parser_backend=parser_backend).parse() == "success"
+        assert (str(ASTGenerator(source, parser_backend=parser_backend).generate())
+                == str(ASTGenerator(source, parser_backend="antlr").generate()))
+
+    def test_struct_literal_operands(self):
+        ast = str(ASTGenerator("void f() { a = {1} = 2 + {3}.x; }").generate())
+        assert ast == ("Program([FuncDecl(VoidType(), f, [], BlockStmt([AssignStmt(AssignExpr("
+                       "Identifier(a) = AssignExpr(StructLiteral({IntLiteral(1)}) = BinaryOp("
+                       "IntLiteral(2), +, MemberAccess(StructLiteral({IntLiteral(3)}).x)))))]))])")
+
+    @pytest.mark.parametrize("parser_backend", ["antlr", "descent"])
+    @pytest.mark.parametrize("source,error", [
+        # a statement starting with '{' is a block, not a struct literal
+        ("void f() { {1}; }", "Error on line 1 col 13: }"),
+        ("void f() { {1}.a = 2; }", "Error on line 1 col 13: }"),
+        ("void f() { if (a) {x} = 1; }", "Error on line 1 col 20: }"),
+    ])
+    def test_statement_cannot_start_with_struct_literal(self, source, error, parser_backend):
+        assert Parser(source, parser_backend=parser_backend).parse() == error
+
+    def test_nested_blocks_parse_in_linear_time(self):
+        session = FrontEndSession(load_dfa=False)
+
+        def measure():
+            # warm up the prediction DFA first
+            assert session.parse(nested_blocks(100)) == "success"
+            per_statement = {}
+            for size in SIZES:
+                source = nested_blocks(size)
+                start = time.perf_counter()
+                assert session.parse(source) == "success"
+                per_statement[size] = (time.perf_counter() - start) / size
+            return per_statement
+
+        per_statement = run_deep(measure)
+        # quadratic lookahead would make the largest input 100x slower per
+        # statement than the smallest; allow generous noise instead
+        assert per_statement[SIZES[-1]] < 4 * per_statement[SIZES[0]], per_statement
@@ -0,0 +1,86 @@
+"""
+Tests for the per-decision parser profiler.
+"""
+
+import json
+
+from tests.utils import Parser, collect_check_inputs
+from build.TyCParser import TyCParser
+from src.frontend.profiling import (
+    GRAMMAR_PATH,
+    GrammarProfiler,
+    _grammar_decision_lines,
+    format_report,
+    profile_sources,
+)
+
+SOURCES = [source for _, source in collect_check_inputs("test_parser.py")]
+
+
+def decisions_of(report, rule):
+    return [d for d in report["decisions"] if d["rule"] == rule]
+
+
+class TestGrammarProfiler:
+
+    def test_profiling_does_not_change_results(self):
+        profiler = GrammarProfiler()
+        for source in SOURCES:
+            profiler.parse(source)
+        failures = sum(1 for source in SOURCES if Parser(source).parse() != "success")
+        assert profiler.inputs == len(SOURCES)
+        assert profiler.syntax_errors == failures
+
+    def test_dangling_else_is_reported_as_ambiguity(self):
+        report = profile_sources(["void f() { if (a) if (b) x = 1; else y = 2; }"])
+        ambiguous = [d for d in decisions_of(report, "stmt") if d["ambiguities"]]
+        assert ambiguous and ambiguous[0]["ll_fallback"] >= 1
+        assert ambiguous[0]["ll_max_look"] >= 1
+
+    def test_lookahead_depth_is_bounded_for_nested_blocks(self):
+        def max_look(depth):
+            source = "void f() { " + "{" * depth + " x = 1; " + "}" * depth + " }"
+            report = profile_sources([source])
+            return max(d["sll_max_look"] for d in decisions_of(report, "stmt"))
+
+        assert max_look(32) == max_look(2)
+
+    def test_decisions_map_to_grammar_lines(self):
+        report = profile_sources(SOURCES[:10])
+        grammar = GRAMMAR_PATH.read_text(encoding="utf-8").splitlines()
+        assert report["decisions"]
+        for decision in report["decisions"]:
+            first, last = decision["grammar_lines"]
+            assert grammar[first - 1].startswith(decision["rule"])
+            assert first <= decision["grammar_line"] <= last
+            assert decision["generated_line"] is not None
+
+    def test_every_decision_has_its_own_line(self):
+        lines = _grammar_decision_lines()
+        assert len(lines) == len(TyCParser.atn.decisionToState)
+        grammar = GRAMMAR_PATH.read_text(encoding="utf-8").splitlines()
+        report = profile_sources(["void f() { if (a) x = 1; else y = 2; }"])
+        rows = {d["decision"]: d for d in decisions_of(report, "stmt")}
+        assert any("ELSE" in grammar[row["grammar_line"] - 1] for row in rows.values())
+
+    def test_failed_predictions_are_counted(self):
+        profiler = GrammarProfiler()
+        profiler.parse("int x + 1;")
+        assert profiler.syntax_errors == 1
+        failed = [info for info in profiler.decisions if info.failures]
+        assert failed
+        for info in failed:
+            assert info.invocations >= info.failures and info.time_ns > 0
+        report = profiler.report()
+        assert sum(d["failures"] for d in report["decisions"]) == sum(i.failures for i in failed)
+
+    def test_text_and_json_report(self):
+        report = profile_sources(SOURCES[:10])
+        assert json.loads(json.dumps(report)) == report
+        text = format_report(report, sort="invocations")
+        lines = text.splitlines()
+        assert lines[0].startswith("10 inputs")
+        assert "SLL max" in lines[1] and "LL fb" in lines[1]
+        assert len(lines) == len(report["decisions"]) + 2
+        busiest = max(report["decisions"], key=lambda d: d["invocations"])
+        assert lines[2].split()[0] == str(busiest["decision"])
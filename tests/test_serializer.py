@@ -0,0 +1,86 @@
+"""
+Tests for the iterative AST serializer (src/utils/serializer.py).
+Its output is the canonical ``str(node)`` text the AST tests compare.
+"""
+
+import io
+
+import pytest
+from tests.utils import ASTGenerator
+from src.utils.nodes import *
+from src.utils.serializer import dump, dumps
+
+
+class TestSerializer:
+
+    @pytest.mark.parametrize(
+        "node,expected",
+        [
+            (Program([]), "Program([])"),
+            (FuncCall(MemberAccess(Identifier("s"), "m"), [IntLiteral(1)]),
+             "FuncCall(MemberAccess(Identifier(s).m), [IntLiteral(1)])"),
+            (FuncCall("f", [Identifier("a"), Identifier("b")]),
+             "FuncCall(f, [Identifier(a), Identifier(b)])"),
+            (VarDecl(None, "x"), "VarDecl(auto, x)"),
+            (VarDecl(IntType(), "y", IntLiteral(0)), "VarDecl(IntType(), y = IntLiteral(0))"),
+            (ReturnStmt(), "ReturnStmt(return)"),
+            (ReturnStmt(Identifier("r")), "ReturnStmt(return Identifier(r))"),
+            (IfStmt(Identifier("a"), BlockStmt([])), "IfStmt(if Identifier(a) then BlockStmt([]))"),
+            (IfStmt(Identifier("a"), BreakStmt(), ContinueStmt()),
+             "IfStmt(if Identifier(a) then BreakStmt(), else ContinueStmt())"),
+            (WhileStmt(Identifier("a"), BlockStmt([])),
+             "WhileStmt(while Identifier(a) do BlockStmt([]))"),
+            (ForStmt(None, None, None, BlockStmt([])), "ForStmt(for None; None; None do BlockStmt([]))"),
+            (SwitchStmt(IntLiteral(1), []), "SwitchStmt(switch IntLiteral(1) cases [])"),
+            (SwitchStmt(IntLiteral(1), [CaseStmt(IntLiteral(2), [BreakStmt()])],
+                        DefaultStmt([ContinueStmt()])),
+             "SwitchStmt(switch IntLiteral(1) cases [CaseStmt(case IntLiteral(2): [BreakStmt()])], "
+             "default DefaultStmt(default: [ContinueStmt()]))"),
+            (StringLiteral("a'\"\\n"), "StringLiteral('a\\'\"\\\\n')"),
+            (FloatLiteral(1e300), "FloatLiteral(1e+300)"),
+            (StructLiteral([IntLiteral(1), StructLiteral([])]),
+             "StructLiteral({IntLiteral(1), StructLiteral({})})"),
+            (FuncDecl(None, "g", [Param(StringType(), "s"), Param(FloatType(), "f")], BlockStmt([])),
+             "FuncDecl(auto, g, [Param(StringType(), s), Param(FloatType(), f)], BlockStmt([]))"),
+            (StructDecl("S", [MemberDecl(StructType("S"), "n")]),
+             "StructDecl(S, [MemberDecl(StructType(S), n)])"),
+            (ExprStmt(PrefixOp("-", PostfixOp("++", Identifier("x")))),
+             "ExprStmt(PrefixOp(-PostfixOp(Identifier(x)++)))"),
+            (AssignStmt(AssignExpr(Identifier("a"), BinaryOp(IntLiteral(1), "+", FloatLiteral(2.5)))),
+             "AssignStmt(AssignExpr(Identifier(a) = BinaryOp(IntLiteral(1), +, FloatLiteral(2.5))))"),
+            (Expr(), "Expr()"),
+        ],
+    )
+    def test_canonical_text(self, node, expected):
+        assert dumps(node) == expected
+        assert str(node) == expected
+
+    def test_dump_to_stream(self):
+        ast = ASTGenerator("int f(int a) { return a * 2 + g(a); }" * 500).generate()
+        out = io.StringIO()
+        dump(ast, out)
+        assert out.getvalue() == dumps(ast)
+
+    def test_deep_expression_chain(self):
+        expr = Identifier("a")
+        for _ in range(100_000):
+            expr = BinaryOp(expr, "+", Identifier("b"))
+        text = dumps(expr)
+        assert text == "BinaryOp(" * 100_000 + "Identifier(a)" + ", +, Identifier(b))" * 100_000
+
+    def test_deep_nested_blocks(self):
+        stmt = BreakStmt()
+        for _ in range(50_000):
+            stmt = BlockStmt([stmt])
+        assert str(Program([FuncDecl(VoidType(), "f", [], stmt)])).count("BlockStmt([") == 50_000
+
+    def test_subclasses(self):
+        class Name(Identifier):
+            pass
+
+        class Quoted(Identifier):
+            def __str__(self):
+                return f"Quoted({self.name})"
+
+        assert dumps(ExprStmt(Name("n"))) == "ExprStmt(Identifier(n))"
+        assert dumps(ExprStmt(Quoted("q"))) == "ExprStmt(Quoted(q))"
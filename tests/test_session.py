@@ -0,0 +1,68 @@
+"""
+Tests for FrontEndSession.
+Batch results must equal what the per-input wrappers in tests/utils.py
+return for every input of the test corpora, in input order.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tests.utils import ASTGenerator, Tokenizer, Parser, collect_check_inputs
+from src.frontend.session import FrontEndSession
+from lexererr import *
+
+LEXER_SOURCES = [source for _, source in collect_check_inputs("test_lexer.py")]
+PARSER_SOURCES = [source for _, source in collect_check_inputs("test_parser.py")]
+
+
+def tokenize(source, backend):
+    try:
+        return Tokenizer(source, backend).get_tokens_as_string()
+    except LexerError as e:
+        return str(e)
+
+
+class TestFrontEndSession:
+
+    @pytest.mark.parametrize("backend", ["antlr", "fast"])
+    def test_tokenize_many(self, backend):
+        expected = [tokenize(source, backend) for source in LEXER_SOURCES]
+        assert FrontEndSession(backend).tokenize_many(LEXER_SOURCES) == expected
+
+    @pytest.mark.parametrize("compact_tokens", [False, True])
+    @pytest.mark.parametrize("backend", ["antlr", "fast"])
+    def test_parse_many(self, backend, compact_tokens):
+        expected = [Parser(source).parse() for source in PARSER_SOURCES]
+        session = FrontEndSession(backend, compact_tokens)
+        assert session.parse_many(PARSER_SOURCES) == expected
+
+    def test_build_ast_many(self):
+        sources = PARSER_SOURCES[:20]
+        expected = [str(ASTGenerator(source).generate()) for source in sources]
+        actual = FrontEndSession().build_ast_many(sources)
+        assert [str(ast) for ast in actual] == expected
+
+    def test_errors_do_not_leak_into_next_input(self):
+        session = FrontEndSession()
+        sources = ["void f() { x = ; }", "void f() { x = 1; }", '"open', "int x;"]
+        assert session.parse_many(sources) == [
+            "Error on line 1 col 15: ;",
+            "success",
+            'Unclosed String: "open',
+            "success",
+        ]
+        assert session.tokenize_many(["a @", "b"]) == ["Error Token @", "ID,b,EOF"]
+
+    def test_pipeline_is_reused(self):
+        session = FrontEndSession()
+        session.parse("int x;")
+        parser = session._local.pipeline.parser
+        session.parse("int y;")
+        assert session._local.pipeline.parser is parser
+
+    @pytest.mark.parametrize("backend", ["antlr", "fast"])
+    def test_executor_keeps_input_order(self, backend):
+        expected = [Parser(source).parse() for source in PARSER_SOURCES]
+        session = FrontEndSession(backend)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert session.parse_many(PARSER_SOURCES, executor) == expected
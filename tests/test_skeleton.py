@@ -0,0 +1,119 @@
+"""
+Tests for skeleton parsing (src/frontend/skeleton.py).
+A skeleton Program must match the DescentParser AST once its bodies are
+parsed, and must not parse any body before it is used.
+"""
+
+import pickle
+
+import pytest
+from tests.utils import collect_check_inputs
+from src.frontend.descent import parse_source
+from src.frontend.skeleton import LazyStatements, SkeletonParser, match_braces, parse_skeleton
+from src.utils.error_listener import SyntaxException
+from src.utils.nodes import FuncDecl, ReturnStmt
+from src.utils.visitor import BaseVisitor
+from lexererr import *
+
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+SOURCE = """struct Point { int x; int y; };
+int area(Point p) {
+    if (p.x > 0) { return p.x * p.y; }
+    printString("} { \\" }"); /* } */ // }
+    return 0;
+}
+Point origin = {0, 0};
+void log(string s) { printString(s); }
+"""
+
+
+def outcome(parse, source):
+    try:
+        return str(parse(source))
+    except (Exception, LexerError) as e:
+        return type(e).__name__, str(e)
+
+
+def bodies(program):
+    return [decl.body.statements for decl in program.decls if isinstance(decl, FuncDecl)]
+
+
+class TestSkeleton:
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_matches_descent(self, name, source):
+        try:
+            program = parse_skeleton(source)
+        except (Exception, LexerError):
+            pytest.skip("error outside function bodies")
+        assert not any(body.parsed for body in bodies(program))
+        # str() parses every body in source order
+        assert outcome(lambda _: program, source) == outcome(parse_source, source)
+
+    def test_bodies_are_deferred(self):
+        parser = SkeletonParser(SOURCE)
+        program = parser.parse()
+        assert parser.skipped == 2
+        area, log = bodies(program)
+        assert isinstance(area, LazyStatements) and not area.parsed
+        assert SOURCE[area.start:area.end].startswith("{\n    if")
+        assert SOURCE[area.start:area.end].endswith("return 0;\n}")
+        assert (area.line, area.column) == (2, 18)
+        assert str(program.decls[1].params[0]) == "Param(StructType(Point), p)"
+        assert len(area) == 3 and area.parsed and not log.parsed
+        assert str(program) == str(parse_source(SOURCE))
+
+    def test_match_braces(self):
+        assert match_braces("{ { } }", 0) == 7
+        assert match_braces('{ "}" }', 0) == 7
+        assert match_braces("{ /* } */ }", 0) == 11
+        assert match_braces("{ // }\n }", 0) == 9
+        assert match_braces("{ /* }", 0) == 6  # an unterminated comment is no comment
+        assert match_braces("{ { }", 0) == -1
+
+    def test_errors_in_bodies_are_deferred(self):
+        source = "int f() {\n  int x = ;\n}\nint g;"
+        program = parse_skeleton(source)
+        with pytest.raises(SyntaxException) as deferred:
+            str(program)
+        with pytest.raises(SyntaxException) as full:
+            parse_source(source)
+        assert str(deferred.value) == str(full.value) == "Error on line 2 col 10: ;"
+
+        program = parse_skeleton('void f() { "abc\n }')
+        with pytest.raises(UncloseString):
+            len(program.decls[0].body.statements)
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "int f() { return 1; ",  # the body never closes
+            "int f() return 1;",
+            "int f() { } int",
+            "int f() { } x y z;",
+            "void f() {}\n\nint g(int a,) {}",
+        ],
+    )
+    def test_errors_outside_bodies(self, source):
+        assert outcome(parse_skeleton, source) == outcome(parse_source, source)
+
+    def test_positions_after_skipped_bodies(self):
+        source = 'void f() {\n  printString("{");\n\n}  int 5;'
+        assert outcome(parse_skeleton, source) == outcome(parse_source, source)
+
+    def test_visitors_and_pickle(self):
+        program = parse_skeleton(SOURCE)
+
+        class Returns(BaseVisitor):
+            def __init__(self):
+                self.count = 0
+
+            def pre_visit(self, node, o=None):
+                self.count += isinstance(node, ReturnStmt)
+
+        returns = Returns()
+        returns.walk(program)
+        assert returns.count == 2
+        copy = pickle.loads(pickle.dumps(parse_skeleton(SOURCE)))
+        assert type(copy.decls[1].body.statements) is list
+        assert str(copy) == str(parse_source(SOURCE))
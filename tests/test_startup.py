@@ -0,0 +1,116 @@
+"""
+Tests for the startup-optimized entry point (src/frontend/startup.py).
+Its results must equal the tests/utils.py wrappers with every backend, the
+fast lexer with DescentParser must not import the ANTLR runtime or the
+generated recognizers, and ``precompile`` must write checked-hash bytecode.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from tests.utils import ASTGenerator, Parser, Tokenizer, collect_check_inputs
+from src.frontend import startup
+from lexererr import *
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LEXER_SOURCES = [source for _, source in collect_check_inputs("test_lexer.py")]
+PARSER_SOURCES = [source for _, source in collect_check_inputs("test_parser.py")]
+BACKENDS = [("antlr", "antlr"), ("fast", "antlr"), ("antlr", "descent"), ("fast", "descent")]
+
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(PROJECT_ROOT), str(PROJECT_ROOT / "build")]))
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def tokenize(func, source):
+    try:
+        return func(source)
+    except LexerError as e:
+        return type(e).__name__, str(e)
+
+
+class TestStartup:
+
+    @pytest.mark.parametrize("lexer_backend", ["antlr", "fast"])
+    def test_tokenize_matches_wrapper(self, lexer_backend):
+        for source in LEXER_SOURCES:
+            assert tokenize(lambda s: startup.tokenize(s, lexer_backend), source) == tokenize(
+                lambda s: Tokenizer(s, lexer_backend).get_tokens_as_string(), source
+            )
+
+    @pytest.mark.parametrize("lexer_backend,parser_backend", BACKENDS)
+    def test_parse_and_ast_match_wrappers(self, lexer_backend, parser_backend):
+        for source in PARSER_SOURCES:
+            assert startup.parse(source, lexer_backend, parser_backend) == Parser(
+                source, lexer_backend, parser_backend=parser_backend
+            ).parse()
+            assert str(startup.build_ast(source, lexer_backend, parser_backend)) == str(
+                ASTGenerator(source, lexer_backend, parser_backend=parser_backend).generate()
+            )
+
+    def test_descent_path_imports_no_antlr(self):
+        loaded = run_python(
+            "import sys\n"
+            "from src.frontend import startup\n"
+            "source = 'int main() { printInt(1); return 0; }'\n"
+            "startup.tokenize(source, 'fast')\n"
+            "assert startup.parse(source, 'fast', 'descent') == 'success'\n"
+            "startup.build_ast('int 5;', 'fast', 'descent')\n"
+            "print(*sorted(m for m in sys.modules if m.startswith(('antlr4', 'build.', 'TyC'))))\n"
+        )
+        assert loaded == []
+        # only what the backends need is imported, on first use
+        loaded = run_python(
+            "import sys\n"
+            "from src.frontend import startup, descent\n"
+            "from src.utils.errors import SyntaxException\n"
+            "print('antlr4' in sys.modules)\n"
+            "startup.parse('int x;', 'antlr', 'antlr')\n"
+            "print('antlr4' in sys.modules)\n"
+        )
+        assert loaded == ["False", "True"]
+
+    def test_syntax_exception_is_shared(self):
+        from antlr4.error.ErrorListener import ConsoleErrorListener
+        from src.utils import error_listener, errors
+
+        assert isinstance(error_listener.NewErrorListener.INSTANCE, ConsoleErrorListener)
+        assert error_listener.SyntaxException is errors.SyntaxException
+        from src.frontend.descent import parse_source
+
+        # DescentParser's errors are caught as the listener's
+        with pytest.raises(error_listener.SyntaxException, match="Error on line 1 col 4: 5"):
+            parse_source("int 5;", "fast")
+
+    def test_precompile_writes_checked_hash_bytecode(self, tmp_path):
+        module = tmp_path / "generated.py"
+        module.write_text("ATN = [1, 2, 3]\n")
+        assert startup.precompile([tmp_path])
+        with open(importlib.util.cache_from_source(str(module)), "rb") as f:
+            header = f.read(8)
+        # PEP 552: flags 0b11 mark a hash-based pyc that is checked against its source
+        assert int.from_bytes(header[4:8], "little") == 0b11
+        module.write_text("def broken(:\n")
+        assert not startup.precompile([tmp_path])
+
+    def test_cli(self, tmp_path, capsys):
+        good = tmp_path / "good.tyc"
+        good.write_text("int main() { return 0; }")
+        bad = tmp_path / "bad.tyc"
+        bad.write_text("int 5;")
+        assert startup.main(["parse", "--lexer", "fast", "--parser", "descent", str(good)]) == 0
+        assert capsys.readouterr().out == "success\n"
+        assert startup.main(["parse", str(good), str(bad)]) == 1
+        assert capsys.readouterr().out.splitlines() == [
+            f"{good}: success", f"{bad}: Error on line 1 col 4: 5",
+        ]
+        bad.write_text("int x = 1 # 2;")
+        assert startup.main(["tokenize", "--lexer", "fast", str(bad)]) == 1
+        assert capsys.readouterr().out == "Error Token #\n"
@@ -0,0 +1,72 @@
+"""
+Tests for the two-stage SLL/LL parse strategy.
+Results and error messages must be identical to plain LL parsing; only
+inputs SLL rejects may be parsed a second time.
+"""
+
+import pytest
+from tests.utils import ASTGenerator, Parser, collect_check_inputs
+from src.frontend.session import FrontEndSession
+from src.frontend.strategy import ParseStats, resolve_parse_strategy
+
+LEXER_CORPUS = collect_check_inputs("test_lexer.py")
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+CORPUS = LEXER_CORPUS + PARSER_CORPUS
+
+
+class TestTwoStageStrategy:
+
+    @pytest.mark.parametrize("name,source", CORPUS, ids=[n for n, _ in CORPUS])
+    def test_matches_ll(self, name, source):
+        assert Parser(source, strategy="two-stage").parse() == Parser(source, strategy="ll").parse()
+
+    @pytest.mark.parametrize("backend", ["antlr", "fast"])
+    def test_compact_tokens_match_ll(self, backend):
+        sources = [source for _, source in CORPUS]
+        expected = [Parser(source).parse() for source in sources]
+        actual = [
+            Parser(source, backend, compact_tokens=True, strategy="two-stage").parse()
+            for source in sources
+        ]
+        assert actual == expected
+
+    def test_ast_generator(self):
+        for _, source in PARSER_CORPUS[:20]:
+            assert str(ASTGenerator(source, strategy="two-stage").generate()) == str(
+                ASTGenerator(source).generate()
+            )
+
+    def test_valid_input_does_not_fall_back(self):
+        session = FrontEndSession()
+        sources = [source for _, source in PARSER_CORPUS]
+        results = session.parse_many(sources)
+        assert session.stats.inputs == len(sources)
+        for result, record in zip(results, session.stats.records):
+            assert record.fallback == (result != "success")
+            assert record.sll_seconds > 0
+
+    def test_invalid_input_falls_back(self):
+        session = FrontEndSession()
+        assert session.parse_many(["int x = ;", "int x;", '"open']) == [
+            "Error on line 1 col 8: ;",
+            "success",
+            'Unclosed String: "open',
+        ]
+        assert [record.fallback for record in session.stats.records] == [True, False, True]
+        assert session.stats.fallbacks == 2
+        assert session.stats.ll_seconds > 0
+        assert session.stats.summary().startswith("3 inputs, 2 LL fallbacks")
+
+    def test_ll_strategy_records_nothing(self):
+        session = FrontEndSession(strategy="ll")
+        session.parse("int x;")
+        assert session.stats.inputs == 0
+
+    def test_unknown_strategy(self):
+        assert resolve_parse_strategy(None) == "ll"
+        with pytest.raises(ValueError):
+            FrontEndSession(strategy="sll")
+
+    def test_empty_stats_summary(self):
+        stats = ParseStats()
+        assert stats.summary() == "0 inputs, 0 LL fallbacks (0.0%), SLL 0.0 ms, LL 0.0 ms"
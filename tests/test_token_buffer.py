@@ -0,0 +1,78 @@
+"""
+Tests for the array-backed CompactTokenBuffer and CompactTokenStream.
+"""
+
+import pytest
+from tests.utils import Tokenizer, Parser, collect_check_inputs
+from antlr4 import CommonTokenStream, InputStream
+from build.TyCLexer import TyCLexer
+from src.frontend.token_buffer import CompactTokenBuffer, CompactTokenStream
+from lexererr import *
+
+LEXER_CORPUS = collect_check_inputs("test_lexer.py")
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+
+
+def buffer_string(source, backend):
+    try:
+        buffer = CompactTokenBuffer.from_source(source, backend)
+        return buffer.to_string(TyCLexer.symbolicNames)
+    except LexerError as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def tokenize(source):
+    try:
+        return Tokenizer(source, "antlr").get_tokens_as_string()
+    except LexerError as e:
+        return f"{type(e).__name__}: {e}"
+
+
+class TestCompactTokenBuffer:
+
+    @pytest.mark.parametrize("backend", ["antlr", "fast"])
+    @pytest.mark.parametrize("name,source", LEXER_CORPUS, ids=[n for n, _ in LEXER_CORPUS])
+    def test_lexer_corpus(self, name, source, backend):
+        assert buffer_string(source, backend) == tokenize(source)
+
+    @pytest.mark.parametrize("backend", ["antlr", "fast"])
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS, ids=[n for n, _ in PARSER_CORPUS])
+    def test_parser_corpus(self, name, source, backend):
+        assert Parser(source, backend, compact_tokens=True).parse() == Parser(source).parse()
+
+    def test_materialized_tokens_match_common_tokens(self):
+        source = 'struct P { int x; };\n/* c */ void f() {\n\tprintString("a\\n"); }'
+        stream = CommonTokenStream(TyCLexer(InputStream(source)))
+        stream.fill()
+        buffer = CompactTokenBuffer.from_source(source, "fast").fill()
+        assert len(buffer) == len(stream.tokens)
+        for i, expected in enumerate(stream.tokens):
+            token = buffer.token(i)
+            assert (token.type, token.text, token.start, token.stop, token.line,
+                    token.column, token.tokenIndex) == (
+                expected.type, expected.text, expected.start, expected.stop,
+                expected.line, expected.column, expected.tokenIndex)
+
+    def test_seventeen_bytes_per_token(self):
+        buffer = CompactTokenBuffer.from_source("int x = 1;", "fast").fill()
+        assert len(buffer) == 6
+        assert buffer.nbytes() == 6 * 17
+
+    def test_lexer_error_is_lazy(self):
+        # The syntax error at ';' comes before the bad character is reached
+        source = "void f() { x = ; } @"
+        assert Parser(source, compact_tokens=True).parse() == Parser(source).parse()
+        assert Parser(source, compact_tokens=True).parse() == "Error on line 1 col 15: ;"
+
+    def test_stream_lookahead(self):
+        stream = CompactTokenStream(CompactTokenBuffer.from_source("a b", "fast"))
+        assert stream.LA(1) == TyCLexer.ID
+        assert stream.LT(2).text == "b"
+        assert stream.LA(3) == stream.LA(9) == -1
+        stream.consume()
+        stream.consume()
+        assert stream.LT(-1).text == "b"
+        assert stream.LT(1).text == "<EOF>"
+        with pytest.raises(Exception):
+            stream.consume()
+        assert stream.getText() == "ab"
@@ -0,0 +1,304 @@
+"""
+Tests for visitor dispatch, the iterative BaseVisitor traversal and fused
+traversals. ``visit`` must call the same handler as ``node.accept``, ``walk``
+must reach the same nodes in the same order as the recursive default methods,
+and FusedVisitor must give each visitor the results of visiting alone.
+"""
+
+import pytest
+from tests.utils import ASTGenerator, collect_check_inputs
+from src.frontend.descent import parse_source
+from src.utils import nodes
+from src.utils.nodes import BinaryOp, Identifier, IntLiteral, Program, ReturnStmt
+from src.utils.visitor import CHILD_FIELDS, BaseVisitor, FusedVisitor
+
+PARSER_CORPUS = collect_check_inputs("test_parser.py")
+NODE_CLASSES = [
+    cls for cls in vars(nodes).values()
+    if isinstance(cls, type) and issubclass(cls, nodes.ASTNode)
+    and cls is not nodes.ASTNode and "accept" in vars(cls)
+]
+
+
+class Recorder(BaseVisitor):
+    """Records every node the recursive traversal visits, in pre-order."""
+
+    def __init__(self):
+        self.seen = []
+
+    def visit(self, node, o=None):
+        self.seen.append(node)
+        return super().visit(node, o)
+
+
+class AcceptRecorder(Recorder):
+    """The same traversal through ``node.accept``."""
+
+    def visit(self, node, o=None):
+        self.seen.append(node)
+        return node.accept(self, o)
+
+
+class Walker(BaseVisitor):
+
+    def __init__(self):
+        self.events = []
+
+    def pre_visit(self, node, o=None):
+        self.events.append(("pre", node))
+
+    def post_visit(self, node, o=None):
+        self.events.append(("post", node))
+
+
+def chain(depth):
+    expr = Identifier("x")
+    for _ in range(depth):
+        expr = BinaryOp(expr, "+", IntLiteral(1))
+    return Program([ReturnStmt(expr)])
+
+
+class TestVisitor:
+
+    def test_every_node_class_has_child_fields(self):
+        assert set(NODE_CLASSES) == set(CHILD_FIELDS)
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS[:60], ids=[n for n, _ in PARSER_CORPUS[:60]])
+    def test_dispatch_matches_accept(self, name, source):
+        ast = ASTGenerator(source).generate()
+        if isinstance(ast, str):
+            pytest.skip("not a valid program")
+        table, accept = Recorder(), AcceptRecorder()
+        table.visit(ast)
+        accept.visit(ast)
+        assert table.seen == accept.seen
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS[:60], ids=[n for n, _ in PARSER_CORPUS[:60]])
+    def test_walk_matches_recursion(self, name, source):
+        ast = ASTGenerator(source).generate()
+        if isinstance(ast, str):
+            pytest.skip("not a valid program")
+        recorder, walker = Recorder(), Walker()
+        recorder.visit(ast)
+        walker.walk(ast)
+        assert [node for event, node in walker.events if event == "pre"] == recorder.seen
+
+    def test_handlers_are_cached(self):
+        visitor = Recorder()
+        visitor.visit(parse_source("int x = y;"))
+        handlers = visitor._handlers
+        assert {Program, nodes.VarDecl, nodes.IntType, Identifier} <= set(handlers)
+        assert handlers[Identifier].__func__ is BaseVisitor.visit_identifier
+
+    def test_overridden_handler_is_used(self):
+        class Names(BaseVisitor):
+            def __init__(self):
+                self.names = []
+
+            def visit_identifier(self, node, o=None):
+                self.names.append((node.name, o))
+
+        visitor = Names()
+        visitor.visit(parse_source("int f() { return a + b * c; }"), "ctx")
+        assert visitor.names == [("a", "ctx"), ("b", "ctx"), ("c", "ctx")]
+
+    def test_callee_expression_is_visited(self):
+        class Names(BaseVisitor):
+            def __init__(self):
+                self.names = []
+
+            def visit_identifier(self, node, o=None):
+                self.names.append(node.name)
+
+        visitor = Names()
+        visitor.visit(parse_source("void main() { s.f(1); f(1)(x); }"))
+        assert visitor.names == ["s", "x"]
+
+    def test_node_subclasses(self):
+        class Name(Identifier):
+            __slots__ = ()
+
+        class Custom(Identifier):
+            __slots__ = ()
+
+            def accept(self, visitor, o=None):
+                return ("custom", o)
+
+        class Names(BaseVisitor):
+            def visit_identifier(self, node, o=None):
+                return ("identifier", o)
+
+        visitor = Names()
+        assert visitor.visit(Name("x"), 1) == ("identifier", 1)
+        assert visitor.visit(Custom("x"), 2) == ("custom", 2)
+        walker = Walker()
+        walker.walk(BinaryOp(Name("x"), "+", Custom("y")))
+        assert [type(node) for event, node in walker.events if event == "pre"] == [BinaryOp, Name, Custom]
+
+    def test_post_order_and_pruning(self):
+        ast = parse_source("int f(int a) { return a + 1; }")
+
+        class Prune(Walker):
+            def pre_visit(self, node, o=None):
+                super().pre_visit(node, o)
+                return not isinstance(node, ReturnStmt)
+
+        walker = Prune()
+        walker.walk(ast)
+        events = [(event, type(node).__name__) for event, node in walker.events]
+        assert events == [
+            ("pre", "Program"), ("pre", "FuncDecl"), ("pre", "IntType"), ("post", "IntType"),
+            ("pre", "Param"), ("pre", "IntType"), ("post", "IntType"), ("post", "Param"),
+            ("pre", "BlockStmt"), ("pre", "ReturnStmt"), ("post", "ReturnStmt"),
+            ("post", "BlockStmt"), ("post", "FuncDecl"), ("post", "Program"),
+        ]
+
+    def test_walk_deep_tree(self):
+        count = []
+
+        class Counter(BaseVisitor):
+            def pre_visit(self, node, o=None):
+                count.append(node)
+
+        Counter().walk(chain(100_000))
+        assert len(count) == 2 + 2 * 100_000 + 1
+        with pytest.raises(RecursionError):
+            BaseVisitor().visit(chain(100_000))
+
+
+class Symbols(BaseVisitor):
+
+    def __init__(self):
+        self.names = []
+
+    def visit_func_decl(self, node, o=None):
+        self.names.append(("func", node.name))
+        super().visit_func_decl(node, o)
+
+    def visit_param(self, node, o=None):
+        self.names.append(("param", node.name))
+        super().visit_param(node, o)
+
+    def visit_var_decl(self, node, o=None):
+        self.names.append(("var", node.name))
+        super().visit_var_decl(node, o)
+
+
+class Uses(BaseVisitor):
+
+    def visit_identifier(self, node, o=None):
+        o.append(node.name)
+
+
+class Counts(BaseVisitor):
+
+    def __init__(self):
+        self.counts = {}
+
+    def visit(self, node, o=None):
+        self.counts[type(node).__name__] = self.counts.get(type(node).__name__, 0) + 1
+        return super().visit(node, o)
+
+
+class TestFusedVisitor:
+
+    @pytest.mark.parametrize("name,source", PARSER_CORPUS[:60], ids=[n for n, _ in PARSER_CORPUS[:60]])
+    def test_matches_separate_visits(self, name, source):
+        ast = ASTGenerator(source).generate()
+        if isinstance(ast, str):
+            pytest.skip("not a valid program")
+        symbols, uses, recorder = Symbols(), Uses(), Recorder()
+        symbols.visit(ast)
+        used = []
+        uses.visit(ast, used)
+        recorder.visit(ast)
+
+        fused_symbols, fused_uses, fused_recorder = Symbols(), Uses(), Walker()
+        fused_used = []
+        FusedVisitor(
+            [fused_symbols, fused_uses, fused_recorder], [None, fused_used, None]
+        ).walk(ast)
+        assert fused_symbols.names == symbols.names
+        assert fused_used == used
+        assert [node for event, node in fused_recorder.events if event == "pre"] == recorder.seen
+
+    def test_callee_expressions(self):
+        ast = parse_source("void main() { s.f(1); f(1)(x); }")
+        recorder, walker, fused = Recorder(), Walker(), Walker()
+        recorder.visit(ast)
+        walker.walk(ast)
+        used = []
+        FusedVisitor([fused, Uses()], [None, used]).walk(ast)
+        assert [node for event, node in walker.events if event == "pre"] == recorder.seen
+        assert [node for event, node in fused.events if event == "pre"] == recorder.seen
+        assert used == ["s", "x"]
+        assert sum(isinstance(node, nodes.FuncCall) for node in recorder.seen) == 3
+
+    def test_visitors_can_visit_alone_afterwards(self):
+        ast = parse_source("int f(int a) { return a; }")
+        symbols = Symbols()
+        FusedVisitor([symbols]).walk(ast)
+        assert "visit" not in vars(symbols)
+        symbols.visit(ast)
+        assert symbols.names == [("func", "f"), ("param", "a")] * 2
+
+    def test_overridden_visit_is_rejected(self):
+        with pytest.raises(TypeError, match="overrides visit"):
+            FusedVisitor([Counts(), Symbols()])
+
+    def test_value_returning_handler_is_rejected(self):
+        class Types(BaseVisitor):
+            def visit_int_literal(self, node, o=None):
+                return "int"
+
+        class Hooked(Symbols):
+            def pre_visit(self, node, o=None):
+                pass
+
+        # with and without pre_visit hooks
+        for symbols in (Symbols(), Hooked()):
+            with pytest.raises(TypeError, match="visit_int_literal returned a value"):
+                FusedVisitor([symbols, Types()]).walk(parse_source("int x = 1;"))
+            assert "visit" not in vars(symbols)
+
+    def test_hook_order_and_pruning(self):
+        events = []
+
+        class Hooks(BaseVisitor):
+            def __init__(self, label, prune=None):
+                self.label, self.prune = label, prune
+
+            def pre_visit(self, node, o=None):
+                events.append((self.label, "pre", type(node).__name__))
+                return not (self.prune and isinstance(node, self.prune))
+
+            def post_visit(self, node, o=None):
+                events.append((self.label, "post", type(node).__name__))
+
+            def visit_identifier(self, node, o=None):
+                events.append((self.label, "id", node.name))
+
+        FusedVisitor([Hooks("a"), Hooks("b", prune=ReturnStmt)]).walk(
+            parse_source("void f() { return x; } void g() { y; }")
+        )
+        assert events[:2] == [("a", "pre", "Program"), ("b", "pre", "Program")]
+        assert events[-2:] == [("b", "post", "Program"), ("a", "post", "Program")]
+        assert ("a", "id", "x") in events
+        assert ("b", "id", "x") not in events
+        assert ("b", "id", "y") in events
+        assert events.count(("b", "pre", "Identifier")) == 1
+        # each visitor's own events are those of walking alone
+        b_events = [event for event in events if event[0] == "b"]
+        at = b_events.index(("b", "pre", "ReturnStmt"))
+        assert b_events[at + 1] == ("b", "post", "ReturnStmt")
+
+    def test_deep_tree(self):
+        used = []
+        FusedVisitor([Uses(), Symbols()], [used, None]).walk(chain(100_000))
+        assert used == ["x"]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            FusedVisitor([Uses(), Uses()], [[]])
+        with pytest.raises(TypeError):
+            FusedVisitor([object()])
@@ -11,20 +11,37 @@ build_dir = os.path.join(project_root, "build")
 sys.path.insert(0, project_root)
 sys.path.insert(0, build_dir)
 
-from build.TyCLexer import TyCLexer
 from build.TyCParser import TyCParser
-from antlr4 import InputStream, CommonTokenStream
+from antlr4 import CommonTokenStream
+from src.frontend.backends import (
+    create_lexer,
+    create_token_stream,
+    resolve_lexer_backend,
+    resolve_parser_backend,
+)
+from src.frontend.strategy import parse_program
 from src.utils.error_listener import NewErrorListener
 
 
 class ASTGenerator:
     """Class to generate AST from TyC source code."""
 
-    def __init__(self, input_string: str):
+    def __init__(
+        self,
+        input_string: str,
+        lexer_backend: str = None,
+        compact_tokens: bool = False,
+        strategy: str = None,
+        parser_backend: str = None,
+    ):
         self.input_string = input_string
-        self.input_stream = InputStream(input_string)
-        self.lexer = TyCLexer(self.input_stream)
-        self.token_stream = CommonTokenStream(self.lexer)
+        self.lexer_backend = lexer_backend
+        self.compact_tokens = compact_tokens
+        self.strategy = strategy
+        self.parser_backend = resolve_parser_backend(parser_backend)
+        self.token_stream = create_token_stream(
+            input_string, lexer_backend, compact=compact_tokens
+        )
         self.parser = TyCParser(self.token_stream)
         self.parser.removeErrorListeners()
         self.parser.addErrorListener(NewErrorListener.INSTANCE)
@@ -38,11 +55,18 @@ class ASTGenerator:
 
     def generate(self):
         """Generate AST from the input string."""
+        if self.parser_backend == "descent":
+            from src.frontend.descent import parse_source
+
+            try:
+                return parse_source(self.input_string, self.lexer_backend)
+            except Exception as e:
+                return f"AST Generation Error: {str(e)}"
         if self.ast_generator is None:
             return "AST Generation Error: ASTGeneration class not found. Please implement src/astgen/ast_generation.py"
         try:
             # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
+            parse_tree = parse_program(self.parser, self._rewind, self.strategy)
 
             # Generate AST using the visitor
             ast = self.ast_generator.visit(parse_tree)
@@ -50,17 +74,30 @@ class ASTGenerator:
         except Exception as e:
             return f"AST Generation Error: {str(e)}"
 
+    def _rewind(self):
+        self.token_stream = create_token_stream(
+            self.input_string, self.lexer_backend, compact=self.compact_tokens
+        )
+        self.parser.setTokenStream(self.token_stream)
+
 
 class Tokenizer:
     """Lexer wrapper for testing"""
 
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str, lexer_backend: str = None):
         self.source_code = source_code
+        self.lexer_backend = resolve_lexer_backend(lexer_backend)
 
     def get_tokens_as_string(self) -> str:
         """Get tokens as comma-separated string"""
-        input_stream = InputStream(self.source_code)
-        lexer = TyCLexer(input_stream)
+        lexer = create_lexer(self.source_code, self.lexer_backend)
+        if self.lexer_backend == "fast":
+            # The hand-written lexer yields (type, text) pairs directly
+            names = lexer.symbolicNames
+            tokens = [f"{names[ttype]},{text}" for ttype, text in lexer.tokenize()]
+            tokens.append("EOF")
+            return ",".join(tokens)
+
         token_stream = CommonTokenStream(lexer)
         token_stream.fill()
 
@@ -78,20 +115,89 @@ class Tokenizer:
 class Parser:
     """Parser wrapper for testing"""
 
-    def __init__(self, source_code: str):
+    def __init__(
+        self,
+        source_code: str,
+        lexer_backend: str = None,
+        compact_tokens: bool = False,
+        strategy: str = None,
+        parser_backend: str = None,
+    ):
         self.source_code = source_code
+        self.lexer_backend = lexer_backend
+        self.compact_tokens = compact_tokens
+        self.strategy = strategy
+        self.parser_backend = resolve_parser_backend(parser_backend)
+
+    def _token_stream(self):
+        return create_token_stream(
+            self.source_code, self.lexer_backend, compact=self.compact_tokens
+        )
 
     def parse(self) -> str:
         """Parse source code and return result"""
-        input_stream = InputStream(self.source_code)
-        lexer = TyCLexer(input_stream)
-        token_stream = CommonTokenStream(lexer)
-        parser = TyCParser(token_stream)
+        if self.parser_backend == "descent":
+            from src.frontend.descent import parse_source
+
+            try:
+                parse_source(self.source_code, self.lexer_backend)
+                return "success"
+            except Exception as e:
+                return str(e)
+
+        parser = TyCParser(self._token_stream())
         parser.removeErrorListeners()
         parser.addErrorListener(NewErrorListener.INSTANCE)
 
         try:
-            tree = parser.program()
+            tree = parse_program(
+                parser,
+                lambda: parser.setTokenStream(self._token_stream()),
+                self.strategy,
+            )
             return "success"
         except Exception as e:
             return str(e)
+
+
+def collect_check_inputs(test_file: str) -> list:
+    """Collect the source strings passed to ``self.check(...)`` in a test module.
+
+    Arguments may be string literals or local variables assigned a string
+    literal earlier in the same test (the ``code = \"\"\"...\"\"\"`` pattern).
+    Returns a list of (test_name, source) pairs in file order.
+    """
+    import ast
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), test_file)
+    with open(path, encoding="utf-8") as f:
+        module = ast.parse(f.read())
+
+    inputs = []
+    for func in ast.walk(module):
+        if not isinstance(func, ast.FunctionDef) or not func.name.startswith("test"):
+            continue
+        local_strings = {}
+        for node in ast.walk(func):
+            if (
+                isinstance(node, ast.Assign)
+                and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)
+            ):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        local_strings[target.id] = node.value.value
+        for node in ast.walk(func):
+            if not (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "check"
+                and node.args
+            ):
+                continue
+            arg = node.args[0]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                inputs.append((func.name, arg.value))
+            elif isinstance(arg, ast.Name) and arg.id in local_strings:
+                inputs.append((func.name, local_strings[arg.id]))
+    return inputs